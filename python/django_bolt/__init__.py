@@ -126,7 +126,7 @@ from .params import Depends
 
 # Type-safe Request object
 from .request import Request
-from .responses import JSON, Response, StreamingResponse
+from .responses import JSON, NDJSONResponse, Response, StreamingResponse
 from .router import Router
 from .types import (
     APIKeyAuth,
@@ -173,6 +173,7 @@ __all__ = [
     "Response",
     "JSON",
     "StreamingResponse",
+    "NDJSONResponse",
     "CompressionConfig",
     "Cookie",
     "Depends",
@@ -59,20 +59,50 @@ DEFAULT_TYPE_ENCODERS: dict[type, Callable[[Any], Any]] = {
 }
 
 
+# Per-type dispatch cache for default_serializer.
+# Maps concrete type -> encoder (or None when the type is unsupported), so the
+# MRO walk only happens the first time a given type is seen.
+_TYPE_ENCODER_CACHE: dict[type, Callable[[Any], Any] | None] = {}
+
+
+def _resolve_type_encoder(cls: type) -> Callable[[Any], Any] | None:
+    """Walk the MRO of ``cls`` once and cache the matching encoder (or None)."""
+    encoder = None
+    for base in cls.__mro__[:-1]:  # Skip 'object'
+        encoder = DEFAULT_TYPE_ENCODERS.get(base)
+        if encoder is not None:
+            break
+    _TYPE_ENCODER_CACHE[cls] = encoder
+    return encoder
+
+
+def register_type_encoder(type_: type, encoder: Callable[[Any], Any]) -> None:
+    """Register an encoder for a non-JSON-native type.
+
+    Clears the per-type dispatch cache so subclasses pick up the new encoder.
+    """
+    DEFAULT_TYPE_ENCODERS[type_] = encoder
+    _TYPE_ENCODER_CACHE.clear()
+
+
 def default_serializer(value: Any) -> Any:
     """Transform values non-natively supported by msgspec.
 
-    Walks the MRO (Method Resolution Order) to support subclasses.
+    Looks up the concrete type in a cached dispatch table. On a cache miss the
+    MRO is walked once to support subclasses and the result is cached.
     Raises TypeError if type is unsupported.
 
     Note: Serializer instances are handled in serialization.py before reaching
     this hook, since msgspec.Struct is natively supported by msgspec.
     """
-    # Walk MRO to support polymorphic types
-    for base in value.__class__.__mro__[:-1]:  # Skip 'object'
-        encoder = DEFAULT_TYPE_ENCODERS.get(base)
-        if encoder is not None:
-            return encoder(value)
+    cls = value.__class__
+    try:
+        encoder = _TYPE_ENCODER_CACHE[cls]
+    except KeyError:
+        encoder = _resolve_type_encoder(cls)
+
+    if encoder is not None:
+        return encoder(value)
 
     raise TypeError(f"Unsupported type: {type(value)!r}")
 
@@ -168,4 +198,11 @@ def decode_typed[T](
     return msgspec.json.decode(value, type=target_type, strict=strict)
 
 
-__all__ = ["encode", "decode", "decode_typed", "DEFAULT_TYPE_ENCODERS", "default_serializer"]
+__all__ = [
+    "encode",
+    "decode",
+    "decode_typed",
+    "DEFAULT_TYPE_ENCODERS",
+    "default_serializer",
+    "register_type_encoder",
+]
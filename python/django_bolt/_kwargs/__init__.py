@@ -28,6 +28,7 @@ from .model import (
     classify_handler_pattern,
     compile_argument_injector,
     compile_binder,
+    compile_response_plan,
     compile_websocket_binder,
     extract_response_metadata,
     field_has_upload_file,
@@ -53,6 +54,7 @@ __all__ = [
     "classify_handler_pattern",
     "compile_argument_injector",
     "compile_binder",
+    "compile_response_plan",
     "compile_websocket_binder",
     "extract_response_metadata",
     "field_has_upload_file",
@@ -14,8 +14,14 @@ from typing import Any, get_args, get_origin
 import msgspec
 from asgiref.sync import sync_to_async
 
+from .. import _msgpack
 from ..datastructures import UploadFile
-from ..exceptions import HTTPException, RequestValidationError, parse_msgspec_decode_error
+from ..exceptions import (
+    HTTPException,
+    RequestValidationError,
+    parse_msgpack_decode_error,
+    parse_msgspec_decode_error,
+)
 from ..pagination import PaginatedResponse
 from ..typing import (
     FieldDefinition,
@@ -484,42 +490,34 @@ def create_body_extractor(name: str, annotation: Any) -> Callable:
     """
     Create a pre-compiled extractor for request body.
 
-    Uses cached msgspec decoder for maximum performance.
-    Converts msgspec.DecodeError (JSON parsing errors) to RequestValidationError for proper 422 responses.
+    Uses cached msgspec decoders for maximum performance. The extractor decodes
+    JSON by default, or MessagePack when called with ``msgpack=True`` (request sent
+    with ``Content-Type: application/msgpack``).
+    Converts msgspec.DecodeError (parsing errors) to RequestValidationError for proper 422 responses.
     """
     if is_msgspec_struct(annotation):
-        decoder = get_msgspec_decoder(annotation)
-
-        def extract(body_bytes: bytes) -> Any:
-            try:
-                return decoder.decode(body_bytes)
-            except msgspec.ValidationError:
-                # Re-raise ValidationError as-is (field validation errors handled by error_handlers.py)
-                # IMPORTANT: Must catch ValidationError BEFORE DecodeError since ValidationError subclasses DecodeError
-                raise
-            except msgspec.DecodeError as e:
-                # JSON parsing error (malformed JSON) - return 422 with error details including line/column
-                error_detail = parse_msgspec_decode_error(e, body_bytes)
-                raise RequestValidationError(
-                    errors=[error_detail],
-                    body=body_bytes,
-                ) from e
+        json_decode = get_msgspec_decoder(annotation).decode
     else:
         # Fallback to generic msgspec decode
-        def extract(body_bytes: bytes) -> Any:
-            try:
-                return msgspec.json.decode(body_bytes, type=annotation)
-            except msgspec.ValidationError:
-                # Re-raise ValidationError as-is (field validation errors handled by error_handlers.py)
-                # IMPORTANT: Must catch ValidationError BEFORE DecodeError since ValidationError subclasses DecodeError
-                raise
-            except msgspec.DecodeError as e:
-                # JSON parsing error (malformed JSON) - return 422 with error details including line/column
-                error_detail = parse_msgspec_decode_error(e, body_bytes)
-                raise RequestValidationError(
-                    errors=[error_detail],
-                    body=body_bytes,
-                ) from e
+        def json_decode(body_bytes: bytes) -> Any:
+            return msgspec.json.decode(body_bytes, type=annotation)
+
+    def extract(body_bytes: bytes, msgpack: bool = False) -> Any:
+        try:
+            if msgpack:
+                return _msgpack.get_msgpack_decoder(annotation).decode(body_bytes)
+            return json_decode(body_bytes)
+        except msgspec.ValidationError:
+            # Re-raise ValidationError as-is (field validation errors handled by error_handlers.py)
+            # IMPORTANT: Must catch ValidationError BEFORE DecodeError since ValidationError subclasses DecodeError
+            raise
+        except msgspec.DecodeError as e:
+            # Parsing error (malformed body) - return 422 with error details (line/column for JSON)
+            error_detail = parse_msgpack_decode_error(e) if msgpack else parse_msgspec_decode_error(e, body_bytes)
+            raise RequestValidationError(
+                errors=[error_detail],
+                body=body_bytes,
+            ) from e
 
     return extract
 
@@ -15,6 +15,7 @@ from typing import Annotated, Any, get_args, get_origin, get_type_hints
 
 import msgspec
 
+from .._msgpack import is_msgpack_body
 from ..dependencies import resolve_dependency
 from ..params import Depends as DependsMarker
 from ..params import Param
@@ -66,6 +67,61 @@ def extract_response_metadata(response_type: Any) -> dict[str, Any]:
     return metadata
 
 
+# Annotations that coerce_to_response_type returns unchanged (no validation pass)
+_PASSTHROUGH_RESPONSE_TYPES = (dict, list, str, int, float, bool, bytes, bytearray, type(None))
+
+
+def _always_prevalidated(value: Any) -> bool:
+    return True
+
+
+def compile_response_plan(response_type: Any) -> Callable[[Any], bool] | None:
+    """
+    Compile the response encoding plan for a route's response type.
+
+    Called once at route registration time. Returns a predicate that tells the
+    serializer whether a handler result already matches the declared type and
+    can be encoded directly, skipping the coerce_to_response_type pass (which
+    rebuilds the whole object tree via msgspec.convert).
+
+    Args:
+        response_type: Type annotation (e.g., list[UserMini], User, dict, etc.)
+
+    Returns:
+        Predicate ``(value) -> bool``, or None if every result must be coerced
+
+    Example:
+        plan = compile_response_plan(list[UserMini])
+        plan([UserMini(id=1, username="a")])  # True - encode as-is
+        plan([{"id": 1, "username": "a"}])  # False - coerce first
+    """
+    if response_type is None:
+        return None
+
+    if response_type in _PASSTHROUGH_RESPONSE_TYPES:
+        return _always_prevalidated
+
+    if is_msgspec_struct(response_type):
+
+        def is_struct_instance(value: Any) -> bool:
+            return isinstance(value, response_type)
+
+        return is_struct_instance
+
+    origin = get_origin(response_type)
+    if origin is list:
+        args = get_args(response_type)
+        if args and is_msgspec_struct(args[0]):
+            item_type = args[0]
+
+            def is_struct_list(value: Any) -> bool:
+                return value.__class__ is list and all(item.__class__ is item_type for item in value)
+
+            return is_struct_list
+
+    return None
+
+
 def field_has_upload_file(field: FieldDefinition) -> bool:
     """Check if a field contains UploadFile types (for auto-cleanup detection)."""
     if field.source != "form":
@@ -573,14 +629,14 @@ def compile_argument_injector(
 
             def injector_body_only_positional(request: dict[str, Any]) -> tuple[list[Any], dict[str, Any]]:
                 body_bytes = request["body"]
-                return ([body_extractor(body_bytes)], {})
+                return ([body_extractor(body_bytes, is_msgpack_body(request))], {})
 
             return injector_body_only_positional
         else:
 
             def injector_body_only_kwarg(request: dict[str, Any]) -> tuple[list[Any], dict[str, Any]]:
                 body_bytes = request["body"]
-                return ([], {field_name: body_extractor(body_bytes)})
+                return ([], {field_name: body_extractor(body_bytes, is_msgpack_body(request))})
 
             return injector_body_only_kwarg
 
@@ -734,7 +790,7 @@ def compile_argument_injector(
                     value = extractor(files_map)
                 elif src_id == _SRC_BODY_D:
                     if not body_loaded:
-                        body_obj = extractor(request["body"])
+                        body_obj = extractor(request["body"], is_msgpack_body(request))
                         body_loaded = True
                     value = body_obj
                 else:
@@ -846,7 +902,7 @@ def compile_argument_injector(
                 value = extractor(files_map)
             elif src_id == _SRC_BODY:
                 if not body_loaded:
-                    body_obj = extractor(request["body"])
+                    body_obj = extractor(request["body"], is_msgpack_body(request))
                     body_loaded = True
                 value = body_obj
             else:
@@ -0,0 +1,100 @@
+"""Fast MessagePack helpers backed by cached msgspec Encoder/Decoder.
+
+Counterpart of ``_json`` used for ``application/msgpack`` content negotiation:
+- Thread-local cached encoder/decoder instances (thread-safe buffer reuse)
+- Same non-native type handling as JSON (``_json.default_serializer``)
+- Per-type cached typed decoders for request body extraction
+
+Rust detects the negotiated format from the raw ``Content-Type`` / ``Accept``
+headers and flags it in ``request.state`` (see ``MSGPACK_BODY_STATE_KEY`` and
+``MSGPACK_RESPONSE_STATE_KEY``), so routes need no changes to speak MessagePack.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import msgspec
+
+from ._json import default_serializer
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# request.state keys set by Rust (request_pipeline::detect_msgpack)
+MSGPACK_BODY_STATE_KEY = "_bolt_msgpack_body"
+MSGPACK_RESPONSE_STATE_KEY = "_bolt_msgpack_response"
+
+# Thread-local storage for encoder/decoder instances
+_thread_local = threading.local()
+
+# Cache for typed msgspec msgpack decoders
+_DECODER_CACHE: dict[Any, msgspec.msgpack.Decoder] = {}
+
+
+def _get_encoder() -> msgspec.msgpack.Encoder:
+    """Return a thread-local msgspec MessagePack Encoder instance."""
+    encoder = getattr(_thread_local, "encoder", None)
+    if encoder is None:
+        encoder = msgspec.msgpack.Encoder(enc_hook=default_serializer)
+        _thread_local.encoder = encoder
+    return encoder
+
+
+def _get_decoder() -> msgspec.msgpack.Decoder:
+    """Return a thread-local untyped msgspec MessagePack Decoder instance."""
+    decoder = getattr(_thread_local, "decoder", None)
+    if decoder is None:
+        decoder = msgspec.msgpack.Decoder()
+        _thread_local.decoder = decoder
+    return decoder
+
+
+def get_msgpack_decoder(type_: Any) -> msgspec.msgpack.Decoder:
+    """Get or create a cached msgspec MessagePack decoder for a type."""
+    if type_ not in _DECODER_CACHE:
+        _DECODER_CACHE[type_] = msgspec.msgpack.Decoder(type_)
+    return _DECODER_CACHE[type_]
+
+
+def encode(value: Any) -> bytes:
+    """Encode a Python object to MessagePack bytes.
+
+    Raises:
+        TypeError: If value contains unsupported types
+        msgspec.EncodeError: If encoding fails
+    """
+    return _get_encoder().encode(value)
+
+
+def decode(value: bytes) -> Any:
+    """Decode MessagePack bytes to a Python object.
+
+    Raises:
+        msgspec.DecodeError: If decoding fails
+    """
+    return _get_decoder().decode(value)
+
+
+def is_msgpack_body(request: Any) -> bool:
+    """Return True if the request body was sent as ``application/msgpack``."""
+    state = getattr(request, "state", None)
+    return bool(state and state.get(MSGPACK_BODY_STATE_KEY, False))
+
+
+def is_msgpack_response(request: Any) -> bool:
+    """Return True if the client asked for ``application/msgpack`` via ``Accept``."""
+    state = getattr(request, "state", None)
+    return bool(state and state.get(MSGPACK_RESPONSE_STATE_KEY, False))
+
+
+__all__ = [
+    "MSGPACK_MEDIA_TYPE",
+    "MSGPACK_BODY_STATE_KEY",
+    "MSGPACK_RESPONSE_STATE_KEY",
+    "encode",
+    "decode",
+    "get_msgpack_decoder",
+    "is_msgpack_body",
+    "is_msgpack_response",
+]
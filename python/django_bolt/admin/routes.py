@@ -94,5 +94,6 @@ class AdminRouteRegistrar:
             "fields": [],
             "default_status_code": 200,
             "response_type": None,
+            "response_plan": None,
         }
         self.api._handler_meta[handler_id] = meta
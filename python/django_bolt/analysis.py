@@ -4,6 +4,8 @@ Static analysis module for handler functions.
 Performs AST-based analysis of handler source code to detect:
 - Django ORM usage patterns
 - Blocking I/O operations
+- Query performance anti-patterns (N+1 loops, unbounded list results,
+  len() on querysets, sync ORM calls in async handlers)
 
 This enables compile-time optimization decisions (e.g., running sync handlers
 with ORM usage in a thread pool) and developer warnings.
@@ -21,7 +23,10 @@ from typing import Any
 
 __all__ = [
     "HandlerAnalysis",
+    "PerformanceIssue",
+    "PerformanceWarning",
     "analyze_handler",
+    "warn_performance_issues",
 ]
 
 
@@ -171,6 +176,85 @@ BLOCKING_IO_MODULES = frozenset(
 )
 
 
+# QuerySet methods that return a new, still unevaluated QuerySet
+LAZY_QUERYSET_METHODS = frozenset(
+    {
+        "all",
+        "filter",
+        "exclude",
+        "order_by",
+        "reverse",
+        "distinct",
+        "annotate",
+        "alias",
+        "values",
+        "values_list",
+        "select_related",
+        "prefetch_related",
+        "only",
+        "defer",
+        "using",
+        "select_for_update",
+        "none",
+    }
+)
+
+# QuerySet methods that load related objects up front
+RELATED_LOADING_METHODS = frozenset({"select_related", "prefetch_related"})
+
+# QuerySet methods yielding dicts/tuples instead of model instances
+ROW_QUERYSET_METHODS = frozenset({"values", "values_list"})
+
+# Sync QuerySet/Manager methods that hit the database when called
+SYNC_ORM_EVALUATION_METHODS = frozenset(
+    {
+        "get",
+        "first",
+        "last",
+        "earliest",
+        "latest",
+        "create",
+        "get_or_create",
+        "update_or_create",
+        "bulk_create",
+        "bulk_update",
+        "update",
+        "delete",
+        "count",
+        "exists",
+        "aggregate",
+        "in_bulk",
+        "iterator",
+        "contains",
+        "explain",
+    }
+)
+
+# Sync model instance methods that hit the database
+SYNC_INSTANCE_EVALUATION_METHODS = frozenset({"save", "refresh_from_db"})
+
+# Builtins that evaluate a QuerySet synchronously
+QUERYSET_EVALUATING_BUILTINS = frozenset({"list", "tuple", "set", "sorted"})
+
+
+class PerformanceWarning(UserWarning):
+    """Warning for query performance anti-patterns found in handler source."""
+
+
+@dataclass(frozen=True)
+class PerformanceIssue:
+    """A query performance anti-pattern found in a handler."""
+
+    code: str
+    """Issue kind: 'n_plus_one', 'unbounded_queryset', 'len_queryset' or 'sync_orm_in_async'"""
+
+    message: str
+    """Human-readable description with a suggested fix"""
+
+    lineno: int
+    """Line number in the handler's source file"""
+
+
 @dataclass
 class HandlerAnalysis:
     """
@@ -194,6 +278,13 @@ class HandlerAnalysis:
     blocking_operations: set[str] = field(default_factory=set)
     """Set of blocking operations detected"""
 
+    # Query performance anti-patterns
+    performance_issues: list[PerformanceIssue] = field(default_factory=list)
+    """Anti-patterns detected in the handler body (N+1 loops, unbounded results, ...)"""
+
+    source_file: str | None = None
+    """File the handler is defined in (for warning locations)"""
+
     # Analysis metadata
     analysis_failed: bool = False
     """Whether AST analysis failed (e.g., couldn't get source)"""
@@ -354,6 +445,187 @@ class OrmVisitor(ast.NodeVisitor):
         self.generic_visit(node)
 
 
+class PerformanceVisitor(ast.NodeVisitor):
+    """
+    AST visitor that detects query performance anti-patterns.
+
+    Looks for:
+    - Related attribute access inside loops over querysets (N+1 queries)
+    - Querysets returned without slicing (unbounded list results)
+    - len(queryset) instead of .count()
+    - Sync ORM calls inside async def handlers
+
+    QuerySets are recognized by their .objects chain (User.objects.filter(...))
+    or by a local name assigned from one. Nested functions and lambdas are not
+    visited, since they are commonly wrapped with sync_to_async.
+    """
+
+    def __init__(self, is_async: bool, line_offset: int = 0) -> None:
+        self.is_async = is_async
+        self.line_offset = line_offset
+        self.issues: list[PerformanceIssue] = []
+        # Local name -> (chained methods, sliced) for names assigned a QuerySet
+        self._querysets: dict[str, tuple[frozenset[str], bool]] = {}
+
+    def _add(self, code: str, node: ast.AST, message: str) -> None:
+        self.issues.append(PerformanceIssue(code, message, node.lineno + self.line_offset))
+
+    def _queryset_info(self, node: ast.AST) -> tuple[frozenset[str], bool] | None:
+        """
+        Return (chained methods, sliced) if node evaluates to a QuerySet, else None.
+
+        e.g. User.objects.filter(a=1).order_by("b")[:10] -> ({"filter", "order_by"}, True)
+        """
+        methods: set[str] = set()
+        sliced = False
+        current = node
+        while True:
+            if isinstance(current, ast.Subscript):
+                # qs[:10] is still a QuerySet, qs[0] is a model instance
+                if not isinstance(current.slice, ast.Slice):
+                    return None
+                sliced = True
+                current = current.value
+            elif isinstance(current, ast.Call) and isinstance(current.func, ast.Attribute):
+                if current.func.attr not in LAZY_QUERYSET_METHODS:
+                    return None
+                methods.add(current.func.attr)
+                current = current.func.value
+            elif isinstance(current, ast.Attribute):
+                return (frozenset(methods), sliced) if current.attr in ORM_MANAGER_ATTRS else None
+            elif isinstance(current, ast.Name):
+                known = self._querysets.get(current.id)
+                if known is None:
+                    return None
+                return known[0] | methods, known[1] or sliced
+            else:
+                return None
+
+    def _check_related_access(self, nodes: list[ast.AST], var: str, queryset: frozenset[str], loop: ast.AST) -> None:
+        """Flag var.relation.attr / var.relation.all() when the queryset loads no relations."""
+        if queryset & (RELATED_LOADING_METHODS | ROW_QUERYSET_METHODS):
+            return
+
+        called = {id(sub.func) for node in nodes for sub in ast.walk(node) if isinstance(sub, ast.Call)}
+        for node in nodes:
+            for sub in ast.walk(node):
+                if not (
+                    isinstance(sub, ast.Attribute)
+                    and isinstance(sub.value, ast.Attribute)
+                    and isinstance(sub.value.value, ast.Name)
+                    and sub.value.value.id == var
+                ):
+                    continue
+                relation = sub.value.attr
+                if relation == "pk" or relation.endswith("_id"):
+                    continue
+                # var.created_at.isoformat() is a method on a field value, var.tags.all() is a query
+                if id(sub) in called and sub.attr not in LAZY_QUERYSET_METHODS | SYNC_ORM_EVALUATION_METHODS:
+                    continue
+                self._add(
+                    "n_plus_one",
+                    loop,
+                    f"'{var}.{relation}.{sub.attr}' inside a loop over a queryset may run one query per row "
+                    f"(N+1). Use select_related('{relation}') or prefetch_related('{relation}').",
+                )
+                return
+
+    def _check_sync_evaluation(self, node: ast.AST, description: str) -> None:
+        if self.is_async:
+            self._add(
+                "sync_orm_in_async",
+                node,
+                f"{description} runs a sync ORM query inside an async handler. "
+                "Use the async ORM API (aget, acount, async for, ...) or sync_to_async.",
+            )
+
+    def _visit_loop(self, node: ast.For | ast.AsyncFor) -> None:
+        queryset = self._queryset_info(node.iter)
+        if queryset is not None:
+            if isinstance(node, ast.For):
+                self._check_sync_evaluation(node, "Iterating a queryset with 'for'")
+            if isinstance(node.target, ast.Name):
+                self._check_related_access(node.body, node.target.id, queryset[0], node)
+        self.generic_visit(node)
+
+    visit_For = _visit_loop
+    visit_AsyncFor = _visit_loop
+
+    def _visit_comprehension(self, node: ast.ListComp | ast.SetComp | ast.GeneratorExp | ast.DictComp) -> None:
+        results = [node.key, node.value] if isinstance(node, ast.DictComp) else [node.elt]
+        for generator in node.generators:
+            queryset = self._queryset_info(generator.iter)
+            if queryset is None:
+                continue
+            if not generator.is_async:
+                self._check_sync_evaluation(node, "Iterating a queryset in a comprehension")
+            if isinstance(generator.target, ast.Name):
+                self._check_related_access([*results, *generator.ifs], generator.target.id, queryset[0], node)
+        self.generic_visit(node)
+
+    visit_ListComp = _visit_comprehension
+    visit_SetComp = _visit_comprehension
+    visit_GeneratorExp = _visit_comprehension
+    visit_DictComp = _visit_comprehension
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        self.generic_visit(node)
+        queryset = self._queryset_info(node.value)
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                if queryset is None:
+                    self._querysets.pop(target.id, None)
+                else:
+                    self._querysets[target.id] = queryset
+
+    def visit_Call(self, node: ast.Call) -> None:
+        func = node.func
+        if isinstance(func, ast.Name) and len(node.args) == 1 and self._queryset_info(node.args[0]) is not None:
+            if func.id == "len":
+                self._add(
+                    "len_queryset",
+                    node,
+                    "len() on a queryset loads every row to count them. Use .count() (or .acount()) instead.",
+                )
+            elif func.id in QUERYSET_EVALUATING_BUILTINS:
+                self._check_sync_evaluation(node, f"{func.id}(queryset)")
+        elif isinstance(func, ast.Attribute) and (
+            func.attr in SYNC_INSTANCE_EVALUATION_METHODS
+            or (func.attr in SYNC_ORM_EVALUATION_METHODS and self._queryset_info(func.value) is not None)
+        ):
+            self._check_sync_evaluation(node, f".{func.attr}()")
+        self.generic_visit(node)
+
+    def visit_Return(self, node: ast.Return) -> None:
+        value = node.value
+        # return list(qs) is as unbounded as return qs
+        if (
+            isinstance(value, ast.Call)
+            and isinstance(value.func, ast.Name)
+            and value.func.id in QUERYSET_EVALUATING_BUILTINS
+            and len(value.args) == 1
+        ):
+            value = value.args[0]
+        queryset = self._queryset_info(value) if value is not None else None
+        if queryset is not None and not queryset[1]:
+            self._add(
+                "unbounded_queryset",
+                node,
+                "Returns a queryset without slicing, so the response grows with the table. "
+                "Use @paginate(...) or slice the queryset.",
+            )
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        """Skip nested functions (often run via sync_to_async)."""
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        """Skip nested functions."""
+
+    def visit_Lambda(self, node: ast.Lambda) -> None:
+        """Skip lambdas (often run via sync_to_async)."""
+
+
 def analyze_handler(fn: Callable[..., Any]) -> HandlerAnalysis:
     """
     Analyze a handler function for ORM usage and blocking operations.
@@ -372,7 +644,9 @@ def analyze_handler(fn: Callable[..., Any]) -> HandlerAnalysis:
     unwraped_source = inspect.unwrap(fn)
     # Try to get source code
     try:
-        source = inspect.getsource(unwraped_source)
+        source_lines, start_line = inspect.getsourcelines(unwraped_source)
+        source = "".join(source_lines)
+        analysis.source_file = inspect.getsourcefile(unwraped_source)
     except (OSError, TypeError) as e:
         # Can't get source (e.g., built-in, C extension, or lambda)
         analysis.analysis_failed = True
@@ -393,12 +667,19 @@ def analyze_handler(fn: Callable[..., Any]) -> HandlerAnalysis:
     # Find the function definition and analyze only its body (not decorators)
     # This prevents false positives from decorator names like @api.delete("/m")
     visitor = OrmVisitor()
+    visitor.analysis.source_file = analysis.source_file
 
     for node in ast.walk(tree):
         if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             # Only analyze the function body, not decorators
+            performance_visitor = PerformanceVisitor(
+                is_async=isinstance(node, ast.AsyncFunctionDef),
+                line_offset=start_line - 1,
+            )
             for stmt in node.body:
                 visitor.visit(stmt)
+                performance_visitor.visit(stmt)
+            visitor.analysis.performance_issues = performance_visitor.issues
             break  # Only analyze the first function found
 
     return visitor.analysis
@@ -428,3 +709,49 @@ def warn_blocking_handler(
     warning_msg = analysis.get_warning_message(fn.__name__, path, is_async)
     if warning_msg:
         warnings.warn(warning_msg, stacklevel=3)
+
+
+# (file, line, code) of performance issues already warned about
+_WARNED_ISSUES: set[tuple[str | None, int, str]] = set()
+
+
+def warn_performance_issues(
+    fn: Callable[..., Any],
+    path: str,
+    method: str | None = None,
+    analysis: HandlerAnalysis | None = None,
+) -> None:
+    """
+    Emit a PerformanceWarning for each anti-pattern found in the handler.
+
+    Warnings point at the offending line in the handler's source file and are
+    emitted once per location, even if the handler is registered again.
+    Unbounded queryset returns are only reported for non-paginated GET routes.
+    Silence them with ``warnings.filterwarnings("ignore", category=PerformanceWarning)``.
+
+    Args:
+        fn: Handler function
+        path: Route path
+        method: HTTP method of the route (None skips the list-route check)
+        analysis: Pre-computed analysis (will compute if None)
+    """
+    if analysis is None:
+        analysis = analyze_handler(fn)
+
+    if analysis.analysis_failed:
+        return
+
+    is_list_route = method == "GET" and not getattr(fn, "__paginated__", False)
+    for issue in analysis.performance_issues:
+        if issue.code == "unbounded_queryset" and not is_list_route:
+            continue
+        key = (analysis.source_file, issue.lineno, issue.code)
+        if key in _WARNED_ISSUES:
+            continue
+        _WARNED_ISSUES.add(key)
+        warnings.warn_explicit(
+            f"Handler '{fn.__name__}' at {path}: {issue.message}",
+            PerformanceWarning,
+            analysis.source_file or "<unknown>",
+            issue.lineno,
+        )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import sys
 import threading
@@ -25,19 +26,23 @@ from . import _json
 from ._kwargs import (
     compile_argument_injector,
     compile_binder,
+    compile_response_plan,
     compile_websocket_binder,
     extract_response_metadata,
 )
+from ._msgpack import MSGPACK_RESPONSE_STATE_KEY, is_msgpack_response
 from .admin.routes import AdminRouteRegistrar
 from .admin.static_routes import StaticRouteRegistrar
-from .analysis import analyze_handler, warn_blocking_handler
+from .analysis import analyze_handler, warn_blocking_handler, warn_performance_issues
 from .auth import get_default_authentication_classes, register_auth_backend
-from .auth.user_loader import load_user_sync
+from .auth.user_loader import load_user, load_user_sync
 from .concurrency import sync_to_thread
 from .decorators import ActionHandler
 from .error_handlers import handle_exception
 from .exceptions import HTTPException
 from .logging.middleware import LoggingMiddleware, create_logging_middleware
+from .memory_stats import DEFAULT_MEMORY_SAMPLE_RATE, DEFAULT_TRACE_FRAMES, enable_memory_stats
+from .metrics import enable_executor_metrics
 from .middleware import CompressionConfig
 from .middleware.compiler import add_optimization_flags_to_metadata, compile_middleware_meta
 from .middleware.django_loader import load_django_middleware
@@ -54,11 +59,15 @@ from .openapi import (
 from .openapi.routes import OpenAPIRouteRegistrar
 from .openapi.schema_generator import SchemaGenerator
 from .pagination import extract_pagination_item_type
+from .query_stats import DEFAULT_N_PLUS_ONE_THRESHOLD, enable_query_stats
 from .router import Router
 from .serialization import serialize_response, serialize_response_sync
+from .slow_requests import DEFAULT_SLOW_REQUEST_BUFFER, enable_slow_request_sampler
 from .status_codes import HTTP_201_CREATED, HTTP_204_NO_CONTENT
+from .timing import TIMINGS_STATE_KEY
 from .typing import HandlerMetadata
 from .views import APIView, ViewSet
+from .watchdog import DEFAULT_BLOCK_THRESHOLD_MS, enable_loop_watchdog
 from .websocket import mark_websocket_handler
 
 Response = tuple[int, list[tuple[str, str]], bytes]
@@ -229,6 +238,9 @@ class BoltAPI:
         # Register this instance globally for autodiscovery
         _BOLT_API_REGISTRY.append(self)
 
+        # handler_id -> "METHOD /path" labels for per-route metrics (filled lazily)
+        self._route_labels: dict[int | None, str] = {}
+
         # Signal support: wrap _dispatch when enabled
         # This is done at init time (not per-request) for zero overhead when disabled
         if self._emit_signals:
@@ -253,6 +265,132 @@ class BoltAPI:
 
             self._dispatch = _dispatch_with_signals
 
+        # Query instrumentation: wrap _dispatch when enabled
+        # Enable with BOLT_QUERY_STATS = True in Django settings (zero overhead when disabled)
+        if django_settings and getattr(django_settings, "BOLT_QUERY_STATS", False):
+            query_stats = enable_query_stats(
+                getattr(django_settings, "BOLT_N_PLUS_ONE_THRESHOLD", DEFAULT_N_PLUS_ONE_THRESHOLD)
+            )
+            _inner_dispatch = self._dispatch
+
+            async def _dispatch_with_query_stats(handler, request, handler_id=None):
+                """Dispatch wrapper that attributes DB queries to the route."""
+                request_queries, token = query_stats.start_request()
+                try:
+                    return await _inner_dispatch(handler, request, handler_id)
+                finally:
+                    query_stats.finish_request(handler_id, request_queries, token, route=self._route_label(handler_id))
+
+            self._dispatch = _dispatch_with_query_stats
+
+        # Event loop watchdog: wrap _dispatch when enabled
+        # Enable with BOLT_LOOP_WATCHDOG = True in Django settings (zero overhead when disabled)
+        if django_settings and getattr(django_settings, "BOLT_LOOP_WATCHDOG", False):
+            loop_watchdog = enable_loop_watchdog(
+                getattr(django_settings, "BOLT_LOOP_BLOCK_THRESHOLD_MS", DEFAULT_BLOCK_THRESHOLD_MS)
+            )
+            if getattr(django_settings, "BOLT_METRICS", False):
+                loop_watchdog.export_metrics()
+            _watchdog_inner_dispatch = self._dispatch
+
+            async def _dispatch_with_watchdog(handler, request, handler_id=None):
+                """Dispatch wrapper that tags the running task with its route for the loop watchdog."""
+                if not loop_watchdog.running:
+                    loop_watchdog.start()
+                task = asyncio.current_task()
+                loop_watchdog.task_routes[task] = self._route_label(handler_id)
+                try:
+                    return await _watchdog_inner_dispatch(handler, request, handler_id)
+                finally:
+                    loop_watchdog.task_routes.pop(task, None)
+
+            self._dispatch = _dispatch_with_watchdog
+
+        # Slow-request sampler: wrap _dispatch when enabled
+        # Enable with BOLT_SLOW_REQUEST_MS = <milliseconds> in Django settings (zero overhead when disabled)
+        slow_request_ms = getattr(django_settings, "BOLT_SLOW_REQUEST_MS", None) if django_settings else None
+        if slow_request_ms:
+            slow_requests = enable_slow_request_sampler(
+                slow_request_ms,
+                getattr(django_settings, "BOLT_SLOW_REQUEST_BUFFER", DEFAULT_SLOW_REQUEST_BUFFER),
+                self._logging_middleware,
+            )
+            _slow_inner_dispatch = self._dispatch
+
+            async def _dispatch_with_slow_requests(handler, request, handler_id=None):
+                """Dispatch wrapper that records requests slower than BOLT_SLOW_REQUEST_MS."""
+                if not slow_requests.running:
+                    slow_requests.start()
+                # Reuse the phase timings list when Rust created one, otherwise let _dispatch fill our own
+                if hasattr(request, "state"):
+                    request_state = request.state
+                elif isinstance(request, dict):
+                    request_state = request.setdefault("state", {})
+                else:
+                    request_state = {}
+                timings = request_state.setdefault(TIMINGS_STATE_KEY, [])
+                entry, token = slow_requests.start_request()
+                response = error = None
+                try:
+                    response = await _slow_inner_dispatch(handler, request, handler_id)
+                    return response
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    slow_requests.finish_request(
+                        entry,
+                        token,
+                        request,
+                        self._route_label(handler_id),
+                        response[0] if isinstance(response, tuple) else None,
+                        error,
+                        timings,
+                    )
+
+            self._dispatch = _dispatch_with_slow_requests
+
+        # Memory instrumentation: wrap _dispatch when enabled
+        # Enable with BOLT_MEMORY_STATS = True in Django settings (zero overhead when disabled)
+        if django_settings and getattr(django_settings, "BOLT_MEMORY_STATS", False):
+            memory_stats = enable_memory_stats(
+                getattr(django_settings, "BOLT_MEMORY_SAMPLE_RATE", DEFAULT_MEMORY_SAMPLE_RATE),
+                getattr(django_settings, "BOLT_MEMORY_TRACE_FRAMES", DEFAULT_TRACE_FRAMES),
+            )
+            _memory_inner_dispatch = self._dispatch
+
+            async def _dispatch_with_memory_stats(handler, request, handler_id=None):
+                """Dispatch wrapper that samples the memory a request leaves behind."""
+                sample = memory_stats.start_request()
+                if sample is None:
+                    return await _memory_inner_dispatch(handler, request, handler_id)
+                try:
+                    return await _memory_inner_dispatch(handler, request, handler_id)
+                finally:
+                    memory_stats.finish_request(handler_id, sample)
+
+            self._dispatch = _dispatch_with_memory_stats
+
+        # Prometheus metrics are recorded and served by Rust (BOLT_METRICS = True);
+        # Python only tracks the sync handler executor queue
+        if django_settings and getattr(django_settings, "BOLT_METRICS", False):
+            enable_executor_metrics()
+
+    def _route_label(self, handler_id: int | None) -> str:
+        """Return "METHOD /path/{param}" for a handler_id (cached)."""
+        label = self._route_labels.get(handler_id)
+        if label is None:
+            label = next(
+                (
+                    f"{method} {path}"
+                    for method, path, route_handler_id, _ in self._routes
+                    if route_handler_id == handler_id
+                ),
+                f"handler {handler_id}",
+            )
+            self._route_labels[handler_id] = label
+        return label
+
     def get(
         self,
         path: str,
@@ -909,6 +1047,9 @@ class BoltAPI:
             # Emit warning for sync handlers with ORM (will run in thread pool)
             warn_blocking_handler(fn, full_path, is_async, handler_analysis)
 
+            # Emit warnings for query anti-patterns (N+1 loops, unbounded list results, ...)
+            warn_performance_issues(fn, full_path, method, handler_analysis)
+
             # Determine final response type with proper priority:
             # 1. response_model parameter (explicit, takes precedence)
             # 2. sig.return_annotation (fallback if response_model not provided)
@@ -932,6 +1073,10 @@ class BoltAPI:
             else:
                 meta["response_type"] = None
 
+            # Pre-compute the response encoding plan so results that already match
+            # the declared type are encoded without a coercion pass
+            meta["response_plan"] = compile_response_plan(final_response_type)
+
             # If handler is paginated, extract and store the item serializer
             # This enables @paginate to use Serializer.dump_many() for efficient serialization
             if getattr(fn, "__paginated__", False) and final_response_type is not None:
@@ -1162,10 +1307,11 @@ class BoltAPI:
                 else:
                     result = handler(*args, **kwargs)
 
+        msgpack = is_msgpack_response(request)
         if meta.get("is_async", True):
-            response_tuple = await serialize_response(result, meta)
+            response_tuple = await serialize_response(result, meta, msgpack)
         else:
-            response_tuple = serialize_response_sync(result, meta)
+            response_tuple = serialize_response_sync(result, meta, msgpack)
 
         return MiddlewareResponse.from_tuple(response_tuple)
 
@@ -1292,7 +1438,7 @@ class BoltAPI:
         if logging_middleware:
             # _should_time_cached initialized in LoggingMiddleware.__init__()
             if logging_middleware._should_time_cached:
-                start_time = time.time()
+                start_time = time.perf_counter()
 
             # Skip method call when debug-level request logging is disabled.
             if logging_middleware._request_debug_enabled_cached:
@@ -1316,6 +1462,13 @@ class BoltAPI:
                 request["user"] = SimpleLazyObject(
                     partial(load_user_sync, user_id, backend_name, auth_context, is_async_ctx)
                 )
+                # Non-blocking path for async handlers: `user = await request.auser()`
+                # (state["auser"] is what request.auser reads; plain dict requests get a key)
+                auser = partial(load_user, user_id, backend_name, auth_context)
+                if hasattr(request, "state"):
+                    request.state["auser"] = auser
+                else:
+                    request["auser"] = auser
             else:
                 request["user"] = None
 
@@ -1331,8 +1484,18 @@ class BoltAPI:
             api_with_middleware = middleware_owner if (has_python_global_middleware or has_route_python_middleware) else None
 
             if api_with_middleware:
+                # Phase timings list (only present when BOLT_PHASE_TIMINGS/BOLT_SERVER_TIMING is enabled)
+                timings = (getattr(request, "state", None) or {}).get(TIMINGS_STATE_KEY)
+                if timings is not None:
+                    dispatch_start = time.perf_counter()
+
                 # Execute through middleware chain (Django-style)
                 response = await self._dispatch_with_middleware(handler, request, handler_id, api_with_middleware, meta)
+
+                if timings is not None:
+                    elapsed = time.perf_counter() - dispatch_start
+                    timings.append(("handler", elapsed))
+                    timings.append(("dispatch", elapsed))
             else:
                 # Fast path: no middleware, execute handler directly
                 # Optional Rust-prebound args/kwargs for simple handlers.
@@ -1343,6 +1506,11 @@ class BoltAPI:
                 else:
                     request_state = {}
 
+                # Phase timings list (only present when BOLT_PHASE_TIMINGS/BOLT_SERVER_TIMING is enabled)
+                timings = request_state.get(TIMINGS_STATE_KEY)
+                if timings is not None:
+                    dispatch_start = phase_start = time.perf_counter()
+
                 prebound_args = request_state.pop("_bolt_prebound_args", None)
                 prebound_kwargs = request_state.pop("_bolt_prebound_kwargs", None)
                 has_prebound = prebound_args is not None and prebound_kwargs is not None
@@ -1374,6 +1542,11 @@ class BoltAPI:
                         else:
                             args, kwargs = meta["injector"](request)
 
+                    if timings is not None:
+                        now = time.perf_counter()
+                        timings.append(("bind", now - phase_start))
+                        phase_start = now
+
                     # 5. Execute handler (async or sync)
                     if is_async:
                         result = await handler(*args, **kwargs)
@@ -1389,15 +1562,26 @@ class BoltAPI:
                             # This avoids thread pool overhead per request
                             result = handler(*args, **kwargs)
 
-                # 6. Serialize response
+                if timings is not None:
+                    now = time.perf_counter()
+                    timings.append(("handler", now - phase_start))
+                    phase_start = now
+
+                # 6. Serialize response (MessagePack if negotiated via Accept, flagged by Rust)
+                msgpack = request_state.get(MSGPACK_RESPONSE_STATE_KEY, False)
                 if is_async:
-                    response = await serialize_response(result, meta)
+                    response = await serialize_response(result, meta, msgpack)
                 else:
-                    response = serialize_response_sync(result, meta)
+                    response = serialize_response_sync(result, meta, msgpack)
+
+                if timings is not None:
+                    now = time.perf_counter()
+                    timings.append(("serialize", now - phase_start))
+                    timings.append(("dispatch", now - dispatch_start))
 
             # Log response if logging enabled
             if logging_middleware and start_time is not None:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 # Response is usually a tuple (status, headers, body) but StreamingResponse is passed through
                 status_code = response[0] if isinstance(response, tuple) else 200
                 logging_middleware.log_response(request, status_code, duration)
@@ -1407,7 +1591,7 @@ class BoltAPI:
         except HTTPException as he:
             # Log exception if logging enabled
             if logging_middleware and start_time is not None:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 logging_middleware.log_response(request, he.status_code, duration)
 
             return self._handle_http_exception(he)
@@ -1,7 +1,15 @@
 from django.apps import AppConfig
+from django.conf import settings
+
+from .auth.user_cache import connect_signals
 
 
 class DjangoBoltConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "django_bolt"
     verbose_name = "Django Bolt"
+
+    def ready(self):
+        # Processes that only change users (admin, workers) still publish invalidations
+        if getattr(settings, "BOLT_USER_CACHE_TTL", 0) or getattr(settings, "BOLT_USER_CACHE_INVALIDATION", None):
+            connect_signals()
@@ -16,8 +16,11 @@ Performance: ~60k+ RPS with JWT validation happening entirely in Rust.
 
 from __future__ import annotations
 
+import json
+import os
 import sys
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -26,6 +29,32 @@ from django.contrib.auth import get_user_model
 from django.core.exceptions import ImproperlyConfigured
 
 from .revocation import create_revocation_handler
+from .revocation import revocation_sync as _revocation_sync
+
+# Algorithms accepted from a JWK set when none are configured (asymmetric only:
+# never verify with a public key as an HMAC secret)
+DEFAULT_JWKS_ALGORITHMS = ["RS256", "RS384", "RS512", "PS256", "PS384", "PS512", "ES256", "ES384", "EdDSA"]
+
+
+def _jwks_loader(source: str | os.PathLike | Callable[[], dict | str]) -> Callable[[], str]:
+    """Wrap a JWKS file path or callable into a function returning the set as JSON."""
+    if callable(source):
+
+        def load() -> str:
+            jwks = source()
+            if isinstance(jwks, bytes):
+                return jwks.decode()
+            return jwks if isinstance(jwks, str) else json.dumps(jwks)
+
+        return load
+
+    path = os.fspath(source)
+
+    def load() -> str:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+    return load
 
 
 @dataclass
@@ -104,6 +133,20 @@ class JWTAuthentication(BaseAuthentication):
         header: Header name to extract token from (default: "authorization")
         audience: Optional JWT audience claim to validate
         issuer: Optional JWT issuer claim to validate
+        jwks: JWK set to verify tokens with instead of ``secret``: a path to a JSON file
+            or a callable returning the set (dict or JSON). The key is picked by the
+            token's ``kid``; asymmetric algorithms are allowed by default.
+        jwks_refresh: Seconds between reloads of ``jwks``, for key rotation without a
+            restart (default: 300, 0 loads it once)
+        cache_size: Verified tokens remembered per process, so repeat requests with the
+            same token skip the signature check (default: 10000, 0 disables)
+        cache_ttl: Seconds a verified token is trusted before its signature is checked
+            again, never past its ``exp`` (default: 60, 0 disables)
+        revocation_store: RevocationStore checked for every token's ``jti``, in Rust.
+            Revocations made by this process apply immediately; others arrive with
+            the next sync.
+        revocation_sync: Seconds between syncs with ``revocation_store`` (default: 5,
+            0 syncs once at startup)
     """
 
     # Class-level cached User model - resolved once on first use
@@ -126,15 +169,30 @@ class JWTAuthentication(BaseAuthentication):
         revoked_token_handler: callable | None = None,
         revocation_store: Any | None = None,
         require_jti: bool = False,
+        cache_size: int = 10_000,
+        cache_ttl: int = 60,
+        jwks: str | os.PathLike | Callable[[], dict | str] | None = None,
+        jwks_refresh: int = 300,
+        revocation_sync: int = 5,
     ):
         self.secret = secret
-        self.algorithms = algorithms or ["HS256"]
+        self.algorithms = algorithms or (list(DEFAULT_JWKS_ALGORITHMS) if jwks is not None else ["HS256"])
         self.header = header
         self.audience = audience
         self.issuer = issuer
-
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.jwks = jwks
+        self.jwks_refresh = jwks_refresh
+        # One loader per backend: routes sharing this backend share its keys in Rust
+        self._jwks_loader = _jwks_loader(jwks) if jwks is not None else None
+
+        if jwks is not None:
+            if any(algorithm.startswith("HS") for algorithm in self.algorithms):
+                raise ImproperlyConfigured("JWTAuthentication with jwks only supports asymmetric algorithms.")
+            self.secret = self.secret or ""
         # If no secret provided, try to get Django's SECRET_KEY
-        if self.secret is None:
+        elif self.secret is None:
             try:
                 if not hasattr(settings, "SECRET_KEY"):
                     raise ImproperlyConfigured(
@@ -158,6 +216,9 @@ class JWTAuthentication(BaseAuthentication):
         # Revocation support (OPTIONAL - only checked if provided)
         self.revoked_token_handler = revoked_token_handler
         self.revocation_store = revocation_store
+        self.revocation_sync = revocation_sync
+        # One sync callable per backend, like the JWKS loader
+        self._revocation_sync = _revocation_sync(revocation_store) if revocation_store is not None else None
 
         # Auto-enable require_jti if revocation is configured
         if (revoked_token_handler or revocation_store) and not require_jti:
@@ -181,8 +242,18 @@ class JWTAuthentication(BaseAuthentication):
             "audience": self.audience,
             "issuer": self.issuer,
             "require_jti": self.require_jti,
+            "cache_size": self.cache_size,
+            "cache_ttl": self.cache_ttl,
+            "jwks_loader": self._jwks_loader,
+            "jwks_refresh": self.jwks_refresh,
         }
 
+        # Revocation store checked in Rust (its set is shared by backends using it)
+        if self.revocation_store is not None:
+            metadata["revocation_store_id"] = id(self.revocation_store)
+            metadata["revocation_sync"] = self._revocation_sync
+            metadata["revocation_sync_interval"] = self.revocation_sync
+
         # Add revocation handler reference (will be called from Rust if present)
         if self.revoked_token_handler:
             metadata["has_revocation_handler"] = True
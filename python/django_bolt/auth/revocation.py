@@ -3,13 +3,41 @@ Token revocation support for Django-Bolt.
 
 Provides flexible revocation strategies that users can choose based on their needs.
 Revocation is OPTIONAL - only checked if user provides a handler.
+
+Stores passed to ``JWTAuthentication(revocation_store=...)`` are checked in Rust:
+each process keeps the revoked JTIs in memory, filled by ``revoke()`` and synced
+from ``revoked_tokens()`` in the background, so checks never take the GIL.
 """
 
+import heapq
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
 from django.apps import apps
 from django.core.cache import caches
+from django.db import close_old_connections
+
+from django_bolt import _core
+
+# Log entries read per cache round trip when syncing DjangoCacheRevocation
+SYNC_BATCH_SIZE = 1000
+
+# DjangoCacheRevocation records the first log entry of every period this long, so a
+# full sync starts at the oldest entry that can still be live instead of entry 1
+LOG_CHECKPOINT_SECONDS = 3600
+
+# Revocations are kept this long when no TTL is given (longer than most refresh tokens)
+DEFAULT_REVOCATION_TTL = 86400 * 30
+
+# A revocation can become visible after later ones: a DjangoCacheRevocation log
+# position is taken before its entry is written, and a DjangoORMRevocation row is
+# stamped before its transaction commits. Syncs re-read this far behind their
+# cursor, so writes that land within it are not skipped
+SYNC_GRACE_SECONDS = 60
 
 
 class RevocationStore(ABC):
@@ -52,13 +80,57 @@ class RevocationStore(ABC):
         """
         raise NotImplementedError("This revocation store does not support revoke_all")
 
+    def revoked_tokens(self, cursor: Any = None) -> tuple[dict[str, float | None], Any]:
+        """
+        List revoked tokens, for the revocation set each process keeps in Rust.
+
+        Called from a background thread every ``revocation_sync`` seconds (sync, not
+        async). Stores that cannot list tokens leave this unimplemented; their
+        revocations then only reach the processes that call ``revoke()``.
+
+        Args:
+            cursor: None for all revoked tokens, otherwise the cursor returned by the
+                previous call (only tokens revoked since then are needed)
+
+        Returns:
+            (JTI -> expiry as a unix timestamp or None, next cursor). A None cursor
+            means the listing was complete and the next call lists everything again.
+        """
+        raise NotImplementedError("This revocation store cannot list revoked tokens")
+
+    def revoked_users(self) -> dict[str, float]:
+        """
+        List users whose tokens were revoked with ``revoke_all``, for the sync.
+
+        Returns:
+            user id -> unix timestamp; that user's tokens issued (``iat``) before it
+            are revoked. Empty for stores without ``revoke_all``.
+        """
+        return {}
+
+    def _revoked_here(self, jti: str, ttl: int | None = None) -> None:
+        """Make a revocation visible to this process's Rust-side checks right away."""
+        _core.revoke_token(id(self), jti, time.time() + ttl if ttl else None)
+
+    def _user_revoked_here(self, user_id: str, before: float) -> None:
+        """Make a ``revoke_all`` visible to this process's Rust-side checks right away."""
+        _core.revoke_user_tokens(id(self), user_id, before)
+
 
 class InMemoryRevocation(RevocationStore):
     """
-    Simple in-memory revocation store.
+    In-memory revocation store with expiry and a size cap.
+
+    Revocations expire after their ``ttl`` (``default_ttl`` when none is given).
+    Expiry times are kept in a min-heap: expired entries are dropped whenever the
+    store is used, including the periodic revocation sync of ``JWTAuthentication``.
+    Beyond ``max_entries``, the revocations closest to expiry are dropped first.
+
+    ``revoke_all(user_id)`` stores one watermark per user: that user's tokens
+    issued before the call are revoked (checked against their ``iat`` claim).
 
-    ⚠️  WARNING: Only works in single-process mode. Not suitable for production
-    with multiple workers. Use DjangoCacheRevocation for multi-process setups.
+    ⚠️  WARNING: Revocations stay in the process that made them. With multiple
+    workers, use DjangoCacheRevocation (or both, revoking in each).
 
     Good for:
     - Development
@@ -86,19 +158,78 @@ class InMemoryRevocation(RevocationStore):
         ```
     """
 
-    def __init__(self):
-        self._revoked: set[str] = set()
+    def __init__(self, max_entries: int = 100_000, default_ttl: int = DEFAULT_REVOCATION_TTL):
+        """
+        Initialize in-memory revocation.
+
+        Args:
+            max_entries: Maximum number of revoked tokens kept (default: 100000)
+            default_ttl: Seconds a revocation (or user watermark) is kept when no
+                ``ttl`` is given; at least the lifetime of your tokens (default: 30 days)
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._revoked: dict[str, float] = {}
+        # (expires_at, jti), including stale entries of JTIs revoked again
+        self._expiry: list[tuple[float, str]] = []
+        # user_id -> (revoked before, expires_at)
+        self._users: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
 
     async def is_revoked(self, jti: str) -> bool:
-        return jti in self._revoked
+        with self._lock:
+            self._purge(time.time())
+            return jti in self._revoked
 
     async def revoke(self, jti: str, ttl: int | None = None) -> None:
-        self._revoked.add(jti)
-        # TTL not supported in memory (would need background cleanup)
+        ttl = ttl or self.default_ttl
+        expires_at = time.time() + ttl
+        with self._lock:
+            self._revoked[jti] = expires_at
+            heapq.heappush(self._expiry, (expires_at, jti))
+            self._purge(time.time())
+            while len(self._revoked) > self.max_entries:
+                self._pop_soonest()
+            if len(self._expiry) > 2 * len(self._revoked) + 64:
+                # Mostly stale entries: rebuild the heap
+                self._expiry = [(expires, jti) for jti, expires in self._revoked.items()]
+                heapq.heapify(self._expiry)
+        self._revoked_here(jti, ttl)
+
+    async def revoke_all(self, user_id: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._users[str(user_id)] = (now, now + self.default_ttl)
+        self._user_revoked_here(str(user_id), now)
+
+    def revoked_tokens(self, cursor: Any = None) -> tuple[dict[str, float | None], Any]:
+        with self._lock:
+            self._purge(time.time())
+            return dict(self._revoked), None
+
+    def revoked_users(self) -> dict[str, float]:
+        now = time.time()
+        with self._lock:
+            self._users = {user: entry for user, entry in self._users.items() if entry[1] > now}
+            return {user: before for user, (before, _) in self._users.items()}
+
+    def _purge(self, now: float) -> None:
+        """Drop expired revocations (the lock is held)."""
+        while self._expiry and self._expiry[0][0] <= now:
+            self._pop_soonest()
+
+    def _pop_soonest(self) -> None:
+        expires_at, jti = heapq.heappop(self._expiry)
+        # Skip stale entries: the JTI was revoked again with another expiry
+        if self._revoked.get(jti) == expires_at:
+            del self._revoked[jti]
 
     def clear(self) -> None:
         """Clear all revoked tokens (useful for testing)."""
-        self._revoked.clear()
+        with self._lock:
+            self._revoked.clear()
+            self._expiry.clear()
+            self._users.clear()
 
 
 class DjangoCacheRevocation(RevocationStore):
@@ -116,6 +247,14 @@ class DjangoCacheRevocation(RevocationStore):
     ✅ Fast: Uses Django's cache framework (Redis ~50k ops/sec)
     ✅ Automatic cleanup: TTL handled by cache backend
 
+    Every revocation is also appended to a log (``<prefix>__seq__`` counter and
+    ``<prefix>log:<n>`` entries), which workers read incrementally to sync their
+    revocation sets. Use a backend with atomic ``incr`` (Redis, Memcached).
+    A log position whose entry is not written yet is read again on the next syncs
+    until an entry logged after it is ``SYNC_GRACE_SECONDS`` old.
+    Revocations are kept at most ``max_ttl`` seconds, so a worker starting up
+    only reads the log entries of the last ``max_ttl`` seconds.
+
     Example:
         ```python
         # settings.py
@@ -137,16 +276,21 @@ class DjangoCacheRevocation(RevocationStore):
         ```
     """
 
-    def __init__(self, cache_alias: str = "default", key_prefix: str = "revoked:"):
+    def __init__(
+        self, cache_alias: str = "default", key_prefix: str = "revoked:", max_ttl: int = DEFAULT_REVOCATION_TTL
+    ):
         """
         Initialize Django cache-based revocation.
 
         Args:
             cache_alias: Django cache alias to use (default: 'default')
             key_prefix: Prefix for cache keys (default: 'revoked:')
+            max_ttl: Longest time a revocation is kept; larger ``ttl`` values are
+                capped. At least the lifetime of your tokens (default: 30 days)
         """
         self.cache_alias = cache_alias
         self.key_prefix = key_prefix
+        self.max_ttl = max_ttl
         self._cache = None
 
     @property
@@ -163,9 +307,65 @@ class DjangoCacheRevocation(RevocationStore):
 
     async def revoke(self, jti: str, ttl: int | None = None) -> None:
         key = f"{self.key_prefix}{jti}"
-        # TTL defaults to 30 days (longer than most refresh tokens)
-        timeout = ttl or (86400 * 30)
+        timeout = min(ttl or DEFAULT_REVOCATION_TTL, self.max_ttl)
         self.cache.set(key, "1", timeout=timeout)
+        self._revoked_here(jti, timeout)
+
+        # Log entry for the other processes' sync
+        seq_key = f"{self.key_prefix}__seq__"
+        self.cache.add(seq_key, 0, timeout=None)
+        seq = self.cache.incr(seq_key)
+        now = time.time()
+        self.cache.set(f"{self.key_prefix}log:{seq}", (jti, now + timeout, now), timeout=timeout)
+        # Only the first entry of a period is recorded (add() keeps an existing key)
+        self.cache.add(
+            f"{self.key_prefix}__checkpoint__:{int(now // LOG_CHECKPOINT_SECONDS)}",
+            seq,
+            timeout=self.max_ttl + 2 * LOG_CHECKPOINT_SECONDS,
+        )
+
+    def revoked_tokens(self, cursor: Any = None) -> tuple[dict[str, float | None], Any]:
+        last = self.cache.get(f"{self.key_prefix}__seq__", 0)
+        if cursor is None or cursor > last:
+            # Full sync (or the counter went back: cache flushed)
+            first = self._first_live_entry(last)
+        else:
+            first = cursor + 1
+        revoked = {}
+        missing = []
+        # Missing entries up to here are expired, or were never written
+        settled = first - 1
+        horizon = time.time() - SYNC_GRACE_SECONDS
+        for start in range(first, last + 1, SYNC_BATCH_SIZE):
+            seqs = range(start, min(start + SYNC_BATCH_SIZE, last + 1))
+            entries = self.cache.get_many([f"{self.key_prefix}log:{seq}" for seq in seqs])
+            for seq in seqs:
+                entry = entries.get(f"{self.key_prefix}log:{seq}")
+                if entry is None:
+                    missing.append(seq)
+                    continue
+                revoked[entry[0]] = entry[1]
+                # Positions are taken in order, before their entry is written: every
+                # position before an entry logged over the grace period ago had time
+                # to be written (entries without a timestamp predate the grace period)
+                if len(entry) < 3 or entry[2] <= horizon:
+                    settled = seq
+        # Stop before the first entry that may still be written; the next sync reads it again
+        pending = next((seq for seq in missing if seq > settled), None)
+        return revoked, last if pending is None else pending - 1
+
+    def _first_live_entry(self, last: int) -> int:
+        """Log position of the oldest entry that can still be live (entries expire within max_ttl)."""
+        now_period = int(time.time() // LOG_CHECKPOINT_SECONDS)
+        oldest_period = now_period - self.max_ttl // LOG_CHECKPOINT_SECONDS - 1
+        keys = [f"{self.key_prefix}__checkpoint__:{period}" for period in range(oldest_period, now_period + 1)]
+        checkpoints = self.cache.get_many(keys).values()
+        if not checkpoints:
+            # Nothing revoked within max_ttl: every entry has expired
+            return last + 1
+        # Concurrent revokes can record a later entry as the first of its period:
+        # read one batch before the checkpoint as well
+        return max(1, min(checkpoints) - SYNC_BATCH_SIZE)
 
 
 class DjangoORMRevocation(RevocationStore):
@@ -244,9 +444,34 @@ class DjangoORMRevocation(RevocationStore):
         return await self.model.objects.filter(jti=jti).aexists()
 
     async def revoke(self, jti: str, ttl: int | None = None) -> None:
-        expires_at = datetime.now(UTC) + timedelta(seconds=ttl or 86400 * 30)
+        expires_at = datetime.now(UTC) + timedelta(seconds=ttl or DEFAULT_REVOCATION_TTL)
 
         await self.model.objects.aupdate_or_create(jti=jti, defaults={"expires_at": expires_at})
+        self._revoked_here(jti, ttl or DEFAULT_REVOCATION_TTL)
+
+    def revoked_tokens(self, cursor: Any = None) -> tuple[dict[str, float | None], Any]:
+        # Runs on the sync thread, outside any request: manage its connection like a request would
+        close_old_connections()
+        try:
+            return self._revoked_rows(cursor)
+        finally:
+            close_old_connections()
+
+    def _revoked_rows(self, cursor: Any) -> tuple[dict[str, float | None], Any]:
+        rows = self.model.objects.filter(expires_at__gt=datetime.now(UTC))
+        # With a revoked_at field, only rows added since the last sync are read
+        incremental = any(field.name == "revoked_at" for field in self.model._meta.get_fields())
+        if not incremental:
+            return {jti: expires_at.timestamp() for jti, expires_at in rows.values_list("jti", "expires_at")}, None
+        if cursor is not None:
+            # Rows stamped before the cursor may commit after it was read
+            rows = rows.filter(revoked_at__gte=cursor - timedelta(seconds=SYNC_GRACE_SECONDS))
+        revoked = {}
+        for jti, expires_at, revoked_at in rows.values_list("jti", "expires_at", "revoked_at"):
+            revoked[jti] = expires_at.timestamp()
+            cursor = revoked_at if cursor is None else max(cursor, revoked_at)
+        # Without rows yet, keep listing everything until there is a starting point
+        return revoked, cursor
 
 
 def create_revocation_handler(store: RevocationStore):
@@ -280,3 +505,24 @@ def create_revocation_handler(store: RevocationStore):
         return await store.is_revoked(jti)
 
     return handler
+
+
+def revocation_sync(
+    store: RevocationStore,
+) -> Callable[[Any], tuple[dict[str, float | None], Any, dict[str, float]] | None]:
+    """
+    Wrap ``store.revoked_tokens`` and ``store.revoked_users`` for the Rust-side
+    sync thread.
+
+    The wrapper returns None when the store cannot list revoked tokens, which
+    stops the sync (``revoke()`` in this process still takes effect).
+    """
+
+    def sync(cursor: Any) -> tuple[dict[str, float | None], Any, dict[str, float]] | None:
+        try:
+            revoked, cursor = store.revoked_tokens(cursor)
+        except NotImplementedError:
+            return None
+        return revoked, cursor, store.revoked_users()
+
+    return sync
@@ -0,0 +1,238 @@
+"""
+Per-process cache of user objects for request.user.
+
+Opt in with ``BOLT_USER_CACHE_TTL`` (seconds, default 0 = off). Users loaded for
+``request.user`` are kept per (backend, user_id) for that long, up to
+``BOLT_USER_CACHE_SIZE`` users (least recently used dropped first), so repeat
+requests of a user skip the database query and the user loader thread pool.
+
+Saving or deleting a user (``post_save`` / ``post_delete``) drops it from the
+cache of the process that made the change. To reach the other workers and
+nodes, set ``BOLT_USER_CACHE_INVALIDATION`` to a Django cache alias shared by
+all of them: changes are appended to a log in that cache, which every process
+polls in the background.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+
+__all__ = [
+    "DEFAULT_USER_CACHE_SIZE",
+    "UserCache",
+    "configure_user_cache",
+    "connect_signals",
+    "get_user_cache",
+    "invalidate_user",
+]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_CACHE_SIZE = 10_000
+
+# Seconds between polls of the invalidation log
+INVALIDATION_POLL_INTERVAL = 1.0
+
+INVALIDATION_KEY_PREFIX = "bolt-user-cache:"
+
+_SIGNAL_UID = "django_bolt.auth.user_cache"
+
+
+class UserCache:
+    """
+    Bounded LRU cache of user objects with a TTL.
+
+    The cache keeps its own shallow copy of each user and every hit returns
+    another one, so a handler changing ``request.user`` (including the request
+    that loaded it) does not change the object seen by other requests.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_size: int = DEFAULT_USER_CACHE_SIZE,
+        invalidation_cache: str | None = None,
+    ):
+        """
+        Initialize the user cache.
+
+        Args:
+            ttl: Seconds a loaded user is reused
+            max_size: Maximum number of cached users
+            invalidation_cache: Django cache alias for invalidations across
+                processes (default: None, this process only)
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.invalidation_cache = invalidation_cache
+        # (backend_name, user_id) -> (user, expires_at)
+        self._users: OrderedDict[tuple[str, str], tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation: a user loaded before one is not cached
+        self.generation = 0
+        self._stop = threading.Event()
+        self._poller: threading.Thread | None = None
+        if invalidation_cache is not None:
+            self._cursor = self._log_position()
+            self._poller = threading.Thread(
+                target=self._poll_invalidations, name="bolt-user-cache-invalidation", daemon=True
+            )
+            self._poller.start()
+
+    def get(self, backend_name: str | None, user_id: Any) -> Any | None:
+        """Return a copy of the cached user, or None."""
+        key = (backend_name or "", str(user_id))
+        with self._lock:
+            entry = self._users.get(key)
+            if entry is None:
+                return None
+            user, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._users[key]
+                return None
+            self._users.move_to_end(key)
+        return copy.copy(user)
+
+    def set(self, backend_name: str | None, user_id: Any, user: Any, generation: int | None = None) -> None:
+        """
+        Cache ``user`` (None is never cached: the next request retries).
+
+        With ``generation`` (read before loading the user), the user is only
+        cached if nothing was invalidated while it loaded.
+        """
+        if user is None:
+            return
+        key = (backend_name or "", str(user_id))
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._users[key] = (copy.copy(user), time.monotonic() + self.ttl)
+            self._users.move_to_end(key)
+            while len(self._users) > self.max_size:
+                self._users.popitem(last=False)
+
+    def discard(self, user_id: Any) -> None:
+        """Drop ``user_id`` (for every backend) from this process's cache."""
+        user_id = str(user_id)
+        with self._lock:
+            self.generation += 1
+            for key in [key for key in self._users if key[1] == user_id]:
+                del self._users[key]
+
+    def clear(self) -> None:
+        """Drop all cached users (useful for testing)."""
+        with self._lock:
+            self.generation += 1
+            self._users.clear()
+
+    def close(self) -> None:
+        """Stop polling for invalidations."""
+        self._stop.set()
+
+    def _log_position(self) -> int:
+        return caches[self.invalidation_cache].get(f"{INVALIDATION_KEY_PREFIX}seq", 0)
+
+    def _poll_invalidations(self) -> None:
+        cache = caches[self.invalidation_cache]
+        while not self._stop.wait(INVALIDATION_POLL_INTERVAL):
+            try:
+                last = self._log_position()
+                if last == self._cursor:
+                    continue
+                keys = [f"{INVALIDATION_KEY_PREFIX}log:{seq}" for seq in range(self._cursor + 1, last + 1)]
+                entries = cache.get_many(keys)
+                if last < self._cursor or len(entries) < len(keys):
+                    # Counter reset or entries gone: changes may have been missed
+                    self.clear()
+                else:
+                    for user_id in entries.values():
+                        self.discard(user_id)
+                self._cursor = last
+            except Exception:
+                logger.warning("Polling user cache invalidations failed", exc_info=True)
+
+
+_user_cache: UserCache | None = None
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def configure_user_cache(
+    ttl: float,
+    max_size: int = DEFAULT_USER_CACHE_SIZE,
+    invalidation_cache: str | None = None,
+) -> UserCache | None:
+    """
+    Replace the user cache of this process (``ttl=0`` turns it off).
+
+    Used from settings on first use; call it directly in tests or to change the
+    cache at runtime.
+    """
+    global _user_cache, _configured
+    with _configure_lock:
+        if _user_cache is not None:
+            _user_cache.close()
+        _user_cache = UserCache(ttl, max_size, invalidation_cache) if ttl > 0 else None
+        _configured = True
+    if _user_cache is not None:
+        connect_signals()
+    return _user_cache
+
+
+def get_user_cache() -> UserCache | None:
+    """Return the user cache of this process, or None when it is off."""
+    if not _configured:
+        configure_user_cache(
+            getattr(settings, "BOLT_USER_CACHE_TTL", 0),
+            getattr(settings, "BOLT_USER_CACHE_SIZE", DEFAULT_USER_CACHE_SIZE),
+            getattr(settings, "BOLT_USER_CACHE_INVALIDATION", None),
+        )
+    return _user_cache
+
+
+def invalidate_user(user_id: Any) -> None:
+    """
+    Drop ``user_id`` from the user cache, in every process when
+    ``BOLT_USER_CACHE_INVALIDATION`` is set.
+
+    Called on ``post_save`` / ``post_delete`` of the user model; call it
+    yourself after changes that skip signals (``QuerySet.update()``, raw SQL).
+    """
+    user_cache = _user_cache
+    if user_cache is not None:
+        user_cache.discard(user_id)
+        alias, ttl = user_cache.invalidation_cache, user_cache.ttl
+    else:
+        # Publish only (a process that changes users without serving them)
+        alias = getattr(settings, "BOLT_USER_CACHE_INVALIDATION", None)
+        ttl = getattr(settings, "BOLT_USER_CACHE_TTL", 0)
+    if alias is None:
+        return
+    cache = caches[alias]
+    seq_key = f"{INVALIDATION_KEY_PREFIX}seq"
+    cache.add(seq_key, 0, timeout=None)
+    seq = cache.incr(seq_key)
+    # Entries only matter while a cached copy can still be alive
+    timeout = max(60, int(ttl) * 2)
+    cache.set(f"{INVALIDATION_KEY_PREFIX}log:{seq}", str(user_id), timeout=timeout)
+
+
+def _user_changed(sender, instance, **kwargs) -> None:
+    invalidate_user(instance.pk)
+
+
+def connect_signals() -> None:
+    """Invalidate cached users when the user model is saved or deleted."""
+    User = get_user_model()
+    post_save.connect(_user_changed, sender=User, dispatch_uid=_SIGNAL_UID)
+    post_delete.connect(_user_changed, sender=User, dispatch_uid=_SIGNAL_UID)
@@ -4,17 +4,26 @@ User loading system for request.user
 Supports both eager and lazy loading strategies.
 Lazy loading (default): Uses SimpleLazyObject to defer DB query until first access
 Eager loading (optional): Loads user immediately at dispatch time
+
+With BOLT_USER_CACHE_TTL, loaded users are reused from a per-process cache
+(see user_cache).
 """
 
 from __future__ import annotations
 
 import asyncio
 import concurrent.futures
+import copy
 import inspect
+import warnings
+from functools import partial
 from typing import Any
 
 from django.contrib.auth import get_user_model
 
+from ..concurrency import sync_to_thread
+from .user_cache import get_user_cache
+
 # Global registry of auth backend instances for user resolution
 _auth_backend_registry: dict[str, Any] = {}
 
@@ -31,6 +40,13 @@ def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
     return _user_loader_executor
 
 
+# Async user loads in progress, by (event loop, backend, user_id)
+_inflight_loads: dict[tuple[int, str | None, str], asyncio.Task] = {}
+
+# Blocking request.user access from an async handler was reported
+_warned_sync_access = False
+
+
 def register_auth_backend(backend_name: str, backend_instance: Any) -> None:
     """
     Register an authentication backend instance for user resolution.
@@ -51,10 +67,13 @@ def get_registered_backend(backend_name: str) -> Any | None:
 
 async def load_user(user_id: str | None, backend_name: str | None, auth_context: dict | None = None) -> Any | None:
     """
-    Eagerly load user from auth context.
+    Load user from auth context without blocking the event loop.
 
-    Loads user immediately (not lazy). Suitable for authenticated endpoints
-    where user is always needed.
+    This is what ``await request.auser()`` runs. Database work happens on the
+    bolt thread pool (``sync_to_thread``), and concurrent loads of one user in
+    this process share a single query: each waiter gets its own copy of the
+    result. Backends are expected to return the same user for the same
+    ``user_id``, whatever the rest of ``auth_context``.
 
     Args:
         user_id: User identifier from auth context
@@ -67,18 +86,48 @@ async def load_user(user_id: str | None, backend_name: str | None, auth_context:
     if not user_id:
         return None
 
-    # Try to get registered backend with custom get_user method
+    user_cache = get_user_cache()
+    if user_cache is not None and (user := user_cache.get(backend_name, user_id)) is not None:
+        return user
+
+    loop = asyncio.get_running_loop()
+    key = (id(loop), backend_name, str(user_id))
+    task = _inflight_loads.get(key)
+    if task is None:
+        task = loop.create_task(_load_user_async(user_id, backend_name, auth_context, user_cache))
+        _inflight_loads[key] = task
+        task.add_done_callback(partial(_load_done, key))
+
+    # Shielded: a cancelled request must not cancel the load other requests wait for
+    user = await asyncio.shield(task)
+    # The loaded object is shared by every waiter: each request gets its own copy
+    return copy.copy(user) if user is not None else None
+
+
+async def _load_user_async(user_id: str, backend_name: str | None, auth_context: dict | None, user_cache) -> Any | None:
+    """Load user from its backend (or the Django ORM) in the order load_user_sync uses."""
+    generation = user_cache.generation if user_cache is not None else None
     backend = get_registered_backend(backend_name) if backend_name else None
 
-    # If backend has custom get_user, call it
-    if backend and hasattr(backend, "get_user"):
-        try:
-            return await backend.get_user(user_id, auth_context or {})
-        except Exception:
-            # User not found or backend error
-            raise
+    if backend and hasattr(backend, "get_user_sync"):
+        user = await sync_to_thread(backend.get_user_sync, user_id)
+    elif backend and hasattr(backend, "get_user"):
+        user = await backend.get_user(user_id, auth_context or {})
+    else:
+        User = get_user_model()
+        user = await sync_to_thread(User.objects.get, pk=user_id)
 
-    return None
+    if user_cache is not None:
+        user_cache.set(backend_name, user_id, user, generation)
+    return user
+
+
+def _load_done(key: tuple[int, str | None, str], task: asyncio.Task) -> None:
+    if _inflight_loads.get(key) is task:
+        del _inflight_loads[key]
+    # Mark the error as retrieved when every waiter was cancelled
+    if not task.cancelled():
+        task.exception()
 
 
 def load_user_sync(
@@ -91,7 +140,9 @@ def load_user_sync(
     Synchronously load user from auth context.
 
     This is the sync version used by SimpleLazyObject for lazy loading.
-    Handles thread pool wrapping for async contexts.
+    Handles thread pool wrapping for async contexts, where the event loop is
+    blocked until the user is loaded: async handlers should use
+    ``await request.auser()`` (warned about once per process).
 
     Args:
         user_id: User identifier from auth context
@@ -105,6 +156,35 @@ def load_user_sync(
     if not user_id:
         return None
 
+    global _warned_sync_access
+    if is_async_context and not _warned_sync_access:
+        _warned_sync_access = True
+        warnings.warn(
+            "request.user was loaded from an async handler, which blocks the event loop until "
+            "the database returns. Use `user = await request.auser()` instead.",
+            RuntimeWarning,
+            stacklevel=4,
+        )
+
+    user_cache = get_user_cache()
+    if user_cache is None:
+        return _load_user_sync(user_id, backend_name, auth_context, is_async_context)
+
+    user = user_cache.get(backend_name, user_id)
+    if user is None:
+        generation = user_cache.generation
+        user = _load_user_sync(user_id, backend_name, auth_context, is_async_context)
+        user_cache.set(backend_name, user_id, user, generation)
+    return user
+
+
+def _load_user_sync(
+    user_id: str,
+    backend_name: str | None,
+    auth_context: dict | None,
+    is_async_context: bool,
+) -> Any | None:
+    """Load user from its backend (or the Django ORM), bypassing the user cache."""
     # Try to get registered backend with custom get_user_sync method
     backend = get_registered_backend(backend_name) if backend_name else None
 
@@ -10,8 +10,10 @@ Inspired by Litestar's concurrency module.
 from __future__ import annotations
 
 import asyncio
+import contextvars
 from collections.abc import Callable
-from typing import TypeVar
+from functools import partial
+from typing import Any, TypeVar
 
 from typing_extensions import ParamSpec
 
@@ -20,6 +22,23 @@ __all__ = ("sync_to_thread",)
 P = ParamSpec("P")
 T = TypeVar("T")
 
+# (pending, running) Rust gauges behind bolt_executor_queue_depth / bolt_executor_busy_threads.
+# Set by django_bolt.metrics.enable_executor_metrics() when BOLT_METRICS is enabled.
+_executor_gauges = None
+
+# Wraps each call before it is submitted so the slow-request sampler can find the
+# worker thread running it. Set by django_bolt.slow_requests when BOLT_SLOW_REQUEST_MS is enabled.
+_thread_tracker = None
+
+
+def _run_counted(running, fn: Callable[[], Any]) -> Any:
+    """Run ``fn`` on the worker thread, counting it as busy."""
+    running.inc()
+    try:
+        return fn()
+    finally:
+        running.dec()
+
 
 async def sync_to_thread(fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
     """Run the synchronous callable ``fn`` asynchronously in a worker thread.
@@ -51,12 +70,27 @@ async def sync_to_thread(fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs)
         - Enables concurrent I/O across multiple sync handlers
         - Expected 40-60% RPS improvement for I/O-bound sync handlers
     """
-    # Copy current context to preserve request-scoped variables
-    # ctx = contextvars.copy_context()
+    # Copy current context to preserve request-scoped variables (e.g. the
+    # per-request query recorder used by BOLT_QUERY_STATS)
+    ctx = contextvars.copy_context()
 
     # Bind the context to the function call
-    # bound_fn = partial(ctx.run, fn, *args, **kwargs)
+    bound_fn = partial(ctx.run, fn, *args, **kwargs)
+    tracker = _thread_tracker
+    if tracker is not None:
+        bound_fn = tracker(bound_fn)
 
     # Run in default executor (thread pool)
     # None = use default executor (ThreadPoolExecutor with max_workers=min(32, cpu_count + 4))
-    return await asyncio.get_running_loop().run_in_executor(None, fn, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    gauges = _executor_gauges
+    if gauges is None:
+        return await loop.run_in_executor(None, bound_fn)
+
+    # Metrics enabled: pending - running = calls waiting for a worker
+    pending, running = gauges
+    pending.inc()
+    try:
+        return await loop.run_in_executor(None, partial(_run_counted, running, bound_fn))
+    finally:
+        pending.dec()
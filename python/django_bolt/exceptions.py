@@ -326,3 +326,22 @@ def parse_msgspec_decode_error(error: Exception, body_bytes: bytes) -> dict[str,
         "msg": error_msg,
         "input": body_bytes.decode("utf-8", errors="replace")[:100] if body_bytes else "",
     }
+
+
+def parse_msgpack_decode_error(error: Exception) -> dict[str, Any]:
+    """Build error details for a malformed MessagePack request body.
+
+    MessagePack is binary, so unlike parse_msgspec_decode_error there is no
+    line/column to report - only the decoder message.
+
+    Args:
+        error: The msgspec.DecodeError exception
+
+    Returns:
+        Dict with error details
+    """
+    return {
+        "type": "msgpack_invalid",
+        "loc": ("body",),
+        "msg": str(error),
+    }
@@ -52,6 +52,28 @@ class LoggingConfig:
     # Cookies to obfuscate in logs
     obfuscate_cookies: set[str] = field(default_factory=lambda: {"sessionid", "csrftoken"})
 
+    # Path/query parameter names to obfuscate in diagnostics (case-insensitive, "-" matches "_")
+    obfuscate_params: set[str] = field(
+        default_factory=lambda: {
+            "password",
+            "passwd",
+            "secret",
+            "client_secret",
+            "token",
+            "access_token",
+            "refresh_token",
+            "id_token",
+            "api_key",
+            "apikey",
+            "x_api_key",
+            "key",
+            "auth",
+            "code",
+            "signature",
+            "sig",
+        }
+    )
+
     # Log request body (be careful with sensitive data)
     log_request_body: bool = False
 
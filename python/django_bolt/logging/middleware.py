@@ -66,6 +66,20 @@ class LoggingMiddleware:
                 obfuscated[key] = value
         return obfuscated
 
+    def obfuscate_params(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Obfuscate sensitive path/query parameters by name.
+
+        Args:
+            params: Path or query parameters
+
+        Returns:
+            Parameters with sensitive values obfuscated
+        """
+        sensitive = self.config.obfuscate_params
+        return {
+            key: "***" if key.lower().replace("-", "_") in sensitive else value for key, value in params.items()
+        }
+
     def obfuscate_cookies(self, cookies: dict[str, str]) -> dict[str, str]:
         """Obfuscate sensitive cookies.
 
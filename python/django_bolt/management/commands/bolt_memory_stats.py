@@ -0,0 +1,107 @@
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+def format_bytes(size):
+    if size is None:
+        return "n/a"
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+class Command(BaseCommand):
+    help = "Show process and per-route memory stats from a running Django-Bolt server (requires BOLT_MEMORY_STATS)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--url",
+            default="http://127.0.0.1:8000/__bolt__/memory",
+            help="Memory stats endpoint registered with register_memory_stats_endpoint()",
+        )
+        parser.add_argument(
+            "--header",
+            action="append",
+            default=[],
+            help='Extra request header, e.g. --header "Authorization: Bearer <token>" (repeatable)',
+        )
+        parser.add_argument("--limit", type=int, default=20, help="Number of routes to show (default: 20)")
+        parser.add_argument("--json", action="store_true", help="Print the raw JSON response")
+        parser.add_argument("--reset", action="store_true", help="Clear the stats after reading them")
+
+    def handle(self, *args, **options):
+        url = options["url"]
+        if options["reset"]:
+            separator = "&" if urllib.parse.urlparse(url).query else "?"
+            url = f"{url}{separator}reset=true"
+
+        request = urllib.request.Request(url)
+        for header in options["header"]:
+            name, _, value = header.partition(":")
+            if not value:
+                raise CommandError(f"Invalid header {header!r}, expected 'Name: value'")
+            request.add_header(name.strip(), value.strip())
+
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                data = json.loads(response.read())
+        except (urllib.error.URLError, ValueError) as e:
+            raise CommandError(f"Could not fetch memory stats from {url}: {e}") from e
+
+        if options["json"]:
+            self.stdout.write(json.dumps(data, indent=2))
+            return
+
+        process = data["process"]
+        python = process["python"]
+        self.stdout.write(
+            f"PID {process['pid']}: RSS {format_bytes(process['rss_bytes'])} "
+            f"(peak {format_bytes(process['peak_rss_bytes'])}), "
+            f"{python['allocated_blocks']} Python blocks"
+            + (f", {format_bytes(python['traced_bytes'])} traced" if "traced_bytes" in python else "")
+        )
+        allocator = dict(process["allocator"])
+        name = allocator.pop("allocator")
+        details = ", ".join(
+            f"{key.removesuffix('_bytes')} {format_bytes(value)}" if key.endswith("_bytes") else f"{key} {value}"
+            for key, value in allocator.items()
+        )
+        self.stdout.write(f"Allocator: {name}" + (f" ({details})" if details else ""))
+        for generation, stats in enumerate(process["gc"]["generations"]):
+            line = (
+                f"GC gen {generation}: {stats['collections']} collections, "
+                f"{stats['collected']} collected, {stats['uncollectable']} uncollectable"
+            )
+            if "pauses" in stats:
+                line += f", pauses avg {stats['pause_total_ms'] / (stats['pauses'] or 1):.3f} ms"
+                line += f" max {stats['pause_max_ms']} ms"
+            self.stdout.write(line)
+
+        if not data.get("enabled"):
+            self.stdout.write(
+                self.style.WARNING("\nPer-route memory stats are disabled. Set BOLT_MEMORY_STATS = True.")
+            )
+            return
+
+        routes = list(data.get("routes", {}).items())[: options["limit"]]
+        if not routes:
+            self.stdout.write("\nNo requests sampled yet.")
+            return
+
+        self.stdout.write(f"\n{'ROUTE':<48} {'SAMPLES':>7} {'RETAINED':>11} {'AVG':>11} {'MAX':>11}")
+        for route, stats in routes:
+            line = (
+                f"{route[:48]:<48} {stats['samples']:>7} {format_bytes(stats['retained_bytes']):>11} "
+                f"{format_bytes(stats['avg_retained_bytes']):>11} {format_bytes(stats['max_retained_bytes']):>11}"
+            )
+            self.stdout.write(self.style.WARNING(line) if stats["avg_retained_bytes"] > 0 else line)
+            for site in stats["top_sites"][:3]:
+                self.stdout.write(f"    {format_bytes(site['bytes']):>11}  {site['site']}")
+
+        self.stdout.write(f"\nStats are per process; {data['sample_rate']:.1%} of requests are sampled.")
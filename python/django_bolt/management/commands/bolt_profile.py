@@ -0,0 +1,94 @@
+import json
+import os
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from django_bolt.profiler import (
+    DEFAULT_SAMPLE_INTERVAL,
+    PROFILE_FORMATS,
+    PROFILE_SIGNAL,
+    parse_duration,
+    profile_request_path,
+)
+
+
+class Command(BaseCommand):
+    help = "Profile the Python code of a running Django-Bolt worker (requires BOLT_PROFILER)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--pid", type=int, required=True, help="PID of the worker process to profile")
+        parser.add_argument("--duration", default="30s", help="How long to sample, e.g. 30s, 500ms, 2m (default: 30s)")
+        parser.add_argument(
+            "--interval",
+            default=f"{DEFAULT_SAMPLE_INTERVAL * 1000:g}ms",
+            help="Time between samples (default: %(default)s)",
+        )
+        parser.add_argument("--format", choices=PROFILE_FORMATS, default="collapsed", help="Output format")
+        parser.add_argument(
+            "--output",
+            help="Output file (default: bolt-profile-<pid>.collapsed or bolt-profile-<pid>.speedscope.json)",
+        )
+        parser.add_argument("--limit", type=int, default=10, help="Number of routes in the summary (default: 10)")
+
+    def handle(self, *args, **options):
+        pid = options["pid"]
+        try:
+            duration = parse_duration(options["duration"])
+            interval = parse_duration(options["interval"])
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+
+        extension = "speedscope.json" if options["format"] == "speedscope" else "collapsed"
+        output = os.path.abspath(options["output"] or f"bolt-profile-{pid}.{extension}")
+        if os.path.exists(output):
+            os.unlink(output)
+
+        # The worker reads its options from a file only its own user can write, then samples
+        request = {"duration": duration, "interval": interval, "format": options["format"], "output": output}
+        request_path = profile_request_path(pid)
+        fd = os.open(request_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(request, f)
+
+        try:
+            os.kill(pid, PROFILE_SIGNAL)
+        except ProcessLookupError as e:
+            os.unlink(request_path)
+            raise CommandError(f"No process with PID {pid}") from e
+        except PermissionError as e:
+            os.unlink(request_path)
+            raise CommandError(f"Not allowed to signal PID {pid} (run as the server's user)") from e
+
+        self.stdout.write(f"Profiling PID {pid} for {duration:g}s (one sample every {interval * 1000:g} ms)...")
+        deadline = time.monotonic() + duration + 10
+        while not os.path.exists(output):
+            if time.monotonic() > deadline:
+                raise CommandError(
+                    f"PID {pid} did not write a profile. Is it a runbolt worker started with BOLT_PROFILER = True?"
+                )
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError as e:
+                raise CommandError(f"PID {pid} exited while profiling") from e
+            time.sleep(0.2)
+
+        self.stdout.write(self.style.SUCCESS(f"Wrote {output}"))
+        if options["format"] == "speedscope":
+            self.stdout.write("Open it at https://www.speedscope.app")
+            return
+
+        # Summary: samples per route (the first frame of every collapsed stack)
+        routes = Counter()
+        with open(output) as f:
+            for line in f:
+                stack, _, count = line.rstrip("\n").rpartition(" ")
+                routes[stack.split(";", 1)[0]] += int(count)
+        total = sum(routes.values()) or 1
+        self.stdout.write(f"\n{'SAMPLES':>8} {'%':>6}  ROUTE")
+        for route, count in routes.most_common(options["limit"]):
+            self.stdout.write(f"{count:>8} {count * 100 / total:>6.1f}  {route}")
+        self.stdout.write(
+            "\nRender a flame graph with e.g. `flamegraph.pl` or `inferno-flamegraph`, or open it in speedscope."
+        )
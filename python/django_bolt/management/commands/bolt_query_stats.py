@@ -0,0 +1,72 @@
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Show per-route database query stats from a running Django-Bolt server (requires BOLT_QUERY_STATS)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--url",
+            default="http://127.0.0.1:8000/__bolt__/queries",
+            help="Query stats endpoint registered with register_query_stats_endpoint()",
+        )
+        parser.add_argument(
+            "--header",
+            action="append",
+            default=[],
+            help='Extra request header, e.g. --header "Authorization: Bearer <token>" (repeatable)',
+        )
+        parser.add_argument("--limit", type=int, default=20, help="Number of routes to show (default: 20)")
+        parser.add_argument("--json", action="store_true", help="Print the raw JSON response")
+        parser.add_argument("--reset", action="store_true", help="Clear the stats after reading them")
+
+    def handle(self, *args, **options):
+        url = options["url"]
+        if options["reset"]:
+            separator = "&" if urllib.parse.urlparse(url).query else "?"
+            url = f"{url}{separator}reset=true"
+
+        request = urllib.request.Request(url)
+        for header in options["header"]:
+            name, _, value = header.partition(":")
+            if not value:
+                raise CommandError(f"Invalid header {header!r}, expected 'Name: value'")
+            request.add_header(name.strip(), value.strip())
+
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                data = json.loads(response.read())
+        except (urllib.error.URLError, ValueError) as e:
+            raise CommandError(f"Could not fetch query stats from {url}: {e}") from e
+
+        if options["json"]:
+            self.stdout.write(json.dumps(data, indent=2))
+            return
+
+        if not data.get("enabled"):
+            self.stdout.write(self.style.WARNING("Query stats are disabled. Set BOLT_QUERY_STATS = True."))
+            return
+
+        routes = list(data.get("routes", {}).items())[: options["limit"]]
+        if not routes:
+            self.stdout.write("No requests recorded yet.")
+            return
+
+        self.stdout.write(f"{'ROUTE':<48} {'REQS':>7} {'AVG Q':>7} {'MAX Q':>6} {'AVG DB ms':>10} {'N+1':>5}")
+        for route, stats in routes:
+            line = (
+                f"{route[:48]:<48} {stats['requests']:>7} {stats['avg_queries']:>7} "
+                f"{stats['max_queries']:>6} {stats['avg_db_time_ms']:>10} {stats['n_plus_one_requests']:>5}"
+            )
+            self.stdout.write(self.style.WARNING(line) if stats["n_plus_one_requests"] else line)
+            for repeated in stats["repeated_queries"][:3]:
+                self.stdout.write(f"    {repeated['max_per_request']}x {repeated['sql'][:120]}")
+
+        self.stdout.write(
+            f"\nStats are per process; N+1 threshold: {data.get('n_plus_one_threshold')} identical queries per request."
+        )
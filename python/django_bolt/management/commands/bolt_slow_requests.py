@@ -0,0 +1,85 @@
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Dump recorded slow requests from a running Django-Bolt server (requires BOLT_SLOW_REQUEST_MS)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--url",
+            default="http://127.0.0.1:8000/__bolt__/slow-requests",
+            help="Slow requests endpoint registered with register_slow_requests_endpoint()",
+        )
+        parser.add_argument(
+            "--header",
+            action="append",
+            default=[],
+            help='Extra request header, e.g. --header "Authorization: Bearer <token>" (repeatable)',
+        )
+        parser.add_argument("--limit", type=int, default=20, help="Number of requests to show (default: 20)")
+        parser.add_argument("--no-stacks", action="store_true", help="Do not print the sampled stacks")
+        parser.add_argument("--json", action="store_true", help="Print the raw JSON response")
+        parser.add_argument("--reset", action="store_true", help="Clear the buffer after reading it")
+
+    def handle(self, *args, **options):
+        url = options["url"]
+        if options["reset"]:
+            separator = "&" if urllib.parse.urlparse(url).query else "?"
+            url = f"{url}{separator}reset=true"
+
+        request = urllib.request.Request(url)
+        for header in options["header"]:
+            name, _, value = header.partition(":")
+            if not value:
+                raise CommandError(f"Invalid header {header!r}, expected 'Name: value'")
+            request.add_header(name.strip(), value.strip())
+
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                data = json.loads(response.read())
+        except (urllib.error.URLError, ValueError) as e:
+            raise CommandError(f"Could not fetch slow requests from {url}: {e}") from e
+
+        if options["json"]:
+            self.stdout.write(json.dumps(data, indent=2))
+            return
+
+        if not data.get("enabled"):
+            self.stdout.write(self.style.WARNING("Slow request sampling is disabled. Set BOLT_SLOW_REQUEST_MS."))
+            return
+
+        records = data.get("requests", [])[: options["limit"]]
+        if not records:
+            self.stdout.write(f"No requests slower than {data.get('threshold_ms')} ms recorded yet.")
+            return
+
+        for record in records:
+            started = datetime.fromtimestamp(record["timestamp"]).isoformat(sep=" ", timespec="milliseconds")
+            status = record["status"] if record["status"] is not None else record["error"]
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{started}  {record['duration_ms']:.0f} ms  {record['method']} {record['path']}  "
+                    f"[{record['route']}] -> {status} (pid {record['pid']})"
+                )
+            )
+            for name in ("params", "query"):
+                if record[name]:
+                    self.stdout.write(f"    {name}: {record[name]}")
+            if record["phases_ms"]:
+                phases = ", ".join(f"{phase}={ms:.1f}ms" for phase, ms in record["phases_ms"].items())
+                self.stdout.write(f"    phases: {phases}")
+            if record["stack"] and not options["no_stacks"]:
+                self.stdout.write("    stack:")
+                for line in record["stack"].rstrip().splitlines():
+                    self.stdout.write(f"      {line}")
+
+        self.stdout.write(
+            f"\nRecords are per process; threshold: {data.get('threshold_ms')} ms, "
+            f"buffer: {data.get('capacity')} requests."
+        )
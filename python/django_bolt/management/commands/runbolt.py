@@ -1,6 +1,7 @@
 import contextlib
 import importlib
 import os
+import random
 import signal
 import sys
 
@@ -10,6 +11,15 @@ from django.core.management.base import BaseCommand, CommandError
 
 from django_bolt import _core
 from django_bolt.api import BoltAPI
+from django_bolt.metrics import create_shared_metrics_region
+from django_bolt.profiler import enable_profile_trigger
+from django_bolt.rate_limit import (
+    DEFAULT_LEASE_MS,
+    DEFAULT_SHARED_RATE_LIMIT_ENTRIES,
+    create_shared_rate_limit_region,
+    enable_rate_limit_store,
+    window_limited_routes,
+)
 
 try:
     from django.utils import autoreload
@@ -46,6 +56,24 @@ class Command(BaseCommand):
         parser.add_argument(
             "--keep-alive", type=int, default=None, help="HTTP keep-alive timeout in seconds (default: OS setting)"
         )
+        parser.add_argument(
+            "--max-requests",
+            type=int,
+            default=0,
+            help="Recycle a process after it served this many requests (default: 0, disabled)",
+        )
+        parser.add_argument(
+            "--max-requests-jitter",
+            type=int,
+            default=0,
+            help="Add a random 0..N to --max-requests per process so they do not recycle together (default: 0)",
+        )
+        parser.add_argument(
+            "--max-rss-mb",
+            type=int,
+            default=0,
+            help="Recycle a process once its resident memory exceeds this many MB (default: 0, disabled)",
+        )
 
     def handle(self, *args, **options):
         processes = options["processes"]
@@ -59,14 +87,34 @@ class Command(BaseCommand):
                 )
                 options["processes"] = 1
 
+            if self.recycling_enabled(options):
+                self.stdout.write(
+                    self.style.WARNING("[django-bolt] Dev mode enabled: ignoring --max-requests/--max-rss-mb")
+                )
+                options["max_requests"] = options["max_rss_mb"] = 0
+
             self.run_with_autoreload(options)
         else:
             # Production mode (current logic)
-            if processes > 1:
+            # Recycled processes are respawned by the master, so recycling always forks
+            if processes > 1 or self.recycling_enabled(options):
                 self.start_multiprocess(options)
             else:
                 self.start_single_process(options)
 
+    @staticmethod
+    def recycling_enabled(options):
+        return bool(options.get("max_requests") or options.get("max_rss_mb"))
+
+    @staticmethod
+    def set_recycle_env(options):
+        """Pass this process's recycling limits to Rust (jitter is drawn per process)."""
+        if options.get("max_requests"):
+            max_requests = options["max_requests"] + random.randint(0, max(options.get("max_requests_jitter") or 0, 0))
+            os.environ["DJANGO_BOLT_MAX_REQUESTS"] = str(max_requests)
+        if options.get("max_rss_mb"):
+            os.environ["DJANGO_BOLT_MAX_RSS_MB"] = str(options["max_rss_mb"])
+
     def run_with_autoreload(self, options):
         """Run server with auto-reload using Django's autoreload system"""
         if autoreload is None:
@@ -96,21 +144,45 @@ class Command(BaseCommand):
         processes = options["processes"]
         self.stdout.write(f"[django-bolt] Starting {processes} processes with SO_REUSEPORT")
 
-        # Store child PIDs for cleanup
-        child_pids = []
+        # Child PID -> process id, for cleanup and respawning recycled processes
+        child_pids = {}
+        recycling = self.recycling_enabled(options)
+
+        # Shared metrics region: every worker records into its own segment so any
+        # worker's metrics endpoint serves the totals of all processes
+        metrics_region = None
+        if getattr(settings, "BOLT_METRICS", False):
+            metrics_region = create_shared_metrics_region(processes)
+            os.environ["DJANGO_BOLT_METRICS_SHM"] = metrics_region
+            self.stdout.write(f"[django-bolt] Metrics shared across processes via {metrics_region}")
+
+        # Shared rate limit buckets: @rate_limit holds for all processes together
+        rate_limit_region = None
+        if getattr(settings, "BOLT_SHARED_RATE_LIMIT", False):
+            rate_limit_region = create_shared_rate_limit_region(
+                getattr(settings, "BOLT_SHARED_RATE_LIMIT_ENTRIES", DEFAULT_SHARED_RATE_LIMIT_ENTRIES)
+            )
+            os.environ["DJANGO_BOLT_RATE_LIMIT_SHM"] = rate_limit_region
+            self.stdout.write(f"[django-bolt] Rate limits shared across processes via {rate_limit_region}")
+
+        def remove_shared_regions():
+            for region in (metrics_region, rate_limit_region):
+                if region is not None:
+                    with contextlib.suppress(FileNotFoundError):
+                        os.unlink(region)
 
         def signal_handler(signum, frame):
             self.stdout.write("\n[django-bolt] Shutting down processes...")
-            for pid in child_pids:
+            for pid in list(child_pids):
                 with contextlib.suppress(ProcessLookupError):
                     os.kill(pid, signal.SIGTERM)
+            remove_shared_regions()
             sys.exit(0)
 
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
 
-        # Fork processes
-        for i in range(processes):
+        def fork_process(i):
             pid = os.fork()
             if pid == 0:
                 # Child process
@@ -120,23 +192,38 @@ class Command(BaseCommand):
                 sys.exit(0)
             else:
                 # Parent process
-                child_pids.append(pid)
+                child_pids[pid] = i
                 self.stdout.write(f"[django-bolt] Started process {i} (PID: {pid})")
 
+        # Fork processes
+        for i in range(processes):
+            fork_process(i)
+
         # Parent waits for children
         try:
             while True:
                 pid, status = os.wait()
                 self.stdout.write(f"[django-bolt] Process {pid} exited with status {status}")
-                if pid in child_pids:
-                    child_pids.remove(pid)
+                process_id = child_pids.pop(pid, None)
+                # A clean exit with recycling enabled is a process that hit its limit
+                # and drained its requests: replace it (siblings kept serving meanwhile)
+                if process_id is not None and recycling and os.waitstatus_to_exitcode(status) == 0:
+                    fork_process(process_id)
                 if not child_pids:
                     break
         except KeyboardInterrupt:
             pass
+        finally:
+            remove_shared_regions()
 
     def start_single_process(self, options, process_id=None, dev_mode=False):
         """Start a single process server"""
+        # On-demand profiler (bolt_profile --pid): must start before any other thread
+        # so that only its thread receives the profiling signal
+        profiler_enabled = getattr(settings, "BOLT_PROFILER", False)
+        if profiler_enabled:
+            enable_profile_trigger()
+
         # Setup Django logging once at server startup (one-shot, respects existing LOGGING)
         if setup_django_logging is not None:
             setup_django_logging()
@@ -227,6 +314,16 @@ class Command(BaseCommand):
         else:
             self.stdout.write(self.style.SUCCESS(f"[django-bolt] Found {len(merged_api._routes)} routes"))
 
+        # Sliding windows are counted per process: refuse to start rather than let
+        # a window admit window_limit per process when buckets are shared
+        if getattr(settings, "BOLT_SHARED_RATE_LIMIT", False) or getattr(settings, "BOLT_RATE_LIMIT_STORE", None):
+            windowed = window_limited_routes(merged_api)
+            if windowed:
+                raise CommandError(
+                    "@rate_limit(window_limit=...) is counted per process and can't be combined with "
+                    f"BOLT_SHARED_RATE_LIMIT or BOLT_RATE_LIMIT_STORE (routes: {', '.join(windowed)})"
+                )
+
         # Register routes with Rust
         rust_routes = []
         for method, path, handler_id, handler in merged_api._routes:
@@ -283,6 +380,9 @@ class Command(BaseCommand):
         if options.get("keep_alive") is not None:
             os.environ["DJANGO_BOLT_KEEP_ALIVE"] = str(options["keep_alive"])
 
+        # Worker recycling limits (enforced by Rust, the master respawns the process)
+        self.set_recycle_env(options)
+
         # Determine compression config (server-level in Actix)
         # Priority: Django setting > first API with compression config
         compression_config = None
@@ -301,6 +401,17 @@ class Command(BaseCommand):
         # CRITICAL: Must be called BEFORE starting server so backends are available for user loading
         merged_api._register_auth_backends()
 
+        # Cluster-wide rate limits: lease tokens from the configured store
+        # (per process: the refill thread does not survive fork)
+        rate_limit_store = getattr(settings, "BOLT_RATE_LIMIT_STORE", None)
+        if rate_limit_store is not None:
+            enable_rate_limit_store(rate_limit_store, getattr(settings, "BOLT_RATE_LIMIT_LEASE_MS", DEFAULT_LEASE_MS))
+
+        if profiler_enabled:
+            enable_profile_trigger(merged_api)
+            prefix = f"Process {process_id}: " if process_id is not None else ""
+            self.stdout.write(f"[django-bolt] {prefix}Profile with `manage.py bolt_profile --pid {os.getpid()}`")
+
         # Start the server (all handlers go through async dispatch with thread pool for sync)
         _core.start_server_async(
             merged_api._dispatch,
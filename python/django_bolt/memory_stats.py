@@ -0,0 +1,329 @@
+"""Per-route memory instrumentation and process memory stats.
+
+Opt-in with ``BOLT_MEMORY_STATS = True`` in Django settings. When enabled:
+
+- ``tracemalloc`` traces Python allocations (``BOLT_MEMORY_TRACE_FRAMES``
+  frames per allocation, default 1)
+- A fraction of requests (``BOLT_MEMORY_SAMPLE_RATE``, default 0.01) is sampled:
+  a tracemalloc snapshot is taken before and after the request, and the
+  difference is aggregated per ``handler_id`` as net bytes retained and the
+  allocation sites that grew the most
+- Garbage collector pauses are timed per generation through ``gc.callbacks``
+
+Only one request is sampled at a time, but tracemalloc is process-wide, so
+allocations of requests running concurrently with a sampled one are included
+in its diff. Routes that keep retaining memory across many samples are the
+ones to look at. Taking a snapshot walks every traced block, so keep the
+sample rate low under heavy traffic; tracing itself slows allocations down.
+
+Process stats (RSS, Python heap, GC counts and pauses, and the statistics of
+the Rust global allocator, mimalloc or jemalloc) are exposed together with the
+per-route stats through ``register_memory_stats_endpoint()`` and the
+``bolt_memory_stats`` management command. Stats are per process.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any
+
+from django_bolt import _core
+
+from .auth.guards import IsStaff
+
+__all__ = [
+    "MemoryStatsCollector",
+    "enable_memory_stats",
+    "get_memory_stats",
+    "process_memory_stats",
+    "register_memory_stats_endpoint",
+]
+
+# Defaults for BOLT_MEMORY_SAMPLE_RATE / BOLT_MEMORY_TRACE_FRAMES
+DEFAULT_MEMORY_SAMPLE_RATE = 0.01
+DEFAULT_TRACE_FRAMES = 1
+
+# Allocation sites kept per route (the largest growth)
+MAX_SITES_PER_ROUTE = 10
+
+# Allocations of the instrumentation itself are left out of the diffs
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class MemorySample:
+    """Tracemalloc state captured when a sampled request starts."""
+
+    __slots__ = ("snapshot", "traced")
+
+    def __init__(self, snapshot: tracemalloc.Snapshot, traced: int) -> None:
+        self.snapshot = snapshot
+        self.traced = traced
+
+
+class RouteMemoryStats:
+    """Aggregated memory stats for one route."""
+
+    __slots__ = ("samples", "retained", "max_retained", "allocated", "sites")
+
+    def __init__(self) -> None:
+        self.samples = 0
+        # Net traced bytes after - before, summed over samples
+        self.retained = 0
+        self.max_retained = 0
+        # Growth of the allocation sites that grew, summed over samples
+        self.allocated = 0
+        # "file:line" -> growth summed over samples
+        self.sites: dict[str, int] = {}
+
+    def to_dict(self) -> dict[str, Any]:
+        samples = self.samples or 1
+        sites = sorted(self.sites.items(), key=lambda item: item[1], reverse=True)
+        return {
+            "samples": self.samples,
+            "retained_bytes": self.retained,
+            "avg_retained_bytes": round(self.retained / samples),
+            "max_retained_bytes": self.max_retained,
+            "avg_allocated_bytes": round(self.allocated / samples),
+            "top_sites": [{"site": site, "bytes": size} for site, size in sites],
+        }
+
+
+class GCPauseStats:
+    """Garbage collector pauses of one generation."""
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "pauses": self.count,
+            "pause_total_ms": round(self.total * 1000, 3),
+            "pause_max_ms": round(self.max * 1000, 3),
+        }
+
+
+class MemoryStatsCollector:
+    """Samples per-request tracemalloc diffs per handler_id and times GC pauses."""
+
+    def __init__(
+        self,
+        sample_rate: float = DEFAULT_MEMORY_SAMPLE_RATE,
+        trace_frames: int = DEFAULT_TRACE_FRAMES,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.trace_frames = trace_frames
+        self._routes: dict[int | None, RouteMemoryStats] = {}
+        self._lock = threading.Lock()
+        # Held while a sampled request is in flight (one sample at a time)
+        self._sampling = threading.Lock()
+        self._gc_pauses = [GCPauseStats() for _ in range(3)]
+        self._gc_started: float | None = None
+
+    def install(self) -> None:
+        """Start tracemalloc (unless already tracing) and register the GC pause callback."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+        if self._gc_callback not in gc.callbacks:
+            gc.callbacks.append(self._gc_callback)
+
+    def uninstall(self) -> None:
+        """Stop tracemalloc and remove the GC pause callback."""
+        tracemalloc.stop()
+        if self._gc_callback in gc.callbacks:
+            gc.callbacks.remove(self._gc_callback)
+
+    def _gc_callback(self, phase: str, info: dict[str, Any]) -> None:
+        if phase == "start":
+            self._gc_started = time.perf_counter()
+            return
+        if self._gc_started is None:
+            return
+        pause = time.perf_counter() - self._gc_started
+        self._gc_started = None
+        stats = self._gc_pauses[info["generation"]]
+        stats.count += 1
+        stats.total += pause
+        if pause > stats.max:
+            stats.max = pause
+
+    def start_request(self) -> MemorySample | None:
+        """Begin sampling the current request, or return None when it is not sampled."""
+        if random.random() >= self.sample_rate or not tracemalloc.is_tracing():
+            return None
+        if not self._sampling.acquire(blocking=False):
+            return None
+        return MemorySample(tracemalloc.take_snapshot(), tracemalloc.get_traced_memory()[0])
+
+    def finish_request(self, handler_id: int | None, sample: MemorySample | None) -> None:
+        """Fold a sampled request's allocations into its route stats."""
+        if sample is None:
+            return
+        try:
+            traced = tracemalloc.get_traced_memory()[0]
+            after = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+            diffs = after.compare_to(sample.snapshot.filter_traces(_SNAPSHOT_FILTERS), "lineno")
+        finally:
+            self._sampling.release()
+
+        retained = traced - sample.traced
+        grown = {}
+        for diff in diffs:
+            if diff.size_diff <= 0:
+                continue
+            frame = diff.traceback[0]
+            grown[f"{frame.filename}:{frame.lineno}"] = diff.size_diff
+
+        with self._lock:
+            stats = self._routes.get(handler_id)
+            if stats is None:
+                stats = self._routes[handler_id] = RouteMemoryStats()
+            stats.samples += 1
+            stats.retained += retained
+            stats.max_retained = max(stats.max_retained, retained)
+            stats.allocated += sum(grown.values())
+            for site, size in grown.items():
+                stats.sites[site] = stats.sites.get(site, 0) + size
+            if len(stats.sites) > MAX_SITES_PER_ROUTE:
+                largest = sorted(stats.sites.items(), key=lambda item: item[1], reverse=True)
+                stats.sites = dict(largest[:MAX_SITES_PER_ROUTE])
+
+    def snapshot(self, labels: dict[int, str] | None = None) -> dict[str, Any]:
+        """Return per-route stats, keyed by route label (or handler_id), most retained first.
+
+        Args:
+            labels: Optional handler_id -> "METHOD /path" mapping
+        """
+        labels = labels or {}
+        with self._lock:
+            items = [(handler_id, stats.to_dict()) for handler_id, stats in self._routes.items()]
+        items.sort(key=lambda item: item[1]["retained_bytes"], reverse=True)
+        return {labels.get(handler_id, str(handler_id)): stats for handler_id, stats in items}
+
+    def gc_pauses(self) -> list[dict[str, Any]]:
+        """Return GC pause stats per generation."""
+        return [stats.to_dict() for stats in self._gc_pauses]
+
+    def reset(self) -> None:
+        """Drop all collected route stats and GC pauses."""
+        with self._lock:
+            self._routes.clear()
+            self._gc_pauses = [GCPauseStats() for _ in range(3)]
+
+
+def _rss_bytes() -> int | None:
+    """Current resident set size (Linux only, None elsewhere)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _peak_rss_bytes() -> int | None:
+    """Peak resident set size (None where the resource module is unavailable)."""
+    try:
+        import resource  # noqa: PLC0415 - Unix only
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def process_memory_stats(collector: MemoryStatsCollector | None = None) -> dict[str, Any]:
+    """Return RSS, Python heap, GC and allocator stats of this process.
+
+    Args:
+        collector: Collector providing GC pause times (omitted when None)
+    """
+    python: dict[str, Any] = {"allocated_blocks": sys.getallocatedblocks()}
+    if tracemalloc.is_tracing():
+        traced, peak = tracemalloc.get_traced_memory()
+        python["traced_bytes"] = traced
+        python["traced_peak_bytes"] = peak
+
+    generations = []
+    for generation, stats in enumerate(gc.get_stats()):
+        generations.append(dict(stats))
+        if collector is not None:
+            generations[generation].update(collector.gc_pauses()[generation])
+
+    return {
+        "pid": os.getpid(),
+        "rss_bytes": _rss_bytes(),
+        "peak_rss_bytes": _peak_rss_bytes(),
+        "python": python,
+        "gc": {
+            "counts": list(gc.get_count()),
+            "thresholds": list(gc.get_threshold()),
+            "generations": generations,
+        },
+        "allocator": _core.allocator_stats(),
+    }
+
+
+# Process-wide collector (created by enable_memory_stats)
+_collector: MemoryStatsCollector | None = None
+
+
+def enable_memory_stats(
+    sample_rate: float = DEFAULT_MEMORY_SAMPLE_RATE,
+    trace_frames: int = DEFAULT_TRACE_FRAMES,
+) -> MemoryStatsCollector:
+    """Create (once) and install the process-wide memory stats collector."""
+    global _collector
+    if _collector is None:
+        _collector = MemoryStatsCollector(sample_rate, trace_frames)
+        _collector.install()
+    else:
+        _collector.sample_rate = sample_rate
+    return _collector
+
+
+def get_memory_stats() -> MemoryStatsCollector | None:
+    """Return the process-wide collector, or None when instrumentation is disabled."""
+    return _collector
+
+
+def register_memory_stats_endpoint(api: Any, path: str = "/__bolt__/memory", **route_kwargs: Any) -> None:
+    """Register a GET endpoint returning this process's memory stats.
+
+    Process stats are always returned; per-route stats and GC pauses require
+    ``BOLT_MEMORY_STATS``. The stats include allocation sites (source paths)
+    and ``?reset=1`` clears them, so the endpoint is guarded with ``IsStaff()``
+    unless ``guards=[...]`` is passed (pair it with ``auth=[...]`` or the API's
+    default authentication).
+
+    Args:
+        api: BoltAPI instance
+        path: Endpoint path
+        **route_kwargs: Extra arguments for ``api.get`` (guards, auth, tags, ...)
+    """
+
+    async def memory_stats_handler(reset: bool = False) -> dict[str, Any]:
+        collector = get_memory_stats()
+        process = process_memory_stats(collector)
+        if collector is None:
+            return {"enabled": False, "process": process, "routes": {}}
+        routes = collector.snapshot({handler_id: api._route_label(handler_id) for handler_id in api._handlers})
+        if reset:
+            collector.reset()
+        return {"enabled": True, "sample_rate": collector.sample_rate, "process": process, "routes": routes}
+
+    route_kwargs.setdefault("guards", [IsStaff()])
+    api.get(path, **route_kwargs)(memory_stats_handler)
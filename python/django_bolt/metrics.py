@@ -0,0 +1,123 @@
+"""Prometheus metrics.
+
+Opt-in with ``BOLT_METRICS = True`` in Django settings. The Rust server then
+records per-route request counts and latency histograms (by status), in-flight
+requests and rate-limit rejections, and serves them in the Prometheus text
+format at ``BOLT_METRICS_PATH`` (default: ``/metrics``) together with WebSocket
+connections, sync streaming threads and the sync handler executor queue. The
+endpoint is rendered entirely in Rust, so scrapes never take the GIL or wait for
+the event loop.
+
+Application code can add its own series. Updating them is a single atomic
+operation in Rust, cheap enough for hot paths::
+
+    from django_bolt.metrics import counter, gauge
+
+    orders_created = counter("shop_orders_created_total", "Orders created")
+    queue_size = gauge("shop_queue_size", "Jobs waiting", labels={"queue": "emails"})
+
+    orders_created.inc()
+    queue_size.set(12)
+
+With ``runbolt --processes N`` the master creates a shared memory region and
+every worker records its request metrics into its own segment with atomic adds,
+so whichever worker answers a scrape reports the totals of all processes.
+Custom counters and gauges stay per process.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from typing import Any
+
+from django_bolt import _core
+
+from . import concurrency
+
+__all__ = [
+    "DEFAULT_METRICS_PATH",
+    "counter",
+    "create_shared_metrics_region",
+    "enable_executor_metrics",
+    "gauge",
+    "render_metrics",
+    "render_shared_metrics",
+    "reset_metrics",
+]
+
+DEFAULT_METRICS_PATH = "/metrics"
+
+
+def counter(name: str, documentation: str = "", labels: dict[str, str] | None = None) -> Any:
+    """Register (or return the existing) counter series.
+
+    Args:
+        name: Metric name (``[a-zA-Z_:][a-zA-Z0-9_:]*``)
+        documentation: HELP text
+        labels: Constant labels identifying this series
+
+    Returns:
+        A counter with ``inc(amount=1)`` and a ``value`` property
+
+    Raises:
+        ValueError: Invalid name/label, or ``name`` is already registered as a gauge
+    """
+    return _core.register_counter(name, documentation, labels)
+
+
+def gauge(name: str, documentation: str = "", labels: dict[str, str] | None = None) -> Any:
+    """Register (or return the existing) gauge series.
+
+    Returns:
+        A gauge with ``set(value)``, ``inc(amount=1.0)``, ``dec(amount=1.0)`` and a ``value`` property
+
+    Raises:
+        ValueError: Invalid name/label, or ``name`` is already registered as a counter
+    """
+    return _core.register_gauge(name, documentation, labels)
+
+
+def enable_executor_metrics() -> None:
+    """Track sync_to_thread calls for the executor queue depth and busy thread gauges."""
+    concurrency._executor_gauges = _core.executor_gauges()
+
+
+def render_metrics() -> str:
+    """Return the metrics in the Prometheus text format (same as the endpoint).
+
+    In a worker attached to a shared region this is the merged view of all workers.
+    """
+    return _core.render_metrics()
+
+
+def create_shared_metrics_region(processes: int) -> str:
+    """Create the shared metrics file for ``processes`` workers and return its path.
+
+    The file lives in ``/dev/shm`` when available (so it never hits the disk).
+    Workers attach to it through the ``DJANGO_BOLT_METRICS_SHM`` environment variable;
+    the caller is responsible for deleting it.
+    """
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    fd, path = tempfile.mkstemp(prefix="django-bolt-metrics-", dir=directory)
+    os.close(fd)
+    try:
+        _core.create_shared_metrics(path, processes)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+
+def render_shared_metrics(path: str) -> str:
+    """Render the merged metrics of a shared region from any process (e.g. the runbolt master).
+
+    Route labels are only known to processes that registered the routes; other
+    processes label series by ``handler_id``.
+    """
+    return _core.render_shared_metrics(path)
+
+
+def reset_metrics() -> None:
+    """Drop recorded request metrics (registered counters and gauges are kept)."""
+    _core.reset_metrics()
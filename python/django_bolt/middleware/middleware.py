@@ -391,7 +391,15 @@ def middleware(*args, **kwargs):
     return decorator
 
 
-def rate_limit(rps: int = 100, burst: int | None = None, key: str = "ip"):
+def rate_limit(
+    rps: int = 100,
+    burst: int | None = None,
+    key: str = "ip",
+    cost: int = 1,
+    window_limit: int | None = None,
+    window: int | None = None,
+    scope: str | None = None,
+):
     """
     Rate limiting decorator (Rust-accelerated).
 
@@ -399,21 +407,66 @@ def rate_limit(rps: int = 100, burst: int | None = None, key: str = "ip"):
     No Python overhead in the hot path.
 
     Args:
-        rps: Requests per second limit
+        rps: Requests per second limit (tokens added per second)
         burst: Burst capacity (defaults to 2x rps)
-        key: Rate limit key strategy ("ip", "user", "api_key", or header name)
+        key: Rate limit key strategy ("ip", "user", or header name). "user" keys by the
+            authenticated user id (checked after authentication, IP for anonymous requests)
+        cost: Tokens taken by one request, to weigh expensive routes (defaults to 1)
+        window_limit: Units allowed per sliding ``window``, on top of the token bucket
+        window: Sliding window length in seconds (required with ``window_limit``)
+        scope: Share the buckets with every route limited with the same scope (use the
+            same rps/burst/window on all of them)
+
+    Window counts are kept per process, so ``runbolt`` refuses to start when a route
+    has a window and ``BOLT_SHARED_RATE_LIMIT`` or ``BOLT_RATE_LIMIT_STORE`` is set.
+
+    Each process tracks up to 100,000 keys. While that table is full, new keys of a
+    route share one overflow bucket (with the route's rps/burst) until idle keys are
+    evicted: memory stays bounded during a flood of distinct keys, but legitimate new
+    clients are limited together with the flood meanwhile. Known keys are unaffected.
 
     Example:
         @api.get("/api/data")
         @rate_limit(rps=1000, burst=2000, key="ip")
         async def get_data(request: Request) -> dict:
             return {"data": [...]}
+
+        # One budget per user for both routes: an export counts as 50 units
+        @api.get("/api/items")
+        @rate_limit(rps=10, burst=100, key="user", scope="api")
+        async def list_items(request: Request) -> dict:
+            ...
+
+        @api.get("/api/export")
+        @rate_limit(rps=10, burst=100, key="user", scope="api", cost=50)
+        async def export(request: Request) -> dict:
+            ...
     """
+    burst = burst or rps * 2
+    if cost < 1:
+        raise ValueError("rate_limit cost must be at least 1")
+    if cost > burst:
+        raise ValueError(f"rate_limit cost ({cost}) exceeds burst ({burst}): requests would never pass")
+    if (window_limit is None) != (window is None):
+        raise ValueError("rate_limit window_limit and window must be given together")
+    if window_limit is not None and (window < 1 or cost > window_limit):
+        raise ValueError("rate_limit window must be at least 1 second and window_limit at least cost")
 
     def decorator(func):
         if not hasattr(func, "__bolt_middleware__"):
             func.__bolt_middleware__ = []
-        func.__bolt_middleware__.append({"type": "rate_limit", "rps": rps, "burst": burst or rps * 2, "key": key})
+        func.__bolt_middleware__.append(
+            {
+                "type": "rate_limit",
+                "rps": rps,
+                "burst": burst,
+                "key": key,
+                "cost": cost,
+                "window_limit": window_limit,
+                "window": window,
+                "scope": scope,
+            }
+        )
         return func
 
     return decorator
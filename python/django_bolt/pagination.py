@@ -21,17 +21,25 @@ Example (Class-Based View):
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import inspect
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from functools import wraps
-from typing import Any, TypeVar, get_args, get_origin
+from typing import Any, Literal, TypeVar, get_args, get_origin
 
 import msgspec
 from asgiref.sync import sync_to_async
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.signing import BadSignature, Signer
+from django.db import connections
+from django.db.models import BooleanField, F, Func, Q, Value
+from django.db.models.query import ModelIterable, ValuesIterable
 
 from . import _json
+from .concurrency import sync_to_thread
 
 __all__ = [
     "PaginationBase",
@@ -41,10 +49,62 @@ __all__ = [
     "PaginatedResponse",
     "paginate",
     "extract_pagination_item_type",
+    "clear_count_cache",
 ]
 
 T = TypeVar("T")
 
+# Process-local count cache shared by all paginators:
+# (db alias, count SQL, params) -> (total, estimated, expires_at)
+_COUNT_CACHE: dict[tuple[Any, ...], tuple[int, bool, float]] = {}
+_COUNT_CACHE_MAX_ENTRIES = 1024
+
+
+def _is_django_queryset(queryset: Any) -> bool:
+    """Duck-type check for a Django QuerySet (avoids isinstance on lists/iterables)."""
+    return hasattr(queryset, "_iterable_class") and hasattr(queryset, "model")
+
+
+def _count_cache_key(queryset: Any) -> tuple[Any, ...] | None:
+    """Build a count cache key from the queryset's compiled SQL and params.
+
+    Returns None when the query can't be compiled (e.g. ``.none()``) or the
+    params aren't hashable - such querysets are simply not cached.
+    """
+    try:
+        sql, params = queryset.query.get_compiler(using=queryset.db).as_sql()
+        key = (queryset.db, sql, tuple(params))
+        hash(key)
+    except Exception:
+        return None
+    return key
+
+
+def _planner_estimate(queryset: Any) -> int | None:
+    """Return the query planner's row estimate for a queryset.
+
+    Only PostgreSQL exposes a cheap, reliable estimate (``EXPLAIN`` plan rows);
+    other backends return None so callers fall back to an exact count.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    try:
+        sql, params = queryset.query.get_compiler(using=queryset.db).as_sql()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+    except Exception:
+        return None
+    if isinstance(plan, (str, bytes)):
+        plan = _json.decode(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def clear_count_cache() -> None:
+    """Drop all cached pagination counts (e.g. after bulk imports or deletes)."""
+    _COUNT_CACHE.clear()
+
 
 class PaginatedResponse[T](msgspec.Struct, omit_defaults=True):
     """
@@ -65,6 +125,7 @@ class PaginatedResponse[T](msgspec.Struct, omit_defaults=True):
         total_pages: Total number of pages
         next_page: Next page number (None if no next page)
         previous_page: Previous page number (None if no previous page)
+        total_estimated: True when total is a planner estimate (count_mode="estimated")
     """
 
     # Required fields (always included in response)
@@ -88,6 +149,9 @@ class PaginatedResponse[T](msgspec.Struct, omit_defaults=True):
     next_cursor: str | None = None
     previous_cursor: str | None = None
 
+    # Set when total comes from the query planner instead of COUNT(*)
+    total_estimated: bool | None = None
+
 
 def extract_pagination_item_type(response_type: Any) -> type | None:
     """
@@ -141,6 +205,21 @@ class PaginationBase(ABC):
     # Serializer class for item serialization (set at runtime by paginate wrapper)
     serializer_class: type | None = None
 
+    # Issue the COUNT and the page query concurrently (Django QuerySets only, opt-in).
+    # Each query runs on its own worker thread, and therefore its own database
+    # connection: it holds a second connection per request and runs outside any
+    # atomic() block of the caller, so it does not see uncommitted writes.
+    concurrent_count: bool = False
+
+    # Cache counts per (SQL, params) for this many seconds (None disables caching)
+    count_cache_ttl: float | None = None
+
+    # "exact" always runs COUNT(*). "estimated" uses the query planner's row
+    # estimate when it is at least estimate_threshold rows (PostgreSQL only;
+    # other backends fall back to an exact count).
+    count_mode: Literal["exact", "estimated"] = "exact"
+    estimate_threshold: int = 100_000
+
     @abstractmethod
     async def get_page_params(self, request: dict[str, Any]) -> dict[str, Any]:
         """
@@ -194,6 +273,84 @@ class PaginationBase(ABC):
         else:
             return len(queryset)
 
+    def _count_queryset_sync(self, queryset: Any) -> tuple[int, bool]:
+        """
+        Count a Django QuerySet honouring count_cache_ttl and count_mode.
+
+        Runs synchronously (on a worker thread).
+
+        Args:
+            queryset: Django QuerySet
+
+        Returns:
+            Tuple of (total, estimated)
+        """
+        key = None
+        if self.count_cache_ttl is not None:
+            key = _count_cache_key(queryset)
+            if key is not None:
+                cached = _COUNT_CACHE.get(key)
+                if cached is not None and cached[2] > time.monotonic():
+                    return cached[0], cached[1]
+
+        total = None
+        estimated = False
+        if self.count_mode == "estimated":
+            estimate = _planner_estimate(queryset)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                total, estimated = estimate, True
+        if total is None:
+            total = queryset.count()
+
+        if key is not None:
+            if len(_COUNT_CACHE) >= _COUNT_CACHE_MAX_ENTRIES:
+                # Evict the oldest entry (dicts preserve insertion order)
+                _COUNT_CACHE.pop(next(iter(_COUNT_CACHE), None), None)
+            _COUNT_CACHE[key] = (total, estimated, time.monotonic() + self.count_cache_ttl)
+        return total, estimated
+
+    async def _get_total(self, queryset: Any) -> tuple[int, bool]:
+        """
+        Get the total item count, using the count cache / estimate when configured.
+
+        Args:
+            queryset: Django QuerySet or list
+
+        Returns:
+            Tuple of (total, estimated)
+        """
+        if _is_django_queryset(queryset) and (self.count_cache_ttl is not None or self.count_mode != "exact"):
+            return await sync_to_async(self._count_queryset_sync)(queryset)
+        return await self._get_queryset_count(queryset), False
+
+    async def _get_total_and_slice(self, queryset: Any, offset: int, limit: int) -> tuple[int, bool, list[Any]]:
+        """
+        Get the total count and the raw items of one page.
+
+        By default the COUNT and the page query run one after the other on the
+        caller's connection. For Django QuerySets with concurrent_count enabled,
+        they are issued at the same time on separate worker threads (and
+        connections), so a slow COUNT(*) no longer adds to the page query latency.
+
+        Args:
+            queryset: Django QuerySet or list
+            offset: Index of the first item
+            limit: Maximum number of items
+
+        Returns:
+            Tuple of (total, estimated, raw_items)
+        """
+        if self.concurrent_count and _is_django_queryset(queryset):
+            (total, estimated), raw_items = await asyncio.gather(
+                sync_to_thread(self._count_queryset_sync, queryset),
+                sync_to_thread(list, queryset[offset : offset + limit]),
+            )
+            return total, estimated, raw_items
+
+        total, estimated = await self._get_total(queryset)
+        raw_items = await self._evaluate_queryset_slice(queryset[offset : offset + limit])
+        return total, estimated, raw_items
+
     def _serialize_items(self, items: list[Any]) -> list[dict]:
         """
         Serialize items using efficient batch serialization.
@@ -380,21 +537,19 @@ class PageNumberPagination(PaginationBase):
         page_number = page_params["page"]
         page_size = page_params["page_size"]
 
-        # Get total count
-        total = await self._get_queryset_count(queryset)
+        # Get total count and the requested page (concurrently for QuerySets)
+        total, estimated, raw_items = await self._get_total_and_slice(
+            queryset, (page_number - 1) * page_size, page_size
+        )
 
         # Calculate total pages
         total_pages = (total + page_size - 1) // page_size if total > 0 else 0
 
-        # Validate page number
+        # Validate page number - past the end, re-fetch the last page (rare)
         if page_number > total_pages and total_pages > 0:
             page_number = total_pages
-
-        # Calculate offset
-        offset = (page_number - 1) * page_size
-
-        # Slice queryset and get raw items
-        raw_items = await self._evaluate_queryset_slice(queryset[offset : offset + page_size])
+            offset = (page_number - 1) * page_size
+            raw_items = await self._evaluate_queryset_slice(queryset[offset : offset + page_size])
 
         # Serialize items using efficient batch serialization
         items = self._serialize_items(raw_items)
@@ -410,6 +565,7 @@ class PageNumberPagination(PaginationBase):
             has_previous=page_number > 1,
             next_page=page_number + 1 if page_number < total_pages else None,
             previous_page=page_number - 1 if page_number > 1 else None,
+            total_estimated=True if estimated else None,
         )
 
 
@@ -478,11 +634,8 @@ class LimitOffsetPagination(PaginationBase):
         limit = page_params["limit"]
         offset = page_params["offset"]
 
-        # Get total count
-        total = await self._get_queryset_count(queryset)
-
-        # Slice queryset and get raw items
-        raw_items = await self._evaluate_queryset_slice(queryset[offset : offset + limit])
+        # Get total count and the requested slice (concurrently for QuerySets)
+        total, estimated, raw_items = await self._get_total_and_slice(queryset, offset, limit)
 
         # Serialize items using efficient batch serialization
         items = self._serialize_items(raw_items)
@@ -498,64 +651,265 @@ class LimitOffsetPagination(PaginationBase):
             offset=offset,
             has_next=has_next,
             has_previous=has_previous,
+            total_estimated=True if estimated else None,
         )
 
 
+class _RowValueCompare(Func):
+    """
+    Row-value comparison ``(a, b, ...) > (x, y, ...)`` usable directly in ``.filter()``.
+
+    A single row comparison can be served by a composite index on (a, b, ...),
+    unlike the equivalent ``a > x OR (a = x AND b > y)`` expansion.
+    """
+
+    output_field = BooleanField()
+    template = "(%(columns)s) %(operator)s (%(values)s)"
+
+    def __init__(self, columns: list[Any], values: list[Any], operator: str):
+        self.column_count = len(columns)
+        super().__init__(*columns, *values, operator=operator)
+
+    def as_sql(
+        self, compiler: Any, connection: Any, template: str | None = None, **extra_context: Any
+    ) -> tuple[str, list[Any]]:
+        sqls: list[str] = []
+        params: list[Any] = []
+        for expression in self.get_source_expressions():
+            sql, expression_params = compiler.compile(expression)
+            sqls.append(sql)
+            params.extend(expression_params)
+        # Same precedence as Func.as_sql: call arguments over constructor extras
+        data = {**self.extra, **extra_context}
+        data["columns"] = ", ".join(sqls[: self.column_count])
+        data["values"] = ", ".join(sqls[self.column_count :])
+        template = template or data.get("template", self.template)
+        return template % data, params
+
+
+# Backends that support row-value comparisons in WHERE clauses
+_ROW_VALUE_VENDORS = frozenset({"postgresql", "sqlite", "mysql"})
+
+
 class CursorPagination(PaginationBase):
     """
-    Cursor-based pagination for large datasets.
+    Keyset (cursor) pagination for large datasets.
 
     More efficient than offset-based pagination for large datasets
-    as it doesn't require counting all records or scanning through skipped records.
+    as it doesn't require counting all records or scanning through skipped records:
+    every page is a single indexed range query, so deep pages stay O(page_size).
+
+    Ordering may span several fields, e.g. ``("-created_at", "-id")``. The primary
+    key is appended as a tie-breaker when it isn't part of the ordering, so rows
+    sharing a value are never skipped or duplicated. When all fields sort in the
+    same direction the cursor filter is a row-value comparison that a composite
+    index can serve; mixed directions fall back to the expanded OR form.
+    Ordering fields must be non-nullable: a NULL position raises ValueError.
+    ``values()`` querysets get any unselected ordering fields added to their field
+    list; ``values_list()`` querysets are rejected.
+
+    Cursors are compact (JSON + URL-safe base64) and signed with SECRET_KEY, so
+    clients can't forge positions. Each page links forward (``next_cursor``) and
+    backward (``previous_cursor``).
 
     Query parameters:
         - cursor: Opaque cursor string (optional)
         - page_size: Items per page (optional)
 
     Example:
-        /api/users?cursor=eyJpZCI6MTAwfQ==&page_size=20
+        /api/users?cursor=WzAsWzEwMF1d:...&page_size=20
 
     Attributes:
         page_size: Default number of items per page (default: 100)
         max_page_size: Maximum allowed page size (default: 1000)
         page_size_query_param: Query param name for page size (default: "page_size")
-        ordering: Field to order by (default: "-id" for descending ID)
+        ordering: Field or fields to order by (default: "-id" for descending ID)
+        cursor_tiebreaker: Unique field appended to the ordering (default: "pk", None disables)
+        sign_cursors: Sign cursors with Django's Signer (default: True)
     """
 
     page_size: int = 100
     max_page_size: int = 1000
     page_size_query_param: str = "page_size"
-    ordering: str = "-id"  # Default ordering field
+    ordering: str | tuple[str, ...] = "-id"  # Default ordering field
+    cursor_tiebreaker: str | None = "pk"
+    sign_cursors: bool = True
+    cursor_salt: str = "django_bolt.pagination.CursorPagination"
 
-    def _encode_cursor(self, value: Any) -> str:
+    def _encode_cursor(self, values: list[Any], reverse: bool = False) -> str:
         """
-        Encode cursor value to base64 string.
+        Encode a keyset position to a compact, signed cursor string.
 
         Args:
-            value: Cursor value (typically an ID)
+            values: Ordering field values of the row the cursor points at
+            reverse: True for a cursor that pages backward (previous page)
 
         Returns:
-            Base64-encoded cursor string
+            URL-safe cursor string
         """
-        cursor_data = _json.encode({"v": value})
-        return base64.b64encode(cursor_data).decode("utf-8")
+        payload = _json.encode([int(reverse), values])
+        cursor = base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+        if self.sign_cursors:
+            cursor = Signer(salt=self.cursor_salt).sign(cursor)
+        return cursor
 
-    def _decode_cursor(self, cursor: str) -> Any:
+    def _decode_cursor(self, cursor: str) -> tuple[bool, list[Any]] | None:
         """
-        Decode cursor string to value.
+        Decode and verify a cursor string.
 
         Args:
-            cursor: Base64-encoded cursor string
+            cursor: Cursor string produced by _encode_cursor
 
         Returns:
-            Decoded cursor value
+            Tuple of (reverse, values), or None for malformed or tampered cursors
         """
         try:
-            cursor_data = base64.b64decode(cursor.encode("utf-8"))
-            data = msgspec.json.decode(cursor_data)
-            return data.get("v")
-        except Exception:
+            if self.sign_cursors:
+                cursor = Signer(salt=self.cursor_salt).unsign(cursor)
+            padded = cursor + "=" * (-len(cursor) % 4)
+            reverse, values = msgspec.json.decode(base64.urlsafe_b64decode(padded))
+        except (BadSignature, ValueError, TypeError, msgspec.DecodeError):
+            return None
+        if not isinstance(values, list):
             return None
+        return bool(reverse), values
+
+    def _get_ordering_fields(self, queryset: Any) -> list[tuple[str, bool]]:
+        """
+        Resolve the ordering into (field, descending) pairs with the tie-breaker appended.
+
+        Args:
+            queryset: Django QuerySet being paginated
+
+        Returns:
+            List of (field name, descending) tuples
+        """
+        ordering = (self.ordering,) if isinstance(self.ordering, str) else tuple(self.ordering)
+        pk_name = queryset.model._meta.pk.name
+        fields = []
+        for field in ordering:
+            name = field.lstrip("-")
+            fields.append((pk_name if name == "pk" else name, field.startswith("-")))
+
+        tiebreaker = self.cursor_tiebreaker
+        if tiebreaker is not None:
+            tiebreaker = pk_name if tiebreaker == "pk" else tiebreaker
+            if all(name != tiebreaker for name, _ in fields):
+                # Follow the direction of the last field so the keyset stays uniform
+                fields.append((tiebreaker, fields[-1][1]))
+        return fields
+
+    def _select_ordering_fields(self, queryset: Any, fields: list[tuple[str, bool]]) -> Any:
+        """
+        Make sure every ordering field is present on the items the queryset yields.
+
+        Args:
+            queryset: Django QuerySet being paginated
+            fields: Resolved ordering fields
+
+        Returns:
+            The queryset, with unselected ordering fields added to its values() list
+
+        Raises:
+            ValueError: If the queryset yields tuples (values_list())
+        """
+        iterable_class = queryset._iterable_class
+        if iterable_class is ModelIterable:
+            return queryset
+        if iterable_class is not ValuesIterable:
+            raise ValueError(
+                "CursorPagination can't read cursor positions from values_list() querysets; use values() instead."
+            )
+        selected = set(queryset._fields)
+        if not selected:
+            # values() without arguments selects every concrete field
+            return queryset
+        if "pk" in selected:
+            selected.add(queryset.model._meta.pk.name)
+        missing = [name for name, _ in fields if name not in selected]
+        if not missing:
+            return queryset
+        return queryset.values(*queryset._fields, *missing)
+
+    def _get_position(self, item: Any, fields: list[tuple[str, bool]], pk_name: str) -> list[Any]:
+        """
+        Read the ordering field values of a raw item.
+
+        Args:
+            item: Django model instance or dict from values()
+            fields: Resolved ordering fields
+            pk_name: Name of the model's primary key field
+
+        Returns:
+            List of values
+
+        Raises:
+            ValueError: If an ordering value is NULL (the row can't be used as a cursor)
+        """
+        values = []
+        for name, _ in fields:
+            if isinstance(item, dict):
+                value = item.get(name)
+                if value is None and name == pk_name:
+                    value = item.get("pk")
+            else:
+                value = item
+                for part in name.split("__"):
+                    value = getattr(value, part, None)
+            if value is None:
+                raise ValueError(
+                    f"CursorPagination ordering field {name!r} is NULL; cursor ordering fields must be non-nullable."
+                )
+            values.append(value)
+        return values
+
+    def _apply_keyset_filter(
+        self, queryset: Any, fields: list[tuple[str, bool]], values: list[Any], forward: bool
+    ) -> Any:
+        """
+        Filter a queryset to the rows after (forward) or before the cursor position.
+
+        Args:
+            queryset: Ordered Django QuerySet
+            fields: Resolved ordering fields
+            values: Cursor position values (decoded from JSON)
+            forward: True to page forward, False to page backward
+
+        Returns:
+            Filtered QuerySet
+        """
+        opts = queryset.model._meta
+        typed_values = []
+        model_fields = []
+        for (name, _), value in zip(fields, values, strict=True):
+            try:
+                model_field = opts.get_field(name)
+                value = model_field.to_python(value)
+            except (FieldDoesNotExist, ValidationError):
+                model_field = None
+            model_fields.append(model_field)
+            typed_values.append(value)
+
+        lookups = ["lt" if descending == forward else "gt" for _, descending in fields]
+
+        if len(fields) > 1 and len(set(lookups)) == 1 and connections[queryset.db].vendor in _ROW_VALUE_VENDORS:
+            return queryset.filter(
+                _RowValueCompare(
+                    [F(name) for name, _ in fields],
+                    [
+                        Value(value, output_field=model_field) if model_field is not None else Value(value)
+                        for value, model_field in zip(typed_values, model_fields, strict=True)
+                    ],
+                    "<" if lookups[0] == "lt" else ">",
+                )
+            )
+
+        # Mixed directions (or no row-value support): a > x OR (a = x AND b > y) ...
+        condition = Q()
+        for index, (name, _) in enumerate(fields):
+            equal = {fields[i][0]: typed_values[i] for i in range(index)}
+            condition |= Q(**equal, **{f"{name}__{lookups[index]}": typed_values[index]})
+        return queryset.filter(condition)
 
     async def get_page_params(self, request: dict[str, Any]) -> dict[str, Any]:
         """Extract cursor and page_size from request."""
@@ -563,16 +917,16 @@ class CursorPagination(PaginationBase):
 
         # Get cursor (optional)
         cursor_str = query.get("cursor")
-        cursor_value = self._decode_cursor(cursor_str) if cursor_str else None
+        cursor = self._decode_cursor(cursor_str) if cursor_str else None
 
         # Get page size
         page_size = self._get_page_size(request)
 
-        return {"cursor": cursor_value, "page_size": page_size}
+        return {"cursor": cursor, "page_size": page_size}
 
     async def paginate_queryset(self, queryset: Any, request: dict[str, Any], **params: Any) -> PaginatedResponse:
         """
-        Paginate queryset using cursor-based pagination.
+        Paginate queryset using keyset (cursor) pagination.
 
         Args:
             queryset: Django QuerySet to paginate
@@ -583,48 +937,44 @@ class CursorPagination(PaginationBase):
             PaginatedResponse with cursor metadata
         """
         page_params = await self.get_page_params(request)
-        cursor_value = page_params["cursor"]
+        cursor = page_params["cursor"]
         page_size = page_params["page_size"]
 
-        # Apply ordering
-        ordering = self.ordering
-        is_descending = ordering.startswith("-")
-        ordering_field = ordering.lstrip("-")
-
-        # Apply ordering to queryset
-        ordered_qs = queryset.order_by(ordering)
-
-        # Apply cursor filter if present
-        if cursor_value is not None:
-            if is_descending:
-                # For descending order, we want items less than cursor
-                filter_kwargs = {f"{ordering_field}__lt": cursor_value}
-            else:
-                # For ascending order, we want items greater than cursor
-                filter_kwargs = {f"{ordering_field}__gt": cursor_value}
+        fields = self._get_ordering_fields(queryset)
+        queryset = self._select_ordering_fields(queryset, fields)
+        if cursor is not None and len(cursor[1]) != len(fields):
+            # Cursor from a different ordering - start from the beginning
+            cursor = None
+        reverse = cursor is not None and cursor[0]
 
-            ordered_qs = ordered_qs.filter(**filter_kwargs)
+        # Paging backward walks the reversed ordering, then flips the page back
+        ordered_qs = queryset.order_by(*[("-" if descending != reverse else "") + name for name, descending in fields])
+        if cursor is not None:
+            ordered_qs = self._apply_keyset_filter(ordered_qs, fields, cursor[1], forward=not reverse)
 
-        # Fetch page_size + 1 items to determine if there's a next page
+        # Fetch page_size + 1 items to determine if there are more in this direction
         raw_items = await self._evaluate_queryset_slice(ordered_qs[: page_size + 1])
-
-        # Check if there are more items
-        has_next = len(raw_items) > page_size
-        if has_next:
+        has_more = len(raw_items) > page_size
+        if has_more:
             raw_items = raw_items[:page_size]  # Trim to page_size
 
-        # Generate next cursor from last raw item (before serialization)
-        next_cursor = None
-        if has_next and raw_items:
-            last_item = raw_items[-1]
-            # Items are raw (Django models or dicts from values()), get cursor value
-            if isinstance(last_item, dict):
-                last_value = last_item.get(ordering_field)
-            else:
-                last_value = getattr(last_item, ordering_field, None)
+        if reverse:
+            raw_items.reverse()
+            has_next = bool(raw_items)
+            has_previous = has_more
+        else:
+            has_next = has_more
+            has_previous = cursor is not None
 
-            if last_value is not None:
-                next_cursor = self._encode_cursor(last_value)
+        # Generate cursors from the raw boundary items (before serialization)
+        next_cursor = None
+        previous_cursor = None
+        if raw_items:
+            pk_name = queryset.model._meta.pk.name
+            if has_next:
+                next_cursor = self._encode_cursor(self._get_position(raw_items[-1], fields, pk_name))
+            if has_previous:
+                previous_cursor = self._encode_cursor(self._get_position(raw_items[0], fields, pk_name), reverse=True)
 
         # Serialize items using efficient batch serialization
         items = self._serialize_items(raw_items)
@@ -634,8 +984,9 @@ class CursorPagination(PaginationBase):
             total=0,  # Cursor pagination doesn't provide total count for efficiency
             page_size=page_size,
             has_next=has_next,
-            has_previous=cursor_value is not None,
+            has_previous=has_previous,
             next_cursor=next_cursor,
+            previous_cursor=previous_cursor,
         )
 
 
@@ -0,0 +1,281 @@
+"""On-demand sampling profiler for running workers.
+
+Opt-in with ``BOLT_PROFILER = True`` in Django settings. Each ``runbolt``
+process then starts a thread that waits for ``SIGUSR2``; on the signal it
+samples the Python stacks of every thread (``sys._current_frames()``) for a
+while and writes them out in the collapsed-stack format (for ``flamegraph.pl``,
+inferno, speedscope...) or as a speedscope JSON file. Nothing runs between
+profiles, and sampling costs one stack walk per thread per interval.
+
+Each sample is tagged with the route being executed (``handler_id`` and route
+template), found by matching the frames against the registered handlers'
+code objects, so stacks of async handlers on the event loop and sync handlers
+on the thread pool are grouped by route.
+
+Profile a worker with the ``bolt_profile`` management command::
+
+    python manage.py bolt_profile --pid 12345 --duration 30s --format speedscope
+
+or send the signal directly (``kill -USR2 <pid>``) to write a 30s collapsed
+profile into the temporary directory.
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+import logging
+import os
+import re
+import signal
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Any
+
+__all__ = [
+    "DEFAULT_PROFILE_DURATION",
+    "DEFAULT_SAMPLE_INTERVAL",
+    "PROFILE_FORMATS",
+    "PROFILE_SIGNAL",
+    "SamplingProfiler",
+    "enable_profile_trigger",
+    "parse_duration",
+    "profile_request_path",
+]
+
+logger = logging.getLogger(__name__)
+
+# Signal that starts a profile in a worker
+PROFILE_SIGNAL = signal.SIGUSR2
+
+DEFAULT_PROFILE_DURATION = 30.0
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+PROFILE_FORMATS = ("collapsed", "speedscope")
+
+# Frames kept per sample (innermost are dropped beyond this)
+MAX_STACK_DEPTH = 128
+
+_DURATION_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(ms|s|m)?\s*$")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, None: 1.0}
+
+
+def parse_duration(value: str | float) -> float:
+    """Parse ``"30s"``, ``"500ms"``, ``"2m"`` or a number of seconds.
+
+    Raises:
+        ValueError: Invalid or non-positive duration
+    """
+    if isinstance(value, int | float):
+        seconds = float(value)
+    else:
+        match = _DURATION_RE.match(value)
+        if match is None:
+            raise ValueError(f"Invalid duration {value!r}, expected e.g. '30s', '500ms' or '2m'")
+        seconds = float(match.group(1)) * _DURATION_UNITS[match.group(2)]
+    if seconds <= 0:
+        raise ValueError(f"Duration must be positive, got {value!r}")
+    return seconds
+
+
+def profile_request_path(pid: int) -> str:
+    """Path of the file ``bolt_profile`` writes the profile options of worker ``pid`` to."""
+    return os.path.join(tempfile.gettempdir(), f"django-bolt-profile-{pid}.json")
+
+
+def _handler_tags(api: Any) -> dict[Any, str]:
+    """Map handler code objects to "[handler_id=N METHOD /path]" tags."""
+    if api is None:
+        return {}
+    tags = {}
+    for handler_id, handler in api._handlers.items():
+        tag = f"[handler_id={handler_id} {api._route_label(handler_id)}]"
+        for fn in {handler, inspect.unwrap(handler)}:
+            code = getattr(fn, "__code__", None)
+            if code is not None:
+                tags[code] = tag
+    return tags
+
+
+class SamplingProfiler:
+    """Samples the Python stacks of all threads and aggregates identical stacks."""
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL, api: Any = None) -> None:
+        """
+        Args:
+            interval: Seconds between samples
+            api: BoltAPI whose handlers are used to tag samples with their route
+        """
+        self.interval = interval
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self.sample_count = 0
+        self.duration = 0.0
+        self._handler_tags = _handler_tags(api)
+        # Frame names by code object (formatting is the expensive part of a sample)
+        self._names: dict[Any, str] = {}
+
+    def run(self, duration: float) -> None:
+        """Sample for ``duration`` seconds in the calling thread (which is not sampled)."""
+        own_thread = threading.get_ident()
+        started = time.perf_counter()
+        deadline = started + duration
+        next_sample = started
+        while (now := time.perf_counter()) < deadline:
+            self.sample(exclude=own_thread)
+            next_sample = max(next_sample + self.interval, now)
+            time.sleep(max(next_sample - time.perf_counter(), 0))
+        self.duration += time.perf_counter() - started
+
+    def sample(self, exclude: int | None = None) -> None:
+        """Record the current stack of every thread except ``exclude``."""
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == exclude:
+                continue
+            stack = []
+            tag = "[no handler]"
+            while frame is not None:
+                code = frame.f_code
+                name = self._names.get(code)
+                if name is None:
+                    name = f"{code.co_qualname} ({code.co_filename}:{code.co_firstlineno})".replace(";", ":")
+                    self._names[code] = name
+                stack.append(name)
+                # The outermost handler frame wins (handlers calling other handlers)
+                tag = self._handler_tags.get(code, tag)
+                frame = frame.f_back
+            stack.append(thread_names.get(ident, f"thread-{ident}"))
+            stack.append(tag)
+            stack.reverse()
+            self.stacks[tuple(stack[: MAX_STACK_DEPTH + 2])] += 1
+        self.sample_count += 1
+
+    def collapsed(self) -> str:
+        """Return the samples in the collapsed-stack format ("root;...;leaf count" per line)."""
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in self.stacks.most_common())
+
+    def speedscope(self, name: str = "django-bolt") -> dict[str, Any]:
+        """Return the samples as a speedscope file (https://www.speedscope.app)."""
+        frames: list[dict[str, str]] = []
+        frame_index: dict[str, int] = {}
+        samples = []
+        weights = []
+        for stack, count in self.stacks.most_common():
+            indexes = []
+            for frame_name in stack:
+                index = frame_index.get(frame_name)
+                if index is None:
+                    index = frame_index[frame_name] = len(frames)
+                    frames.append({"name": frame_name})
+                indexes.append(index)
+            samples.append(indexes)
+            weights.append(count * self.interval)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "django-bolt",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+
+    def write(self, path: str, output_format: str = "collapsed") -> None:
+        """Write the profile to ``path`` atomically (readers never see a partial file)."""
+        if output_format not in PROFILE_FORMATS:
+            raise ValueError(f"Unknown profile format {output_format!r}, expected one of {PROFILE_FORMATS}")
+        if output_format == "speedscope":
+            content = json.dumps(self.speedscope(f"django-bolt pid {os.getpid()}"))
+        else:
+            content = self.collapsed()
+        partial_path = f"{path}.partial"
+        with open(partial_path, "w") as f:
+            f.write(content)
+        os.replace(partial_path, path)
+
+
+def _read_profile_request(pid: int) -> dict[str, Any]:
+    """Read (and remove) the options written by ``bolt_profile``; defaults when absent."""
+    path = profile_request_path(pid)
+    options: dict[str, Any] = {}
+    try:
+        # Only honor requests written by the worker's own user
+        if os.stat(path).st_uid == os.getuid():
+            with open(path) as f:
+                options = json.load(f)
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError):
+        logger.warning("Ignoring unreadable profile request %s", path, exc_info=True)
+
+    output_format = options.get("format", "collapsed")
+    if "output" not in options:
+        extension = "speedscope.json" if output_format == "speedscope" else "collapsed"
+        options["output"] = os.path.join(
+            tempfile.gettempdir(), f"django-bolt-profile-{pid}-{int(time.time())}.{extension}"
+        )
+    return {
+        "duration": parse_duration(options.get("duration", DEFAULT_PROFILE_DURATION)),
+        "interval": parse_duration(options.get("interval", DEFAULT_SAMPLE_INTERVAL)),
+        "format": output_format,
+        "output": options["output"],
+    }
+
+
+# Trigger thread and the API whose handlers tag the samples (set by enable_profile_trigger)
+_trigger_thread: threading.Thread | None = None
+_trigger_api: Any = None
+
+
+def _wait_for_profile_requests() -> None:
+    """Trigger thread: run a profile each time PROFILE_SIGNAL arrives."""
+    while True:
+        signal.sigwait({PROFILE_SIGNAL})
+        try:
+            options = _read_profile_request(os.getpid())
+            logger.info(
+                "Profiling process %s for %.1fs (every %.1f ms)",
+                os.getpid(),
+                options["duration"],
+                options["interval"] * 1000,
+            )
+            profiler = SamplingProfiler(options["interval"], _trigger_api)
+            profiler.run(options["duration"])
+            profiler.write(options["output"], options["format"])
+            logger.info("Wrote %d samples to %s", profiler.sample_count, options["output"])
+        except Exception:
+            logger.exception("Profiling process %s failed", os.getpid())
+
+
+def enable_profile_trigger(api: Any = None) -> threading.Thread:
+    """Start (once) the thread that profiles this process on PROFILE_SIGNAL.
+
+    The first call must happen in the main thread before any other thread is
+    started: the signal is blocked here, so every thread started afterwards
+    (including the server's) inherits the mask and only the trigger thread
+    receives it, through ``sigwait()``, even while the main thread runs Rust code.
+    Later calls only update ``api``.
+
+    Args:
+        api: BoltAPI whose handlers are used to tag samples with their route
+    """
+    global _trigger_thread, _trigger_api
+    if api is not None:
+        _trigger_api = api
+    if _trigger_thread is None:
+        signal.pthread_sigmask(signal.SIG_BLOCK, {PROFILE_SIGNAL})
+        _trigger_thread = threading.Thread(target=_wait_for_profile_requests, name="bolt-profile-trigger", daemon=True)
+        _trigger_thread.start()
+    return _trigger_thread
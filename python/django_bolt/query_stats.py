@@ -0,0 +1,244 @@
+"""Per-route database query instrumentation and N+1 detection.
+
+Opt-in with ``BOLT_QUERY_STATS = True`` in Django settings. When enabled, every
+database connection gets an ``execute_wrapper`` that records, for the request
+currently being dispatched:
+
+- Number of queries and total time spent in the database
+- Repeated-SQL fingerprints (the parametrized SQL, so ``WHERE id = %s`` issued
+  for 50 different ids counts as 50 repeats of one fingerprint)
+
+Queries are attributed to the request through a ContextVar, so they are counted
+whether the ORM runs on the event loop's ``sync_to_async`` thread or on a
+``sync_to_thread`` worker. Per-request numbers are aggregated per ``handler_id``.
+
+A request that issues the same fingerprint more than
+``BOLT_N_PLUS_ONE_THRESHOLD`` times (default: 10) logs a warning on the
+``django_bolt.query_stats`` logger. Stats are per process and exposed through
+``register_query_stats_endpoint()`` and the ``bolt_query_stats`` management command.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Any
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from .auth.guards import IsStaff
+
+__all__ = [
+    "QueryStatsCollector",
+    "enable_query_stats",
+    "get_query_stats",
+    "register_query_stats_endpoint",
+]
+
+logger = logging.getLogger(__name__)
+
+# Default number of identical queries per request before an N+1 warning is logged
+DEFAULT_N_PLUS_ONE_THRESHOLD = 10
+
+# Repeated fingerprints kept per route (the worst offenders by repeat count)
+MAX_FINGERPRINTS_PER_ROUTE = 20
+
+# Queries of the request currently being dispatched (None outside instrumented requests)
+_current_request: ContextVar[RequestQueries | None] = ContextVar("bolt_query_stats_request", default=None)
+
+
+class RequestQueries:
+    """Queries recorded for a single request."""
+
+    __slots__ = ("count", "duration", "fingerprints")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints: dict[str, int] = {}
+
+    def record(self, sql: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.fingerprints[sql] = self.fingerprints.get(sql, 0) + 1
+
+
+class RouteQueryStats:
+    """Aggregated query stats for one route."""
+
+    __slots__ = ("requests", "queries", "db_time", "max_queries", "n_plus_one_requests", "repeated")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.queries = 0
+        self.db_time = 0.0
+        self.max_queries = 0
+        self.n_plus_one_requests = 0
+        # Fingerprint -> highest repeat count seen in a single request
+        self.repeated: dict[str, int] = {}
+
+    def to_dict(self) -> dict[str, Any]:
+        requests = self.requests or 1
+        repeated = sorted(self.repeated.items(), key=lambda item: item[1], reverse=True)
+        return {
+            "requests": self.requests,
+            "queries": self.queries,
+            "avg_queries": round(self.queries / requests, 2),
+            "max_queries": self.max_queries,
+            "db_time_ms": round(self.db_time * 1000, 3),
+            "avg_db_time_ms": round(self.db_time * 1000 / requests, 3),
+            "n_plus_one_requests": self.n_plus_one_requests,
+            "repeated_queries": [{"sql": sql, "max_per_request": count} for sql, count in repeated],
+        }
+
+
+def _execute_wrapper(execute: Any, sql: str, params: Any, many: bool, context: dict[str, Any]) -> Any:
+    """Connection execute wrapper recording queries for the current request."""
+    request_queries = _current_request.get()
+    if request_queries is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        request_queries.record(sql, time.perf_counter() - start)
+
+
+def _install_wrapper(connection: Any) -> None:
+    if _execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_execute_wrapper)
+
+
+def _on_connection_created(sender: Any, connection: Any, **kwargs: Any) -> None:
+    _install_wrapper(connection)
+
+
+class QueryStatsCollector:
+    """Collects per-request query counts and aggregates them per handler_id."""
+
+    def __init__(self, n_plus_one_threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD) -> None:
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self._routes: dict[int, RouteQueryStats] = {}
+        self._lock = threading.Lock()
+
+    def install(self) -> None:
+        """Attach the execute wrapper to existing and future connections (all threads)."""
+        connection_created.connect(_on_connection_created, dispatch_uid="django_bolt.query_stats")
+        for connection in connections.all(initialized_only=True):
+            _install_wrapper(connection)
+
+    def start_request(self) -> tuple[RequestQueries, Token]:
+        """Begin recording queries for the request running in the current context."""
+        request_queries = RequestQueries()
+        return request_queries, _current_request.set(request_queries)
+
+    def finish_request(
+        self,
+        handler_id: int | None,
+        request_queries: RequestQueries,
+        token: Token,
+        route: str | None = None,
+    ) -> None:
+        """Stop recording and fold the request's queries into its route stats."""
+        _current_request.reset(token)
+
+        repeated = {
+            sql: count for sql, count in request_queries.fingerprints.items() if count > self.n_plus_one_threshold
+        }
+        for sql, count in repeated.items():
+            logger.warning(
+                "Possible N+1 query on %s: the same query ran %d times in one request: %s",
+                route or f"handler {handler_id}",
+                count,
+                sql,
+            )
+
+        with self._lock:
+            stats = self._routes.get(handler_id)
+            if stats is None:
+                stats = self._routes[handler_id] = RouteQueryStats()
+            stats.requests += 1
+            stats.queries += request_queries.count
+            stats.db_time += request_queries.duration
+            stats.max_queries = max(stats.max_queries, request_queries.count)
+            if repeated:
+                stats.n_plus_one_requests += 1
+                for sql, count in repeated.items():
+                    if count > stats.repeated.get(sql, 0):
+                        stats.repeated[sql] = count
+                if len(stats.repeated) > MAX_FINGERPRINTS_PER_ROUTE:
+                    worst = sorted(stats.repeated.items(), key=lambda item: item[1], reverse=True)
+                    stats.repeated = dict(worst[:MAX_FINGERPRINTS_PER_ROUTE])
+
+    def snapshot(self, labels: dict[int, str] | None = None) -> dict[str, Any]:
+        """Return per-route stats, keyed by route label (or handler_id), most queries first.
+
+        Args:
+            labels: Optional handler_id -> "METHOD /path" mapping
+        """
+        labels = labels or {}
+        with self._lock:
+            items = [(handler_id, stats.to_dict()) for handler_id, stats in self._routes.items()]
+        items.sort(key=lambda item: item[1]["queries"], reverse=True)
+        return {labels.get(handler_id, str(handler_id)): stats for handler_id, stats in items}
+
+    def reset(self) -> None:
+        """Drop all collected stats."""
+        with self._lock:
+            self._routes.clear()
+
+
+# Process-wide collector (created by enable_query_stats)
+_collector: QueryStatsCollector | None = None
+
+
+def enable_query_stats(n_plus_one_threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD) -> QueryStatsCollector:
+    """Create (once) and install the process-wide query stats collector."""
+    global _collector
+    if _collector is None:
+        _collector = QueryStatsCollector(n_plus_one_threshold)
+        _collector.install()
+    else:
+        _collector.n_plus_one_threshold = n_plus_one_threshold
+    return _collector
+
+
+def get_query_stats() -> QueryStatsCollector | None:
+    """Return the process-wide collector, or None when instrumentation is disabled."""
+    return _collector
+
+
+def _route_labels(api: Any) -> dict[int, str]:
+    return {handler_id: f"{method} {path}" for method, path, handler_id, _ in api._routes}
+
+
+def register_query_stats_endpoint(api: Any, path: str = "/__bolt__/queries", **route_kwargs: Any) -> None:
+    """Register a GET endpoint returning this process's per-route query stats.
+
+    The stats include the SQL of every route and ``?reset=1`` clears them, so
+    the endpoint is guarded with ``IsStaff()`` unless ``guards=[...]`` is
+    passed (pair it with ``auth=[...]`` or the API's default authentication).
+    Pass ``guards=[AllowAny()]`` only where the endpoint is not reachable by
+    untrusted clients.
+
+    Args:
+        api: BoltAPI instance
+        path: Endpoint path
+        **route_kwargs: Extra arguments for ``api.get`` (guards, auth, tags, ...)
+    """
+
+    async def query_stats_handler(reset: bool = False) -> dict[str, Any]:
+        collector = get_query_stats()
+        if collector is None:
+            return {"enabled": False, "routes": {}}
+        routes = collector.snapshot(_route_labels(api))
+        if reset:
+            collector.reset()
+        return {"enabled": True, "n_plus_one_threshold": collector.n_plus_one_threshold, "routes": routes}
+
+    route_kwargs.setdefault("guards", [IsStaff()])
+    api.get(path, **route_kwargs)(query_stats_handler)
@@ -0,0 +1,246 @@
+"""Rate limits shared across ``runbolt --processes N`` workers and across nodes.
+
+``@rate_limit`` is enforced in Rust with per-process buckets, so N processes
+behind SO_REUSEPORT each allow the full rate. With
+``BOLT_SHARED_RATE_LIMIT = True``, ``runbolt`` creates a shared-memory bucket
+table before forking and every worker checks the same buckets, so a limit
+holds for the whole host. Checks stay in Rust and never take the GIL.
+
+The table has ``BOLT_SHARED_RATE_LIMIT_ENTRIES`` buckets (default 65536, 16
+bytes each). Buckets that refilled are reused for new keys; keys that find no
+room fall back to the per-process limiter.
+
+For limits that hold across nodes, set ``BOLT_RATE_LIMIT_STORE`` to a
+``RateLimitStore`` (e.g. ``DjangoCacheRateLimitStore`` on a Redis cache).
+Asking the store on every request would add a round trip, so each process
+leases batches of tokens from it: requests spend leased tokens in Rust, and a
+background thread fetches the next lease when one runs low. A lease covers
+about ``BOLT_RATE_LIMIT_LEASE_MS`` (default 100) of traffic at the full rate,
+which bounds how far the cluster can overshoot a limit.
+
+Sliding windows (``@rate_limit(window_limit=...)``) are counted per process,
+so ``runbolt`` refuses to start when a route has one and either setting is on.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any
+
+from django.core.cache import caches
+
+from django_bolt import _core
+
+__all__ = [
+    "DEFAULT_LEASE_MS",
+    "DEFAULT_SHARED_RATE_LIMIT_ENTRIES",
+    "DjangoCacheRateLimitStore",
+    "InMemoryRateLimitStore",
+    "RateLimitStore",
+    "attach_shared_rate_limit",
+    "create_shared_rate_limit_region",
+    "disable_rate_limit_store",
+    "enable_rate_limit_store",
+    "window_limited_routes",
+]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARED_RATE_LIMIT_ENTRIES = 65536
+
+DEFAULT_LEASE_MS = 100
+
+
+def create_shared_rate_limit_region(entries: int = DEFAULT_SHARED_RATE_LIMIT_ENTRIES) -> str:
+    """Create the shared rate limit file with ``entries`` buckets and return its path.
+
+    The file lives in ``/dev/shm`` when available (so it never hits the disk).
+    Workers attach to it through the ``DJANGO_BOLT_RATE_LIMIT_SHM`` environment
+    variable; the caller is responsible for deleting it.
+    """
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    fd, path = tempfile.mkstemp(prefix="django-bolt-ratelimit-", dir=directory)
+    os.close(fd)
+    try:
+        _core.create_shared_rate_limit(path, entries)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+
+def attach_shared_rate_limit(path: str) -> None:
+    """Check rate limits of this process against the buckets in ``path``.
+
+    ``runbolt`` workers attach automatically; this is for custom process managers.
+    Only the first call has an effect.
+    """
+    _core.attach_shared_rate_limit(path)
+
+
+class RateLimitStore(ABC):
+    """
+    Base class for cluster-wide rate limit storage (``BOLT_RATE_LIMIT_STORE``).
+
+    A store holds the budget of every limit key and grants tokens from it.
+    Implementations can use the Django cache, Redis, a database, etc.
+    """
+
+    #: Grant the requested tokens when the store raises (availability over strictness)
+    fail_open = True
+
+    @abstractmethod
+    def acquire(self, key: str, tokens: int, rps: int, burst: int) -> int:
+        """
+        Take up to ``tokens`` tokens from the bucket of ``key``.
+
+        Called from a background thread, never on the request path.
+
+        Args:
+            key: Limit key (route id and client key, e.g. ``"3:user:42"``)
+            tokens: Number of tokens wanted
+            rps: Refill rate of the bucket (tokens per second)
+            burst: Bucket capacity
+
+        Returns:
+            Number of tokens granted (0 to ``tokens``)
+        """
+        pass
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    """
+    Token buckets in this process.
+
+    Only limits the process itself, like the default limiter. Useful for tests
+    and as a reference implementation.
+    """
+
+    # SECURITY: bound memory (full buckets are dropped beyond this)
+    max_keys = 100_000
+
+    def __init__(self):
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, tokens: int, rps: int, burst: int) -> int:
+        now = time.monotonic()
+        with self._lock:
+            available, updated = self._buckets.get(key, (float(burst), now))
+            available = min(float(burst), available + (now - updated) * rps)
+            granted = min(tokens, int(available))
+            self._buckets[key] = (available - granted, now)
+            if len(self._buckets) > self.max_keys:
+                self._prune(now, rps, burst)
+        return granted
+
+    def _prune(self, now: float, rps: int, burst: int) -> None:
+        self._buckets = {
+            key: (available, updated)
+            for key, (available, updated) in self._buckets.items()
+            if available + (now - updated) * rps < burst
+        }
+
+    def clear(self) -> None:
+        """Reset all buckets (useful for testing)."""
+        with self._lock:
+            self._buckets.clear()
+
+
+class DjangoCacheRateLimitStore(RateLimitStore):
+    """
+    Django cache-based rate limit store.
+
+    Counts tokens in fixed windows of ``burst / rps`` seconds (at least one)
+    with ``cache.add`` + ``cache.incr``. Each window holds ``burst`` tokens, or
+    ``rps`` tokens per second of the window when that is more, so a ``burst``
+    below ``rps`` still sustains ``rps``. Use a
+    backend with atomic ``incr`` shared by all nodes (Redis, Memcached); the
+    database and file backends do not increment atomically.
+
+    Example:
+        ```python
+        # settings.py
+        CACHES = {
+            "ratelimit": {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "redis://127.0.0.1:6379/2",
+            }
+        }
+
+        from django_bolt.rate_limit import DjangoCacheRateLimitStore
+
+        BOLT_RATE_LIMIT_STORE = DjangoCacheRateLimitStore(cache_alias="ratelimit")
+        ```
+    """
+
+    def __init__(self, cache_alias: str = "default", key_prefix: str = "bolt-ratelimit:"):
+        """
+        Initialize Django cache-based rate limits.
+
+        Args:
+            cache_alias: Django cache alias to use (default: 'default')
+            key_prefix: Prefix for cache keys (default: 'bolt-ratelimit:')
+        """
+        self.cache_alias = cache_alias
+        self.key_prefix = key_prefix
+        self._cache = None
+
+    @property
+    def cache(self):
+        """Lazy-load cache to avoid import issues."""
+        if self._cache is None:
+            self._cache = caches[self.cache_alias]
+        return self._cache
+
+    def acquire(self, key: str, tokens: int, rps: int, burst: int) -> int:
+        window = max(1, math.ceil(burst / max(rps, 1)))
+        capacity = max(burst, rps * window)
+        cache_key = f"{self.key_prefix}{key}:{int(time.time() // window)}"
+        self.cache.add(cache_key, 0, timeout=window + 1)
+        try:
+            used = self.cache.incr(cache_key, tokens)
+        except ValueError:
+            # Expired between add and incr: this is a new window
+            self.cache.add(cache_key, tokens, timeout=window + 1)
+            used = tokens
+        return max(0, min(tokens, capacity - (used - tokens)))
+
+
+def enable_rate_limit_store(store: RateLimitStore, lease_ms: int = DEFAULT_LEASE_MS) -> None:
+    """Enforce ``@rate_limit`` through ``store`` in this process.
+
+    ``runbolt`` calls this in every worker when ``BOLT_RATE_LIMIT_STORE`` is set.
+    """
+    def acquire(key: str, tokens: int, rps: int, burst: int) -> int:
+        try:
+            return store.acquire(key, tokens, rps, burst)
+        except Exception:
+            logger.warning("Rate limit store %r failed", store, exc_info=True)
+            return tokens if store.fail_open else 0
+
+    _core.set_rate_limit_store(acquire, lease_ms)
+
+
+def disable_rate_limit_store() -> None:
+    """Go back to local rate limits in this process."""
+    _core.set_rate_limit_store(None)
+
+
+def window_limited_routes(api: Any) -> list[str]:
+    """Return the routes of ``api`` limited by a sliding window, as "METHOD /path".
+
+    Window counts are kept per process, so with buckets shared across processes
+    or nodes a window would admit ``window_limit`` units per process.
+    """
+    return [
+        f"{meta['method']} {meta['path']}"
+        for meta in api._handler_middleware.values()
+        if any(mw.get("type") == "rate_limit" and mw.get("window_limit") for mw in meta.get("middleware", ()))
+    ]
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
+import time
+from collections.abc import AsyncIterator, Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeVar
 
+import msgspec
+from django.db.models import QuerySet
+from django.db.models.query import ModelIterable
+
 # Django import - may fail if Django not configured, kept at top for consistency
 try:
     from django.conf import settings as django_settings
@@ -324,3 +331,149 @@ class StreamingResponse(CookieMixin):
             raise TypeError(
                 f"StreamingResponse content must be a generator instance. Received type: {type(content).__name__}"
             )
+
+
+# Sentinel returned by anext() once an async NDJSON source is exhausted
+_NDJSON_END = object()
+
+
+class NDJSONResponse(StreamingResponse):
+    """Stream items as newline-delimited JSON (NDJSON / JSON Lines).
+
+    Items are encoded with a single msgspec encoder straight into a shared
+    buffer (``Encoder.encode_into``) and flushed as one chunk once the buffer
+    reaches ``flush_bytes`` or ``flush_interval`` seconds have passed since the
+    last flush. Rust therefore sees a few large chunks instead of one tiny
+    chunk per item.
+
+    ``content`` may be a sync iterable, an async iterable, or a Django QuerySet.
+    QuerySets are streamed with ``.iterator(chunk_size=...)`` from the sync
+    streaming thread, so rows are never loaded into memory all at once.
+
+    When ``item_type`` is given, each item is converted with
+    ``msgspec.convert(..., from_attributes=True)`` (validating dicts and model
+    instances alike). For a Struct ``item_type`` a QuerySet is narrowed to
+    ``.values(*fields)`` first, skipping model instantiation. Without
+    ``item_type`` a QuerySet of model instances is streamed as ``.values()``
+    (one object of all concrete fields per row).
+
+    Example:
+        return NDJSONResponse(Event.objects.order_by("id"), item_type=EventSchema)
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        *,
+        item_type: Any = None,
+        status_code: int = 200,
+        media_type: str = "application/x-ndjson",
+        headers: dict[str, str] | None = None,
+        flush_bytes: int = 64 * 1024,
+        flush_interval: float | None = 0.05,
+        chunk_size: int = 2000,
+    ):
+        if callable(content) and not isinstance(content, QuerySet):
+            raise TypeError(
+                f"NDJSONResponse content must be an iterable, async iterable or QuerySet, "
+                f"not a callable. Received: {type(content).__name__}"
+            )
+
+        self.item_type = item_type
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+
+        if isinstance(content, QuerySet):
+            if item_type is not None and hasattr(item_type, "__struct_fields__"):
+                content = content.values(*item_type.__struct_fields__)
+            elif item_type is None and content._iterable_class is ModelIterable:
+                # Model instances are not JSON serializable: encode their field values
+                content = content.values()
+            stream = self._encode_sync(content.iterator(chunk_size=chunk_size))
+        elif hasattr(content, "__aiter__"):
+            stream = self._encode_async(content)
+        elif hasattr(content, "__iter__"):
+            stream = self._encode_sync(content)
+        else:
+            raise TypeError(
+                f"NDJSONResponse content must be an iterable, async iterable or QuerySet. "
+                f"Received type: {type(content).__name__}"
+            )
+
+        super().__init__(stream, status_code=status_code, media_type=media_type, headers=headers)
+
+    def _convert(self, item: Any) -> Any:
+        item_type = self.item_type
+        if item_type is None or item.__class__ is item_type:
+            return item
+        return msgspec.convert(item, item_type, from_attributes=True)
+
+    def _encode_sync(self, iterable: Any) -> Iterator[bytearray]:
+        encoder = msgspec.json.Encoder(enc_hook=_json.default_serializer)
+        convert = self._convert
+        flush_bytes = self.flush_bytes
+        flush_interval = self.flush_interval
+        buffer = bytearray()
+        last_flush = time.monotonic()
+
+        for item in iterable:
+            encoder.encode_into(convert(item), buffer, -1)
+            buffer.append(10)  # b"\n"
+            if len(buffer) >= flush_bytes or (
+                flush_interval is not None and time.monotonic() - last_flush >= flush_interval
+            ):
+                # Hand the filled buffer to Rust and start a fresh one (no copy)
+                yield buffer
+                buffer = bytearray()
+                last_flush = time.monotonic()
+
+        if buffer:
+            yield buffer
+
+    async def _encode_async(self, aiterable: Any) -> AsyncIterator[bytearray]:
+        encoder = msgspec.json.Encoder(enc_hook=_json.default_serializer)
+        convert = self._convert
+        flush_bytes = self.flush_bytes
+        flush_interval = self.flush_interval
+        iterator = aiter(aiterable)
+        buffer = bytearray()
+        last_flush = time.monotonic()
+        pending: asyncio.Future | None = None
+
+        try:
+            while True:
+                if buffer and flush_interval is not None:
+                    # Items are buffered: wait for the next one only until the time
+                    # budget runs out so slow sources (log tails) are not held back
+                    if pending is None:
+                        pending = asyncio.ensure_future(anext(iterator, _NDJSON_END))
+                    remaining = flush_interval - (time.monotonic() - last_flush)
+                    if remaining <= 0 or not (await asyncio.wait((pending,), timeout=remaining))[0]:
+                        yield buffer
+                        buffer = bytearray()
+                        last_flush = time.monotonic()
+                        continue
+                    item = pending.result()
+                    pending = None
+                elif pending is not None:
+                    # Buffer was just flushed while a read was still in flight
+                    item = await pending
+                    pending = None
+                else:
+                    item = await anext(iterator, _NDJSON_END)
+
+                if item is _NDJSON_END:
+                    break
+
+                encoder.encode_into(convert(item), buffer, -1)
+                buffer.append(10)  # b"\n"
+                if len(buffer) >= flush_bytes:
+                    yield buffer
+                    buffer = bytearray()
+                    last_flush = time.monotonic()
+
+            if buffer:
+                yield buffer
+        finally:
+            if pending is not None:
+                pending.cancel()
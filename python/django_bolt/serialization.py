@@ -11,7 +11,7 @@ from django.db.models import QuerySet
 from django.http import HttpResponse as DjangoHttpResponse
 from django.http import HttpResponseRedirect as DjangoHttpResponseRedirect
 
-from . import _json
+from . import _json, _msgpack
 from ._kwargs import coerce_to_response_type, coerce_to_response_type_async
 from .cookies import Cookie
 from .responses import HTML, JSON, File, FileResponse, PlainText, Redirect, StreamingResponse
@@ -81,7 +81,9 @@ def _build_response_meta(
 
 
 # Pre-computed response metadata tuples for common cases (module-level constants)
-_RESPONSE_META_JSON = _build_response_meta("json", None, None)
+# Data responses are negotiated on Accept (JSON or MessagePack), so caches must vary on it
+_RESPONSE_META_JSON = _build_response_meta("json", {"vary": "Accept"}, None)
+_RESPONSE_META_MSGPACK = _build_response_meta("msgpack", {"vary": "Accept"}, None)
 _RESPONSE_META_PLAINTEXT = _build_response_meta("plaintext", None, None)
 _RESPONSE_META_OCTETSTREAM = _build_response_meta("octetstream", None, None)
 
@@ -114,6 +116,16 @@ def _convert_serializers(result: Any) -> Any:
     return result
 
 
+def _is_prevalidated(result: Any, meta: HandlerMetadata | None) -> bool:
+    """Check whether a result already matches the route's response type.
+
+    Uses the plan compiled at registration time (see compile_response_plan), so
+    matching results are encoded directly without a coercion pass.
+    """
+    plan = meta.get("response_plan") if meta else None
+    return plan is not None and plan(result)
+
+
 def _dispatch_non_json_type(
     result: Any, response_tp: Any | None, meta: HandlerMetadata, status_code: int, is_async: bool = True
 ) -> ResponseTuple | None:
@@ -162,8 +174,13 @@ def _dispatch_non_json_type(
     return None  # Signal unhandled type
 
 
-async def serialize_response(result: Any, meta: HandlerMetadata) -> ResponseTuple:
-    """Serialize handler result to HTTP response."""
+async def serialize_response(result: Any, meta: HandlerMetadata, msgpack: bool = False) -> ResponseTuple:
+    """Serialize handler result to HTTP response.
+
+    When ``msgpack`` is True (client sent ``Accept: application/msgpack``), plain data
+    results (dict, list, Struct, QuerySet) are encoded as MessagePack instead of JSON.
+    Explicit response objects (JSON, Response, ...) keep their own media type.
+    """
     # Direct access -- keys guaranteed at registration time
     status_code = meta["default_status_code"]
     response_tp = meta["response_type"]
@@ -174,10 +191,10 @@ async def serialize_response(result: Any, meta: HandlerMetadata) -> ResponseTupl
 
     # Fast path: dict/list are the most common response types (90%+ of handlers)
     if isinstance(result, dict):
-        return await serialize_json_data(result, response_tp, meta)
+        return await serialize_json_data(result, response_tp, meta, msgpack)
     if isinstance(result, list):
         result = _convert_serializers(result)
-        return await serialize_json_data(result, response_tp, meta)
+        return await serialize_json_data(result, response_tp, meta, msgpack)
 
     # Convert Serializer instances to dicts (handles write_only, computed_field)
     original = result
@@ -185,7 +202,7 @@ async def serialize_response(result: Any, meta: HandlerMetadata) -> ResponseTupl
 
     # If _convert_serializers changed the value, it IS dict/list -- skip isinstance re-check
     if result is not original:
-        return await serialize_json_data(result, response_tp, meta)
+        return await serialize_json_data(result, response_tp, meta, msgpack)
 
     # Try shared dispatch first (handles most non-JSON types)
     shared_result = _dispatch_non_json_type(result, response_tp, meta, status_code)
@@ -198,10 +215,10 @@ async def serialize_response(result: Any, meta: HandlerMetadata) -> ResponseTupl
     if isinstance(result, ResponseClass):
         return await serialize_generic_response(result, response_tp, meta)
     if isinstance(result, msgspec.Struct):
-        return await serialize_json_data(result, response_tp, meta)
+        return await serialize_json_data(result, response_tp, meta, msgpack)
     if isinstance(result, QuerySet):
         result_list = await sync_to_async(list, thread_sensitive=True)(result)
-        return await serialize_json_data(result_list, response_tp, meta)
+        return await serialize_json_data(result_list, response_tp, meta, msgpack)
 
     raise TypeError(
         f"Handler returned unsupported type {type(result).__name__!r}. "
@@ -209,7 +226,7 @@ async def serialize_response(result: Any, meta: HandlerMetadata) -> ResponseTupl
     )
 
 
-def serialize_response_sync(result: Any, meta: HandlerMetadata) -> ResponseTuple:
+def serialize_response_sync(result: Any, meta: HandlerMetadata, msgpack: bool = False) -> ResponseTuple:
     """Serialize handler result to HTTP response (sync version for sync handlers)."""
     # Direct access -- keys guaranteed at registration time
     status_code = meta["default_status_code"]
@@ -221,10 +238,10 @@ def serialize_response_sync(result: Any, meta: HandlerMetadata) -> ResponseTuple
 
     # Fast path: dict/list are the most common response types (90%+ of handlers)
     if isinstance(result, dict):
-        return serialize_json_data_sync(result, response_tp, meta)
+        return serialize_json_data_sync(result, response_tp, meta, msgpack)
     if isinstance(result, list):
         result = _convert_serializers(result)
-        return serialize_json_data_sync(result, response_tp, meta)
+        return serialize_json_data_sync(result, response_tp, meta, msgpack)
 
     # Convert Serializer instances
     original = result
@@ -232,7 +249,7 @@ def serialize_response_sync(result: Any, meta: HandlerMetadata) -> ResponseTuple
 
     # If _convert_serializers changed the value, skip isinstance re-check
     if result is not original:
-        return serialize_json_data_sync(result, response_tp, meta)
+        return serialize_json_data_sync(result, response_tp, meta, msgpack)
 
     # Try shared dispatch first (handles most non-JSON types)
     shared_result = _dispatch_non_json_type(result, response_tp, meta, status_code, is_async=False)
@@ -241,7 +258,7 @@ def serialize_response_sync(result: Any, meta: HandlerMetadata) -> ResponseTuple
 
     # Sync-specific handling
     if isinstance(result, JSON):
-        if response_tp is not None:
+        if response_tp is not None and not _is_prevalidated(result.data, meta):
             try:
                 validated = coerce_to_response_type(result.data, response_tp, meta=meta)
                 data_bytes = _json.encode(validated)
@@ -274,9 +291,9 @@ def serialize_response_sync(result: Any, meta: HandlerMetadata) -> ResponseTuple
         resp_meta = _build_response_meta(response_type, headers, cookies)
         return int(result.status_code), resp_meta, data_bytes
     elif isinstance(result, msgspec.Struct):
-        return serialize_json_data_sync(result, response_tp, meta)
+        return serialize_json_data_sync(result, response_tp, meta, msgpack)
     elif isinstance(result, QuerySet):
-        return serialize_json_data_sync(list(result), response_tp, meta)
+        return serialize_json_data_sync(list(result), response_tp, meta, msgpack)
 
     raise TypeError(
         f"Handler returned unsupported type {type(result).__name__!r}. "
@@ -322,7 +339,7 @@ async def serialize_json_response(
 
     Uses the new ResponseMeta tuple format for Rust-side header building.
     """
-    if response_tp is not None:
+    if response_tp is not None and not _is_prevalidated(result.data, meta):
         try:
             validated = await coerce_to_response_type_async(result.data, response_tp, meta=meta)
             data_bytes = _json.encode(validated)
@@ -434,40 +451,46 @@ def serialize_file_streaming_response(result: FileResponse) -> ResponseTuple:
     return int(result.status_code), resp_meta, b""
 
 
-async def serialize_json_data(result: Any, response_tp: Any | None, meta: HandlerMetadata) -> ResponseTuple:
-    """Serialize dict/list/other data as JSON.
+async def serialize_json_data(
+    result: Any, response_tp: Any | None, meta: HandlerMetadata, msgpack: bool = False
+) -> ResponseTuple:
+    """Serialize dict/list/other data as JSON (or MessagePack when negotiated).
 
     Uses the new ResponseMeta tuple format for Rust-side header building.
     """
-    if response_tp is not None:
+    encode = _msgpack.encode if msgpack else _json.encode
+    if response_tp is not None and not _is_prevalidated(result, meta):
         try:
             validated = await coerce_to_response_type_async(result, response_tp, meta=meta)
-            data = _json.encode(validated)
+            data = encode(validated)
         except Exception as e:
             err = f"Response validation error: {e}"
             # Error responses use legacy format (simple case)
             return 500, [("content-type", "text/plain; charset=utf-8")], err.encode()
     else:
-        data = _json.encode(result)
+        data = encode(result)
 
     status = meta["default_status_code"]
-    return status, _RESPONSE_META_JSON, data
+    return status, _RESPONSE_META_MSGPACK if msgpack else _RESPONSE_META_JSON, data
 
 
-def serialize_json_data_sync(result: Any, response_tp: Any | None, meta: HandlerMetadata) -> ResponseTuple:
-    """Serialize dict/list/other data as JSON (sync version for sync handlers).
+def serialize_json_data_sync(
+    result: Any, response_tp: Any | None, meta: HandlerMetadata, msgpack: bool = False
+) -> ResponseTuple:
+    """Serialize dict/list/other data as JSON or MessagePack (sync version for sync handlers).
 
     Uses the new ResponseMeta tuple format for Rust-side header building.
     """
-    if response_tp is not None:
+    encode = _msgpack.encode if msgpack else _json.encode
+    if response_tp is not None and not _is_prevalidated(result, meta):
         try:
             validated = coerce_to_response_type(result, response_tp, meta=meta)
-            data = _json.encode(validated)
+            data = encode(validated)
         except Exception as e:
             err = f"Response validation error: {e}"
             return 500, [("content-type", "text/plain; charset=utf-8")], err.encode()
     else:
-        data = _json.encode(result)
+        data = encode(result)
 
     status = meta["default_status_code"]
-    return status, _RESPONSE_META_JSON, data
+    return status, _RESPONSE_META_MSGPACK if msgpack else _RESPONSE_META_JSON, data
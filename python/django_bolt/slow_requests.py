@@ -0,0 +1,321 @@
+"""Slow-request sampler.
+
+Opt-in with ``BOLT_SLOW_REQUEST_MS = <milliseconds>`` in Django settings. Every
+dispatched request is tracked while it runs; a sampling thread captures the
+Python stack of requests that are still running past the threshold:
+
+- the worker thread's stack for sync handlers running on the thread pool
+- the event loop thread's stack when the request is blocking the loop
+- otherwise the coroutine stack of the request's task (where it is awaiting)
+
+When a slow request finishes, its route, path/query parameters and headers
+(obfuscated with ``LoggingMiddleware.obfuscate_params``/``obfuscate_headers``,
+so ``?token=`` or ``?password=`` values are never stored), status, Python phase
+timings and the sampled stack are stored in a bounded ring buffer
+(``BOLT_SLOW_REQUEST_BUFFER`` records, default: 100) and logged on the
+``django_bolt.slow_requests`` logger.
+
+Records are per process. Read them with ``get_slow_request_sampler().records()``,
+an endpoint registered with ``register_slow_requests_endpoint()`` or the
+``bolt_slow_requests`` management command.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from . import concurrency
+from .auth.guards import IsStaff
+from .logging.middleware import LoggingMiddleware
+
+__all__ = [
+    "DEFAULT_SLOW_REQUEST_BUFFER",
+    "SlowRequestSampler",
+    "enable_slow_request_sampler",
+    "get_slow_request_sampler",
+    "register_slow_requests_endpoint",
+]
+
+logger = logging.getLogger(__name__)
+
+# Default number of slow requests kept per process
+DEFAULT_SLOW_REQUEST_BUFFER = 100
+
+# Frames kept from the captured stack (innermost)
+MAX_STACK_FRAMES = 30
+
+
+class _InFlightRequest:
+    """A request being dispatched, as seen by the sampling thread."""
+
+    __slots__ = ("started", "task", "threads", "stack")
+
+    def __init__(self, task: asyncio.Task | None) -> None:
+        self.started = time.perf_counter()
+        self.task = task
+        # Thread pool workers currently running code for this request
+        self.threads: list[int] = []
+        self.stack: str | None = None
+
+
+# In-flight request of the current task (copied into sync_to_thread worker threads)
+_current_request: contextvars.ContextVar[_InFlightRequest | None] = contextvars.ContextVar(
+    "bolt_slow_request", default=None
+)
+
+
+def _track_worker_thread(fn: Callable[[], Any]) -> Callable[[], Any]:
+    """Let the sampler find the worker thread running ``fn`` for the current request."""
+    entry = _current_request.get()
+    if entry is None:
+        return fn
+
+    def run() -> Any:
+        ident = threading.get_ident()
+        entry.threads.append(ident)
+        try:
+            return fn()
+        finally:
+            entry.threads.remove(ident)
+
+    return run
+
+
+def _format_await_chain(coro: Any) -> str:
+    """Format the frames of a suspended coroutine and everything it awaits, outermost first.
+
+    ``Task.get_stack()`` only returns the outermost frame of a suspended task.
+    """
+    summary = traceback.StackSummary()
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        if frame is None:
+            break
+        summary.append(traceback.FrameSummary(frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name))
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    return "".join(traceback.StackSummary.from_list(summary[-MAX_STACK_FRAMES:]).format())
+
+
+class SlowRequestSampler:
+    """Captures stacks of requests running past a threshold and keeps the slowest ones."""
+
+    def __init__(
+        self,
+        threshold: float,
+        capacity: int = DEFAULT_SLOW_REQUEST_BUFFER,
+        obfuscator: LoggingMiddleware | None = None,
+        interval: float | None = None,
+    ) -> None:
+        """
+        Args:
+            threshold: Seconds after which a request is considered slow
+            capacity: Number of records kept (oldest are dropped)
+            obfuscator: Logging middleware whose obfuscation settings are applied to parameters and headers
+            interval: Sampling interval in seconds (default: threshold / 2, at most 50ms)
+        """
+        self.threshold = threshold
+        self.interval = interval if interval is not None else min(threshold / 2, 0.05)
+        self.obfuscator = obfuscator or LoggingMiddleware()
+
+        self._inflight: dict[int, _InFlightRequest] = {}
+        self._records: deque[dict[str, Any]] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def capacity(self) -> int:
+        return self._records.maxlen or 0
+
+    def start(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """Start the sampling thread for ``loop`` (default: the running loop). Idempotent."""
+        if self.running:
+            return
+        self._loop = loop or asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop.clear()
+        concurrency._thread_tracker = _track_worker_thread
+        self._thread = threading.Thread(target=self._watch, name="bolt-slow-request-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread."""
+        self._stop.set()
+        if concurrency._thread_tracker is _track_worker_thread:
+            concurrency._thread_tracker = None
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def start_request(self) -> tuple[_InFlightRequest, contextvars.Token]:
+        """Track the current task's request (called on the event loop)."""
+        entry = _InFlightRequest(asyncio.current_task())
+        self._inflight[id(entry)] = entry
+        return entry, _current_request.set(entry)
+
+    def finish_request(
+        self,
+        entry: _InFlightRequest,
+        token: contextvars.Token,
+        request: Any,
+        route: str,
+        status: int | None,
+        error: BaseException | None = None,
+        timings: list[tuple[str, float]] | None = None,
+    ) -> dict[str, Any] | None:
+        """Stop tracking a request and record it when it was slow.
+
+        Returns:
+            The stored record, or None when the request was fast
+        """
+        duration = time.perf_counter() - entry.started
+        _current_request.reset(token)
+        self._inflight.pop(id(entry), None)
+        if duration < self.threshold:
+            return None
+
+        record = {
+            "timestamp": time.time() - duration,
+            "pid": os.getpid(),
+            "route": route,
+            "method": request.get("method", ""),
+            "path": request.get("path", ""),
+            "status": status,
+            "error": f"{type(error).__name__}: {error}" if error is not None else None,
+            "duration_ms": round(duration * 1000, 3),
+            "params": self.obfuscator.obfuscate_params(dict(request.get("params") or {})),
+            "query": self.obfuscator.obfuscate_params(dict(request.get("query") or {})),
+            "headers": self.obfuscator.obfuscate_headers(dict(request.get("headers") or {})),
+            "phases_ms": {name: round(seconds * 1000, 3) for name, seconds in timings or ()},
+            # Requests finishing between two samples have no stack
+            "stack": entry.stack,
+        }
+        with self._lock:
+            self._records.append(record)
+        logger.warning(
+            "Slow request: %s %s (route: %s) took %.0f ms%s",
+            record["method"],
+            record["path"],
+            route,
+            record["duration_ms"],
+            f". Stack while running:\n{entry.stack}" if entry.stack else "",
+        )
+        return record
+
+    def _watch(self) -> None:
+        """Sampling thread: capture stacks of requests running past the threshold."""
+        while not self._stop.wait(self.interval):
+            deadline = time.perf_counter() - self.threshold
+            for entry in list(self._inflight.values()):
+                if entry.stack is None and entry.started <= deadline:
+                    try:
+                        entry.stack = self._capture_stack(entry)
+                    except Exception:
+                        # Frames can go away while they are being walked
+                        logger.debug("Could not capture the stack of a slow request", exc_info=True)
+                        entry.stack = ""
+
+    def _capture_stack(self, entry: _InFlightRequest) -> str:
+        frames = sys._current_frames()
+        stacks = [
+            "".join(traceback.format_stack(frames[ident], limit=MAX_STACK_FRAMES))
+            for ident in list(entry.threads)
+            if ident in frames
+        ]
+        if stacks:
+            return "\n".join(stacks)
+
+        task = entry.task
+        if task is None:
+            return ""
+        try:
+            running = asyncio.current_task(self._loop) is task
+        except RuntimeError:
+            running = False
+        if running and self._loop_thread_id in frames:
+            # The request is blocking the event loop
+            return "".join(traceback.format_stack(frames[self._loop_thread_id], limit=MAX_STACK_FRAMES))
+
+        # Suspended: show where the coroutine chain is awaiting
+        return _format_await_chain(task.get_coro())
+
+    def records(self) -> list[dict[str, Any]]:
+        """Return the recorded slow requests, newest first."""
+        with self._lock:
+            return list(reversed(self._records))
+
+    def reset(self) -> None:
+        """Drop all records."""
+        with self._lock:
+            self._records.clear()
+
+
+# Process-wide sampler (created by enable_slow_request_sampler)
+_sampler: SlowRequestSampler | None = None
+
+
+def enable_slow_request_sampler(
+    threshold_ms: float,
+    capacity: int = DEFAULT_SLOW_REQUEST_BUFFER,
+    obfuscator: LoggingMiddleware | None = None,
+) -> SlowRequestSampler:
+    """Create (once) the process-wide sampler. It starts on the first dispatched request."""
+    global _sampler
+    if _sampler is None:
+        _sampler = SlowRequestSampler(threshold_ms / 1000, capacity, obfuscator)
+    return _sampler
+
+
+def get_slow_request_sampler() -> SlowRequestSampler | None:
+    """Return the process-wide sampler, or None when it is disabled."""
+    return _sampler
+
+
+def register_slow_requests_endpoint(api: Any, path: str = "/__bolt__/slow-requests", **route_kwargs: Any) -> None:
+    """Register a GET endpoint returning this process's slow request records.
+
+    The records contain request parameters and headers and ``?reset=1`` clears
+    them, so the endpoint is guarded with ``IsStaff()`` unless ``guards=[...]``
+    is passed (pair it with ``auth=[...]`` or the API's default authentication).
+    Pass ``guards=[AllowAny()]`` only where the endpoint is not reachable by
+    untrusted clients.
+
+    Args:
+        api: BoltAPI instance
+        path: Endpoint path
+        **route_kwargs: Extra arguments for ``api.get`` (guards, auth, tags, ...)
+    """
+
+    async def slow_requests_handler(reset: bool = False) -> dict[str, Any]:
+        sampler = get_slow_request_sampler()
+        if sampler is None:
+            return {"enabled": False, "requests": []}
+        records = sampler.records()
+        if reset:
+            sampler.reset()
+        return {
+            "enabled": True,
+            "threshold_ms": round(sampler.threshold * 1000, 3),
+            "capacity": sampler.capacity,
+            "requests": records,
+        }
+
+    route_kwargs.setdefault("guards", [IsStaff()])
+    api.get(path, **route_kwargs)(slow_requests_handler)
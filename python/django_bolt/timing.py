@@ -0,0 +1,104 @@
+"""Per-phase request timings.
+
+Opt-in with ``BOLT_PHASE_TIMINGS = True`` (per-route histograms) or
+``BOLT_SERVER_TIMING = True`` (histograms plus a ``Server-Timing`` response
+header). The Rust server splits each request into phases:
+
+- ``route``: route matching and path parameter decoding
+- ``parse``: query/path parameter validation and header extraction
+- ``auth``: rate limiting, authentication and guards
+- ``body``: reading the request body and form parsing
+- ``gil``: acquiring the GIL and building the Python request
+- ``queue``: waiting for the event loop to run the dispatch coroutine
+- ``bind``: parameter binding in Python
+- ``handler``: the handler itself (and Python middleware, if any)
+- ``serialize``: response serialization in Python
+- ``respond``: building the Rust response
+- ``total``: the whole request, from route match to response
+
+Compression runs while the body is streamed, after headers are sent, so it is
+not part of the breakdown.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django_bolt import _core
+
+__all__ = [
+    "PHASES",
+    "TIMINGS_STATE_KEY",
+    "get_route_timings",
+    "reset_route_timings",
+]
+
+# request.state key of the list _dispatch appends (phase, seconds) tuples to.
+# Rust only creates the list when timings are enabled.
+TIMINGS_STATE_KEY = "_bolt_timings"
+
+PHASES = (
+    "route",
+    "parse",
+    "auth",
+    "body",
+    "gil",
+    "queue",
+    "bind",
+    "handler",
+    "serialize",
+    "respond",
+    "total",
+)
+
+
+def _percentile(buckets: list[tuple[float, int]], count: int, quantile: float) -> float:
+    """Estimate a percentile (ms) from cumulative histogram buckets by linear interpolation."""
+    rank = quantile * count
+    lower_bound = 0.0
+    lower_count = 0
+    for bound, cumulative in buckets:
+        if cumulative >= rank:
+            if bound == float("inf"):
+                return lower_bound
+            in_bucket = cumulative - lower_count
+            fraction = (rank - lower_count) / in_bucket if in_bucket else 0.0
+            return lower_bound + (bound - lower_bound) * fraction
+        lower_bound, lower_count = bound, cumulative
+    return lower_bound
+
+
+def get_route_timings(api: Any = None) -> dict[str, dict[str, dict[str, Any]]]:
+    """Return this process's per-route phase timings.
+
+    Each phase has ``count``, ``avg_ms``, ``p50_ms``, ``p95_ms``, ``p99_ms``
+    (estimated from histogram buckets) and the raw cumulative ``buckets``.
+
+    Args:
+        api: BoltAPI used to label routes as "METHOD /path" (default: handler_id)
+    """
+    result: dict[str, dict[str, dict[str, Any]]] = {}
+    for handler_id, phases in _core.get_route_timings().items():
+        label = api._route_label(handler_id) if api is not None else str(handler_id)
+        route: dict[str, dict[str, Any]] = {}
+        for phase in PHASES:
+            stats = phases.get(phase)
+            if stats is None:
+                continue
+            count = stats["count"]
+            buckets = stats["buckets"]
+            route[phase] = {
+                "count": count,
+                "avg_ms": round(stats["sum_ms"] / count, 3),
+                "p50_ms": round(_percentile(buckets, count, 0.50), 3),
+                "p95_ms": round(_percentile(buckets, count, 0.95), 3),
+                "p99_ms": round(_percentile(buckets, count, 0.99), 3),
+                "buckets": buckets,
+            }
+        result[label] = route
+    return result
+
+
+def reset_route_timings() -> None:
+    """Drop this process's collected phase timings."""
+    _core.reset_route_timings()
@@ -102,6 +102,10 @@ class HandlerMetadata(TypedDict, total=False):
     response_field_names: list[str]
     """Pre-computed field names for QuerySet.values() call"""
 
+    response_plan: Any
+    """Pre-compiled predicate ``(result) -> bool`` telling the serializer that a result
+    already matches response_type and can be encoded without coercion (None = always coerce)"""
+
     # Performance optimizations
     needs_form_parsing: bool
     """Whether this handler needs form/multipart parsing (Form/File params)"""
@@ -0,0 +1,258 @@
+"""Event loop lag monitor and blocking-call detector.
+
+All async handlers in a process share one asyncio event loop, so a handler
+doing blocking work (sync I/O, CPU-heavy loops, sync ORM) stalls every other
+request. Opt-in with ``BOLT_LOOP_WATCHDOG = True`` in Django settings.
+
+The watchdog has two parts:
+
+- A heartbeat callback on the event loop that measures scheduling lag
+  (how late each ``call_later`` fires) into a histogram.
+- A sampling thread that notices when the heartbeat stops for longer than
+  ``BOLT_LOOP_BLOCK_THRESHOLD_MS`` (default: 100) and captures the loop
+  thread's Python stack together with the route of the running task.
+
+Blocking episodes are logged on the ``django_bolt.watchdog`` logger and
+counted per route. ``get_loop_watchdog().snapshot()`` returns the metrics.
+With ``BOLT_METRICS = True`` they are also exported as Prometheus series
+(``bolt_event_loop_*``) through the custom metrics registry.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Any
+
+from . import metrics
+
+__all__ = [
+    "LoopWatchdog",
+    "enable_loop_watchdog",
+    "get_loop_watchdog",
+]
+
+logger = logging.getLogger(__name__)
+
+# Default time the loop may be blocked before the stack is captured
+DEFAULT_BLOCK_THRESHOLD_MS = 100
+
+# Upper bounds (ms) of the loop lag histogram buckets
+LAG_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# Frames kept from the captured stack (innermost)
+MAX_STACK_FRAMES = 30
+
+LAG_METRIC = "bolt_event_loop_lag_observations_total"
+BLOCKED_METRIC = "bolt_event_loop_blocked_total"
+
+
+class LoopWatchdog:
+    """Measures event loop lag and captures stacks of blocking callbacks."""
+
+    def __init__(self, threshold: float = DEFAULT_BLOCK_THRESHOLD_MS / 1000, interval: float | None = None) -> None:
+        """
+        Args:
+            threshold: Seconds the loop may be blocked before it is reported
+            interval: Heartbeat interval in seconds (default: threshold / 2, at most 50ms)
+        """
+        self.threshold = threshold
+        self.interval = interval if interval is not None else min(threshold / 2, 0.05)
+
+        # Route label of each task currently dispatching a request
+        self.task_routes: dict[asyncio.Task, str] = {}
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+        self._last_beat = 0.0
+        # Blocking episode in progress: (started_at, route, stack)
+        self._episode: tuple[float, str | None, str] | None = None
+
+        self._lag_last = 0.0
+        self._lag_max = 0.0
+        self._lag_sum = 0.0
+        self._lag_samples = 0
+        self._lag_buckets = [0] * (len(LAG_BUCKETS_MS) + 1)
+
+        self._blocked_count = 0
+        self._blocked_total = 0.0
+        self._blocked_max = 0.0
+        self._blocked_routes: dict[str, int] = {}
+
+        # Prometheus series (set by export_metrics)
+        self._lag_counters: list[Any] | None = None
+        self._lag_gauge: Any = None
+        self._blocked_ms_counter: Any = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """Start monitoring ``loop`` (default: the running loop). Idempotent."""
+        if self.running:
+            return
+        self._loop = loop or asyncio.get_running_loop()
+        self._stop.clear()
+        self._last_beat = time.perf_counter()
+        self._loop.call_soon_threadsafe(self._beat, self._last_beat)
+        self._thread = threading.Thread(target=self._watch, name="bolt-loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread (the heartbeat stops at its next tick)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def _beat(self, scheduled_at: float) -> None:
+        """Heartbeat callback running on the event loop."""
+        now = time.perf_counter()
+        self._loop_thread_id = threading.get_ident()
+        with self._lock:
+            self._last_beat = now
+            episode, self._episode = self._episode, None
+        self._record_lag(max(now - scheduled_at, 0.0))
+
+        if episode is not None:
+            self._finish_episode(episode, now)
+
+        if not self._stop.is_set():
+            self._loop.call_later(self.interval, self._beat, now + self.interval)
+
+    def export_metrics(self) -> None:
+        """Mirror lag and blocking metrics into Prometheus series. Idempotent.
+
+        Lag observations are cumulative counters by upper bound (``le``, seconds),
+        like the buckets of a Prometheus histogram.
+        """
+        if self._lag_counters is not None:
+            return
+        help_text = "Event loop heartbeats by scheduling lag"
+        self._lag_counters = [
+            metrics.counter(LAG_METRIC, help_text, {"le": f"{bound / 1000:g}"}) for bound in LAG_BUCKETS_MS
+        ] + [metrics.counter(LAG_METRIC, help_text, {"le": "+Inf"})]
+        self._lag_gauge = metrics.gauge("bolt_event_loop_lag_seconds", "Scheduling lag of the last heartbeat")
+        self._blocked_ms_counter = metrics.counter(
+            "bolt_event_loop_blocked_milliseconds_total", "Time the event loop spent blocked"
+        )
+
+    def _record_lag(self, lag: float) -> None:
+        lag_ms = lag * 1000
+        bucket = next((i for i, bound in enumerate(LAG_BUCKETS_MS) if lag_ms <= bound), len(LAG_BUCKETS_MS))
+        with self._lock:
+            self._lag_last = lag
+            self._lag_max = max(self._lag_max, lag)
+            self._lag_sum += lag
+            self._lag_samples += 1
+            self._lag_buckets[bucket] += 1
+        if self._lag_counters is not None:
+            for counter in self._lag_counters[bucket:]:
+                counter.inc()
+            self._lag_gauge.set(lag)
+
+    def _watch(self) -> None:
+        """Sampling thread: capture the loop's stack when the heartbeat stalls."""
+        while not self._stop.wait(self.interval):
+            stalled = time.perf_counter() - self._last_beat - self.interval
+            if stalled > self.threshold and self._episode is None:
+                self._start_episode(stalled)
+
+    def _start_episode(self, stalled: float) -> None:
+        last_beat = self._last_beat
+        route = None
+        stack = ""
+        if self._loop_thread_id is not None:
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                stack = "".join(traceback.format_stack(frame, limit=MAX_STACK_FRAMES))
+            try:
+                task = asyncio.current_task(self._loop)
+            except RuntimeError:
+                task = None
+            route = self.task_routes.get(task) if task is not None else None
+
+        with self._lock:
+            if self._last_beat != last_beat:
+                # The loop recovered while the stack was being captured
+                return
+            self._episode = (last_beat + self.interval, route, stack)
+        logger.warning(
+            "Event loop blocked for more than %.0f ms (route: %s). Stack of the blocking call:\n%s",
+            stalled * 1000,
+            route or "unknown",
+            stack,
+        )
+
+    def _finish_episode(self, episode: tuple[float, str | None, str], now: float) -> None:
+        started_at, route, _ = episode
+        duration = max(now - started_at, 0.0)
+        with self._lock:
+            self._blocked_count += 1
+            self._blocked_total += duration
+            self._blocked_max = max(self._blocked_max, duration)
+            if route is not None:
+                self._blocked_routes[route] = self._blocked_routes.get(route, 0) + 1
+        if self._blocked_ms_counter is not None:
+            metrics.counter(BLOCKED_METRIC, "Event loop blocking episodes", {"route": route or "unknown"}).inc()
+            self._blocked_ms_counter.inc(round(duration * 1000))
+        logger.info("Event loop was blocked for %.0f ms (route: %s)", duration * 1000, route or "unknown")
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return loop lag and blocking metrics."""
+        with self._lock:
+            samples = self._lag_samples or 1
+            buckets = {f"le_{bound}ms": count for bound, count in zip(LAG_BUCKETS_MS, self._lag_buckets, strict=False)}
+            buckets[f"gt_{LAG_BUCKETS_MS[-1]}ms"] = self._lag_buckets[-1]
+            return {
+                "threshold_ms": round(self.threshold * 1000, 3),
+                "lag_ms": {
+                    "last": round(self._lag_last * 1000, 3),
+                    "max": round(self._lag_max * 1000, 3),
+                    "avg": round(self._lag_sum * 1000 / samples, 3),
+                    "samples": self._lag_samples,
+                    "histogram": buckets,
+                },
+                "blocked": {
+                    "count": self._blocked_count,
+                    "total_ms": round(self._blocked_total * 1000, 3),
+                    "max_ms": round(self._blocked_max * 1000, 3),
+                    "routes": dict(sorted(self._blocked_routes.items(), key=lambda item: item[1], reverse=True)),
+                },
+            }
+
+    def reset(self) -> None:
+        """Drop all collected metrics (exported Prometheus counters keep counting)."""
+        with self._lock:
+            self._lag_last = self._lag_max = self._lag_sum = 0.0
+            self._lag_samples = 0
+            self._lag_buckets = [0] * (len(LAG_BUCKETS_MS) + 1)
+            self._blocked_count = 0
+            self._blocked_total = self._blocked_max = 0.0
+            self._blocked_routes.clear()
+
+
+# Process-wide watchdog (created by enable_loop_watchdog)
+_watchdog: LoopWatchdog | None = None
+
+
+def enable_loop_watchdog(threshold_ms: float = DEFAULT_BLOCK_THRESHOLD_MS) -> LoopWatchdog:
+    """Create (once) the process-wide watchdog. It starts on the first dispatched request."""
+    global _watchdog
+    if _watchdog is None:
+        _watchdog = LoopWatchdog(threshold=threshold_ms / 1000)
+    return _watchdog
+
+
+def get_loop_watchdog() -> LoopWatchdog | None:
+    """Return the process-wide watchdog, or None when it is disabled."""
+    return _watchdog
@@ -7,6 +7,7 @@ with type-safe dependency injection.
 Uses pytest-django for proper Django configuration.
 """
 
+import json
 import time
 
 import jwt
@@ -275,5 +276,361 @@ def test_jwt_custom_secret_overrides():
     print("✓ Explicit JWT secret overrides Django SECRET_KEY")
 
 
+def test_jwt_metadata_includes_cache_settings():
+    """Test that token cache settings reach the Rust backend."""
+    metadata = JWTAuthentication(secret="secret", cache_size=100, cache_ttl=5).to_metadata()
+    assert metadata["cache_size"] == 100
+    assert metadata["cache_ttl"] == 5
+
+
+@pytest.mark.parametrize("cache_ttl", [60, 0])
+def test_jwt_repeated_token_with_cache(cache_ttl):
+    """Test that repeat requests with one token pass, with and without the token cache."""
+    from django_bolt.testing import TestClient  # noqa: PLC0415
+
+    api = BoltAPI()
+
+    @api.get("/me", auth=[JWTAuthentication(secret="cache-secret", cache_ttl=cache_ttl)], guards=[IsAuthenticated()])
+    async def me(request: dict):
+        return {"user_id": request["context"]["user_id"]}
+
+    token = jwt.encode({"sub": "42", "exp": int(time.time()) + 3600}, "cache-secret", algorithm="HS256")
+    forged = jwt.encode({"sub": "42", "exp": int(time.time()) + 3600}, "other-secret", algorithm="HS256")
+    expired = jwt.encode({"sub": "42", "exp": int(time.time()) - 100}, "cache-secret", algorithm="HS256")
+
+    with TestClient(api) as client:
+        for _ in range(3):
+            response = client.get("/me", headers={"Authorization": f"Bearer {token}"})
+            assert response.status_code == 200
+            assert response.json() == {"user_id": "42"}
+        # Cached tokens never vouch for other tokens
+        assert client.get("/me", headers={"Authorization": f"Bearer {forged}"}).status_code == 401
+        assert client.get("/me", headers={"Authorization": f"Bearer {expired}"}).status_code == 401
+
+
+def test_jwt_rs256_uses_public_key():
+    """Test that RS256 tokens are verified with a PEM public key."""
+    rsa = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.rsa")
+    serialization = pytest.importorskip("cryptography.hazmat.primitives.serialization")
+    from django_bolt.testing import TestClient  # noqa: PLC0415
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    public_pem = (
+        private_key.public_key()
+        .public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+        .decode()
+    )
+
+    api = BoltAPI()
+
+    @api.get("/me", auth=[JWTAuthentication(secret=public_pem, algorithms=["RS256"])], guards=[IsAuthenticated()])
+    async def me(request: dict):
+        return {"user_id": request["context"]["user_id"]}
+
+    token = jwt.encode({"sub": "7", "exp": int(time.time()) + 3600}, private_key, algorithm="RS256")
+    with TestClient(api) as client:
+        response = client.get("/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert response.json() == {"user_id": "7"}
+
+
+def _rsa_jwk(kid):
+    """Generate an RSA key pair and return (private_key, public JWK with kid)."""
+    rsa = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.rsa")
+    from jwt.algorithms import RSAAlgorithm  # noqa: PLC0415
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": kid, "alg": "RS256", "use": "sig"})
+    return private_key, jwk
+
+
+def _rs256_token(private_key, kid, sub="7"):
+    payload = {"sub": sub, "exp": int(time.time()) + 3600}
+    return jwt.encode(payload, private_key, algorithm="RS256", headers={"kid": kid})
+
+
+def _jwks_api(auth):
+    api = BoltAPI()
+
+    @api.get("/me", auth=[auth], guards=[IsAuthenticated()])
+    async def me(request: dict):
+        return {"user_id": request["context"]["user_id"]}
+
+    return api
+
+
+def test_jwt_jwks_file_picks_key_by_kid(tmp_path):
+    """Test that tokens are verified with the JWKS key named by their kid."""
+    from django_bolt.testing import TestClient  # noqa: PLC0415
+
+    key_a, jwk_a = _rsa_jwk("a")
+    key_b, jwk_b = _rsa_jwk("b")
+    jwks_file = tmp_path / "jwks.json"
+    jwks_file.write_text(json.dumps({"keys": [jwk_a, jwk_b]}))
+
+    api = _jwks_api(JWTAuthentication(jwks=jwks_file))
+    with TestClient(api) as client:
+        for key, kid in ((key_a, "a"), (key_b, "b")):
+            response = client.get("/me", headers={"Authorization": f"Bearer {_rs256_token(key, kid)}"})
+            assert response.status_code == 200
+        # Signed with key a but claiming kid b
+        forged = _rs256_token(key_a, "b")
+        assert client.get("/me", headers={"Authorization": f"Bearer {forged}"}).status_code == 401
+        # Unknown kid
+        unknown = _rs256_token(key_a, "c")
+        assert client.get("/me", headers={"Authorization": f"Bearer {unknown}"}).status_code == 401
+
+
+def test_jwt_jwks_rotation_without_restart():
+    """Test that a refreshed JWK set replaces the keys of a running server."""
+    from django_bolt.testing import TestClient  # noqa: PLC0415
+
+    old_key, old_jwk = _rsa_jwk("old")
+    new_key, new_jwk = _rsa_jwk("new")
+    current = {"keys": [old_jwk]}
+
+    auth = JWTAuthentication(jwks=lambda: current, jwks_refresh=1, cache_ttl=0)
+    api = _jwks_api(auth)
+    old_token = _rs256_token(old_key, "old")
+    new_token = _rs256_token(new_key, "new")
+
+    with TestClient(api) as client:
+        assert client.get("/me", headers={"Authorization": f"Bearer {old_token}"}).status_code == 200
+        assert client.get("/me", headers={"Authorization": f"Bearer {new_token}"}).status_code == 401
+
+        current["keys"] = [new_jwk]
+        deadline = time.time() + 5
+        while time.time() < deadline:
+            if client.get("/me", headers={"Authorization": f"Bearer {new_token}"}).status_code == 200:
+                break
+            time.sleep(0.2)
+
+        assert client.get("/me", headers={"Authorization": f"Bearer {new_token}"}).status_code == 200
+        assert client.get("/me", headers={"Authorization": f"Bearer {old_token}"}).status_code == 401
+
+
+def test_jwt_jwks_rejects_hmac_algorithms():
+    """Test that a JWK set cannot be combined with HMAC algorithms."""
+    from django.core.exceptions import ImproperlyConfigured  # noqa: PLC0415
+
+    with pytest.raises(ImproperlyConfigured):
+        JWTAuthentication(jwks=lambda: {"keys": []}, algorithms=["HS256"])
+
+
+def _revocation_api(auth):
+    api = BoltAPI()
+
+    @api.get("/me", auth=[auth], guards=[IsAuthenticated()])
+    async def me(request: dict):
+        return {"user_id": request["context"]["user_id"]}
+
+    return api
+
+
+def _token_with_jti(jti, secret="revocation-secret"):
+    claims = {"sub": "42", "exp": int(time.time()) + 3600}
+    if jti is not None:
+        claims["jti"] = jti
+    return {"Authorization": f"Bearer {jwt.encode(claims, secret, algorithm='HS256')}"}
+
+
+def test_jwt_revoked_token_rejected_immediately():
+    """Test that revoke() takes effect on the next request, even for a cached token."""
+    from asgiref.sync import async_to_sync  # noqa: PLC0415
+
+    from django_bolt.auth.revocation import InMemoryRevocation  # noqa: PLC0415
+    from django_bolt.testing import TestClient  # noqa: PLC0415
+
+    store = InMemoryRevocation()
+    api = _revocation_api(JWTAuthentication(secret="revocation-secret", revocation_store=store))
+
+    with TestClient(api) as client:
+        assert client.get("/me", headers=_token_with_jti("token-1")).status_code == 200
+        async_to_sync(store.revoke)("token-1")
+        assert client.get("/me", headers=_token_with_jti("token-1")).status_code == 401
+        assert client.get("/me", headers=_token_with_jti("token-2")).status_code == 200
+        # Revocation requires a jti: tokens without one are rejected
+        assert client.get("/me", headers=_token_with_jti(None)).status_code == 401
+
+
+def test_jwt_require_jti():
+    """Test that require_jti rejects tokens without a jti claim."""
+    from django_bolt.testing import TestClient  # noqa: PLC0415
+
+    api = _revocation_api(JWTAuthentication(secret="revocation-secret", require_jti=True))
+
+    with TestClient(api) as client:
+        assert client.get("/me", headers=_token_with_jti(None)).status_code == 401
+        assert client.get("/me", headers=_token_with_jti("token-1")).status_code == 200
+
+
+def test_jwt_revocation_synced_from_store():
+    """Test that revocations made by another process arrive with the next sync."""
+    from asgiref.sync import async_to_sync  # noqa: PLC0415
+    from django.core.cache import caches  # noqa: PLC0415
+
+    from django_bolt.auth.revocation import DjangoCacheRevocation  # noqa: PLC0415
+    from django_bolt.testing import TestClient  # noqa: PLC0415
+
+    caches["default"].clear()
+    store = DjangoCacheRevocation(key_prefix="test-revoked:")
+    # Same cache keys, another store object: stands in for another worker
+    other_worker = DjangoCacheRevocation(key_prefix="test-revoked:")
+    async_to_sync(other_worker.revoke)("before-start")
+    api = _revocation_api(JWTAuthentication(secret="revocation-secret", revocation_store=store, revocation_sync=1))
+
+    with TestClient(api) as client:
+        # Revoked before startup: part of the initial sync
+        assert client.get("/me", headers=_token_with_jti("before-start")).status_code == 401
+        assert client.get("/me", headers=_token_with_jti("later")).status_code == 200
+
+        async_to_sync(other_worker.revoke)("later")
+        deadline = time.time() + 5
+        while time.time() < deadline:
+            if client.get("/me", headers=_token_with_jti("later")).status_code == 401:
+                break
+            time.sleep(0.2)
+
+        assert client.get("/me", headers=_token_with_jti("later")).status_code == 401
+
+
+def test_django_cache_revocation_lists_tokens_since_cursor():
+    """Test incremental listing of revoked tokens from the cache log."""
+    from asgiref.sync import async_to_sync  # noqa: PLC0415
+    from django.core.cache import caches  # noqa: PLC0415
+
+    from django_bolt.auth.revocation import DjangoCacheRevocation  # noqa: PLC0415
+
+    caches["default"].clear()
+    store = DjangoCacheRevocation(key_prefix="test-revoked-log:")
+    async_to_sync(store.revoke)("a", ttl=60)
+    async_to_sync(store.revoke)("b")
+
+    revoked, cursor = store.revoked_tokens()
+    assert set(revoked) == {"a", "b"}
+    assert revoked["a"] == pytest.approx(time.time() + 60, abs=5)
+
+    async_to_sync(store.revoke)("c")
+    revoked, cursor = store.revoked_tokens(cursor)
+    assert set(revoked) == {"c"}
+    assert store.revoked_tokens(cursor)[0] == {}
+
+
+def test_django_cache_revocation_full_sync_skips_expired_log(monkeypatch):
+    """Test that a full sync starts at the log entries that can still be live."""
+    from asgiref.sync import async_to_sync  # noqa: PLC0415
+    from django.core.cache import caches  # noqa: PLC0415
+
+    from django_bolt.auth import revocation  # noqa: PLC0415
+    from django_bolt.auth.revocation import SYNC_BATCH_SIZE, DjangoCacheRevocation  # noqa: PLC0415
+
+    cache = caches["default"]
+    cache.clear()
+    store = DjangoCacheRevocation(key_prefix="test-revoked-window:", max_ttl=3600)
+    # A long history of revocations whose entries (and checkpoints) are gone
+    cache.set("test-revoked-window:__seq__", 50_000)
+    async_to_sync(store.revoke)("recent", ttl=7200)
+
+    assert store._first_live_entry(50_001) == 50_001 - SYNC_BATCH_SIZE
+    revoked, cursor = store.revoked_tokens()
+    assert set(revoked) == {"recent"}
+    # ttl is capped at max_ttl
+    assert revoked["recent"] == pytest.approx(time.time() + 3600, abs=5)
+    # The missing entries before "recent" could still be written: read them again next time
+    assert cursor == 50_001 - SYNC_BATCH_SIZE - 1
+
+    # Once "recent" is older than the grace period, they are expired
+    monkeypatch.setattr(revocation, "SYNC_GRACE_SECONDS", 0)
+    assert store.revoked_tokens(cursor) == ({"recent": revoked["recent"]}, 50_001)
+
+    cache.clear()
+    assert store.revoked_tokens() == ({}, 0)
+
+
+def test_django_cache_revocation_sync_waits_for_unwritten_entry(monkeypatch):
+    """Test that a sync between a revoke's incr and its log write doesn't skip the entry."""
+    from asgiref.sync import async_to_sync  # noqa: PLC0415
+    from django.core.cache import caches  # noqa: PLC0415
+
+    from django_bolt.auth import revocation  # noqa: PLC0415
+    from django_bolt.auth.revocation import DjangoCacheRevocation  # noqa: PLC0415
+
+    cache = caches["default"]
+    cache.clear()
+    store = DjangoCacheRevocation(key_prefix="test-revoked-gap:")
+    async_to_sync(store.revoke)("a")
+    _, cursor = store.revoked_tokens()
+    assert cursor == 1
+
+    # Another process takes position 2, and a third one logs position 3 before it writes
+    assert cache.incr("test-revoked-gap:__seq__") == 2
+    async_to_sync(store.revoke)("c")
+    revoked, cursor = store.revoked_tokens(cursor)
+    assert set(revoked) == {"c"}
+    assert cursor == 1
+
+    # The slow writer finishes: the next sync picks it up and moves past both
+    now = time.time()
+    cache.set("test-revoked-gap:log:2", ("b", now + 60, now), timeout=60)
+    revoked, cursor = store.revoked_tokens(cursor)
+    assert set(revoked) == {"b", "c"}
+    assert cursor == 3
+
+    # A position that is never written is given up once later entries are old enough
+    assert cache.incr("test-revoked-gap:__seq__") == 4
+    async_to_sync(store.revoke)("e")
+    assert store.revoked_tokens(cursor)[1] == 3
+    monkeypatch.setattr(revocation, "SYNC_GRACE_SECONDS", 0)
+    assert store.revoked_tokens(cursor) == ({"e": pytest.approx(time.time() + 86400 * 30, abs=5)}, 5)
+
+
+def test_in_memory_revocation_expires_and_is_bounded():
+    """Test that in-memory revocations expire and the oldest-expiring are dropped at the cap."""
+    from asgiref.sync import async_to_sync  # noqa: PLC0415
+
+    from django_bolt.auth.revocation import InMemoryRevocation  # noqa: PLC0415
+
+    store = InMemoryRevocation(max_entries=2)
+    async_to_sync(store.revoke)("short", ttl=1)
+    async_to_sync(store.revoke)("long", ttl=3600)
+    assert async_to_sync(store.is_revoked)("short")
+
+    time.sleep(1.1)
+    assert not async_to_sync(store.is_revoked)("short")
+    assert async_to_sync(store.is_revoked)("long")
+
+    async_to_sync(store.revoke)("a", ttl=60)
+    async_to_sync(store.revoke)("b", ttl=120)
+    # Over the cap: "a" expires first, so it goes first
+    assert set(store.revoked_tokens()[0]) == {"long", "b"}
+
+
+def test_in_memory_revoke_all_revokes_earlier_tokens():
+    """Test that revoke_all rejects a user's earlier tokens, and only that user's."""
+    from asgiref.sync import async_to_sync  # noqa: PLC0415
+
+    from django_bolt.auth.revocation import InMemoryRevocation  # noqa: PLC0415
+    from django_bolt.testing import TestClient  # noqa: PLC0415
+
+    store = InMemoryRevocation()
+    api = _revocation_api(JWTAuthentication(secret="revocation-secret", revocation_store=store))
+
+    def headers(sub, iat):
+        claims = {"sub": sub, "jti": f"{sub}-{iat}", "iat": iat, "exp": int(time.time()) + 3600}
+        return {"Authorization": f"Bearer {jwt.encode(claims, 'revocation-secret', algorithm='HS256')}"}
+
+    issued = int(time.time()) - 10
+    with TestClient(api) as client:
+        assert client.get("/me", headers=headers("42", issued)).status_code == 200
+        async_to_sync(store.revoke_all)("42")
+        assert client.get("/me", headers=headers("42", issued)).status_code == 401
+        assert client.get("/me", headers=headers("43", issued)).status_code == 200
+        # Tokens issued after revoke_all (next login) are accepted
+        assert client.get("/me", headers=headers("42", int(time.time()) + 2)).status_code == 200
+
+    assert set(store.revoked_users()) == {"42"}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,161 @@
+"""
+Tests for per-route memory instrumentation (BOLT_MEMORY_STATS).
+
+Tests cover:
+- Sampled requests aggregated per handler_id with their growing allocation sites
+- Sample rate and one sample at a time
+- GC pause timing per generation
+- Process stats (RSS, Python heap, GC, allocator)
+- The stats endpoint and the BoltAPI dispatch wrapper
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+
+import pytest
+from django.test import override_settings
+
+from django_bolt import BoltAPI, memory_stats
+from django_bolt.auth import AllowAny
+from django_bolt.memory_stats import MemoryStatsCollector, process_memory_stats, register_memory_stats_endpoint
+from django_bolt.testing import TestClient
+
+# Keeps the "leaked" objects alive across requests
+leaked = []
+
+
+@pytest.fixture
+def collector():
+    was_tracing = tracemalloc.is_tracing()
+    collector = MemoryStatsCollector(sample_rate=1.0)
+    collector.install()
+    yield collector
+    if was_tracing:
+        gc.callbacks.remove(collector._gc_callback)
+    else:
+        collector.uninstall()
+    leaked.clear()
+
+
+def leak(count=100):
+    leaked.append([bytearray(1000) for _ in range(count)])
+
+
+def run_request(collector, handler_id, fn):
+    sample = collector.start_request()
+    try:
+        fn()
+    finally:
+        collector.finish_request(handler_id, sample)
+
+
+class TestMemoryStatsCollector:
+    def test_retained_memory_per_route(self, collector):
+        run_request(collector, 1, leak)
+        run_request(collector, 1, leak)
+        run_request(collector, 2, lambda: [bytearray(1000) for _ in range(100)])
+
+        stats = collector.snapshot({1: "GET /leak", 2: "GET /ok"})
+        assert list(stats) == ["GET /leak", "GET /ok"]
+        assert stats["GET /leak"]["samples"] == 2
+        assert stats["GET /leak"]["avg_retained_bytes"] >= 100_000
+        assert stats["GET /leak"]["max_retained_bytes"] >= 100_000
+        assert stats["GET /ok"]["avg_retained_bytes"] < 100_000
+        top_site = stats["GET /leak"]["top_sites"][0]
+        assert top_site["site"].startswith(__file__)
+        assert top_site["bytes"] >= 200_000
+
+    def test_sample_rate(self, collector):
+        collector.sample_rate = 0.0
+        run_request(collector, 1, leak)
+
+        assert collector.snapshot() == {}
+
+    def test_one_sample_at_a_time(self, collector):
+        first = collector.start_request()
+        assert collector.start_request() is None
+        collector.finish_request(1, first)
+
+        second = collector.start_request()
+        assert second is not None
+        collector.finish_request(1, second)
+        assert collector.snapshot()["1"]["samples"] == 2
+
+    def test_gc_pauses(self, collector):
+        gc.collect()
+
+        pauses = collector.gc_pauses()
+        assert len(pauses) == 3
+        assert pauses[2]["pauses"] >= 1
+        assert pauses[2]["pause_max_ms"] >= 0
+
+    def test_reset(self, collector):
+        run_request(collector, 1, leak)
+        gc.collect()
+        collector.reset()
+
+        assert collector.snapshot() == {}
+        assert collector.gc_pauses()[2]["pauses"] == 0
+
+
+class TestProcessMemoryStats:
+    def test_process_stats(self, collector):
+        stats = process_memory_stats(collector)
+
+        assert stats["python"]["allocated_blocks"] > 0
+        assert stats["python"]["traced_bytes"] > 0
+        assert stats["allocator"]["allocator"] in ("mimalloc", "jemalloc", "system")
+        generations = stats["gc"]["generations"]
+        assert len(generations) == 3
+        assert {"collections", "collected", "uncollectable", "pauses", "pause_max_ms"} <= set(generations[0])
+
+    def test_without_collector(self):
+        stats = process_memory_stats()
+
+        assert "pauses" not in stats["gc"]["generations"][0]
+        assert stats["peak_rss_bytes"] is None or stats["peak_rss_bytes"] > 0
+
+
+class TestMemoryStatsEndpoint:
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setattr(memory_stats, "_collector", None)
+        api = BoltAPI()
+        register_memory_stats_endpoint(api, guards=[AllowAny()])
+
+        with TestClient(api) as client:
+            data = client.get("/__bolt__/memory").json()
+            assert data["enabled"] is False
+            assert data["routes"] == {}
+            assert data["process"]["python"]["allocated_blocks"] > 0
+
+    def test_dispatch_records_route_stats(self, monkeypatch):
+        monkeypatch.setattr(memory_stats, "_collector", None)
+        was_tracing = tracemalloc.is_tracing()
+        with override_settings(BOLT_MEMORY_STATS=True, BOLT_MEMORY_SAMPLE_RATE=1.0):
+            api = BoltAPI()
+
+        @api.get("/leak")
+        def leaky():
+            leak()
+            return {"ok": True}
+
+        register_memory_stats_endpoint(api, guards=[AllowAny()])
+
+        try:
+            with TestClient(api) as client:
+                assert client.get("/leak").status_code == 200
+                data = client.get("/__bolt__/memory?reset=true").json()
+                assert data["enabled"] is True
+                assert data["sample_rate"] == 1.0
+                assert data["routes"]["GET /leak"]["samples"] == 1
+                assert data["routes"]["GET /leak"]["retained_bytes"] > 0
+                assert "GET /leak" not in client.get("/__bolt__/memory").json()["routes"]
+        finally:
+            collector = memory_stats.get_memory_stats()
+            if was_tracing:
+                gc.callbacks.remove(collector._gc_callback)
+            else:
+                collector.uninstall()
+            leaked.clear()
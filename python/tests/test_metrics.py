@@ -0,0 +1,284 @@
+"""
+Tests for the native Prometheus metrics endpoint (BOLT_METRICS).
+
+Tests cover:
+- Per-route request counts and latency histograms labelled by route template and status
+- Unmatched requests, rate-limit rejections and runtime gauges
+- Python-registered counters and gauges
+- sync_to_thread executor queue tracking
+- Custom endpoint path and the endpoint being absent when disabled
+- Shared-memory aggregation across forked workers, including worker restarts
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+
+import pytest
+from django.test import override_settings
+
+import django_bolt
+from django_bolt import BoltAPI, concurrency
+from django_bolt.concurrency import sync_to_thread
+from django_bolt.metrics import counter, gauge, render_metrics, reset_metrics
+from django_bolt.middleware import rate_limit
+from django_bolt.testing import TestClient
+
+
+class FakeGauge:
+    def __init__(self):
+        self.value = 0
+        self.max = 0
+
+    def inc(self):
+        self.value += 1
+        self.max = max(self.max, self.value)
+
+    def dec(self):
+        self.value -= 1
+
+
+def sample(text, series):
+    for line in text.splitlines():
+        if line.startswith(series + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return None
+
+
+class TestExecutorTracking:
+    def test_counts_pending_and_running_calls(self, monkeypatch):
+        pending, running = FakeGauge(), FakeGauge()
+        monkeypatch.setattr(concurrency, "_executor_gauges", (pending, running))
+        seen = []
+
+        def work():
+            seen.append((pending.value, running.value))
+            return threading.current_thread().name
+
+        async def main():
+            return await sync_to_thread(work)
+
+        assert asyncio.run(main()) != threading.current_thread().name
+        assert seen == [(1, 1)]
+        assert (pending.value, running.value) == (0, 0)
+
+    def test_exception_releases_gauges(self, monkeypatch):
+        pending, running = FakeGauge(), FakeGauge()
+        monkeypatch.setattr(concurrency, "_executor_gauges", (pending, running))
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            asyncio.run(sync_to_thread(fail))
+        assert (pending.value, running.value) == (0, 0)
+        assert pending.max == running.max == 1
+
+    def test_untracked_by_default(self):
+        assert concurrency._executor_gauges is None
+        assert asyncio.run(sync_to_thread(lambda: 42)) == 42
+
+
+class TestMetricsEndpoint:
+    @pytest.fixture(autouse=True)
+    def fresh_metrics(self, monkeypatch):
+        monkeypatch.setattr(concurrency, "_executor_gauges", None)
+        reset_metrics()
+        yield
+        reset_metrics()
+
+    def test_route_metrics(self):
+        with override_settings(BOLT_METRICS=True):
+            api = BoltAPI()
+
+            @api.get("/items/{item_id}")
+            async def get_item(item_id: int):
+                return {"id": item_id}
+
+            @api.get("/sync")
+            def sync_view():
+                return {"ok": True}
+
+            with TestClient(api) as client:
+                assert client.get("/items/1").status_code == 200
+                assert client.get("/items/2").status_code == 200
+                assert client.get("/items/abc").status_code == 422
+                assert client.get("/sync").status_code == 200
+                assert client.get("/missing").status_code == 404
+                response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        labels = 'method="GET",route="/items/{item_id}"'
+        assert sample(text, f'bolt_requests_total{{{labels},status="200"}}') == 2
+        assert sample(text, f'bolt_requests_total{{{labels},status="422"}}') == 1
+        assert sample(text, f'bolt_request_duration_seconds_count{{{labels},status="200"}}') == 2
+        assert sample(text, f'bolt_request_duration_seconds_bucket{{{labels},status="200",le="+Inf"}}') == 2
+        assert sample(text, 'bolt_requests_total{method="GET",route="/sync",status="200"}') == 1
+        assert sample(text, "bolt_requests_unmatched_total") == 1
+        assert sample(text, "bolt_requests_in_flight") == 0
+        assert sample(text, "bolt_websocket_connections") == 0
+        assert sample(text, "bolt_sync_streaming_threads") == 0
+        assert sample(text, "bolt_executor_queue_depth") == 0
+        assert "# TYPE bolt_request_duration_seconds histogram" in text
+        # Scrapes are served before routing and not counted as requests
+        assert "/metrics" not in text
+        assert render_metrics().startswith("# HELP bolt_requests_total")
+
+    def test_rate_limited_requests(self):
+        with override_settings(BOLT_METRICS=True):
+            api = BoltAPI()
+
+            @api.get("/limited")
+            @rate_limit(rps=1, burst=1)
+            async def limited():
+                return {"ok": True}
+
+            with TestClient(api) as client:
+                statuses = [client.get("/limited").status_code for _ in range(3)]
+                text = client.get("/metrics").text
+
+        assert statuses.count(429) == 2
+        assert sample(text, 'bolt_rate_limited_total{method="GET",route="/limited"}') == 2
+
+    def test_custom_metrics(self):
+        orders = counter("test_orders_total", "Orders created", labels={"shop": 'main "1"'})
+        depth = gauge("test_queue_depth", "Jobs waiting")
+        orders.inc()
+        orders.inc(2)
+        depth.set(5)
+        depth.dec(1.5)
+
+        assert counter("test_orders_total", labels={"shop": 'main "1"'}).value == 3
+        text = render_metrics()
+        assert "# TYPE test_orders_total counter" in text
+        assert sample(text, 'test_orders_total{shop="main \\"1\\""}') == 3
+        assert sample(text, "test_queue_depth") == 3.5
+
+        with pytest.raises(ValueError):
+            gauge("test_orders_total")
+        with pytest.raises(ValueError):
+            counter("invalid-name")
+
+    def test_custom_path(self):
+        with override_settings(BOLT_METRICS=True, BOLT_METRICS_PATH="/internal/metrics"):
+            api = BoltAPI()
+
+            @api.get("/ping")
+            async def ping():
+                return {"ok": True}
+
+            with TestClient(api) as client:
+                client.get("/ping")
+                assert client.get("/metrics").status_code == 404
+                text = client.get("/internal/metrics").text
+
+        assert sample(text, 'bolt_requests_total{method="GET",route="/ping",status="200"}') == 1
+
+    def test_disabled_by_default(self):
+        api = BoltAPI()
+
+        @api.get("/ping")
+        async def ping():
+            return {"ok": True}
+
+        with TestClient(api) as client:
+            client.get("/ping")
+            assert client.get("/metrics").status_code == 404
+
+        assert concurrency._executor_gauges is None
+        assert 'route="/ping"' not in render_metrics()
+
+
+# Forks "workers" that attach to one shared region and serve requests through the
+# test client (run in a fresh interpreter: forking after the runtime started is unsafe)
+SHARED_METRICS_SCRIPT = textwrap.dedent(
+    """
+    import json
+    import os
+
+    import django
+    from django.conf import settings
+
+    settings.configure(SECRET_KEY="test", ALLOWED_HOSTS=["*"], INSTALLED_APPS=["django_bolt"], BOLT_METRICS=True)
+    django.setup()
+
+    from django_bolt import BoltAPI, _core
+    from django_bolt.metrics import create_shared_metrics_region, render_shared_metrics
+    from django_bolt.testing import TestClient
+
+
+    def run_worker(path, slot, requests, output):
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                _core.attach_shared_metrics(path, slot)
+                api = BoltAPI()
+
+                @api.get("/items/{item_id}")
+                async def get_item(item_id: int):
+                    return {"id": item_id}
+
+                with TestClient(api) as client:
+                    for item_id in range(requests):
+                        client.get(f"/items/{item_id}")
+                    client.get("/missing")
+                    with open(output, "w") as f:
+                        f.write(client.get("/metrics").text)
+            except BaseException:
+                import traceback
+
+                traceback.print_exc()
+                code = 1
+            os._exit(code)
+        assert os.waitpid(pid, 0)[1] == 0
+        with open(output) as f:
+            return f.read()
+
+
+    path = create_shared_metrics_region(2)
+    output = path + ".out"
+    try:
+        results = {
+            "worker0": run_worker(path, 0, 2, output),
+            "worker1": run_worker(path, 1, 3, output),
+            "worker0_restarted": run_worker(path, 0, 1, output),
+            "master": render_shared_metrics(path),
+        }
+    finally:
+        os.unlink(path)
+        os.unlink(output)
+    print(json.dumps(results))
+    """
+)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="multi-process metrics require fork()")
+def test_shared_metrics_across_processes():
+    env = {**os.environ, "PYTHONPATH": os.path.dirname(os.path.dirname(django_bolt.__file__))}
+    env.pop("DJANGO_SETTINGS_MODULE", None)
+    completed = subprocess.run(
+        [sys.executable, "-c", SHARED_METRICS_SCRIPT], capture_output=True, text=True, env=env, timeout=60
+    )
+    assert completed.returncode == 0, completed.stderr
+    results = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    series = 'bolt_requests_total{method="GET",route="/items/{item_id}",status="200"}'
+    assert sample(results["worker0"], series) == 2
+    # Each worker reports the totals of every worker that shares the region
+    assert sample(results["worker1"], series) == 5
+    assert sample(results["worker1"], "bolt_requests_unmatched_total") == 2
+    # A restarted worker keeps adding to its predecessor's segment (no reset, no double count)
+    assert sample(results["worker0_restarted"], series) == 6
+    assert sample(results["worker0_restarted"], "bolt_requests_unmatched_total") == 3
+    # The master has no routes registered and labels series by handler_id
+    assert sample(results["master"], 'bolt_requests_total{handler_id="0",status="200"}') == 6
+    assert sample(results["master"], "bolt_requests_unmatched_total") == 3
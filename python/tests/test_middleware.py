@@ -59,6 +59,29 @@ class TestMiddlewareDecorators:
         assert middleware[0]["burst"] == 100
         assert middleware[0]["key"] == "ip"
 
+    def test_rate_limit_decorator_cost_and_window(self):
+        """Test rate limit decorator attaches cost and sliding window"""
+        api = BoltAPI()
+
+        @api.get("/export")
+        @rate_limit(rps=10, burst=100, cost=50, window_limit=500, window=3600)
+        async def export_endpoint():
+            return {"status": "ok"}
+
+        middleware = api._handlers[0].__bolt_middleware__
+        assert middleware[0]["cost"] == 50
+        assert middleware[0]["window_limit"] == 500
+        assert middleware[0]["window"] == 3600
+
+    def test_rate_limit_decorator_rejects_invalid_cost_and_window(self):
+        """Test rate limit decorator validates cost and window at registration"""
+        with pytest.raises(ValueError, match="exceeds burst"):
+            rate_limit(rps=1, burst=5, cost=10)
+        with pytest.raises(ValueError, match="together"):
+            rate_limit(rps=1, window_limit=100)
+        with pytest.raises(ValueError, match="window_limit at least cost"):
+            rate_limit(rps=10, burst=20, cost=5, window_limit=2, window=60)
+
     def test_cors_decorator(self):
         """Test CORS decorator attaches metadata"""
         api = BoltAPI()
@@ -157,6 +157,59 @@ def test_rate_limiting(http_client):
     assert "retry-after" in response.headers
 
 
+def test_rate_limit_cost():
+    """Test weighted requests take `cost` tokens from the bucket"""
+    api = BoltAPI()
+
+    @api.get("/export")
+    @rate_limit(rps=1, burst=100, cost=50)
+    async def export():
+        return {"ok": True}
+
+    with TestClient(api) as client:
+        statuses = [client.get("/export").status_code for _ in range(3)]
+    assert statuses == [200, 200, 429]
+
+
+def test_rate_limit_scope_shares_buckets():
+    """Test routes with the same scope spend one budget"""
+    api = BoltAPI()
+
+    @api.get("/items")
+    @rate_limit(rps=1, burst=100, scope="api")
+    async def items():
+        return {"ok": True}
+
+    @api.get("/export")
+    @rate_limit(rps=1, burst=100, scope="api", cost=50)
+    async def export():
+        return {"ok": True}
+
+    with TestClient(api) as client:
+        assert client.get("/export").status_code == 200
+        assert client.get("/items").status_code == 200
+        # 49 tokens left: not enough for another export, enough for reads
+        assert client.get("/export").status_code == 429
+        assert client.get("/items").status_code == 200
+
+
+def test_rate_limit_sliding_window():
+    """Test sliding-window limits apply on top of the token bucket"""
+    api = BoltAPI()
+
+    @api.get("/windowed")
+    @rate_limit(rps=100, burst=100, window_limit=3, window=3600)
+    async def windowed():
+        return {"ok": True}
+
+    with TestClient(api) as client:
+        statuses = [client.get("/windowed").status_code for _ in range(4)]
+        rejected = client.get("/windowed")
+    assert statuses == [200, 200, 200, 429]
+    # Rejected by the window: no earlier than the next window
+    assert int(rejected.headers["retry-after"]) > 1
+
+
 def test_cors_headers(http_client):
     """Test CORS headers"""
     response = http_client.get("/cors-test", headers={"Origin": "http://localhost:3000"})
@@ -0,0 +1,150 @@
+"""
+Tests for MessagePack request/response content negotiation.
+
+Tests cover:
+- Body extractor decoding MessagePack (typed structs and generic annotations)
+- Malformed MessagePack bodies returning 422 with msgpack_invalid errors
+- Content-Type: application/msgpack request bodies end-to-end
+- Accept: application/msgpack responses for dict/list/Struct results
+- JSON remaining the default when no MessagePack headers are sent
+"""
+
+from __future__ import annotations
+
+import msgspec
+import pytest
+
+from django_bolt import BoltAPI, _msgpack
+from django_bolt._kwargs import create_body_extractor
+from django_bolt.exceptions import RequestValidationError
+from django_bolt.responses import JSON
+from django_bolt.testing import TestClient
+
+
+class Item(msgspec.Struct):
+    name: str
+    price: float
+
+
+MSGPACK_HEADERS = {"content-type": "application/msgpack", "accept": "application/msgpack"}
+
+
+class TestMsgpackBodyExtractor:
+    def test_decodes_struct_from_msgpack(self):
+        extractor = create_body_extractor("item", Item)
+        body = msgspec.msgpack.encode({"name": "Widget", "price": 9.5})
+        assert extractor(body, msgpack=True) == Item(name="Widget", price=9.5)
+
+    def test_decodes_generic_annotation_from_msgpack(self):
+        extractor = create_body_extractor("data", dict[str, int])
+        assert extractor(msgspec.msgpack.encode({"a": 1}), msgpack=True) == {"a": 1}
+
+    def test_json_is_default(self):
+        extractor = create_body_extractor("item", Item)
+        assert extractor(b'{"name": "Widget", "price": 1}') == Item(name="Widget", price=1.0)
+
+    def test_malformed_msgpack_returns_422(self):
+        extractor = create_body_extractor("item", Item)
+        with pytest.raises(RequestValidationError) as exc_info:
+            extractor(b"\xc1", msgpack=True)
+
+        errors = exc_info.value.errors()
+        assert errors[0]["type"] == "msgpack_invalid"
+        assert errors[0]["loc"] == ("body",)
+
+    def test_msgpack_validation_error_propagates(self):
+        extractor = create_body_extractor("item", Item)
+        with pytest.raises(msgspec.ValidationError):
+            extractor(msgspec.msgpack.encode({"name": "Widget", "price": "free"}), msgpack=True)
+
+
+class TestMsgpackNegotiation:
+    @pytest.fixture
+    def api(self):
+        api = BoltAPI()
+
+        @api.post("/items")
+        async def create_item(item: Item) -> Item:
+            return item
+
+        @api.get("/items")
+        def list_items() -> list[Item]:
+            return [Item(name="a", price=1.0), Item(name="b", price=2.0)]
+
+        @api.get("/raw")
+        async def raw():
+            return {"ok": True}
+
+        @api.get("/explicit-json")
+        async def explicit_json():
+            return JSON({"ok": True})
+
+        return api
+
+    def test_msgpack_request_and_response(self, api):
+        with TestClient(api) as client:
+            response = client.post(
+                "/items",
+                content=msgspec.msgpack.encode({"name": "Widget", "price": 9.5}),
+                headers=MSGPACK_HEADERS,
+            )
+            assert response.status_code == 200
+            assert response.headers["content-type"] == _msgpack.MSGPACK_MEDIA_TYPE
+            assert msgspec.msgpack.decode(response.content) == {"name": "Widget", "price": 9.5}
+
+    def test_msgpack_request_json_response(self, api):
+        with TestClient(api) as client:
+            response = client.post(
+                "/items",
+                content=msgspec.msgpack.encode({"name": "Widget", "price": 9.5}),
+                headers={"content-type": "application/msgpack"},
+            )
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/json"
+            assert response.json() == {"name": "Widget", "price": 9.5}
+
+    def test_accept_msgpack_for_sync_list_and_dict(self, api):
+        with TestClient(api) as client:
+            response = client.get("/items", headers={"accept": "application/msgpack"})
+            assert response.headers["content-type"] == _msgpack.MSGPACK_MEDIA_TYPE
+            assert msgspec.msgpack.decode(response.content) == [
+                {"name": "a", "price": 1.0},
+                {"name": "b", "price": 2.0},
+            ]
+
+            response = client.get("/raw", headers={"accept": "application/x-msgpack"})
+            assert msgspec.msgpack.decode(response.content) == {"ok": True}
+
+    def test_json_by_default(self, api):
+        with TestClient(api) as client:
+            response = client.get("/raw")
+            assert response.headers["content-type"] == "application/json"
+            assert response.json() == {"ok": True}
+
+    def test_accept_quality_values(self, api):
+        with TestClient(api) as client:
+            response = client.get("/raw", headers={"accept": "application/json, application/msgpack;q=0.9"})
+            assert response.headers["content-type"] == "application/json"
+
+            response = client.get("/raw", headers={"accept": "application/msgpack;q=0"})
+            assert response.headers["content-type"] == "application/json"
+
+            response = client.get("/raw", headers={"accept": "application/json;q=0.5, application/msgpack"})
+            assert msgspec.msgpack.decode(response.content) == {"ok": True}
+
+    def test_negotiated_responses_vary_on_accept(self, api):
+        with TestClient(api) as client:
+            for accept in ("application/json", "application/msgpack"):
+                response = client.get("/raw", headers={"accept": accept})
+                assert "Accept" in response.headers.get_list("vary")
+
+    def test_explicit_json_response_is_not_negotiated(self, api):
+        with TestClient(api) as client:
+            response = client.get("/explicit-json", headers={"accept": "application/msgpack"})
+            assert response.headers["content-type"] == "application/json"
+            assert response.json() == {"ok": True}
+
+    def test_malformed_msgpack_body_returns_422(self, api):
+        with TestClient(api) as client:
+            response = client.post("/items", content=b"\xc1", headers=MSGPACK_HEADERS)
+            assert response.status_code == 422
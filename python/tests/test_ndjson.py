@@ -0,0 +1,165 @@
+"""
+Tests for NDJSONResponse (newline-delimited JSON streaming).
+
+Tests cover:
+- Sync and async iterables encoded one JSON document per line
+- Batching: many items flushed as few chunks, split on the byte budget
+- Time budget flushing buffered items while an async source is idle
+- item_type conversion (dicts, objects) and QuerySet streaming via .values()
+- End-to-end streaming through the test client
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+
+import msgspec
+import pytest
+
+from django_bolt import BoltAPI, NDJSONResponse
+from django_bolt.testing import TestClient
+
+from .test_models import Article
+
+
+class Event(msgspec.Struct):
+    id: int
+    name: str
+
+
+def collect_sync(response):
+    return list(response.content)
+
+
+async def collect_async(response):
+    return [chunk async for chunk in response.content]
+
+
+def lines(chunks):
+    return [msgspec.json.decode(line) for line in b"".join(chunks).splitlines()]
+
+
+class TestNDJSONEncoding:
+    def test_sync_iterable(self):
+        response = NDJSONResponse([{"id": 1}, {"id": 2, "day": date(2024, 1, 2)}])
+        assert response.media_type == "application/x-ndjson"
+        assert response.is_async_generator is False
+        chunks = collect_sync(response)
+        assert b"".join(chunks) == b'{"id":1}\n{"id":2,"day":"2024-01-02"}\n'
+
+    def test_items_are_batched_into_few_chunks(self):
+        response = NDJSONResponse(({"id": i} for i in range(1000)), flush_interval=None)
+        chunks = collect_sync(response)
+        assert len(chunks) == 1
+        assert lines(chunks) == [{"id": i} for i in range(1000)]
+
+    def test_flush_on_byte_budget(self):
+        response = NDJSONResponse(({"id": i} for i in range(100)), flush_bytes=100, flush_interval=None)
+        chunks = collect_sync(response)
+        assert len(chunks) > 1
+        assert all(len(chunk) < 100 + 20 for chunk in chunks)
+        assert all(chunk.endswith(b"\n") for chunk in chunks)
+        assert lines(chunks) == [{"id": i} for i in range(100)]
+
+    def test_async_iterable(self):
+        async def events():
+            for i in range(3):
+                yield Event(id=i, name=f"e{i}")
+
+        response = NDJSONResponse(events())
+        assert response.is_async_generator is True
+        chunks = asyncio.run(collect_async(response))
+        assert lines(chunks) == [{"id": i, "name": f"e{i}"} for i in range(3)]
+
+    def test_time_budget_flushes_while_source_is_idle(self):
+        async def tail():
+            yield {"line": 1}
+            await asyncio.sleep(0.2)
+            yield {"line": 2}
+
+        async def run():
+            stream = NDJSONResponse(tail(), flush_interval=0.01).content
+            first = await asyncio.wait_for(anext(stream), timeout=0.1)
+            rest = [chunk async for chunk in stream]
+            return first, rest
+
+        first, rest = asyncio.run(run())
+        assert first == b'{"line":1}\n'
+        assert rest == [b'{"line":2}\n']
+
+    def test_item_type_converts_items(self):
+        class Row:
+            def __init__(self, id, name):
+                self.id, self.name = id, name
+
+        response = NDJSONResponse([{"id": 1, "name": "a"}, Row(2, "b")], item_type=Event)
+        assert lines(collect_sync(response)) == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+
+    def test_item_type_validation_error(self):
+        response = NDJSONResponse([{"id": "x", "name": "a"}], item_type=Event)
+        with pytest.raises(msgspec.ValidationError):
+            collect_sync(response)
+
+    def test_rejects_callables_and_non_iterables(self):
+        def gen():
+            yield {}
+
+        with pytest.raises(TypeError, match="not a callable"):
+            NDJSONResponse(gen)
+        with pytest.raises(TypeError, match="Received type: int"):
+            NDJSONResponse(42)
+
+
+@pytest.mark.django_db
+class TestNDJSONQuerySet:
+    def test_queryset_streams_values(self):
+        class ArticleRow(msgspec.Struct):
+            title: str
+            author: str
+
+        Article.objects.create(title="one", content="c", author="alice")
+        Article.objects.create(title="two", content="c", author="bob")
+
+        response = NDJSONResponse(Article.objects.order_by("title"), item_type=ArticleRow)
+        assert response.is_async_generator is False
+        assert lines(collect_sync(response)) == [
+            {"title": "one", "author": "alice"},
+            {"title": "two", "author": "bob"},
+        ]
+
+    def test_queryset_without_item_type_streams_all_fields(self):
+        Article.objects.create(title="one", content="c", author="alice")
+
+        response = NDJSONResponse(Article.objects.all())
+        [row] = lines(collect_sync(response))
+        assert row["title"] == "one"
+        assert row["author"] == "alice"
+        assert "id" in row
+
+    def test_values_queryset_is_kept(self):
+        Article.objects.create(title="one", content="c", author="alice")
+
+        response = NDJSONResponse(Article.objects.values_list("title", flat=True))
+        assert lines(collect_sync(response)) == ["one"]
+
+
+class TestNDJSONEndpoint:
+    def test_streams_through_client(self):
+        api = BoltAPI()
+
+        @api.get("/events")
+        async def export_events():
+            async def events():
+                for i in range(5):
+                    yield Event(id=i, name=f"e{i}")
+
+            return NDJSONResponse(events())
+
+        with TestClient(api) as client:
+            response = client.get("/events")
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("application/x-ndjson")
+            assert [msgspec.json.decode(line) for line in response.content.splitlines()] == [
+                {"id": i, "name": f"e{i}"} for i in range(5)
+            ]
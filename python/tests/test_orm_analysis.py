@@ -5,17 +5,24 @@ Tests the AST-based analysis of handler functions for:
 - Django ORM usage detection
 - Blocking I/O detection
 - Warning generation for sync handlers
+- Query performance anti-patterns (N+1 loops, unbounded results, len(), sync ORM in async)
 """
 
 from __future__ import annotations
 
+import inspect
 import warnings
 
+from django_bolt import BoltAPI
+from django_bolt import analysis as analysis_module
 from django_bolt.analysis import (
     HandlerAnalysis,
+    PerformanceWarning,
     analyze_handler,
     warn_blocking_handler,
+    warn_performance_issues,
 )
+from django_bolt.pagination import paginate
 
 
 # Test handler functions for analysis
@@ -296,3 +303,195 @@ class TestHandlerAnalysisProperties:
         """Test is_blocking returns False when neither present."""
         analysis = HandlerAnalysis()
         assert analysis.is_blocking is False
+
+
+# Handlers with query performance anti-patterns
+def sync_handler_n_plus_one():
+    """Sync handler accessing a relation per row."""
+    from django.contrib.auth.models import User  # noqa: PLC0415
+
+    users = User.objects.filter(is_active=True)
+    names = []
+    for user in users:
+        names.append(user.profile.display_name)
+    return names
+
+
+def sync_handler_n_plus_one_comprehension():
+    """Sync handler accessing a many-to-many manager per row."""
+    from django.contrib.auth.models import User  # noqa: PLC0415
+
+    return [[group.name for group in user.groups.all()] for user in User.objects.all()[:10]]
+
+
+def sync_handler_related_loaded():
+    """Sync handler that loads relations up front."""
+    from django.contrib.auth.models import User  # noqa: PLC0415
+
+    return [
+        (user.profile.display_name, user.date_joined.isoformat())
+        for user in User.objects.select_related("profile")[:10]
+    ]
+
+
+def sync_handler_field_methods():
+    """Sync handler calling methods on plain field values."""
+    from django.contrib.auth.models import User  # noqa: PLC0415
+
+    return [user.date_joined.isoformat() for user in User.objects.all()[:10]]
+
+
+def sync_handler_unbounded():
+    """Sync handler returning a whole table."""
+    from django.contrib.auth.models import User  # noqa: PLC0415
+
+    return list(User.objects.all())
+
+
+def sync_handler_sliced():
+    """Sync handler returning a bounded queryset."""
+    from django.contrib.auth.models import User  # noqa: PLC0415
+
+    return User.objects.order_by("-id")[:50]
+
+
+def sync_handler_len_queryset():
+    """Sync handler counting with len()."""
+    from django.contrib.auth.models import User  # noqa: PLC0415
+
+    users = User.objects.filter(is_active=True)
+    return {"count": len(users)}
+
+
+async def async_handler_sync_calls():
+    """Async handler calling sync ORM methods."""
+    from django.contrib.auth.models import User  # noqa: PLC0415
+
+    user = User.objects.get(id=1)
+    user.save()
+    return {"count": User.objects.count()}
+
+
+async def async_handler_sync_to_async():
+    """Async handler running sync ORM in a nested function."""
+    from asgiref.sync import sync_to_async  # noqa: PLC0415
+    from django.contrib.auth.models import User  # noqa: PLC0415
+
+    def load():
+        return User.objects.get(id=1)
+
+    user = await sync_to_async(load)()
+    users = [u async for u in User.objects.filter(is_active=True)[:10]]
+    return {"user": user, "users": users}
+
+
+def issue_codes(handler):
+    return [issue.code for issue in analyze_handler(handler).performance_issues]
+
+
+class TestPerformanceIssues:
+    """Tests for query performance anti-pattern detection."""
+
+    def test_related_access_in_loop(self):
+        analysis = analyze_handler(sync_handler_n_plus_one)
+        issues = [issue for issue in analysis.performance_issues if issue.code == "n_plus_one"]
+
+        assert len(issues) == 1
+        assert "user.profile.display_name" in issues[0].message
+        assert "select_related('profile')" in issues[0].message
+
+        lines, start = inspect.getsourcelines(sync_handler_n_plus_one)
+        loop_line = next(i for i, line in enumerate(lines) if "for user in users" in line)
+        assert issues[0].lineno == start + loop_line
+        assert analysis.source_file == __file__
+
+    def test_related_manager_in_comprehension(self):
+        assert issue_codes(sync_handler_n_plus_one_comprehension) == ["n_plus_one"]
+
+    def test_select_related_and_field_methods_not_flagged(self):
+        assert issue_codes(sync_handler_related_loaded) == []
+        assert issue_codes(sync_handler_field_methods) == []
+
+    def test_unbounded_return(self):
+        assert issue_codes(sync_handler_unbounded) == ["unbounded_queryset"]
+        assert issue_codes(sync_handler_sliced) == []
+
+    def test_len_queryset(self):
+        assert "len_queryset" in issue_codes(sync_handler_len_queryset)
+
+    def test_sync_orm_in_async_handler(self):
+        issues = analyze_handler(async_handler_sync_calls).performance_issues
+        messages = [issue.message for issue in issues if issue.code == "sync_orm_in_async"]
+
+        assert len(messages) == 3
+        assert ".get()" in messages[0]
+        assert ".save()" in messages[1]
+        assert ".count()" in messages[2]
+
+    def test_sync_orm_in_sync_handler_not_flagged(self):
+        assert "sync_orm_in_async" not in issue_codes(sync_handler_with_multiple_orm_calls)
+
+    def test_list_of_queryset_in_async_handler(self):
+        assert "sync_orm_in_async" in issue_codes(async_handler_with_sync_orm)
+
+    def test_nested_functions_and_async_iteration_not_flagged(self):
+        assert issue_codes(async_handler_sync_to_async) == []
+        assert issue_codes(async_handler_with_async_orm) == []
+
+
+class TestPerformanceWarnings:
+    """Tests for registration-time performance warnings."""
+
+    def setup_method(self):
+        analysis_module._WARNED_ISSUES.clear()
+
+    def test_warning_points_at_handler_source(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            warn_performance_issues(sync_handler_len_queryset, "/users/count", "GET")
+
+        assert len(w) == 1
+        assert w[0].category is PerformanceWarning
+        assert w[0].filename == __file__
+        assert w[0].lineno == analyze_handler(sync_handler_len_queryset).performance_issues[0].lineno
+        assert "sync_handler_len_queryset" in str(w[0].message)
+        assert "/users/count" in str(w[0].message)
+
+    def test_warned_once_per_location(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            warn_performance_issues(sync_handler_len_queryset, "/a", "GET")
+            warn_performance_issues(sync_handler_len_queryset, "/b", "GET")
+
+        assert len(w) == 1
+
+    def test_unbounded_only_on_get_routes(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            warn_performance_issues(sync_handler_unbounded, "/users", "POST")
+            assert w == []
+
+            warn_performance_issues(sync_handler_unbounded, "/users", "GET")
+            assert len(w) == 1
+            assert "@paginate" in str(w[0].message)
+
+    def test_paginated_handler_not_flagged_as_unbounded(self):
+        async def list_users(request):
+            from django.contrib.auth.models import User  # noqa: PLC0415
+
+            return User.objects.all()
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            warn_performance_issues(paginate()(list_users), "/users", "GET")
+
+        assert w == []
+
+    def test_route_registration_warns(self):
+        api = BoltAPI()
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            api.get("/users")(sync_handler_unbounded)
+
+        assert [warning.category for warning in w if warning.category is PerformanceWarning] == [PerformanceWarning]
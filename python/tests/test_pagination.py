@@ -5,8 +5,11 @@ Tests pagination with actual Django models, database queries, and HTTP requests.
 No mocking - tests the full integration stack.
 """
 
+import asyncio
+
 import msgspec
 import pytest
+from django.db.models import IntegerField, Value
 
 from django_bolt import (
     BoltAPI,
@@ -17,6 +20,8 @@ from django_bolt import (
     ViewSet,
     paginate,
 )
+from django_bolt import pagination as pagination_module
+from django_bolt.pagination import clear_count_cache
 from django_bolt.testing import TestClient
 
 from .test_models import Article
@@ -1258,5 +1263,273 @@ def test_multiple_pagination_types_different_endpoints(sample_articles):
         assert "next_cursor" in data3
 
 
+# ============================================================================
+# Concurrent Count, Count Cache and Estimated Count
+# ============================================================================
+
+
+@pytest.mark.django_db(transaction=True)
+def test_page_number_concurrent_count_matches_sequential(sample_articles):
+    """Concurrent count + page queries return the same page as the sequential path"""
+
+    class ConcurrentPagination(PageNumberPagination):
+        page_size = 10
+        concurrent_count = True
+
+    class SequentialPagination(PageNumberPagination):
+        page_size = 10
+
+    request = {"query": {"page": "3"}}
+    qs = Article.objects.order_by("id")
+    concurrent = asyncio.run(ConcurrentPagination().paginate_queryset(qs, request))
+    sequential = asyncio.run(SequentialPagination().paginate_queryset(qs, request))
+
+    assert concurrent.total == sequential.total == 50
+    assert concurrent.page == 3
+    assert [item["id"] for item in concurrent.items] == [item["id"] for item in sequential.items]
+    assert concurrent.total_estimated is None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_page_number_concurrent_count_clamps_page_past_end(sample_articles):
+    """A page past the end is clamped to the last page and re-fetched"""
+
+    class ConcurrentPagination(PageNumberPagination):
+        page_size = 20
+        concurrent_count = True
+
+    qs = Article.objects.order_by("id")
+    result = asyncio.run(ConcurrentPagination().paginate_queryset(qs, {"query": {"page": "99"}}))
+
+    assert result.page == 3
+    assert len(result.items) == 10
+    assert result.has_next is False
+
+
+@pytest.mark.django_db(transaction=True)
+def test_count_cache_reuses_total_until_ttl(sample_articles):
+    """Cached counts are reused per SQL/params until the TTL expires or the cache is cleared"""
+
+    class CachedPagination(LimitOffsetPagination):
+        count_cache_ttl = 60
+
+    clear_count_cache()
+    paginator = CachedPagination()
+    qs = Article.objects.filter(is_published=True)
+
+    assert paginator._count_queryset_sync(qs) == (25, False)
+    Article.objects.create(title="New", content="c", author="a", is_published=True)
+
+    # Same SQL and params -> cached total
+    assert paginator._count_queryset_sync(Article.objects.filter(is_published=True)) == (25, False)
+    # Different params -> separate cache entry
+    assert paginator._count_queryset_sync(Article.objects.filter(is_published=False)) == (25, False)
+
+    clear_count_cache()
+    assert paginator._count_queryset_sync(qs) == (26, False)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_count_cache_disabled_by_default(sample_articles):
+    """Without count_cache_ttl every count hits the database"""
+    clear_count_cache()
+    paginator = PageNumberPagination()
+    qs = Article.objects.all()
+
+    assert paginator._count_queryset_sync(qs) == (50, False)
+    Article.objects.create(title="New", content="c", author="a")
+    assert paginator._count_queryset_sync(qs) == (51, False)
+    assert pagination_module._COUNT_CACHE == {}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_estimated_count_uses_planner_above_threshold(sample_articles, monkeypatch):
+    """Estimated mode reports the planner estimate above the threshold, exact count below it"""
+
+    class EstimatedPagination(PageNumberPagination):
+        page_size = 10
+        count_mode = "estimated"
+        estimate_threshold = 1000
+
+    qs = Article.objects.order_by("id")
+
+    monkeypatch.setattr(pagination_module, "_planner_estimate", lambda _queryset: 5_000_000)
+    result = asyncio.run(EstimatedPagination().paginate_queryset(qs, {"query": {}}))
+    assert result.total == 5_000_000
+    assert result.total_estimated is True
+    assert len(result.items) == 10
+
+    monkeypatch.setattr(pagination_module, "_planner_estimate", lambda _queryset: 40)
+    result = asyncio.run(EstimatedPagination().paginate_queryset(qs, {"query": {}}))
+    assert result.total == 50
+    assert result.total_estimated is None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_estimated_count_falls_back_to_exact_without_planner(sample_articles):
+    """Backends without a planner estimate (SQLite) fall back to COUNT(*)"""
+
+    class EstimatedPagination(LimitOffsetPagination):
+        count_mode = "estimated"
+        estimate_threshold = 1
+
+    result = asyncio.run(EstimatedPagination().paginate_queryset(Article.objects.all(), {"query": {}}))
+    assert result.total == 50
+    assert result.total_estimated is None
+
+
+# ============================================================================
+# Multi-column Keyset Cursors
+# ============================================================================
+
+
+def _walk_cursor_pages(paginator, queryset, cursor_key="next_cursor", start=None):
+    """Follow cursors from ``start`` until exhausted, returning each page of ids"""
+    pages = []
+    cursor = start
+    while True:
+        query = {"cursor": cursor} if cursor else {}
+        result = asyncio.run(paginator.paginate_queryset(queryset, {"query": query}))
+        pages.append([item["id"] for item in result.items])
+        cursor = getattr(result, cursor_key)
+        if cursor is None:
+            return pages, result
+
+
+@pytest.mark.parametrize(
+    "ordering",
+    [
+        ("author",),  # tie-breaker appended automatically
+        ("-author", "-id"),  # uniform directions -> row-value comparison
+        ("-author", "id"),  # mixed directions -> expanded OR filter
+    ],
+)
+@pytest.mark.django_db(transaction=True)
+def test_cursor_pagination_composite_ordering_has_no_gaps(sample_articles, ordering):
+    """Rows sharing an ordering value are neither skipped nor duplicated"""
+
+    class CompositeCursorPagination(CursorPagination):
+        page_size = 7
+
+    CompositeCursorPagination.ordering = ordering
+    paginator = CompositeCursorPagination()
+    qs = Article.objects.all()
+
+    pages, _ = _walk_cursor_pages(paginator, qs)
+    seen = [article_id for page in pages for article_id in page]
+
+    order_by = [*ordering, "id"] if len(ordering) == 1 else list(ordering)
+    expected = list(Article.objects.order_by(*order_by).values_list("id", flat=True))
+    assert seen == expected
+
+
+@pytest.mark.django_db(transaction=True)
+def test_cursor_pagination_uniform_ordering_uses_row_value_comparison(sample_articles):
+    """Uniform directions compile to a single row-value comparison"""
+
+    class CompositeCursorPagination(CursorPagination):
+        ordering = ("-author", "-id")
+
+    paginator = CompositeCursorPagination()
+    qs = Article.objects.order_by("-author", "-id")
+    fields = paginator._get_ordering_fields(qs)
+
+    uniform = paginator._apply_keyset_filter(qs, fields, ["Author 5", 10], forward=True)
+    assert '("django_bolt_article"."author", "django_bolt_article"."id") <' in str(uniform.query)
+
+    mixed = paginator._apply_keyset_filter(qs, [("author", True), ("id", False)], ["Author 5", 10], forward=True)
+    assert " OR " in str(mixed.query)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_cursor_pagination_previous_cursor_walks_back(sample_articles):
+    """previous_cursor returns exactly the pages seen on the way forward"""
+
+    class CompositeCursorPagination(CursorPagination):
+        page_size = 8
+        ordering = ("author",)
+
+    paginator = CompositeCursorPagination()
+    qs = Article.objects.all()
+
+    forward_pages, last = _walk_cursor_pages(paginator, qs)
+    assert last.has_next is False
+    assert last.has_previous is True
+
+    backward_pages, first = _walk_cursor_pages(paginator, qs, cursor_key="previous_cursor", start=last.previous_cursor)
+    assert backward_pages == list(reversed(forward_pages[:-1]))
+    assert first.has_previous is False
+    assert first.has_next is True
+    assert first.next_cursor is not None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_cursor_pagination_rejects_tampered_cursor(sample_articles):
+    """Cursors are signed; forged or unsigned cursors restart from the first page"""
+
+    class SignedCursorPagination(CursorPagination):
+        page_size = 10
+
+    paginator = SignedCursorPagination()
+    qs = Article.objects.all()
+    first = asyncio.run(paginator.paginate_queryset(qs, {"query": {}}))
+
+    payload, _, signature = first.next_cursor.rpartition(":")
+    assert payload and signature
+    assert paginator._decode_cursor(first.next_cursor) is not None
+
+    forged = f"{payload[:-1]}A:{signature}"
+    assert paginator._decode_cursor(forged) is None
+
+    unsigned = SignedCursorPagination()
+    unsigned.sign_cursors = False
+    assert paginator._decode_cursor(unsigned._encode_cursor([1, 1])) is None
+
+    result = asyncio.run(paginator.paginate_queryset(qs, {"query": {"cursor": forged}}))
+    assert [item["id"] for item in result.items] == [item["id"] for item in first.items]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_cursor_pagination_values_queryset_selects_tiebreaker(sample_articles):
+    """values() querysets without the pk still get a cursor for every page"""
+
+    class ValuesCursorPagination(CursorPagination):
+        page_size = 7
+        ordering = ("author",)
+
+    paginator = ValuesCursorPagination()
+    qs = Article.objects.values("title", "author")
+
+    pages, last = _walk_cursor_pages(paginator, qs)
+    seen = [article_id for page in pages for article_id in page]
+    assert seen == list(Article.objects.order_by("author", "id").values_list("id", flat=True))
+    assert last.has_next is False
+
+
+@pytest.mark.django_db(transaction=True)
+def test_cursor_pagination_rejects_values_list(sample_articles):
+    """values_list() rows can't carry a cursor position"""
+    paginator = CursorPagination()
+    qs = Article.objects.values_list("id", "title")
+
+    with pytest.raises(ValueError, match="values_list"):
+        asyncio.run(paginator.paginate_queryset(qs, {"query": {}}))
+
+
+@pytest.mark.django_db(transaction=True)
+def test_cursor_pagination_null_ordering_value_raises(sample_articles):
+    """A NULL ordering value raises instead of reporting has_next without a cursor"""
+
+    class NullableCursorPagination(CursorPagination):
+        page_size = 5
+        ordering = ("rank",)
+
+    paginator = NullableCursorPagination()
+    qs = Article.objects.annotate(rank=Value(None, output_field=IntegerField()))
+
+    with pytest.raises(ValueError, match="'rank' is NULL"):
+        asyncio.run(paginator.paginate_queryset(qs, {"query": {}}))
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,150 @@
+"""
+Tests for the on-demand sampling profiler (BOLT_PROFILER / bolt_profile).
+
+Tests cover:
+- Duration parsing
+- Samples tagged with the route of the running handler
+- Collapsed-stack and speedscope output
+- Profile requests written by bolt_profile
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from django_bolt import BoltAPI, profiler
+from django_bolt.profiler import SamplingProfiler, parse_duration, profile_request_path
+
+
+class TestParseDuration:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("30s", 30.0), ("500ms", 0.5), ("2m", 120.0), ("1.5", 1.5), (" 10 s ", 10.0), (0.005, 0.005)],
+    )
+    def test_valid(self, value, expected):
+        assert parse_duration(value) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("value", ["", "abc", "10h", "0s", -1])
+    def test_invalid(self, value):
+        with pytest.raises(ValueError):
+            parse_duration(value)
+
+
+def spin(stop):
+    while not stop.is_set():
+        sum(range(100))
+
+
+class TestSamplingProfiler:
+    def test_samples_tagged_by_route(self):
+        api = BoltAPI()
+        stop = threading.Event()
+
+        @api.get("/busy/{item_id}")
+        def busy(item_id: int):
+            spin(stop)
+
+        handler_id = next(iter(api._handlers))
+        worker = threading.Thread(target=busy, args=(1,), name="busy-worker")
+        worker.start()
+        try:
+            sampler = SamplingProfiler(interval=0.001, api=api)
+            sampler.run(0.1)
+        finally:
+            stop.set()
+            worker.join()
+
+        assert sampler.sample_count > 0
+        tag = f"[handler_id={handler_id} GET /busy/{{item_id}}]"
+        busy_stacks = [stack for stack in sampler.stacks if stack[0] == tag]
+        assert busy_stacks
+        assert all(stack[1] == "busy-worker" for stack in busy_stacks)
+        assert any("spin" in frame for stack in busy_stacks for frame in stack)
+        # The sampling thread itself is excluded
+        assert not any("SamplingProfiler.run" in frame for stack in sampler.stacks for frame in stack)
+
+    def test_untagged_without_api(self):
+        sampler = SamplingProfiler()
+        stop = threading.Event()
+        worker = threading.Thread(target=spin, args=(stop,))
+        worker.start()
+        try:
+            sampler.sample(exclude=threading.get_ident())
+        finally:
+            stop.set()
+            worker.join()
+
+        assert all(stack[0] == "[no handler]" for stack in sampler.stacks)
+
+    def test_collapsed_output(self):
+        sampler = SamplingProfiler()
+        sampler.stacks.update({("[no handler]", "main", "a", "b"): 3, ("[no handler]", "main", "a"): 1})
+
+        assert sampler.collapsed() == "[no handler];main;a;b 3\n[no handler];main;a 1\n"
+
+    def test_speedscope_output(self):
+        sampler = SamplingProfiler(interval=0.01)
+        sampler.stacks.update({("root", "a", "b"): 3, ("root", "c"): 1})
+
+        profile = sampler.speedscope("test")
+        frames = [frame["name"] for frame in profile["shared"]["frames"]]
+        assert frames == ["root", "a", "b", "c"]
+        sampled = profile["profiles"][0]
+        assert sampled["samples"] == [[0, 1, 2], [0, 3]]
+        assert sampled["weights"] == pytest.approx([0.03, 0.01])
+        assert sampled["endValue"] == pytest.approx(0.04)
+
+    def test_write(self, tmp_path):
+        sampler = SamplingProfiler()
+        sampler.stacks.update({("root", "a"): 2})
+
+        sampler.write(str(tmp_path / "out.collapsed"))
+        sampler.write(str(tmp_path / "out.json"), "speedscope")
+
+        assert (tmp_path / "out.collapsed").read_text() == "root;a 2\n"
+        assert json.loads((tmp_path / "out.json").read_text())["exporter"] == "django-bolt"
+        assert sorted(os.listdir(tmp_path)) == ["out.collapsed", "out.json"]
+        with pytest.raises(ValueError):
+            sampler.write(str(tmp_path / "out.svg"), "svg")
+
+
+class TestProfileRequest:
+    def test_reads_and_removes_request(self, tmp_path):
+        pid = os.getpid()
+        path = profile_request_path(pid)
+        output = str(tmp_path / "profile.json")
+        with open(path, "w") as f:
+            json.dump({"duration": 2, "interval": 0.01, "format": "speedscope", "output": output}, f)
+
+        options = profiler._read_profile_request(pid)
+
+        assert options == {"duration": 2.0, "interval": 0.01, "format": "speedscope", "output": output}
+        assert not os.path.exists(path)
+
+    def test_defaults_without_request(self):
+        options = profiler._read_profile_request(os.getpid())
+
+        assert options["duration"] == profiler.DEFAULT_PROFILE_DURATION
+        assert options["interval"] == profiler.DEFAULT_SAMPLE_INTERVAL
+        assert options["format"] == "collapsed"
+        assert options["output"].endswith(".collapsed")
+
+    def test_run_writes_requested_profile(self, tmp_path):
+        output = tmp_path / "profile.collapsed"
+        with open(profile_request_path(os.getpid()), "w") as f:
+            json.dump({"duration": "50ms", "interval": "1ms", "output": str(output)}, f)
+
+        options = profiler._read_profile_request(os.getpid())
+        sampler = SamplingProfiler(options["interval"])
+        started = time.perf_counter()
+        sampler.run(options["duration"])
+        sampler.write(options["output"], options["format"])
+
+        assert time.perf_counter() - started >= 0.05
+        assert sampler.duration >= 0.05
+        assert output.exists()
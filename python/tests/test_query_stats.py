@@ -0,0 +1,172 @@
+"""
+Tests for per-route query instrumentation (BOLT_QUERY_STATS).
+
+Tests cover:
+- Queries counted per request and aggregated per handler_id
+- Queries on sync_to_thread workers attributed to the dispatching request
+- Repeated parametrized queries triggering an N+1 warning
+- Queries outside an instrumented request being ignored
+- snapshot() labels/order and reset()
+- The stats endpoint and the BoltAPI dispatch wrapper
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import pytest
+from django.db import connection
+from django.test import override_settings
+
+from django_bolt import BoltAPI, query_stats
+from django_bolt.auth import AllowAny
+from django_bolt.concurrency import sync_to_thread
+from django_bolt.query_stats import QueryStatsCollector, register_query_stats_endpoint
+from django_bolt.testing import TestClient
+
+from .test_models import Article
+
+
+@pytest.fixture
+def collector():
+    collector = QueryStatsCollector(n_plus_one_threshold=3)
+    collector.install()
+    return collector
+
+
+def run_request(collector, handler_id, fn, route=None):
+    request_queries, token = collector.start_request()
+    try:
+        fn()
+    finally:
+        collector.finish_request(handler_id, request_queries, token, route=route)
+    return request_queries
+
+
+def fetch_each(ids):
+    for pk in ids:
+        list(Article.objects.filter(pk=pk))
+
+
+@pytest.mark.django_db(transaction=True)
+class TestQueryStatsCollector:
+    def test_install_adds_wrapper_once(self, collector):
+        connection.ensure_connection()
+        collector.install()
+        assert connection.execute_wrappers.count(query_stats._execute_wrapper) == 1
+
+    def test_counts_queries_per_route(self, collector):
+        recorded = run_request(collector, 1, lambda: list(Article.objects.all()))
+        assert recorded.count == 1
+        assert recorded.duration > 0
+
+        run_request(collector, 1, lambda: fetch_each([1, 2]))
+        run_request(collector, 2, lambda: None)
+
+        stats = collector.snapshot()
+        assert stats["1"]["requests"] == 2
+        assert stats["1"]["queries"] == 3
+        assert stats["1"]["max_queries"] == 2
+        assert stats["1"]["avg_queries"] == 1.5
+        assert stats["2"]["queries"] == 0
+        assert list(stats) == ["1", "2"]
+
+    def test_queries_outside_requests_are_ignored(self, collector):
+        list(Article.objects.all())
+        assert collector.snapshot() == {}
+
+    def test_n_plus_one_warning(self, collector, caplog):
+        with caplog.at_level(logging.WARNING, logger="django_bolt.query_stats"):
+            run_request(collector, 7, lambda: fetch_each(range(5)), route="GET /articles")
+
+        assert "Possible N+1 query on GET /articles" in caplog.text
+        assert "ran 5 times" in caplog.text
+
+        stats = collector.snapshot({7: "GET /articles"})["GET /articles"]
+        assert stats["n_plus_one_requests"] == 1
+        assert len(stats["repeated_queries"]) == 1
+        assert stats["repeated_queries"][0]["max_per_request"] == 5
+        assert "%s" in stats["repeated_queries"][0]["sql"]
+
+    def test_below_threshold_does_not_warn(self, collector, caplog):
+        with caplog.at_level(logging.WARNING, logger="django_bolt.query_stats"):
+            run_request(collector, 1, lambda: fetch_each(range(3)))
+        assert caplog.text == ""
+        assert collector.snapshot()["1"]["n_plus_one_requests"] == 0
+
+    def test_sync_to_thread_queries_are_attributed(self, collector):
+        async def dispatch():
+            request_queries, token = collector.start_request()
+            try:
+                await sync_to_thread(fetch_each, [1, 2, 3])
+            finally:
+                collector.finish_request(1, request_queries, token)
+
+        asyncio.run(dispatch())
+        assert collector.snapshot()["1"]["queries"] == 3
+
+    def test_reset(self, collector):
+        run_request(collector, 1, lambda: list(Article.objects.all()))
+        collector.reset()
+        assert collector.snapshot() == {}
+
+
+class TestQueryStatsEndpoint:
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setattr(query_stats, "_collector", None)
+        api = BoltAPI()
+        register_query_stats_endpoint(api, guards=[AllowAny()])
+
+        with TestClient(api) as client:
+            assert client.get("/__bolt__/queries").json() == {"enabled": False, "routes": {}}
+
+    def test_requires_staff_by_default(self, monkeypatch):
+        monkeypatch.setattr(query_stats, "_collector", None)
+        api = BoltAPI()
+        register_query_stats_endpoint(api)
+
+        with TestClient(api) as client:
+            assert client.get("/__bolt__/queries").status_code == 401
+
+    @pytest.mark.django_db(transaction=True)
+    def test_dispatch_records_route_stats(self, monkeypatch):
+        monkeypatch.setattr(query_stats, "_collector", None)
+        with override_settings(BOLT_QUERY_STATS=True, BOLT_N_PLUS_ONE_THRESHOLD=2):
+            api = BoltAPI()
+
+        @api.get("/articles")
+        def list_articles():
+            for pk in range(3):
+                list(Article.objects.filter(pk=pk))
+            return {"ok": True}
+
+        register_query_stats_endpoint(api, guards=[AllowAny()])
+
+        with TestClient(api) as client:
+            assert client.get("/articles").status_code == 200
+            data = client.get("/__bolt__/queries?reset=true").json()
+            assert data["enabled"] is True
+            assert data["n_plus_one_threshold"] == 2
+            assert data["routes"]["GET /articles"]["queries"] == 3
+            assert data["routes"]["GET /articles"]["n_plus_one_requests"] == 1
+            assert "GET /articles" not in client.get("/__bolt__/queries").json()["routes"]
+
+    @pytest.mark.django_db(transaction=True)
+    def test_n_plus_one_warning_uses_route_pattern(self, monkeypatch, caplog):
+        monkeypatch.setattr(query_stats, "_collector", None)
+        with override_settings(BOLT_QUERY_STATS=True, BOLT_N_PLUS_ONE_THRESHOLD=2):
+            api = BoltAPI()
+
+        @api.get("/authors/{author}/articles")
+        def author_articles(author: str):
+            for pk in range(3):
+                list(Article.objects.filter(pk=pk, author=author))
+            return {"ok": True}
+
+        with TestClient(api) as client, caplog.at_level("WARNING", logger="django_bolt.query_stats"):
+            assert client.get("/authors/alice/articles").status_code == 200
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert any("GET /authors/{author}/articles" in message for message in messages)
+        assert not any("/authors/alice/" in message for message in messages)
@@ -0,0 +1,167 @@
+"""
+Tests for cluster-wide rate limits through a store (BOLT_RATE_LIMIT_STORE).
+
+Tests cover:
+- InMemoryRateLimitStore and DjangoCacheRateLimitStore token accounting
+- DjangoCacheRateLimitStore sustaining rps when burst < rps
+- Requests limited by tokens leased from the store
+- Failing stores (fail open / fail closed)
+- Limits keyed by the authenticated user
+- Routes with sliding windows found for the shared-bucket startup check
+"""
+
+from __future__ import annotations
+
+import time
+
+import jwt
+import pytest
+from django.core.cache import caches
+
+from django_bolt import BoltAPI
+from django_bolt.auth import JWTAuthentication
+from django_bolt.middleware import rate_limit
+from django_bolt.rate_limit import (
+    DjangoCacheRateLimitStore,
+    InMemoryRateLimitStore,
+    RateLimitStore,
+    disable_rate_limit_store,
+    enable_rate_limit_store,
+    window_limited_routes,
+)
+from django_bolt.testing import TestClient
+
+
+class FailingStore(RateLimitStore):
+    def acquire(self, key: str, tokens: int, rps: int, burst: int) -> int:
+        raise ConnectionError("store unavailable")
+
+
+@pytest.fixture
+def store_enabled():
+    """Enable a store for one test, back to local limits afterwards"""
+
+    def enable(store, lease_ms=100):
+        enable_rate_limit_store(store, lease_ms)
+        return store
+
+    yield enable
+    disable_rate_limit_store()
+
+
+def make_api():
+    api = BoltAPI()
+
+    @api.get("/limited")
+    @rate_limit(rps=1, burst=3, key="x-api-key")
+    async def limited():
+        return {"ok": True}
+
+    return api
+
+
+def send(client, count, key="a"):
+    statuses = []
+    for _ in range(count):
+        statuses.append(client.get("/limited", headers={"x-api-key": key}).status_code)
+        # Give the refill thread time to fetch the next lease
+        time.sleep(0.02)
+    return statuses
+
+
+def test_in_memory_store_grants_up_to_burst():
+    store = InMemoryRateLimitStore()
+    assert store.acquire("1:a", 5, rps=1, burst=3) == 3
+    assert store.acquire("1:a", 1, rps=1, burst=3) == 0
+    # Other keys have their own bucket
+    assert store.acquire("1:b", 2, rps=1, burst=3) == 2
+
+
+def test_in_memory_store_refills():
+    store = InMemoryRateLimitStore()
+    assert store.acquire("1:a", 10, rps=100, burst=10) == 10
+    time.sleep(0.05)
+    assert 1 <= store.acquire("1:a", 10, rps=100, burst=10) <= 10
+
+
+def test_django_cache_store():
+    caches["default"].clear()
+    store = DjangoCacheRateLimitStore(key_prefix="test-ratelimit:")
+    assert store.acquire("1:a", 2, rps=1, burst=5) == 2
+    assert store.acquire("1:a", 5, rps=1, burst=5) == 3
+    assert store.acquire("1:a", 1, rps=1, burst=5) == 0
+    assert store.acquire("1:b", 1, rps=1, burst=5) == 1
+
+
+def test_django_cache_store_sustains_rps_above_burst(monkeypatch):
+    """With burst < rps each one-second window still holds rps tokens"""
+    caches["default"].clear()
+    store = DjangoCacheRateLimitStore(key_prefix="test-ratelimit:")
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+
+    assert sum(store.acquire("1:a", 10, rps=50, burst=10) for _ in range(6)) == 50
+    assert store.acquire("1:a", 10, rps=50, burst=10) == 0
+
+    now[0] += 1
+    assert sum(store.acquire("1:a", 10, rps=50, burst=10) for _ in range(6)) == 50
+
+
+def test_requests_limited_by_store(store_enabled):
+    store = store_enabled(InMemoryRateLimitStore())
+    with TestClient(make_api()) as client:
+        statuses = send(client, 10)
+
+    assert statuses[0] == 200
+    assert 429 in statuses
+    # burst tokens from the store, plus at most the provisional first token
+    assert statuses.count(200) <= 4
+    assert all(key.endswith(":a") for key in store._buckets)
+
+
+def test_failing_store_fails_open(store_enabled):
+    store_enabled(FailingStore())
+    with TestClient(make_api()) as client:
+        assert send(client, 5) == [200] * 5
+
+
+def test_failing_store_fails_closed(store_enabled):
+    store = FailingStore()
+    store.fail_open = False
+    store_enabled(store)
+    with TestClient(make_api()) as client:
+        statuses = send(client, 5)
+    # Only the provisional first token is spent
+    assert statuses == [200] + [429] * 4
+
+
+def test_rate_limit_keyed_by_user():
+    api = BoltAPI()
+
+    @api.get("/me", auth=[JWTAuthentication(secret="test-secret")])
+    @rate_limit(rps=1, burst=2, key="user")
+    async def me():
+        return {"ok": True}
+
+    def headers(user_id):
+        token = jwt.encode({"sub": user_id, "exp": int(time.time()) + 3600}, "test-secret", algorithm="HS256")
+        # Same IP for both users: only the user id tells them apart
+        return {"Authorization": f"Bearer {token}", "x-forwarded-for": "10.0.0.1"}
+
+    with TestClient(api) as client:
+        first = [client.get("/me", headers=headers("alice")).status_code for _ in range(3)]
+        second = [client.get("/me", headers=headers("bob")).status_code for _ in range(2)]
+
+    assert first == [200, 200, 429]
+    assert second == [200, 200]
+
+
+def test_window_limited_routes():
+    api = make_api()
+
+    @api.get("/quota")
+    @rate_limit(rps=10, window_limit=100, window=60)
+    async def quota():
+        return {"ok": True}
+
+    assert window_limited_routes(api) == ["GET /quota"]
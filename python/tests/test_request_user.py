@@ -7,6 +7,8 @@ for different authentication backends via actual HTTP requests.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import time
 
 import jwt
@@ -439,3 +441,98 @@ class TestRequestUserGuardBehavior:
             assert response.status_code == 200
             assert handler_called["called"] is True
             assert response.json()["user_loaded"] is True
+
+
+class TestAsyncUserLoading:
+    """Test `await request.auser()` and coalesced user loads."""
+
+    @pytest.mark.django_db(transaction=True)
+    def test_auser_loads_authenticated_user(self):
+        """Test that request.auser() returns the authenticated user."""
+        user = User.objects.create(username="asyncuser")
+        api = BoltAPI()
+
+        @api.get("/me", auth=[JWTAuthentication(secret="test-secret")], guards=[IsAuthenticated()])
+        async def me(request):
+            current = await request.auser()
+            return {"username": current.username}
+
+        with TestClient(api) as client:
+            token = create_jwt_token(user_id=str(user.id))
+            response = client.get("/me", headers={"Authorization": f"Bearer {token}"})
+            assert response.status_code == 200
+            assert response.json() == {"username": "asyncuser"}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_share_one_query(self):
+        """Test that concurrent loads of one user run the backend once."""
+        from django_bolt.auth import load_user, register_auth_backend  # noqa: PLC0415
+
+        loads = []
+
+        class SlowBackend(APIKeyAuthentication):
+            def get_user_sync(self, user_id: str):
+                time.sleep(0.1)
+                loads.append(User(username=user_id))
+                return loads[-1]
+
+        register_auth_backend("slow_test", SlowBackend(api_keys={"key"}))
+        users = await asyncio.gather(*(load_user("7", "slow_test") for _ in range(5)))
+
+        assert len(loads) == 1
+        assert {user.username for user in users} == {"7"}
+        # Every request gets its own object, the one that started the load included
+        assert len({id(user) for user in users}) == 5
+        assert all(user is not loads[0] for user in users)
+
+    @pytest.mark.asyncio
+    async def test_auser_on_dict_request(self):
+        """Test that dispatching a plain dict request exposes auser as a key."""
+        from django_bolt.auth import register_auth_backend  # noqa: PLC0415
+
+        class DictBackend(APIKeyAuthentication):
+            def get_user_sync(self, user_id: str):
+                return User(username=f"user-{user_id}")
+
+        register_auth_backend("dict_test", DictBackend(api_keys={"key"}))
+        api = BoltAPI()
+
+        @api.get("/me")
+        async def me(request: dict):
+            current = await request["auser"]()
+            return {"username": current.username}
+
+        request = {
+            "method": "GET",
+            "path": "/me",
+            "body": b"",
+            "params": {},
+            "query": {},
+            "headers": {},
+            "cookies": {},
+            "context": None,
+            "auth": {"user_id": "9", "auth_backend": "dict_test"},
+        }
+        status, _, body = await api._dispatch(api._handlers[0], request, 0)
+
+        assert status == 200
+        assert json.loads(body) == {"username": "user-9"}
+
+    @pytest.mark.django_db(transaction=True)
+    def test_sync_user_access_in_async_handler_warns(self, monkeypatch):
+        """Test that blocking request.user access from an async handler warns."""
+        from django_bolt.auth import user_loader  # noqa: PLC0415
+
+        monkeypatch.setattr(user_loader, "_warned_sync_access", False)
+        user = User.objects.create(username="blocking")
+        api = BoltAPI()
+
+        @api.get("/me", auth=[JWTAuthentication(secret="test-secret")], guards=[IsAuthenticated()])
+        async def me(request):
+            return {"username": request.user.username}
+
+        with TestClient(api) as client:
+            token = create_jwt_token(user_id=str(user.id))
+            with pytest.warns(RuntimeWarning, match="auser"):
+                response = client.get("/me", headers={"Authorization": f"Bearer {token}"})
+            assert response.status_code == 200
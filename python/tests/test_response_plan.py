@@ -0,0 +1,176 @@
+"""
+Tests for per-route response encoding plans and the cached type dispatch table.
+
+These tests verify that:
+1. compile_response_plan builds the right predicate for each response type
+2. Results that already match the declared type skip coerce_to_response_type
+3. Results that don't match are still validated
+4. default_serializer caches its per-type lookup (no MRO walk on repeat types)
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+import msgspec
+import pytest
+
+from django_bolt import BoltAPI, _json
+from django_bolt import serialization as serialization_module
+from django_bolt._kwargs import compile_response_plan
+from django_bolt.testing import TestClient
+
+
+class Item(msgspec.Struct):
+    id: int
+    name: str
+
+
+class OtherItem(msgspec.Struct):
+    id: int
+    name: str
+
+
+class TestCompileResponsePlan:
+    def test_no_response_type_has_no_plan(self):
+        assert compile_response_plan(None) is None
+
+    def test_primitive_types_are_always_prevalidated(self):
+        for tp in (dict, list, str, int):
+            plan = compile_response_plan(tp)
+            assert plan is not None
+            assert plan({"anything": 1}) is True
+
+    def test_struct_plan_matches_instances_only(self):
+        plan = compile_response_plan(Item)
+        assert plan(Item(id=1, name="a")) is True
+        assert plan({"id": 1, "name": "a"}) is False
+        assert plan(OtherItem(id=1, name="a")) is False
+
+    def test_list_of_struct_plan_checks_every_item(self):
+        plan = compile_response_plan(list[Item])
+        assert plan([]) is True
+        assert plan([Item(id=1, name="a"), Item(id=2, name="b")]) is True
+        assert plan([Item(id=1, name="a"), {"id": 2, "name": "b"}]) is False
+        assert plan((Item(id=1, name="a"),)) is False
+
+    def test_other_generics_have_no_plan(self):
+        assert compile_response_plan(dict[str, int]) is None
+        assert compile_response_plan(list[int]) is None
+
+    def test_route_registration_stores_plan(self):
+        api = BoltAPI()
+
+        @api.get("/items")
+        async def list_items() -> list[Item]:
+            return []
+
+        @api.get("/raw")
+        async def raw():
+            return {}
+
+        meta_items = api._handler_meta[api._routes[0][2]]
+        meta_raw = api._handler_meta[api._routes[1][2]]
+        assert callable(meta_items["response_plan"])
+        assert meta_raw["response_plan"] is None
+
+
+class TestPrevalidatedEncoding:
+    @pytest.fixture
+    def coerce_calls(self, monkeypatch):
+        calls = []
+        original_sync = serialization_module.coerce_to_response_type
+        original_async = serialization_module.coerce_to_response_type_async
+
+        def tracked_sync(value, annotation, meta=None):
+            calls.append(value)
+            return original_sync(value, annotation, meta=meta)
+
+        async def tracked_async(value, annotation, meta=None):
+            calls.append(value)
+            return await original_async(value, annotation, meta=meta)
+
+        monkeypatch.setattr(serialization_module, "coerce_to_response_type", tracked_sync)
+        monkeypatch.setattr(serialization_module, "coerce_to_response_type_async", tracked_async)
+        return calls
+
+    def test_matching_structs_skip_coercion(self, coerce_calls):
+        api = BoltAPI()
+
+        @api.get("/items")
+        async def list_items() -> list[Item]:
+            return [Item(id=1, name="a"), Item(id=2, name="b")]
+
+        @api.get("/item")
+        def get_item() -> Item:
+            return Item(id=3, name="c")
+
+        with TestClient(api) as client:
+            assert client.get("/items").json() == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+            assert client.get("/item").json() == {"id": 3, "name": "c"}
+
+        assert coerce_calls == []
+
+    def test_dicts_are_still_validated(self, coerce_calls):
+        api = BoltAPI()
+
+        @api.get("/items")
+        async def list_items() -> list[Item]:
+            return [{"id": 1, "name": "a"}]
+
+        @api.get("/bad")
+        async def bad_items() -> list[Item]:
+            return [{"id": "not-an-int", "name": "a"}]
+
+        with TestClient(api) as client:
+            assert client.get("/items").json() == [{"id": 1, "name": "a"}]
+            response = client.get("/bad")
+            assert response.status_code == 500
+            assert "Response validation error" in response.text
+
+        assert len(coerce_calls) == 2
+
+
+class TestTypeEncoderCache:
+    def test_repeat_types_hit_cache(self):
+        _json._TYPE_ENCODER_CACHE.clear()
+        assert _json.default_serializer(UUID(int=1)) == "00000000-0000-0000-0000-000000000001"
+        assert UUID in _json._TYPE_ENCODER_CACHE
+
+        # datetime is a subclass of date - the MRO result is cached per concrete type
+        assert _json.default_serializer(datetime(2024, 1, 2, 3, 4, 5)) == "2024-01-02T03:04:05"
+        assert _json.default_serializer(date(2024, 1, 2)) == "2024-01-02"
+        assert _json._TYPE_ENCODER_CACHE[datetime] is _json.DEFAULT_TYPE_ENCODERS[datetime]
+
+    def test_subclass_resolved_through_mro(self):
+        class MyDecimal(Decimal):
+            pass
+
+        assert _json.default_serializer(MyDecimal("1.5")) == 1.5
+        assert _json._TYPE_ENCODER_CACHE[MyDecimal] is _json.DEFAULT_TYPE_ENCODERS[Decimal]
+
+    def test_unsupported_type_is_cached_and_raises(self):
+        class Unsupported:
+            pass
+
+        for _ in range(2):
+            with pytest.raises(TypeError, match="Unsupported type"):
+                _json.default_serializer(Unsupported())
+        assert _json._TYPE_ENCODER_CACHE[Unsupported] is None
+
+    def test_register_type_encoder_invalidates_cache(self):
+        class Point:
+            def __init__(self, x, y):
+                self.x, self.y = x, y
+
+        with pytest.raises(TypeError):
+            _json.default_serializer(Point(1, 2))
+
+        _json.register_type_encoder(Point, lambda p: [p.x, p.y])
+        try:
+            assert _json.encode({"p": Point(1, 2)}) == b'{"p":[1,2]}'
+        finally:
+            _json.DEFAULT_TYPE_ENCODERS.pop(Point, None)
+            _json._TYPE_ENCODER_CACHE.clear()
@@ -0,0 +1,75 @@
+"""
+Tests for runbolt worker recycling options (--max-requests / --max-rss-mb).
+
+Tests cover:
+- Recycling limits passed to Rust through environment variables
+- --max-requests-jitter drawn per process within 0..N
+- Dev mode ignoring the recycling limits
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from django_bolt.management.commands import runbolt
+from django_bolt.management.commands.runbolt import Command
+
+RECYCLE_ENV = ("DJANGO_BOLT_MAX_REQUESTS", "DJANGO_BOLT_MAX_RSS_MB")
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in RECYCLE_ENV:
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_limits_passed_through_env():
+    Command.set_recycle_env({"max_requests": 1000, "max_requests_jitter": 0, "max_rss_mb": 512})
+
+    assert os.environ["DJANGO_BOLT_MAX_REQUESTS"] == "1000"
+    assert os.environ["DJANGO_BOLT_MAX_RSS_MB"] == "512"
+
+
+def test_unset_limits_leave_env_untouched():
+    Command.set_recycle_env({"max_requests": 0, "max_requests_jitter": 50, "max_rss_mb": 0})
+
+    assert all(name not in os.environ for name in RECYCLE_ENV)
+    assert not Command.recycling_enabled({"max_requests": 0, "max_rss_mb": 0})
+    assert Command.recycling_enabled({"max_requests": 0, "max_rss_mb": 256})
+
+
+def test_jitter_added_per_process(monkeypatch):
+    draws = []
+
+    def randint(low, high):
+        draws.append((low, high))
+        return high
+
+    monkeypatch.setattr(runbolt.random, "randint", randint)
+    Command.set_recycle_env({"max_requests": 1000, "max_requests_jitter": 100})
+
+    assert draws == [(0, 100)]
+    assert os.environ["DJANGO_BOLT_MAX_REQUESTS"] == "1100"
+
+
+def test_jitter_stays_in_range():
+    seen = set()
+    for _ in range(200):
+        Command.set_recycle_env({"max_requests": 1000, "max_requests_jitter": 5})
+        seen.add(int(os.environ["DJANGO_BOLT_MAX_REQUESTS"]))
+
+    assert seen <= set(range(1000, 1006))
+    assert len(seen) > 1
+
+
+def test_dev_mode_ignores_recycling(monkeypatch):
+    started = []
+    command = Command()
+    monkeypatch.setattr(command, "run_with_autoreload", lambda options: started.append(dict(options)))
+
+    command.handle(dev=True, processes=1, max_requests=1000, max_requests_jitter=10, max_rss_mb=512)
+
+    assert started[0]["max_requests"] == 0
+    assert started[0]["max_rss_mb"] == 0
@@ -0,0 +1,108 @@
+"""
+Tests for rate limits shared across processes (BOLT_SHARED_RATE_LIMIT).
+
+Tests cover:
+- Buckets shared by forked workers (a limit holds for all of them together)
+- Independent buckets per key
+- Fallback to the per-process limiter when the shared table is full
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import django_bolt
+
+# Forks "workers" that attach to one shared bucket table and send requests through
+# the test client (run in a fresh interpreter: forking after the runtime started is unsafe)
+SHARED_RATE_LIMIT_SCRIPT = textwrap.dedent(
+    """
+    import json
+    import os
+    import sys
+
+    import django
+    from django.conf import settings
+
+    settings.configure(SECRET_KEY="test", ALLOWED_HOSTS=["*"], INSTALLED_APPS=["django_bolt"])
+    django.setup()
+
+    from django_bolt import BoltAPI
+    from django_bolt.middleware import rate_limit
+    from django_bolt.rate_limit import attach_shared_rate_limit, create_shared_rate_limit_region
+    from django_bolt.testing import TestClient
+
+
+    def run_worker(path, keys, output):
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                attach_shared_rate_limit(path)
+                api = BoltAPI()
+
+                @api.get("/limited")
+                @rate_limit(rps=1, burst=5, key="x-api-key")
+                async def limited():
+                    return {"ok": True}
+
+                with TestClient(api) as client:
+                    statuses = [client.get("/limited", headers={"x-api-key": key}).status_code for key in keys]
+                with open(output, "w") as f:
+                    json.dump(statuses, f)
+            except BaseException:
+                import traceback
+
+                traceback.print_exc()
+                code = 1
+            os._exit(code)
+        assert os.waitpid(pid, 0)[1] == 0
+        with open(output) as f:
+            return json.load(f)
+
+
+    results = {}
+    for name, entries in (("shared", 1024), ("full", 1)):
+        path = create_shared_rate_limit_region(entries)
+        output = path + ".out"
+        try:
+            results[name] = [
+                run_worker(path, ["a"] * 5, output),
+                run_worker(path, ["a"] * 5 + ["b"] * 5, output),
+            ]
+        finally:
+            os.unlink(path)
+            os.unlink(output)
+    print(json.dumps(results))
+    """
+)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="shared rate limits require fork()")
+def test_shared_rate_limit_across_processes():
+    env = {**os.environ, "PYTHONPATH": os.path.dirname(os.path.dirname(django_bolt.__file__))}
+    env.pop("DJANGO_SETTINGS_MODULE", None)
+    completed = subprocess.run(
+        [sys.executable, "-c", SHARED_RATE_LIMIT_SCRIPT], capture_output=True, text=True, env=env, timeout=60
+    )
+    assert completed.returncode == 0, completed.stderr
+    results = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    first, second = results["shared"]
+    assert first == [200] * 5
+    # The second worker sees the burst the first one used (only the refill since then is left)
+    assert second[:5].count(200) <= 2
+    # Another key has its own bucket
+    assert second[5:] == [200] * 5
+
+    first, second = results["full"]
+    assert first == [200] * 5
+    assert second[:5].count(200) <= 2
+    # No room for "b" in a one-bucket table: the per-process limiter takes over
+    assert second[5:] == [200] * 5
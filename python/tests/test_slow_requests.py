@@ -0,0 +1,176 @@
+"""
+Tests for the slow-request sampler (BOLT_SLOW_REQUEST_MS).
+
+Tests cover:
+- Fast requests not recorded
+- Stacks sampled while the request is suspended, blocking the loop or running on the thread pool
+- Parameter/header obfuscation and Python phase timings in records
+- Ring buffer bound and reset
+- BoltAPI dispatch wrapper and the protected dump endpoint
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+import pytest
+from django.test import override_settings
+
+from django_bolt import BoltAPI, concurrency, slow_requests
+from django_bolt.auth import AllowAny
+from django_bolt.concurrency import sync_to_thread
+from django_bolt.slow_requests import SlowRequestSampler, register_slow_requests_endpoint
+from django_bolt.testing import TestClient
+
+
+def make_request():
+    return {
+        "method": "GET",
+        "path": "/items/1",
+        "params": {"item_id": "1"},
+        "query": {"x-api-key": "secret", "Password": "hunter2", "page": "2"},
+        "headers": {"authorization": "Bearer secret", "accept": "application/json"},
+    }
+
+
+async def run_request(sampler, body, status=200):
+    sampler.start()
+    try:
+        entry, token = sampler.start_request()
+        await body()
+        return sampler.finish_request(entry, token, make_request(), "GET /items/{item_id}", status)
+    finally:
+        sampler.stop()
+
+
+def blocking_lookup(seconds):
+    time.sleep(seconds)
+
+
+class TestSlowRequestSampler:
+    def test_fast_request_not_recorded(self):
+        sampler = SlowRequestSampler(threshold=0.2, interval=0.01)
+
+        async def body():
+            await asyncio.sleep(0.01)
+
+        assert asyncio.run(run_request(sampler, body)) is None
+        assert sampler.records() == []
+
+    def test_suspended_request_records_coroutine_stack(self, caplog):
+        sampler = SlowRequestSampler(threshold=0.05, interval=0.01)
+
+        async def wait_for_backend():
+            await asyncio.sleep(0.2)
+
+        with caplog.at_level(logging.WARNING, logger="django_bolt.slow_requests"):
+            record = asyncio.run(run_request(sampler, wait_for_backend))
+
+        assert record["route"] == "GET /items/{item_id}"
+        assert record["status"] == 200
+        assert record["duration_ms"] >= 200
+        assert "wait_for_backend" in record["stack"]
+        assert sampler.records() == [record]
+        assert any("Slow request: GET /items/1" in r.getMessage() for r in caplog.records)
+
+    def test_blocking_request_records_loop_stack(self):
+        sampler = SlowRequestSampler(threshold=0.05, interval=0.01)
+
+        async def body():
+            blocking_lookup(0.2)
+
+        record = asyncio.run(run_request(sampler, body))
+        assert "blocking_lookup" in record["stack"]
+        assert "time.sleep" in record["stack"]
+
+    def test_thread_pool_request_records_worker_stack(self):
+        sampler = SlowRequestSampler(threshold=0.05, interval=0.01)
+
+        async def body():
+            await sync_to_thread(blocking_lookup, 0.2)
+
+        record = asyncio.run(run_request(sampler, body))
+        assert "blocking_lookup" in record["stack"]
+        assert concurrency._thread_tracker is None
+
+    def test_obfuscates_params_and_headers(self):
+        sampler = SlowRequestSampler(threshold=0.0, interval=0.01)
+
+        async def body():
+            pass
+
+        record = asyncio.run(run_request(sampler, body))
+        assert record["params"] == {"item_id": "1"}
+        assert record["query"] == {"x-api-key": "***", "Password": "***", "page": "2"}
+        assert record["headers"] == {"authorization": "***", "accept": "application/json"}
+
+    def test_buffer_is_bounded(self):
+        sampler = SlowRequestSampler(threshold=0.0, capacity=3, interval=0.01)
+
+        async def body():
+            for status in range(5):
+                entry, token = sampler.start_request()
+                sampler.finish_request(entry, token, make_request(), "GET /items/{item_id}", 200 + status)
+
+        asyncio.run(body())
+
+        assert [record["status"] for record in sampler.records()] == [204, 203, 202]
+        sampler.reset()
+        assert sampler.records() == []
+
+
+class TestSlowRequestDispatch:
+    @pytest.fixture(autouse=True)
+    def fresh_sampler(self, monkeypatch):
+        monkeypatch.setattr(slow_requests, "_sampler", None)
+        yield
+        if slow_requests._sampler is not None:
+            slow_requests._sampler.stop()
+
+    def test_disabled_by_default(self):
+        api = BoltAPI()
+        register_slow_requests_endpoint(api, guards=[AllowAny()])
+
+        with TestClient(api) as client:
+            assert client.get("/__bolt__/slow-requests").json() == {"enabled": False, "requests": []}
+
+        assert slow_requests.get_slow_request_sampler() is None
+
+    def test_endpoint_requires_staff_by_default(self):
+        api = BoltAPI()
+        register_slow_requests_endpoint(api)
+
+        with TestClient(api) as client:
+            assert client.get("/__bolt__/slow-requests").status_code == 401
+
+    def test_records_slow_route(self):
+        with override_settings(BOLT_SLOW_REQUEST_MS=50, BOLT_SLOW_REQUEST_BUFFER=10):
+            api = BoltAPI()
+
+        @api.get("/items/{item_id}")
+        async def get_item(item_id: int):
+            await asyncio.sleep(item_id / 10)
+            return {"id": item_id}
+
+        register_slow_requests_endpoint(api, guards=[AllowAny()])
+
+        with TestClient(api) as client:
+            assert client.get("/items/0").status_code == 200
+            assert client.get("/items/2?token=abc&page=1", headers={"Authorization": "Bearer x"}).status_code == 200
+            data = client.get("/__bolt__/slow-requests?reset=true").json()
+            assert client.get("/__bolt__/slow-requests").json()["requests"] == []
+
+        assert data["enabled"] is True
+        assert data["threshold_ms"] == 50
+        assert data["capacity"] == 10
+        [record] = data["requests"]
+        assert record["route"] == "GET /items/{item_id}"
+        assert record["path"] == "/items/2"
+        assert record["status"] == 200
+        assert record["params"] == {"item_id": "2"}
+        assert record["query"] == {"token": "***", "page": "1"}
+        assert record["headers"]["authorization"] == "***"
+        assert {"bind", "handler", "serialize", "dispatch"} <= set(record["phases_ms"])
+        assert "get_item" in record["stack"]
@@ -0,0 +1,136 @@
+"""
+Tests for per-phase request timings (BOLT_PHASE_TIMINGS / BOLT_SERVER_TIMING).
+
+Tests cover:
+- Percentile estimation from cumulative histogram buckets
+- _dispatch reporting bind/handler/serialize/dispatch phases to Rust
+- _dispatch leaving requests untouched when timings are disabled
+- Server-Timing header and per-route histograms through the test client
+"""
+
+from __future__ import annotations
+
+import pytest
+from django.test import override_settings
+
+from django_bolt import BoltAPI
+from django_bolt.testing import TestClient
+from django_bolt.timing import TIMINGS_STATE_KEY, _percentile, get_route_timings, reset_route_timings
+
+
+def make_request(state):
+    return {
+        "method": "GET",
+        "path": "/items/1",
+        "body": b"",
+        "params": {"item_id": "1"},
+        "query": {},
+        "headers": {},
+        "cookies": {},
+        "context": None,
+        "state": state,
+    }
+
+
+class TestPercentile:
+    BUCKETS = [(1.0, 50), (5.0, 90), (10.0, 100), (float("inf"), 100)]
+
+    def test_interpolates_within_bucket(self):
+        assert _percentile(self.BUCKETS, 100, 0.5) == 1.0
+        assert _percentile(self.BUCKETS, 100, 0.25) == 0.5
+        assert _percentile(self.BUCKETS, 100, 0.7) == 3.0
+        assert _percentile(self.BUCKETS, 100, 0.95) == 7.5
+
+    def test_overflow_bucket_returns_last_bound(self):
+        buckets = [(1.0, 1), (5.0, 1), (float("inf"), 10)]
+        assert _percentile(buckets, 10, 0.99) == 5.0
+
+
+class TestDispatchTimings:
+    @pytest.mark.asyncio
+    async def test_reports_python_phases(self):
+        api = BoltAPI()
+
+        @api.get("/items/{item_id}")
+        async def get_item(item_id: int):
+            return {"id": item_id}
+
+        timings = []
+        response = await api._dispatch(api._handlers[0], make_request({TIMINGS_STATE_KEY: timings}), 0)
+
+        assert response[0] == 200
+        phases = dict(timings)
+        assert [name for name, _ in timings] == ["bind", "handler", "serialize", "dispatch"]
+        assert all(seconds >= 0 for seconds in phases.values())
+        assert phases["dispatch"] >= phases["bind"] + phases["handler"] + phases["serialize"]
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_timings_list(self):
+        api = BoltAPI()
+
+        @api.get("/items/{item_id}")
+        async def get_item(item_id: int):
+            return {"id": item_id}
+
+        request = make_request({})
+        response = await api._dispatch(api._handlers[0], request, 0)
+
+        assert response[0] == 200
+        assert TIMINGS_STATE_KEY not in request["state"]
+
+
+class TestServerTiming:
+    @pytest.fixture(autouse=True)
+    def fresh_timings(self):
+        reset_route_timings()
+        yield
+        reset_route_timings()
+
+    def test_header_and_route_histograms(self):
+        with override_settings(BOLT_SERVER_TIMING=True):
+            api = BoltAPI()
+
+            @api.get("/items/{item_id}")
+            async def get_item(item_id: int):
+                return {"id": item_id}
+
+            with TestClient(api) as client:
+                for item_id in range(3):
+                    response = client.get(f"/items/{item_id}")
+                    assert response.status_code == 200
+
+        metrics = [part.split(";")[0] for part in response.headers["server-timing"].split(", ")]
+        for phase in ("route", "auth", "handler", "serialize", "total"):
+            assert phase in metrics
+
+        route = get_route_timings(api)["GET /items/{item_id}"]
+        assert route["total"]["count"] == 3
+        assert route["handler"]["count"] == 3
+        assert route["total"]["p99_ms"] >= route["total"]["p50_ms"] >= 0
+
+    def test_phase_timings_without_header(self):
+        with override_settings(BOLT_PHASE_TIMINGS=True):
+            api = BoltAPI()
+
+            @api.get("/ping")
+            async def ping():
+                return {"ok": True}
+
+            with TestClient(api) as client:
+                response = client.get("/ping")
+
+        assert "server-timing" not in response.headers
+        assert get_route_timings(api)["GET /ping"]["total"]["count"] == 1
+
+    def test_disabled_by_default(self):
+        api = BoltAPI()
+
+        @api.get("/ping")
+        async def ping():
+            return {"ok": True}
+
+        with TestClient(api) as client:
+            response = client.get("/ping")
+
+        assert "server-timing" not in response.headers
+        assert get_route_timings(api) == {}
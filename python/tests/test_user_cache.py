@@ -0,0 +1,118 @@
+"""
+Tests for the per-process user cache (BOLT_USER_CACHE_TTL).
+
+Tests cover:
+- TTL expiry, size bound and per-request copies of cached users
+- Users loaded for request.user once per TTL instead of once per request
+- Invalidation on post_save, and across processes through the Django cache
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import caches
+
+from django_bolt import BoltAPI
+from django_bolt.auth import APIKeyAuthentication, IsAuthenticated
+from django_bolt.auth.user_cache import UserCache, configure_user_cache, invalidate_user
+from django_bolt.testing import TestClient
+
+
+class Account:
+    def __init__(self, name):
+        self.name = name
+
+
+@pytest.fixture
+def user_cache():
+    """Turn the user cache on for one test, off afterwards"""
+    yield configure_user_cache(60)
+    configure_user_cache(0)
+
+
+def test_user_cache_expires_and_is_bounded():
+    cache = UserCache(ttl=0.2, max_size=2)
+    cache.set("jwt", 1, Account("a"))
+    cache.set("jwt", 2, Account("b"))
+    assert cache.get("jwt", "1").name == "a"
+
+    # "1" was used last: "2" is dropped first
+    cache.set("jwt", 3, Account("c"))
+    assert cache.get("jwt", 2) is None
+    assert cache.get("jwt", 1) is not None
+
+    time.sleep(0.3)
+    assert cache.get("jwt", 1) is None
+
+
+def test_user_cache_returns_copies():
+    cache = UserCache(ttl=60)
+    loaded = Account("a")
+    cache.set("jwt", 1, loaded)
+    # The request that loaded the user keeps using its own object
+    loaded.name = "changed by the loading request"
+    cache.get("jwt", 1).name = "changed by a handler"
+    assert cache.get("jwt", 1).name == "a"
+
+
+def test_user_cache_skips_users_loaded_before_an_invalidation():
+    cache = UserCache(ttl=60)
+    generation = cache.generation
+    cache.discard(1)
+    cache.set("jwt", 1, Account("stale"), generation)
+    assert cache.get("jwt", 1) is None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_request_user_loaded_once_per_ttl(user_cache):
+    loads = []
+
+    class CountingKeyAuth(APIKeyAuthentication):
+        def get_user_sync(self, user_id: str):
+            loads.append(user_id)
+            return User.objects.get(username="cached")
+
+    api = BoltAPI()
+
+    @api.get("/me", auth=[CountingKeyAuth(api_keys={"key"})], guards=[IsAuthenticated()])
+    async def me(request):
+        return {"username": request.user.username}
+
+    User.objects.create(username="cached")
+    with TestClient(api) as client:
+        for _ in range(3):
+            assert client.get("/me", headers={"X-API-Key": "key"}).json() == {"username": "cached"}
+
+    assert len(loads) == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_post_save_invalidates_cached_user(user_cache):
+    user = User.objects.create(username="before")
+    user_cache.set("jwt", user.pk, user)
+
+    user.username = "after"
+    user.save()
+
+    assert user_cache.get("jwt", user.pk) is None
+
+
+def test_invalidation_reaches_other_processes():
+    caches["default"].clear()
+    configure_user_cache(60, invalidation_cache="default")
+    # Stands in for the cache of another worker
+    other_worker = UserCache(ttl=60, invalidation_cache="default")
+    try:
+        other_worker.set("jwt", 42, Account("a"))
+        invalidate_user(42)
+
+        deadline = time.time() + 5
+        while time.time() < deadline and other_worker.get("jwt", 42) is not None:
+            time.sleep(0.1)
+        assert other_worker.get("jwt", 42) is None
+    finally:
+        other_worker.close()
+        configure_user_cache(0)
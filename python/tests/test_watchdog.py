@@ -0,0 +1,155 @@
+"""
+Tests for the event loop watchdog (BOLT_LOOP_WATCHDOG).
+
+Tests cover:
+- Loop lag samples recorded into the histogram
+- Blocking callbacks logged with the loop thread's stack and the task's route
+- Blocking episodes counted per route and recovery logged
+- Short pauses below the threshold not reported
+- BoltAPI dispatch wrapper tagging tasks with their route template
+- Lag histogram and blocking counts exported as Prometheus series
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+import pytest
+from django.test import override_settings
+
+from django_bolt import BoltAPI, watchdog
+from django_bolt.metrics import counter, render_metrics
+from django_bolt.testing import TestClient
+from django_bolt.watchdog import BLOCKED_METRIC, LAG_METRIC, LoopWatchdog
+
+
+def block_event_loop(seconds):
+    time.sleep(seconds)
+
+
+async def run_with_watchdog(loop_watchdog, body):
+    loop_watchdog.start()
+    try:
+        # Let the heartbeat run once so the loop thread is known
+        await asyncio.sleep(0.05)
+        await body()
+        await asyncio.sleep(0.05)
+    finally:
+        loop_watchdog.stop()
+
+
+class TestLoopWatchdog:
+    def test_records_lag_samples(self):
+        loop_watchdog = LoopWatchdog(threshold=0.1, interval=0.01)
+
+        async def idle():
+            await asyncio.sleep(0.1)
+
+        asyncio.run(run_with_watchdog(loop_watchdog, idle))
+
+        lag = loop_watchdog.snapshot()["lag_ms"]
+        assert lag["samples"] >= 5
+        assert sum(lag["histogram"].values()) == lag["samples"]
+        assert loop_watchdog.snapshot()["blocked"]["count"] == 0
+
+    def test_blocking_call_captures_stack_and_route(self, caplog):
+        loop_watchdog = LoopWatchdog(threshold=0.05, interval=0.01)
+
+        async def handler():
+            loop_watchdog.task_routes[asyncio.current_task()] = "GET /slow"
+            block_event_loop(0.3)
+
+        with caplog.at_level(logging.INFO, logger="django_bolt.watchdog"):
+            asyncio.run(run_with_watchdog(loop_watchdog, handler))
+
+        blocked_logs = [r.getMessage() for r in caplog.records if "blocked for more than" in r.getMessage()]
+        assert len(blocked_logs) == 1
+        assert "route: GET /slow" in blocked_logs[0]
+        assert "block_event_loop" in blocked_logs[0]
+        assert "time.sleep" in blocked_logs[0]
+        assert any("was blocked for" in r.getMessage() for r in caplog.records)
+
+        blocked = loop_watchdog.snapshot()["blocked"]
+        assert blocked["count"] == 1
+        assert blocked["routes"] == {"GET /slow": 1}
+        assert 150 < blocked["max_ms"] < 1000
+        assert loop_watchdog.snapshot()["lag_ms"]["max"] > 150
+
+    def test_short_pause_not_reported(self, caplog):
+        loop_watchdog = LoopWatchdog(threshold=0.2, interval=0.01)
+
+        async def handler():
+            block_event_loop(0.02)
+
+        with caplog.at_level(logging.WARNING, logger="django_bolt.watchdog"):
+            asyncio.run(run_with_watchdog(loop_watchdog, handler))
+
+        assert caplog.records == []
+        assert loop_watchdog.snapshot()["blocked"]["count"] == 0
+
+    def test_reset(self):
+        loop_watchdog = LoopWatchdog(threshold=0.05, interval=0.01)
+
+        async def handler():
+            block_event_loop(0.15)
+
+        asyncio.run(run_with_watchdog(loop_watchdog, handler))
+        loop_watchdog.reset()
+
+        snapshot = loop_watchdog.snapshot()
+        assert snapshot["blocked"]["count"] == 0
+        assert snapshot["lag_ms"]["samples"] == 0
+
+    def test_exported_metrics(self):
+        loop_watchdog = LoopWatchdog(threshold=0.05, interval=0.01)
+        loop_watchdog.export_metrics()
+        observations = counter(LAG_METRIC, labels={"le": "+Inf"})
+        blocked = counter(BLOCKED_METRIC, labels={"route": "GET /exported"})
+        observations_before, blocked_before = observations.value, blocked.value
+
+        async def handler():
+            loop_watchdog.task_routes[asyncio.current_task()] = "GET /exported"
+            block_event_loop(0.2)
+
+        asyncio.run(run_with_watchdog(loop_watchdog, handler))
+
+        assert observations.value - observations_before == loop_watchdog.snapshot()["lag_ms"]["samples"]
+        assert blocked.value - blocked_before == 1
+        text = render_metrics()
+        assert f'{LAG_METRIC}{{le="0.001"}}' in text
+        assert "bolt_event_loop_lag_seconds" in text
+        assert "bolt_event_loop_blocked_milliseconds_total" in text
+
+
+class TestWatchdogDispatch:
+    @pytest.fixture(autouse=True)
+    def fresh_watchdog(self, monkeypatch):
+        monkeypatch.setattr(watchdog, "_watchdog", None)
+        yield
+        if watchdog._watchdog is not None:
+            watchdog._watchdog.stop()
+
+    def test_disabled_by_default(self):
+        BoltAPI()
+        assert watchdog.get_loop_watchdog() is None
+
+    def test_blocking_handler_counted_per_route(self):
+        with override_settings(BOLT_LOOP_WATCHDOG=True, BOLT_LOOP_BLOCK_THRESHOLD_MS=50):
+            api = BoltAPI()
+
+        @api.get("/items/{item_id}")
+        async def get_item(item_id: int):
+            await asyncio.sleep(0.05)
+            block_event_loop(0.3)
+            return {"id": item_id}
+
+        with TestClient(api) as client:
+            assert client.get("/items/1").status_code == 200
+            time.sleep(0.1)
+
+        loop_watchdog = watchdog.get_loop_watchdog()
+        assert loop_watchdog.threshold == 0.05
+        assert loop_watchdog.snapshot()["blocked"]["routes"] == {"GET /items/{item_id}": 1}
+        assert loop_watchdog.task_routes == {}
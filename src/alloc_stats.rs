@@ -0,0 +1,111 @@
+//! Global allocator statistics (`BOLT_MEMORY_STATS`).
+//!
+//! Reports the numbers of the allocator selected with the `mimalloc` (default) or
+//! `jemalloc` feature, so RSS growth can be split between Python objects and
+//! allocator overhead, and the allocator features compared on real traffic.
+
+use pyo3::prelude::*;
+use pyo3::types::PyDict;
+
+/// Return the global allocator's statistics:
+/// {"allocator": "mimalloc" | "jemalloc" | "system", ...allocator-specific byte counts}
+#[pyfunction]
+pub fn allocator_stats(py: Python<'_>) -> PyResult<Py<PyDict>> {
+    let stats = PyDict::new(py);
+    fill_allocator_stats(&stats)?;
+    Ok(stats.unbind())
+}
+
+#[cfg(all(feature = "mimalloc", not(feature = "jemalloc")))]
+fn fill_allocator_stats(stats: &Bound<'_, PyDict>) -> PyResult<()> {
+    let mut elapsed_ms = 0usize;
+    let mut user_ms = 0usize;
+    let mut system_ms = 0usize;
+    let mut rss = 0usize;
+    let mut peak_rss = 0usize;
+    let mut committed = 0usize;
+    let mut peak_committed = 0usize;
+    let mut page_faults = 0usize;
+    // SAFETY: mi_process_info only writes to the provided pointers
+    unsafe {
+        libmimalloc_sys::mi_process_info(
+            &mut elapsed_ms,
+            &mut user_ms,
+            &mut system_ms,
+            &mut rss,
+            &mut peak_rss,
+            &mut committed,
+            &mut peak_committed,
+            &mut page_faults,
+        );
+    }
+    stats.set_item("allocator", "mimalloc")?;
+    stats.set_item("rss_bytes", rss)?;
+    stats.set_item("peak_rss_bytes", peak_rss)?;
+    stats.set_item("committed_bytes", committed)?;
+    stats.set_item("peak_committed_bytes", peak_committed)?;
+    stats.set_item("page_faults", page_faults)?;
+    stats.set_item("user_time_ms", user_ms)?;
+    stats.set_item("system_time_ms", system_ms)?;
+    Ok(())
+}
+
+#[cfg(all(feature = "jemalloc", not(feature = "mimalloc")))]
+fn fill_allocator_stats(stats: &Bound<'_, PyDict>) -> PyResult<()> {
+    use std::ffi::{c_void, CStr};
+    use std::mem::size_of;
+    use std::ptr::null_mut;
+
+    /// Read a size_t statistic (None when jemalloc was built without stats)
+    fn read_size(name: &CStr) -> Option<usize> {
+        let mut value = 0usize;
+        let mut len = size_of::<usize>();
+        // SAFETY: `value`/`len` describe a valid size_t output buffer and nothing is written
+        let rc = unsafe {
+            tikv_jemalloc_sys::mallctl(
+                name.as_ptr(),
+                &mut value as *mut usize as *mut c_void,
+                &mut len,
+                null_mut(),
+                0,
+            )
+        };
+        (rc == 0).then_some(value)
+    }
+
+    // jemalloc caches its statistics until the epoch is advanced
+    let mut epoch = 1u64;
+    let mut current_epoch = 0u64;
+    let mut len = size_of::<u64>();
+    // SAFETY: both buffers are valid u64s of the advertised length
+    unsafe {
+        tikv_jemalloc_sys::mallctl(
+            c"epoch".as_ptr(),
+            &mut current_epoch as *mut u64 as *mut c_void,
+            &mut len,
+            &mut epoch as *mut u64 as *mut c_void,
+            size_of::<u64>(),
+        );
+    }
+
+    stats.set_item("allocator", "jemalloc")?;
+    for (key, name) in [
+        ("allocated_bytes", c"stats.allocated"),
+        ("active_bytes", c"stats.active"),
+        ("resident_bytes", c"stats.resident"),
+        ("mapped_bytes", c"stats.mapped"),
+        ("retained_bytes", c"stats.retained"),
+        ("metadata_bytes", c"stats.metadata"),
+    ] {
+        if let Some(value) = read_size(name) {
+            stats.set_item(key, value)?;
+        }
+    }
+    Ok(())
+}
+
+#[cfg(not(any(feature = "mimalloc", feature = "jemalloc")))]
+fn fill_allocator_stats(stats: &Bound<'_, PyDict>) -> PyResult<()> {
+    stats.set_item("allocator", "system")?;
+    Ok(())
+}
@@ -0,0 +1,246 @@
+//! Cluster-wide rate limits through a pluggable store (`BOLT_RATE_LIMIT_STORE`).
+//!
+//! The store (Django cache, Redis, ...) holds the authoritative budget of every
+//! (route, key) pair and is shared by all nodes. Asking it on every request would add a
+//! network round trip, so each process leases batches of tokens instead: requests
+//! spend leased tokens with a single atomic decrement, and when a lease runs low a
+//! background thread asks the store for the next batch (taking the GIL only there).
+//!
+//! A lease holds about `BOLT_RATE_LIMIT_LEASE_MS` of traffic at the full rate
+//! (`rps x lease`, at least one request's cost, at most `burst`). Unused tokens expire
+//! after `LEASE_TTL` so an idle process cannot spend an old budget later. A key seen for
+//! the first time gets provisional tokens for one request, which are charged to the
+//! store with the first lease, so new clients are not rejected while it is fetched.
+
+use dashmap::DashMap;
+use once_cell::sync::Lazy;
+use parking_lot::RwLock;
+use pyo3::prelude::*;
+use std::sync::atomic::{AtomicBool, AtomicI64, AtomicU64, AtomicUsize, Ordering};
+use std::sync::mpsc::{channel, Receiver, Sender};
+use std::sync::Arc;
+use std::time::{Duration, Instant};
+
+use crate::middleware::rate_limit::SCOPED_BUCKET;
+
+/// Leased tokens not spent within this time are dropped
+const LEASE_TTL: Duration = Duration::from_secs(1);
+
+/// Retry-After for requests rejected while the lease is empty
+const EMPTY_LEASE_RETRY: Duration = Duration::from_secs(1);
+
+// SECURITY: Maximum number of leases to prevent memory exhaustion
+const MAX_LEASES: usize = 100_000;
+
+/// Tokens of one (handler_id, key) pair leased by this process
+struct Lease {
+    /// Spendable tokens (negative while provisional tokens are not covered yet)
+    tokens: AtomicI64,
+    /// Tokens spent that the store has not been charged for (provisional tokens)
+    unaccounted: AtomicI64,
+    /// A refill is queued or running
+    refilling: AtomicBool,
+    /// Nanoseconds since EPOCH after which the remaining tokens are dropped
+    expires_ns: AtomicU64,
+}
+
+struct Refill {
+    store_key: String,
+    lease: Arc<Lease>,
+    tokens: i64,
+    rps: u32,
+    burst: u32,
+}
+
+struct Store {
+    lease_secs: f64,
+    refills: Sender<Refill>,
+}
+
+static EPOCH: Lazy<Instant> = Lazy::new(Instant::now);
+
+static ENABLED: AtomicBool = AtomicBool::new(false);
+static STORE: RwLock<Option<Arc<Store>>> = RwLock::new(None);
+static LEASES: Lazy<DashMap<(usize, String), Arc<Lease>>> = Lazy::new(DashMap::new);
+static LEASE_COUNT: AtomicUsize = AtomicUsize::new(0);
+
+#[inline]
+fn now_ns() -> u64 {
+    EPOCH.elapsed().as_nanos() as u64
+}
+
+/// Tokens requested per lease for a limit
+#[inline]
+fn lease_size(lease_secs: f64, rps: u32, burst: u32, cost: u32) -> i64 {
+    ((rps as f64 * lease_secs).ceil() as i64)
+        .max(cost as i64)
+        .clamp(1, burst.max(1) as i64)
+}
+
+/// Check a request costing `cost` tokens against this process's lease for
+/// (handler_id, key).
+///
+/// Returns None when no store is configured (or the lease table is full), otherwise
+/// `Ok(())` when allowed and `Err(wait)` when the lease is short (a refill is already
+/// on its way).
+pub fn check(
+    handler_id: usize,
+    key: &str,
+    rps: u32,
+    burst: u32,
+    cost: u32,
+) -> Option<Result<(), Duration>> {
+    if !ENABLED.load(Ordering::Relaxed) {
+        return None;
+    }
+    let store = STORE.read().clone()?;
+    let now = now_ns();
+    let cost = cost as i64;
+
+    let lease = match LEASES.get(&(handler_id, key.to_string())) {
+        Some(lease) => lease.clone(),
+        // SECURITY: no new leases while the table is full; the sweeper makes room
+        None if LEASE_COUNT.load(Ordering::Relaxed) >= MAX_LEASES => {
+            crate::middleware::rate_limit::wake_sweeper();
+            return None;
+        }
+        None => LEASES
+            .entry((handler_id, key.to_string()))
+            .or_insert_with(|| {
+                LEASE_COUNT.fetch_add(1, Ordering::Relaxed);
+                Arc::new(Lease {
+                    tokens: AtomicI64::new(cost),
+                    unaccounted: AtomicI64::new(cost),
+                    refilling: AtomicBool::new(false),
+                    expires_ns: AtomicU64::new(now + LEASE_TTL.as_nanos() as u64),
+                })
+            })
+            .clone(),
+    };
+
+    // Expired: drop the remaining tokens and start over with provisional tokens
+    // (only the request that claims the new expiry resets the lease)
+    let expires = lease.expires_ns.load(Ordering::Relaxed);
+    if now > expires
+        && lease
+            .expires_ns
+            .compare_exchange(
+                expires,
+                now + LEASE_TTL.as_nanos() as u64,
+                Ordering::AcqRel,
+                Ordering::Relaxed,
+            )
+            .is_ok()
+    {
+        let stale = lease.tokens.load(Ordering::Acquire);
+        // A negative balance is debt for tokens the store refused: keep it
+        if stale >= 0 {
+            lease.tokens.fetch_add(cost - stale, Ordering::AcqRel);
+            lease.unaccounted.fetch_add(cost, Ordering::AcqRel);
+        }
+    }
+
+    let size = lease_size(store.lease_secs, rps, burst, cost as u32);
+    let remaining = lease.tokens.fetch_sub(cost, Ordering::AcqRel) - cost;
+
+    // Prefetch the next lease at half the current one, off the request path
+    if remaining < (size + 1) / 2 && !lease.refilling.swap(true, Ordering::AcqRel) {
+        let refill = Refill {
+            store_key: if handler_id == SCOPED_BUCKET {
+                // Already "scope:<name>:<key>", identical on every node
+                key.to_string()
+            } else {
+                format!("{}:{}", handler_id, key)
+            },
+            lease: lease.clone(),
+            tokens: size,
+            rps,
+            burst,
+        };
+        if store.refills.send(refill).is_err() {
+            lease.refilling.store(false, Ordering::Release);
+        }
+    }
+
+    if remaining >= 0 {
+        Some(Ok(()))
+    } else {
+        lease.tokens.fetch_add(cost, Ordering::AcqRel);
+        Some(Err(EMPTY_LEASE_RETRY))
+    }
+}
+
+/// Drop expired leases (called by the rate limit sweeper thread)
+pub fn sweep() {
+    if !ENABLED.load(Ordering::Relaxed) {
+        return;
+    }
+    let now = now_ns();
+    LEASES.retain(|_, lease| {
+        lease.refilling.load(Ordering::Acquire) || now <= lease.expires_ns.load(Ordering::Relaxed)
+    });
+    LEASE_COUNT.store(LEASES.len(), Ordering::Relaxed);
+}
+
+/// Background thread: ask the store for leases and credit them
+fn refill_loop(acquire: Py<PyAny>, refills: Receiver<Refill>) {
+    for refill in refills {
+        let unaccounted = refill.lease.unaccounted.swap(0, Ordering::AcqRel);
+        let requested = refill.tokens + unaccounted;
+        let granted = Python::attach(|py| {
+            acquire
+                .call1(
+                    py,
+                    (
+                        refill.store_key.as_str(),
+                        requested,
+                        refill.rps,
+                        refill.burst,
+                    ),
+                )
+                .and_then(|granted| granted.extract::<i64>(py))
+                .unwrap_or_else(|e| {
+                    e.print(py);
+                    0
+                })
+        });
+        let granted = granted.clamp(0, requested);
+        refill
+            .lease
+            .tokens
+            .fetch_add(granted - unaccounted, Ordering::AcqRel);
+        refill
+            .lease
+            .expires_ns
+            .store(now_ns() + LEASE_TTL.as_nanos() as u64, Ordering::Relaxed);
+        refill.lease.refilling.store(false, Ordering::Release);
+    }
+}
+
+/// Route rate limit checks through a store, or back to local limits with None.
+///
+/// `acquire(key, tokens, rps, burst) -> granted` is called from a background thread
+/// with the GIL held; it must return how many of the requested tokens the store grants.
+#[pyfunction]
+#[pyo3(signature = (acquire, lease_ms=100))]
+pub fn set_rate_limit_store(acquire: Option<Py<PyAny>>, lease_ms: u64) -> PyResult<()> {
+    let store = match acquire {
+        Some(acquire) => {
+            let (sender, receiver) = channel();
+            std::thread::Builder::new()
+                .name("bolt-rate-limit-refill".into())
+                .spawn(move || refill_loop(acquire, receiver))?;
+            Some(Arc::new(Store {
+                lease_secs: lease_ms.max(1) as f64 / 1000.0,
+                refills: sender,
+            }))
+        }
+        None => None,
+    };
+    ENABLED.store(store.is_some(), Ordering::Relaxed);
+    // Replacing the store drops the old sender, which ends the old refill thread
+    *STORE.write() = store;
+    LEASES.clear();
+    LEASE_COUNT.store(0, Ordering::Relaxed);
+    Ok(())
+}
@@ -20,16 +20,18 @@ use crate::form_parsing::{
     FormParseResult, ValidationError, DEFAULT_MAX_PARTS, DEFAULT_MEMORY_LIMIT,
 };
 use crate::metadata::{RustArgBinding, RustArgSource};
+use crate::metrics;
 use crate::middleware;
 use crate::middleware::auth::populate_auth_context;
 use crate::request::PyRequest;
-use crate::request_pipeline::validate_and_cache_typed_params;
+use crate::request_pipeline::{detect_msgpack, validate_and_cache_typed_params};
 use crate::response_builder;
 use crate::response_meta::ResponseMeta;
 use crate::responses;
 use crate::router::parse_query_string;
 use crate::state::{AppState, GLOBAL_ROUTER, ROUTE_METADATA, TASK_LOCALS};
 use crate::streaming::{create_python_stream, create_sse_stream};
+use crate::timing::{Phase, PhaseTimer, TIMINGS_STATE_KEY};
 use crate::type_coercion::{params_to_py_dict, CoercedValue};
 use crate::validation::{parse_cookies_inline, validate_auth_and_guards, AuthGuardResult};
 
@@ -388,9 +390,39 @@ pub(crate) fn build_prebound_args_kwargs(
 }
 
 pub async fn handle_request(
+    req: HttpRequest,
+    payload: web::Payload,
+    state: web::Data<Arc<AppState>>,
+) -> HttpResponse {
+    // Worker recycling request count (runbolt --max-requests)
+    crate::recycle::record_request();
+
+    // Phase timings (BOLT_PHASE_TIMINGS / BOLT_SERVER_TIMING) and metrics (BOLT_METRICS)
+    // are opt-in: no Instant reads or atomics otherwise
+    if !state.timing.enabled && !state.metrics.enabled {
+        return handle_request_inner(req, payload, state, None).await;
+    }
+    let timing = state.timing;
+    let metrics_enabled = state.metrics.enabled;
+    let _in_flight = metrics_enabled.then(metrics::InFlightGuard::enter);
+    let mut timer = PhaseTimer::start(timing.enabled);
+    let mut response = handle_request_inner(req, payload, state, Some(&mut timer)).await;
+    if metrics_enabled {
+        metrics::observe_request(
+            timer.handler_id(),
+            response.status().as_u16(),
+            timer.elapsed(),
+        );
+    }
+    timer.finish(&mut response, timing.header);
+    response
+}
+
+async fn handle_request_inner(
     req: HttpRequest,
     mut payload: web::Payload,
     state: web::Data<Arc<AppState>>,
+    mut timer: Option<&mut PhaseTimer>,
 ) -> HttpResponse {
     // Keep as &str - no allocation, only clone on error paths
     let method = req.method().as_str();
@@ -483,6 +515,11 @@ pub async fn handle_request(
         }
     };
 
+    if let Some(t) = timer.as_mut() {
+        t.mark(Phase::Route);
+        t.set_handler_id(handler_id);
+    }
+
     // Store method/path as owned for Python (needed after route_match is dropped)
     // OPTIMIZATION: Use compact strings to reduce allocation overhead
     let method_owned = method.to_string();
@@ -584,19 +621,27 @@ pub async fn handle_request(
         .map(|m| m.skip.contains("compression"))
         .unwrap_or(false);
 
+    if let Some(t) = timer.as_mut() {
+        t.mark(Phase::Parse);
+    }
+
     // Process rate limiting (Rust-native, no GIL)
+    // Limits keyed by user are checked after authentication (below)
     if let Some(route_meta) = route_metadata {
         if let Some(ref rate_config) = route_meta.rate_limit_config {
-            if let Some(response) = middleware::rate_limit::check_rate_limit(
-                handler_id,
-                &headers,
-                peer_addr.as_deref(),
-                rate_config,
-                &method,
-                &path,
-            ) {
-                // CORS headers will be added by CorsMiddleware
-                return response;
+            if !rate_config.keyed_by_user() {
+                if let Some(response) = middleware::rate_limit::check_rate_limit(
+                    handler_id,
+                    &headers,
+                    peer_addr.as_deref(),
+                    None,
+                    rate_config,
+                    &method,
+                    &path,
+                ) {
+                    // CORS headers will be added by CorsMiddleware
+                    return response;
+                }
             }
         }
     }
@@ -618,6 +663,28 @@ pub async fn handle_request(
         None
     };
 
+    // Rate limits keyed by the authenticated user id
+    if let Some(rate_config) = route_metadata.and_then(|m| m.rate_limit_config.as_ref()) {
+        if rate_config.keyed_by_user() {
+            if let Some(response) = middleware::rate_limit::check_rate_limit(
+                handler_id,
+                &headers,
+                peer_addr.as_deref(),
+                auth_ctx.as_ref().and_then(|ctx| ctx.user_id.as_deref()),
+                rate_config,
+                &method,
+                &path,
+            ) {
+                // CORS headers will be added by CorsMiddleware
+                return response;
+            }
+        }
+    }
+
+    if let Some(t) = timer.as_mut() {
+        t.mark(Phase::Auth);
+    }
+
     // Optimization: Only parse cookies if handler needs them
     // Cookie parsing can be expensive for requests with many cookies
     let cookies = if needs_cookies {
@@ -716,13 +783,24 @@ pub async fn handle_request(
             }
         };
 
+    // MessagePack content negotiation (Content-Type / Accept), checked on raw headers
+    let (msgpack_body, msgpack_response) = detect_msgpack(req.headers());
+
     // Check if this is a HEAD request (needed for body stripping after Python handler)
     let is_head_request = method == "HEAD";
 
+    let timing_enabled = match timer.as_mut() {
+        Some(t) => {
+            t.mark(Phase::Body);
+            t.phases_enabled()
+        }
+        None => false,
+    };
+
     // All handlers (sync and async) go through async dispatch path
     // Sync handlers are executed in thread pool via sync_to_thread() in Python layer
     // OPTIMIZATION: Single GIL acquisition for handler clone + dispatch call
-    let fut = match Python::attach(|py| -> PyResult<_> {
+    let (fut, python_timings) = match Python::attach(|py| -> PyResult<_> {
         let handler = route_handler.clone_ref(py);
         let dispatch = state.dispatch.clone_ref(py);
 
@@ -769,6 +847,21 @@ pub async fn handle_request(
         let cookies_dict = params_to_py_dict(py, &cookies, param_types)?;
 
         let state_dict = PyDict::new(py);
+        // MessagePack content negotiation flags (read by Python body extractors/serializers)
+        if msgpack_body {
+            state_dict.set_item("_bolt_msgpack_body", true)?;
+        }
+        if msgpack_response {
+            state_dict.set_item("_bolt_msgpack_response", true)?;
+        }
+        // Python's _dispatch appends (phase, seconds) tuples to this list
+        let python_timings = if timing_enabled {
+            let list = PyList::empty(py);
+            state_dict.set_item(TIMINGS_STATE_KEY, &list)?;
+            Some(list.unbind())
+        } else {
+            None
+        };
         if let Some(bindings) = route_metadata.and_then(|m| m.rust_arg_bindings.as_deref()) {
             if let Some((pre_args, pre_kwargs)) = build_prebound_args_kwargs(
                 py,
@@ -817,9 +910,10 @@ pub async fn handle_request(
 
         // Call dispatch (always returns a coroutine since _dispatch is async)
         let coroutine = dispatch.call1(py, (handler, request_obj, handler_id))?;
-        pyo3_async_runtimes::into_future_with_locals(locals, coroutine.into_bound(py))
+        let fut = pyo3_async_runtimes::into_future_with_locals(locals, coroutine.into_bound(py))?;
+        Ok((fut, python_timings))
     }) {
-        Ok(f) => f,
+        Ok(pair) => pair,
         Err(e) => {
             return Python::attach(|py| {
                 handle_python_error(py, e, &path_owned, &method_owned, state.debug)
@@ -827,7 +921,17 @@ pub async fn handle_request(
         }
     };
 
-    match fut.await {
+    if let Some(t) = timer.as_mut() {
+        t.mark(Phase::Gil);
+    }
+
+    let result = fut.await;
+
+    if let Some(t) = timer.as_mut() {
+        t.mark_app(python_timings.as_ref());
+    }
+
+    match result {
         Ok(result_obj) => {
             // Try new ResponseMeta format first: (status, meta_tuple, body)
             // Performance: All header building happens in Rust using static strings
@@ -1,5 +1,7 @@
 use pyo3::prelude::*;
 
+mod alloc_stats;
+mod cluster_rate_limit;
 mod cookies;
 mod cors;
 mod error;
@@ -7,19 +9,25 @@ mod form_parsing;
 mod handler;
 mod json;
 mod metadata;
+mod metrics;
 mod middleware;
 mod permissions;
+mod recycle;
 mod request;
 mod request_pipeline;
 mod response_builder;
 mod response_meta;
 mod responses;
+mod revocation;
 mod router;
 mod server;
+mod shared_metrics;
+mod shared_rate_limit;
 mod state;
 mod static_files;
 mod streaming;
 mod testing;
+mod timing;
 mod type_coercion;
 mod validation;
 mod websocket;
@@ -56,6 +64,52 @@ fn _core(_py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(register_middleware_metadata, m)?)?;
     m.add_function(wrap_pyfunction!(start_server_async, m)?)?;
 
+    // Phase timing histograms (BOLT_PHASE_TIMINGS / BOLT_SERVER_TIMING)
+    m.add_function(wrap_pyfunction!(crate::timing::get_route_timings, m)?)?;
+    m.add_function(wrap_pyfunction!(crate::timing::reset_route_timings, m)?)?;
+
+    // Prometheus metrics (BOLT_METRICS)
+    m.add_class::<crate::metrics::Counter>()?;
+    m.add_class::<crate::metrics::Gauge>()?;
+    m.add_class::<crate::metrics::ExecutorGauge>()?;
+    m.add_function(wrap_pyfunction!(crate::metrics::register_counter, m)?)?;
+    m.add_function(wrap_pyfunction!(crate::metrics::register_gauge, m)?)?;
+    m.add_function(wrap_pyfunction!(crate::metrics::executor_gauges, m)?)?;
+    m.add_function(wrap_pyfunction!(crate::metrics::render_metrics, m)?)?;
+    m.add_function(wrap_pyfunction!(crate::metrics::reset_metrics, m)?)?;
+    m.add_function(wrap_pyfunction!(crate::metrics::render_shared_metrics, m)?)?;
+    m.add_function(wrap_pyfunction!(
+        crate::shared_metrics::create_shared_metrics,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(
+        crate::shared_metrics::py_attach_shared_metrics,
+        m
+    )?)?;
+
+    // Rate limits shared across processes (BOLT_SHARED_RATE_LIMIT)
+    m.add_function(wrap_pyfunction!(
+        crate::shared_rate_limit::create_shared_rate_limit,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(
+        crate::shared_rate_limit::py_attach_shared_rate_limit,
+        m
+    )?)?;
+
+    // JWT revocation checked in Rust (RevocationStore.revoke pushes here)
+    m.add_function(wrap_pyfunction!(crate::revocation::revoke_token, m)?)?;
+    m.add_function(wrap_pyfunction!(crate::revocation::revoke_user_tokens, m)?)?;
+
+    // Cluster-wide rate limits through a pluggable store (BOLT_RATE_LIMIT_STORE)
+    m.add_function(wrap_pyfunction!(
+        crate::cluster_rate_limit::set_rate_limit_store,
+        m
+    )?)?;
+
+    // Allocator statistics (BOLT_MEMORY_STATS)
+    m.add_function(wrap_pyfunction!(crate::alloc_stats::allocator_stats, m)?)?;
+
     // Test infrastructure functions (async-native, uses Actix test utilities)
     m.add_function(wrap_pyfunction!(create_test_app, m)?)?;
     m.add_function(wrap_pyfunction!(destroy_test_app, m)?)?;
@@ -10,7 +10,7 @@ use regex::Regex;
 use std::collections::{HashMap, HashSet};
 
 use crate::form_parsing::FileFieldConstraints;
-use crate::middleware::auth::AuthBackend;
+use crate::middleware::auth::{AuthBackend, JwtSettings, JwtVerifier};
 use crate::permissions::Guard;
 
 /// Request value source for Rust-side argument prebinding.
@@ -182,6 +182,13 @@ pub struct RateLimitConfig {
     pub rps: u32,
     pub burst: u32,
     pub key_type: String,
+    /// Tokens (and window units) taken by one request
+    pub cost: u32,
+    /// Sliding-window limit in units per `window_secs` (0 = none)
+    pub window_limit: u32,
+    pub window_secs: u64,
+    /// Routes with the same scope share their buckets
+    pub scope: Option<String>,
 }
 
 impl Default for RateLimitConfig {
@@ -190,10 +197,22 @@ impl Default for RateLimitConfig {
             rps: 100,
             burst: 200,
             key_type: "ip".to_string(),
+            cost: 1,
+            window_limit: 0,
+            window_secs: 0,
+            scope: None,
         }
     }
 }
 
+impl RateLimitConfig {
+    /// Keyed by the authenticated user, so it must be checked after authentication
+    #[inline]
+    pub fn keyed_by_user(&self) -> bool {
+        self.key_type == "user"
+    }
+}
+
 /// Compression configuration parsed at startup
 #[derive(Debug, Clone)]
 pub struct CompressionConfig {
@@ -532,6 +551,31 @@ fn parse_rate_limit_config(
         }
     }
 
+    // Parse cost (optional, defaults to 1)
+    if let Some(cost_py) = dict.get("cost") {
+        if let Ok(cost) = cost_py.extract::<u32>(py) {
+            config.cost = cost.max(1);
+        }
+    }
+
+    // Parse sliding window (optional, both or neither)
+    if let (Some(limit_py), Some(window_py)) = (dict.get("window_limit"), dict.get("window")) {
+        if let (Ok(Some(limit)), Ok(Some(window))) = (
+            limit_py.extract::<Option<u32>>(py),
+            window_py.extract::<Option<u64>>(py),
+        ) {
+            config.window_limit = limit;
+            config.window_secs = window;
+        }
+    }
+
+    // Parse scope (optional)
+    if let Some(scope_py) = dict.get("scope") {
+        if let Ok(scope) = scope_py.extract::<Option<String>>(py) {
+            config.scope = scope;
+        }
+    }
+
     Some(config)
 }
 
@@ -556,14 +600,63 @@ fn parse_auth_backend(dict: &HashMap<String, Py<PyAny>>, py: Python) -> Option<A
             let issuer = dict
                 .get("issuer")
                 .and_then(|i| i.extract::<String>(py).ok());
-
-            Some(AuthBackend::JWT {
-                secret,
-                algorithms,
-                header,
-                audience,
-                issuer,
-            })
+            let cache_size = dict
+                .get("cache_size")
+                .and_then(|c| c.extract::<usize>(py).ok())
+                .unwrap_or(10_000);
+            let cache_ttl = dict
+                .get("cache_ttl")
+                .and_then(|c| c.extract::<u64>(py).ok())
+                .unwrap_or(60);
+
+            // JWK set loader (a callable returning the set as JSON), replaces `secret`
+            let jwks_loader = dict
+                .get("jwks_loader")
+                .filter(|loader| !loader.is_none(py))
+                .map(|loader| loader.clone_ref(py));
+            let jwks_refresh = dict
+                .get("jwks_refresh")
+                .and_then(|r| r.extract::<u64>(py).ok())
+                .unwrap_or(300);
+
+            // Revocation: the store's id (its set is shared by all backends using it)
+            // and `store.revoked_tokens`, which syncs the set in the background
+            let require_jti = dict
+                .get("require_jti")
+                .and_then(|r| r.extract::<bool>(py).ok())
+                .unwrap_or(false);
+            let revocation = dict
+                .get("revocation_store_id")
+                .and_then(|r| r.extract::<usize>(py).ok());
+            let revocation_sync = dict
+                .get("revocation_sync")
+                .filter(|sync| !sync.is_none(py))
+                .map(|sync| sync.clone_ref(py));
+            let revocation_sync_interval = dict
+                .get("revocation_sync_interval")
+                .and_then(|r| r.extract::<u64>(py).ok())
+                .unwrap_or(5);
+
+            // Key and validation are built once and shared by routes with the same settings
+            let verifier = JwtVerifier::shared(
+                JwtSettings {
+                    secret,
+                    algorithms,
+                    audience,
+                    issuer,
+                    cache_size,
+                    cache_ttl,
+                    jwks: jwks_loader.as_ref().map(|loader| loader.as_ptr() as usize),
+                    jwks_refresh,
+                    require_jti,
+                    revocation,
+                    revocation_sync: revocation_sync_interval,
+                },
+                jwks_loader,
+                revocation_sync,
+            );
+
+            Some(AuthBackend::JWT { header, verifier })
         }
         "api_key" => {
             let api_keys_list = dict
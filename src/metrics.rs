@@ -0,0 +1,772 @@
+//! Prometheus metrics rendered natively in Rust.
+//!
+//! When enabled (`BOLT_METRICS`), every HTTP request updates lock-free atomics:
+//! per-route request counts and latency histograms (by status), in-flight requests
+//! and rate-limit rejections. WebSocket connections, sync streaming threads and the
+//! Python executor queue are read from their existing counters at scrape time.
+//!
+//! The endpoint (`BOLT_METRICS_PATH`, default `/metrics`) is an Actix route that
+//! renders the text exposition format without touching the GIL. Python code can
+//! register its own counters and gauges (`django_bolt.metrics`); updating them is a
+//! single atomic operation.
+//!
+//! Under `runbolt --processes N` request metrics are recorded into a shared memory
+//! region instead (see `shared_metrics`), so every worker serves the merged view.
+
+use actix_web::{web, HttpResponse};
+use dashmap::DashMap;
+use once_cell::sync::Lazy;
+use parking_lot::RwLock;
+use pyo3::prelude::*;
+use std::collections::BTreeMap;
+use std::fmt::Write;
+use std::sync::atomic::{AtomicI64, AtomicU64, Ordering};
+use std::sync::Arc;
+
+use crate::shared_metrics::{self, SegmentVisitor};
+use crate::state::ACTIVE_SYNC_STREAMING_THREADS;
+use crate::timing::{Histogram, BUCKETS_MS, BUCKET_COUNT};
+use crate::websocket::ACTIVE_WS_CONNECTIONS;
+
+pub const DEFAULT_METRICS_PATH: &str = "/metrics";
+
+const CONTENT_TYPE: &str = "text/plain; version=0.0.4; charset=utf-8";
+
+/// Metrics settings read once at startup
+#[derive(Clone, Debug, Default)]
+pub struct MetricsConfig {
+    /// Record request metrics and serve the metrics endpoint
+    pub enabled: bool,
+    /// Path of the metrics endpoint
+    pub path: String,
+}
+
+impl MetricsConfig {
+    /// Read BOLT_METRICS / BOLT_METRICS_PATH from Django settings
+    pub fn from_django_settings(py: Python<'_>) -> Self {
+        let settings = py
+            .import("django.conf")
+            .and_then(|django_conf| django_conf.getattr("settings"))
+            .ok();
+        let setting = |name: &str| settings.as_ref().and_then(|s| s.getattr(name).ok());
+        let enabled = setting("BOLT_METRICS")
+            .and_then(|value| value.is_truthy().ok())
+            .unwrap_or(false);
+        let path = setting("BOLT_METRICS_PATH")
+            .and_then(|value| value.extract::<String>().ok())
+            .unwrap_or_else(|| DEFAULT_METRICS_PATH.to_string());
+        MetricsConfig { enabled, path }
+    }
+}
+
+/// handler_id -> (method, path template), filled when routes are registered
+static ROUTE_LABELS: Lazy<DashMap<usize, (String, String)>> = Lazy::new(DashMap::new);
+
+/// (handler_id, status) -> latency histogram (its count is the request count)
+static REQUESTS: Lazy<DashMap<(usize, u16), Arc<Histogram>>> = Lazy::new(DashMap::new);
+
+/// handler_id -> requests rejected by the rate limiter
+static RATE_LIMITED: Lazy<DashMap<usize, Arc<AtomicU64>>> = Lazy::new(DashMap::new);
+
+static IN_FLIGHT: AtomicI64 = AtomicI64::new(0);
+static UNMATCHED: AtomicU64 = AtomicU64::new(0);
+static WS_REJECTED: AtomicU64 = AtomicU64::new(0);
+
+/// Sync handler executor: calls submitted and calls running (updated by sync_to_thread)
+static EXECUTOR_PENDING: Lazy<Arc<AtomicU64>> = Lazy::new(|| Arc::new(AtomicU64::new(0)));
+static EXECUTOR_RUNNING: Lazy<Arc<AtomicU64>> = Lazy::new(|| Arc::new(AtomicU64::new(0)));
+
+/// Remember the route template of a handler (called when routes are registered)
+pub fn register_route_label(handler_id: usize, method: &str, path: &str) {
+    ROUTE_LABELS.insert(handler_id, (method.to_string(), path.to_string()));
+}
+
+/// Counts a request as in flight until dropped
+pub struct InFlightGuard;
+
+impl InFlightGuard {
+    pub fn enter() -> Self {
+        IN_FLIGHT.fetch_add(1, Ordering::Relaxed);
+        InFlightGuard
+    }
+}
+
+impl Drop for InFlightGuard {
+    fn drop(&mut self) {
+        IN_FLIGHT.fetch_sub(1, Ordering::Relaxed);
+    }
+}
+
+/// Record a finished request
+#[inline]
+pub fn observe_request(handler_id: Option<usize>, status: u16, secs: f64) {
+    let shared = shared_metrics::attached();
+    let Some(handler_id) = handler_id else {
+        match shared {
+            Some(region) => region.record_unmatched(),
+            None => {
+                UNMATCHED.fetch_add(1, Ordering::Relaxed);
+            }
+        }
+        return;
+    };
+    // Shared region first; process-local map when not attached or its table is full
+    if shared.is_some_and(|region| region.observe_request(handler_id, status, secs)) {
+        return;
+    }
+    let key = (handler_id, status);
+    let histogram = match REQUESTS.get(&key) {
+        Some(histogram) => histogram.clone(),
+        None => REQUESTS
+            .entry(key)
+            .or_insert_with(|| Arc::new(Histogram::new()))
+            .clone(),
+    };
+    histogram.observe(secs);
+}
+
+/// Record a request rejected by the rate limiter (always on: only touched on rejection)
+pub fn record_rate_limited(handler_id: usize) {
+    if shared_metrics::attached().is_some_and(|region| region.record_rate_limited(handler_id)) {
+        return;
+    }
+    RATE_LIMITED
+        .entry(handler_id)
+        .or_insert_with(|| Arc::new(AtomicU64::new(0)))
+        .fetch_add(1, Ordering::Relaxed);
+}
+
+/// Record a WebSocket upgrade rejected by BOLT_WS_MAX_CONNECTIONS
+pub fn record_ws_rejected() {
+    match shared_metrics::attached() {
+        Some(region) => region.record_ws_rejected(),
+        None => {
+            WS_REJECTED.fetch_add(1, Ordering::Relaxed);
+        }
+    }
+}
+
+// ---------------------------------------------------------------------------
+// Python-registered metrics
+// ---------------------------------------------------------------------------
+
+#[derive(Clone, Copy, PartialEq, Eq)]
+enum MetricKind {
+    Counter,
+    Gauge,
+}
+
+impl MetricKind {
+    fn as_str(self) -> &'static str {
+        match self {
+            MetricKind::Counter => "counter",
+            MetricKind::Gauge => "gauge",
+        }
+    }
+}
+
+struct CustomFamily {
+    kind: MetricKind,
+    help: String,
+    /// Rendered label set ("" or `{a="b"}`) -> value (u64 for counters, f64 bits for gauges)
+    series: BTreeMap<String, Arc<AtomicU64>>,
+}
+
+/// name -> family (only locked on registration and scrape, never on update)
+static CUSTOM_METRICS: Lazy<RwLock<BTreeMap<String, CustomFamily>>> =
+    Lazy::new(|| RwLock::new(BTreeMap::new()));
+
+/// Monotonic counter registered from Python
+#[pyclass(frozen, module = "django_bolt._core")]
+pub struct Counter {
+    value: Arc<AtomicU64>,
+}
+
+#[pymethods]
+impl Counter {
+    #[pyo3(signature = (amount=1))]
+    fn inc(&self, amount: u64) {
+        self.value.fetch_add(amount, Ordering::Relaxed);
+    }
+
+    #[getter]
+    fn value(&self) -> u64 {
+        self.value.load(Ordering::Relaxed)
+    }
+}
+
+/// Gauge registered from Python (f64 stored as bits)
+#[pyclass(frozen, module = "django_bolt._core")]
+pub struct Gauge {
+    value: Arc<AtomicU64>,
+}
+
+impl Gauge {
+    fn add(&self, delta: f64) {
+        let _ = self
+            .value
+            .fetch_update(Ordering::Relaxed, Ordering::Relaxed, |bits| {
+                Some((f64::from_bits(bits) + delta).to_bits())
+            });
+    }
+}
+
+#[pymethods]
+impl Gauge {
+    fn set(&self, value: f64) {
+        self.value.store(value.to_bits(), Ordering::Relaxed);
+    }
+
+    #[pyo3(signature = (amount=1.0))]
+    fn inc(&self, amount: f64) {
+        self.add(amount);
+    }
+
+    #[pyo3(signature = (amount=1.0))]
+    fn dec(&self, amount: f64) {
+        self.add(-amount);
+    }
+
+    #[getter]
+    fn value(&self) -> f64 {
+        f64::from_bits(self.value.load(Ordering::Relaxed))
+    }
+}
+
+/// Integer gauge over one of the built-in executor counters
+#[pyclass(frozen, module = "django_bolt._core")]
+pub struct ExecutorGauge {
+    value: Arc<AtomicU64>,
+}
+
+#[pymethods]
+impl ExecutorGauge {
+    fn inc(&self) {
+        self.value.fetch_add(1, Ordering::Relaxed);
+    }
+
+    fn dec(&self) {
+        self.value.fetch_sub(1, Ordering::Relaxed);
+    }
+}
+
+fn is_valid_name(name: &str) -> bool {
+    let mut chars = name.chars();
+    matches!(chars.next(), Some(c) if c.is_ascii_alphabetic() || c == '_' || c == ':')
+        && chars.all(|c| c.is_ascii_alphanumeric() || c == '_' || c == ':')
+}
+
+fn register_series(
+    name: &str,
+    help: &str,
+    labels: Option<BTreeMap<String, String>>,
+    kind: MetricKind,
+) -> PyResult<Arc<AtomicU64>> {
+    if !is_valid_name(name) {
+        return Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "Invalid metric name: {:?}",
+            name
+        )));
+    }
+    let mut label_set = String::new();
+    if let Some(labels) = labels.filter(|labels| !labels.is_empty()) {
+        for (i, (key, value)) in labels.iter().enumerate() {
+            if !is_valid_name(key) || key.contains(':') {
+                return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                    "Invalid label name: {:?}",
+                    key
+                )));
+            }
+            label_set.push(if i == 0 { '{' } else { ',' });
+            write_label(&mut label_set, key, value);
+        }
+        label_set.push('}');
+    }
+
+    let mut families = CUSTOM_METRICS.write();
+    let family = families
+        .entry(name.to_string())
+        .or_insert_with(|| CustomFamily {
+            kind,
+            help: help.to_string(),
+            series: BTreeMap::new(),
+        });
+    if family.kind != kind {
+        return Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "Metric {:?} is already registered as a {}",
+            name,
+            family.kind.as_str()
+        )));
+    }
+    Ok(family
+        .series
+        .entry(label_set)
+        .or_insert_with(|| Arc::new(AtomicU64::new(0)))
+        .clone())
+}
+
+/// Register (or return the existing) counter `name` with the given labels
+#[pyfunction]
+#[pyo3(signature = (name, help="", labels=None))]
+pub fn register_counter(
+    name: &str,
+    help: &str,
+    labels: Option<BTreeMap<String, String>>,
+) -> PyResult<Counter> {
+    let value = register_series(name, help, labels, MetricKind::Counter)?;
+    Ok(Counter { value })
+}
+
+/// Register (or return the existing) gauge `name` with the given labels
+#[pyfunction]
+#[pyo3(signature = (name, help="", labels=None))]
+pub fn register_gauge(
+    name: &str,
+    help: &str,
+    labels: Option<BTreeMap<String, String>>,
+) -> PyResult<Gauge> {
+    let value = register_series(name, help, labels, MetricKind::Gauge)?;
+    Ok(Gauge { value })
+}
+
+/// Return the (pending, running) gauges updated by sync_to_thread
+#[pyfunction]
+pub fn executor_gauges() -> (ExecutorGauge, ExecutorGauge) {
+    (
+        ExecutorGauge {
+            value: EXECUTOR_PENDING.clone(),
+        },
+        ExecutorGauge {
+            value: EXECUTOR_RUNNING.clone(),
+        },
+    )
+}
+
+// ---------------------------------------------------------------------------
+// Rendering
+// ---------------------------------------------------------------------------
+
+fn write_label(out: &mut String, key: &str, value: &str) {
+    out.push_str(key);
+    out.push_str("=\"");
+    for c in value.chars() {
+        match c {
+            '\\' => out.push_str("\\\\"),
+            '"' => out.push_str("\\\""),
+            '\n' => out.push_str("\\n"),
+            _ => out.push(c),
+        }
+    }
+    out.push('"');
+}
+
+fn write_header(out: &mut String, name: &str, kind: &str, help: &str) {
+    let _ = writeln!(out, "# HELP {} {}", name, help.replace('\n', " "));
+    let _ = writeln!(out, "# TYPE {} {}", name, kind);
+}
+
+fn route_labels(handler_id: usize) -> String {
+    let mut labels = String::new();
+    match ROUTE_LABELS.get(&handler_id) {
+        Some(entry) => {
+            let (method, path) = entry.value();
+            write_label(&mut labels, "method", method);
+            labels.push(',');
+            write_label(&mut labels, "route", path);
+        }
+        None => write_label(&mut labels, "handler_id", &handler_id.to_string()),
+    }
+    labels
+}
+
+/// Non-cumulative histogram counts, summed over processes
+#[derive(Default)]
+struct HistogramSnapshot {
+    count: u64,
+    sum_ns: u64,
+    buckets: [u64; BUCKET_COUNT],
+}
+
+impl HistogramSnapshot {
+    fn add(&mut self, count: u64, sum_ns: u64, buckets: &[u64]) {
+        self.count += count;
+        self.sum_ns += sum_ns;
+        for (total, value) in self.buckets.iter_mut().zip(buckets) {
+            *total += value;
+        }
+    }
+}
+
+/// Values to render, merged from this process and (if attached) the shared region
+#[derive(Default)]
+struct Snapshot {
+    requests: BTreeMap<(usize, u16), HistogramSnapshot>,
+    rate_limited: BTreeMap<usize, u64>,
+    unmatched: u64,
+    ws_rejected: u64,
+    in_flight: i64,
+    ws_connections: u64,
+    sync_threads: u64,
+    executor_pending: u64,
+    executor_running: u64,
+    /// Live workers sharing the region (None when not shared)
+    processes: Option<u64>,
+}
+
+impl Snapshot {
+    /// This process's own metrics
+    fn local() -> Self {
+        let mut snapshot = Snapshot::default();
+        // Snapshot the Arcs first so no DashMap shard lock is held while reading
+        let requests: Vec<((usize, u16), Arc<Histogram>)> = REQUESTS
+            .iter()
+            .map(|entry| (*entry.key(), entry.value().clone()))
+            .collect();
+        for (key, histogram) in requests {
+            let buckets: Vec<u64> = histogram
+                .buckets
+                .iter()
+                .map(|bucket| bucket.load(Ordering::Relaxed))
+                .collect();
+            snapshot.requests.entry(key).or_default().add(
+                histogram.count.load(Ordering::Relaxed),
+                histogram.sum_ns.load(Ordering::Relaxed),
+                &buckets,
+            );
+        }
+        for entry in RATE_LIMITED.iter() {
+            *snapshot.rate_limited.entry(*entry.key()).or_default() +=
+                entry.value().load(Ordering::Relaxed);
+        }
+        snapshot.unmatched = UNMATCHED.load(Ordering::Relaxed);
+        snapshot.ws_rejected = WS_REJECTED.load(Ordering::Relaxed);
+        snapshot.in_flight = IN_FLIGHT.load(Ordering::Relaxed);
+        snapshot.ws_connections = ACTIVE_WS_CONNECTIONS.load(Ordering::Relaxed) as u64;
+        snapshot.sync_threads = ACTIVE_SYNC_STREAMING_THREADS.load(Ordering::Relaxed);
+        snapshot.executor_pending = EXECUTOR_PENDING.load(Ordering::Relaxed);
+        snapshot.executor_running = EXECUTOR_RUNNING.load(Ordering::Relaxed);
+        snapshot
+    }
+
+    /// This process's metrics merged with every worker sharing its region
+    fn merged() -> Self {
+        let mut snapshot = Snapshot::local();
+        if let Some(region) = shared_metrics::attached() {
+            snapshot.processes = Some(0);
+            region.visit(&mut snapshot);
+        }
+        snapshot
+    }
+}
+
+impl SegmentVisitor for Snapshot {
+    fn request(
+        &mut self,
+        handler_id: usize,
+        status: u16,
+        count: u64,
+        sum_ns: u64,
+        buckets: &[u64],
+    ) {
+        self.requests
+            .entry((handler_id, status))
+            .or_default()
+            .add(count, sum_ns, buckets);
+    }
+
+    fn rate_limited(&mut self, handler_id: usize, count: u64) {
+        *self.rate_limited.entry(handler_id).or_default() += count;
+    }
+
+    fn counter(&mut self, field: usize, value: u64) {
+        match field {
+            shared_metrics::UNMATCHED => self.unmatched += value,
+            shared_metrics::WS_REJECTED => self.ws_rejected += value,
+            _ => {}
+        }
+    }
+
+    fn gauge(&mut self, field: usize, value: u64) {
+        match field {
+            shared_metrics::IN_FLIGHT => self.in_flight += value as i64,
+            shared_metrics::WS_CONNECTIONS => self.ws_connections += value,
+            shared_metrics::SYNC_THREADS => self.sync_threads += value,
+            shared_metrics::EXECUTOR_PENDING => self.executor_pending += value,
+            shared_metrics::EXECUTOR_RUNNING => self.executor_running += value,
+            _ => {}
+        }
+    }
+
+    fn live_worker(&mut self) {
+        *self.processes.get_or_insert(0) += 1;
+    }
+}
+
+/// This process's gauges as (shared segment field, value), published to the shared region
+pub fn local_gauges() -> [(usize, u64); 5] {
+    [
+        (
+            shared_metrics::IN_FLIGHT,
+            IN_FLIGHT.load(Ordering::Relaxed).max(0) as u64,
+        ),
+        (
+            shared_metrics::WS_CONNECTIONS,
+            ACTIVE_WS_CONNECTIONS.load(Ordering::Relaxed) as u64,
+        ),
+        (
+            shared_metrics::SYNC_THREADS,
+            ACTIVE_SYNC_STREAMING_THREADS.load(Ordering::Relaxed),
+        ),
+        (
+            shared_metrics::EXECUTOR_PENDING,
+            EXECUTOR_PENDING.load(Ordering::Relaxed),
+        ),
+        (
+            shared_metrics::EXECUTOR_RUNNING,
+            EXECUTOR_RUNNING.load(Ordering::Relaxed),
+        ),
+    ]
+}
+
+fn write_sample(out: &mut String, name: &str, value: impl std::fmt::Display) {
+    let _ = writeln!(out, "{} {}", name, value);
+}
+
+/// Render a snapshot (plus this process's custom metrics) in the Prometheus text format
+fn render_snapshot(snapshot: &Snapshot) -> String {
+    let mut out = String::with_capacity(8192);
+
+    let requests: Vec<(String, &HistogramSnapshot)> = snapshot
+        .requests
+        .iter()
+        .map(|((handler_id, status), histogram)| {
+            (
+                format!("{},status=\"{}\"", route_labels(*handler_id), status),
+                histogram,
+            )
+        })
+        .collect();
+
+    write_header(
+        &mut out,
+        "bolt_requests_total",
+        "counter",
+        "HTTP requests handled, by route and status.",
+    );
+    for (labels, histogram) in &requests {
+        let _ = writeln!(out, "bolt_requests_total{{{}}} {}", labels, histogram.count);
+    }
+
+    write_header(
+        &mut out,
+        "bolt_request_duration_seconds",
+        "histogram",
+        "HTTP request latency, by route and status.",
+    );
+    for (labels, histogram) in &requests {
+        let mut cumulative = 0u64;
+        for (i, bucket) in histogram.buckets.iter().enumerate() {
+            cumulative += bucket;
+            match BUCKETS_MS.get(i) {
+                Some(bound_ms) => {
+                    let _ = writeln!(
+                        out,
+                        "bolt_request_duration_seconds_bucket{{{},le=\"{}\"}} {}",
+                        labels,
+                        bound_ms / 1000.0,
+                        cumulative
+                    );
+                }
+                None => {
+                    let _ = writeln!(
+                        out,
+                        "bolt_request_duration_seconds_bucket{{{},le=\"+Inf\"}} {}",
+                        labels, cumulative
+                    );
+                }
+            }
+        }
+        let _ = writeln!(
+            out,
+            "bolt_request_duration_seconds_sum{{{}}} {}",
+            labels,
+            histogram.sum_ns as f64 / 1_000_000_000.0
+        );
+        let _ = writeln!(
+            out,
+            "bolt_request_duration_seconds_count{{{}}} {}",
+            labels, histogram.count
+        );
+    }
+
+    write_header(
+        &mut out,
+        "bolt_requests_unmatched_total",
+        "counter",
+        "HTTP requests that matched no route.",
+    );
+    write_sample(
+        &mut out,
+        "bolt_requests_unmatched_total",
+        snapshot.unmatched,
+    );
+
+    write_header(
+        &mut out,
+        "bolt_requests_in_flight",
+        "gauge",
+        "HTTP requests currently being handled.",
+    );
+    write_sample(&mut out, "bolt_requests_in_flight", snapshot.in_flight);
+
+    write_header(
+        &mut out,
+        "bolt_rate_limited_total",
+        "counter",
+        "Requests rejected by the rate limiter, by route.",
+    );
+    for (handler_id, count) in &snapshot.rate_limited {
+        let _ = writeln!(
+            out,
+            "bolt_rate_limited_total{{{}}} {}",
+            route_labels(*handler_id),
+            count
+        );
+    }
+
+    write_header(
+        &mut out,
+        "bolt_websocket_connections",
+        "gauge",
+        "Open WebSocket connections.",
+    );
+    write_sample(
+        &mut out,
+        "bolt_websocket_connections",
+        snapshot.ws_connections,
+    );
+    write_header(
+        &mut out,
+        "bolt_websocket_rejected_total",
+        "counter",
+        "WebSocket upgrades rejected by the connection limit.",
+    );
+    write_sample(
+        &mut out,
+        "bolt_websocket_rejected_total",
+        snapshot.ws_rejected,
+    );
+
+    write_header(
+        &mut out,
+        "bolt_sync_streaming_threads",
+        "gauge",
+        "OS threads serving sync streaming responses.",
+    );
+    write_sample(
+        &mut out,
+        "bolt_sync_streaming_threads",
+        snapshot.sync_threads,
+    );
+
+    write_header(
+        &mut out,
+        "bolt_executor_queue_depth",
+        "gauge",
+        "Sync handler calls waiting for a thread pool worker.",
+    );
+    write_sample(
+        &mut out,
+        "bolt_executor_queue_depth",
+        snapshot
+            .executor_pending
+            .saturating_sub(snapshot.executor_running),
+    );
+    write_header(
+        &mut out,
+        "bolt_executor_busy_threads",
+        "gauge",
+        "Thread pool workers running sync handler calls.",
+    );
+    write_sample(
+        &mut out,
+        "bolt_executor_busy_threads",
+        snapshot.executor_running,
+    );
+
+    if let Some(processes) = snapshot.processes {
+        write_header(
+            &mut out,
+            "bolt_processes",
+            "gauge",
+            "Live worker processes included in these metrics.",
+        );
+        write_sample(&mut out, "bolt_processes", processes);
+    }
+
+    let families = CUSTOM_METRICS.read();
+    for (name, family) in families.iter() {
+        write_header(&mut out, name, family.kind.as_str(), &family.help);
+        for (labels, value) in &family.series {
+            let bits = value.load(Ordering::Relaxed);
+            match family.kind {
+                MetricKind::Counter => {
+                    let _ = writeln!(out, "{}{} {}", name, labels, bits);
+                }
+                MetricKind::Gauge => {
+                    let _ = writeln!(out, "{}{} {}", name, labels, f64::from_bits(bits));
+                }
+            }
+        }
+    }
+
+    out
+}
+
+/// Render all metrics in the Prometheus text exposition format
+/// (merged across workers when the process is attached to a shared region)
+pub fn render() -> String {
+    render_snapshot(&Snapshot::merged())
+}
+
+/// Actix handler of the metrics endpoint (no GIL)
+pub async fn metrics_handler() -> HttpResponse {
+    HttpResponse::Ok().content_type(CONTENT_TYPE).body(render())
+}
+
+/// Register the metrics endpoint on an app (when enabled)
+pub fn configure_metrics_route(cfg: &mut web::ServiceConfig, config: &MetricsConfig) {
+    if config.enabled {
+        cfg.route(&config.path, web::get().to(metrics_handler));
+    }
+}
+
+/// Render the metrics text (same output as the endpoint)
+#[pyfunction]
+pub fn render_metrics(py: Python<'_>) -> String {
+    py.detach(render)
+}
+
+/// Render the merged metrics of a shared metrics file from any process (e.g. the
+/// runbolt master). Gauges only include workers with a recent heartbeat.
+#[pyfunction]
+pub fn render_shared_metrics(py: Python<'_>, path: &str) -> PyResult<String> {
+    py.detach(|| {
+        let mut snapshot = Snapshot {
+            processes: Some(0),
+            ..Snapshot::default()
+        };
+        shared_metrics::visit_file(path, &mut snapshot)?;
+        Ok(render_snapshot(&snapshot))
+    })
+}
+
+/// Drop this process's recorded request metrics (registered Python metrics and
+/// shared-region counters are kept)
+#[pyfunction]
+pub fn reset_metrics() {
+    REQUESTS.clear();
+    RATE_LIMITED.clear();
+    UNMATCHED.store(0, Ordering::Relaxed);
+    WS_REJECTED.store(0, Ordering::Relaxed);
+}
@@ -1,10 +1,17 @@
 use ahash::AHashMap;
-use jsonwebtoken::{decode, Algorithm, DecodingKey, Validation};
+use dashmap::DashMap;
+use jsonwebtoken::jwk::{JwkSet, PublicKeyUse};
+use jsonwebtoken::{decode, decode_header, Algorithm, DecodingKey, Header, Validation};
+use once_cell::sync::Lazy;
+use parking_lot::RwLock;
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
 use pyo3::IntoPyObjectExt;
 use serde::{Deserialize, Serialize};
 use std::collections::{HashMap, HashSet};
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{Arc, Weak};
+use std::time::{Duration, Instant, SystemTime, UNIX_EPOCH};
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct Claims {
@@ -80,11 +87,8 @@ impl AuthContext {
 #[derive(Debug, Clone)]
 pub enum AuthBackend {
     JWT {
-        secret: String,
-        algorithms: Vec<String>,
         header: String,
-        audience: Option<String>,
-        issuer: Option<String>,
+        verifier: Arc<JwtVerifier>,
     },
     APIKey {
         api_keys: HashSet<String>,
@@ -101,21 +105,8 @@ pub fn authenticate(
 ) -> Option<AuthContext> {
     for backend in backends {
         match backend {
-            AuthBackend::JWT {
-                secret,
-                algorithms,
-                header,
-                audience,
-                issuer,
-            } => {
-                if let Some(ctx) = try_jwt_auth(
-                    headers,
-                    secret,
-                    algorithms,
-                    header,
-                    audience.as_deref(),
-                    issuer.as_deref(),
-                ) {
+            AuthBackend::JWT { header, verifier } => {
+                if let Some(ctx) = try_jwt_auth(headers, header, verifier) {
                     return Some(ctx);
                 }
             }
@@ -135,11 +126,8 @@ pub fn authenticate(
 
 fn try_jwt_auth(
     headers: &AHashMap<String, String>,
-    secret: &str,
-    algorithms: &[String],
     header_name: &str,
-    audience: Option<&str>,
-    issuer: Option<&str>,
+    verifier: &JwtVerifier,
 ) -> Option<AuthContext> {
     // Get auth header
     let auth_header = headers.get(header_name)?;
@@ -151,37 +139,430 @@ fn try_jwt_auth(
         auth_header
     };
 
-    // Use FIRST algorithm only (as specified in config) - don't try multiple algorithms
-    // This is more efficient and follows the principle: one token, one algorithm
-    let algorithm = match algorithms.first().map(|s| s.as_str()).unwrap_or("HS256") {
-        "HS256" => Algorithm::HS256,
-        "HS384" => Algorithm::HS384,
-        "HS512" => Algorithm::HS512,
-        "RS256" => Algorithm::RS256,
-        "RS384" => Algorithm::RS384,
-        "RS512" => Algorithm::RS512,
-        "ES256" => Algorithm::ES256,
-        "ES384" => Algorithm::ES384,
-        _ => Algorithm::HS256, // Default fallback
+    verifier.verify(token)
+}
+
+/// Settings that identify a JWT backend (backends with equal settings share a verifier)
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+pub struct JwtSettings {
+    pub secret: String,
+    pub algorithms: Vec<String>,
+    pub audience: Option<String>,
+    pub issuer: Option<String>,
+    /// Maximum number of verified tokens kept (0 disables the cache)
+    pub cache_size: usize,
+    /// Seconds a verified token is trusted without checking its signature again
+    pub cache_ttl: u64,
+    /// Identity of the JWKS loader (keys come from a JWK set instead of `secret`)
+    pub jwks: Option<usize>,
+    /// Seconds between JWKS reloads (0 = load once)
+    pub jwks_refresh: u64,
+    /// Reject tokens without a `jti` claim
+    pub require_jti: bool,
+    /// Identity of the revocation store checked for every token's `jti`
+    pub revocation: Option<usize>,
+    /// Seconds between syncs of the revocation set with its store
+    pub revocation_sync: u64,
+}
+
+/// One verifier per distinct backend settings, shared by all routes using them
+static VERIFIERS: Lazy<DashMap<JwtSettings, Arc<JwtVerifier>>> = Lazy::new(DashMap::new);
+
+fn parse_algorithm(name: &str) -> Option<Algorithm> {
+    match name {
+        "HS256" => Some(Algorithm::HS256),
+        "HS384" => Some(Algorithm::HS384),
+        "HS512" => Some(Algorithm::HS512),
+        "RS256" => Some(Algorithm::RS256),
+        "RS384" => Some(Algorithm::RS384),
+        "RS512" => Some(Algorithm::RS512),
+        "PS256" => Some(Algorithm::PS256),
+        "PS384" => Some(Algorithm::PS384),
+        "PS512" => Some(Algorithm::PS512),
+        "ES256" => Some(Algorithm::ES256),
+        "ES384" => Some(Algorithm::ES384),
+        "EdDSA" => Some(Algorithm::EdDSA),
+        _ => None,
+    }
+}
+
+/// Keys a verifier checks signatures with. Never mutated: JWKS rotation swaps in a
+/// new set, so requests see either the old keys or the new ones.
+#[derive(Default)]
+struct KeySet {
+    /// Key built from `secret` (backends without JWKS)
+    secret: Option<DecodingKey>,
+    /// JWKS keys by `kid` (keys without `kid` under ""), with the JWK's pinned `alg`
+    by_kid: AHashMap<String, (DecodingKey, Option<Algorithm>)>,
+}
+
+impl KeySet {
+    /// Parse every signing key of a JWK set (keys that cannot verify are skipped)
+    fn from_jwks(json: &str) -> Result<KeySet, String> {
+        let set: JwkSet = serde_json::from_str(json).map_err(|e| e.to_string())?;
+        let mut by_kid = AHashMap::new();
+        for jwk in &set.keys {
+            // Encryption keys cannot verify signatures
+            if matches!(jwk.common.public_key_use, Some(PublicKeyUse::Encryption)) {
+                continue;
+            }
+            let algorithm = match &jwk.common.key_algorithm {
+                Some(key_algorithm) => {
+                    let name = serde_json::to_value(key_algorithm).ok();
+                    match name
+                        .as_ref()
+                        .and_then(|n| n.as_str())
+                        .and_then(parse_algorithm)
+                    {
+                        Some(algorithm) => Some(algorithm),
+                        None => continue,
+                    }
+                }
+                None => None,
+            };
+            let Ok(key) = DecodingKey::from_jwk(jwk) else {
+                continue;
+            };
+            let kid = jwk.common.key_id.clone().unwrap_or_default();
+            by_kid.insert(kid, (key, algorithm));
+        }
+        if by_kid.is_empty() {
+            return Err("no usable signing keys".to_string());
+        }
+        Ok(KeySet {
+            secret: None,
+            by_kid,
+        })
+    }
+
+    /// Key for a token header; a JWK's `alg` must match the token's
+    fn key_for(&self, header: &Header) -> Option<&DecodingKey> {
+        let kid = header.kid.as_deref().unwrap_or("");
+        let (key, algorithm) = self.by_kid.get(kid).or_else(|| {
+            // A set with a single key also verifies tokens without `kid`
+            if header.kid.is_none() && self.by_kid.len() == 1 {
+                self.by_kid.values().next()
+            } else {
+                None
+            }
+        })?;
+        match algorithm {
+            Some(algorithm) if *algorithm != header.alg => None,
+            _ => Some(key),
+        }
+    }
+}
+
+/// JWT verification state built once per backend at startup: the decoding keys, the
+/// validation rules and a cache of verified tokens.
+pub struct JwtVerifier {
+    keys: RwLock<Arc<KeySet>>,
+    /// Keys come from a JWK set, picked by the token's `kid`
+    jwks: bool,
+    validation: Validation,
+    cache: Option<TokenCache>,
+    require_jti: bool,
+    /// Revoked JTIs, checked on every request (including cached tokens)
+    revocation: Option<Arc<crate::revocation::RevocationSet>>,
+}
+
+impl std::fmt::Debug for JwtVerifier {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.debug_struct("JwtVerifier")
+            .field("algorithms", &self.validation.algorithms)
+            .field("jwks", &self.jwks)
+            .field("cached", &self.cache.as_ref().map(|c| c.entries.len()))
+            .field("require_jti", &self.require_jti)
+            .field("revocation", &self.revocation.is_some())
+            .finish()
+    }
+}
+
+impl JwtVerifier {
+    /// Get the shared verifier for `settings`, building it on first use.
+    ///
+    /// With a JWKS `loader` (a callable returning the JWK set as JSON), the keys are
+    /// loaded now and reloaded every `settings.jwks_refresh` seconds in the background.
+    /// With a revocation store, `revocation_sync` (`store.revoked_tokens`) fills the
+    /// store's revocation set the same way.
+    pub fn shared(
+        settings: JwtSettings,
+        loader: Option<Py<PyAny>>,
+        revocation_sync: Option<Py<PyAny>>,
+    ) -> Arc<JwtVerifier> {
+        if let Some(verifier) = VERIFIERS.get(&settings) {
+            return verifier.clone();
+        }
+        let mut verifier = JwtVerifier::new(&settings);
+        verifier.revocation = settings.revocation.map(|store_id| {
+            crate::revocation::shared(
+                store_id,
+                revocation_sync,
+                Duration::from_secs(settings.revocation_sync),
+            )
+        });
+        let verifier = Arc::new(verifier);
+        if let Some(loader) = loader {
+            verifier.load_jwks(&loader);
+            if settings.jwks_refresh > 0 {
+                spawn_jwks_refresh(
+                    Arc::downgrade(&verifier),
+                    loader,
+                    Duration::from_secs(settings.jwks_refresh),
+                );
+            }
+        }
+        VERIFIERS.entry(settings).or_insert(verifier).clone()
+    }
+
+    fn new(settings: &JwtSettings) -> Self {
+        let jwks = settings.jwks.is_some();
+
+        // Use FIRST algorithm only (as specified in config) - don't try multiple algorithms
+        // This is more efficient and follows the principle: one token, one algorithm.
+        // JWK sets may mix algorithms: every configured one is allowed (and pinned per key).
+        let algorithm = settings
+            .algorithms
+            .first()
+            .and_then(|name| parse_algorithm(name))
+            .unwrap_or(Algorithm::HS256); // Default fallback
+
+        // Create validation with the specified algorithm
+        let mut validation = Validation::new(algorithm);
+        validation.validate_exp = true;
+        validation.validate_nbf = true;
+        if jwks {
+            validation.algorithms = settings
+                .algorithms
+                .iter()
+                .filter_map(|name| parse_algorithm(name))
+                .collect();
+        }
+
+        if let Some(aud) = &settings.audience {
+            validation.set_audience(&[aud]);
+        }
+        if let Some(iss) = &settings.issuer {
+            validation.set_issuer(&[iss]);
+        }
+
+        let keys = if jwks {
+            // Filled by the first JWKS load
+            KeySet::default()
+        } else {
+            KeySet {
+                secret: secret_key(&settings.secret, algorithm),
+                by_kid: AHashMap::new(),
+            }
+        };
+
+        let cache = (settings.cache_size > 0 && settings.cache_ttl > 0).then(|| TokenCache {
+            entries: DashMap::new(),
+            hasher: ahash::RandomState::new(),
+            max_entries: settings.cache_size,
+            ttl: Duration::from_secs(settings.cache_ttl),
+            last_purge_secs: AtomicU64::new(0),
+        });
+
+        JwtVerifier {
+            keys: RwLock::new(Arc::new(keys)),
+            jwks,
+            validation,
+            cache,
+            require_jti: settings.require_jti,
+            revocation: None,
+        }
+    }
+
+    /// Load the JWK set from `loader` and swap it in; the current keys stay on failure
+    fn load_jwks(&self, loader: &Py<PyAny>) -> bool {
+        let json = Python::attach(|py| {
+            loader
+                .call0(py)
+                .and_then(|json| json.extract::<String>(py))
+                .map_err(|e| e.to_string())
+        });
+        match json.and_then(|json| KeySet::from_jwks(&json)) {
+            Ok(keys) => {
+                *self.keys.write() = Arc::new(keys);
+                true
+            }
+            Err(e) => {
+                eprintln!(
+                    "[django-bolt] Warning: Failed to load JWKS ({}); keeping the current keys",
+                    e
+                );
+                false
+            }
+        }
+    }
+
+    /// Verify `token`, skipping the signature check for recently verified tokens
+    pub fn verify(&self, token: &str) -> Option<AuthContext> {
+        if let Some(ctx) = self.cache.as_ref().and_then(|cache| cache.get(token)) {
+            // Revocation is checked on every use: a token may be revoked after caching
+            return (!self.is_rejected(&ctx)).then_some(ctx);
+        }
+
+        let keys = self.keys.read().clone();
+        let key = if self.jwks {
+            keys.key_for(&decode_header(token).ok()?)?
+        } else {
+            keys.secret.as_ref()?
+        };
+        let claims = decode::<Claims>(token, key, &self.validation).ok()?.claims;
+        let ctx = AuthContext::from_jwt_claims(claims, "jwt");
+        if self.is_rejected(&ctx) {
+            return None;
+        }
+        if let Some(cache) = &self.cache {
+            cache.insert(token, &ctx);
+        }
+        Some(ctx)
+    }
+
+    /// True when the token has no `jti` but one is required, or it is revoked (by
+    /// `jti`, or by a watermark for its user)
+    fn is_rejected(&self, ctx: &AuthContext) -> bool {
+        if !self.require_jti && self.revocation.is_none() {
+            return false;
+        }
+        let claims = ctx.claims.as_ref();
+        let jti = claims.and_then(|claims| claims.jti.as_deref());
+        if jti.is_none() && self.require_jti {
+            return true;
+        }
+        let Some(revocation) = &self.revocation else {
+            return false;
+        };
+        jti.is_some_and(|jti| revocation.is_revoked(jti))
+            || ctx.user_id.as_deref().is_some_and(|user| {
+                revocation.is_user_revoked(user, claims.and_then(|claims| claims.iat))
+            })
+    }
+}
+
+/// Decoding key for `secret`: a PEM public key for asymmetric algorithms, the raw
+/// secret for HMAC. None (every token rejected) when the key cannot be parsed.
+fn secret_key(secret: &str, algorithm: Algorithm) -> Option<DecodingKey> {
+    let secret = secret.as_bytes();
+    let key = match algorithm {
+        Algorithm::RS256
+        | Algorithm::RS384
+        | Algorithm::RS512
+        | Algorithm::PS256
+        | Algorithm::PS384
+        | Algorithm::PS512 => DecodingKey::from_rsa_pem(secret),
+        Algorithm::ES256 | Algorithm::ES384 => DecodingKey::from_ec_pem(secret),
+        Algorithm::EdDSA => DecodingKey::from_ed_pem(secret),
+        _ => Ok(DecodingKey::from_secret(secret)),
     };
+    match key {
+        Ok(key) => Some(key),
+        Err(e) => {
+            eprintln!(
+                "[django-bolt] Warning: Invalid {:?} key for JWT authentication ({}); all tokens will be rejected",
+                algorithm, e
+            );
+            None
+        }
+    }
+}
 
-    // Create validation with the specified algorithm
-    let mut validation = Validation::new(algorithm);
-    validation.validate_exp = true;
-    validation.validate_nbf = true;
+/// Reload a verifier's JWK set every `interval` (until the verifier is dropped)
+fn spawn_jwks_refresh(verifier: Weak<JwtVerifier>, loader: Py<PyAny>, interval: Duration) {
+    let spawned = std::thread::Builder::new()
+        .name("bolt-jwks-refresh".into())
+        .spawn(move || loop {
+            std::thread::sleep(interval);
+            let Some(verifier) = verifier.upgrade() else {
+                break;
+            };
+            verifier.load_jwks(&loader);
+        });
+    if let Err(e) = spawned {
+        eprintln!("[django-bolt] Warning: JWKS refresh disabled: {}", e);
+    }
+}
 
-    if let Some(aud) = audience {
-        validation.set_audience(&[aud]);
+/// Bounded cache of verified tokens, valid until min(exp, ttl)
+struct TokenCache {
+    /// Keyed by a per-process keyed hash of the token
+    entries: DashMap<u64, CachedToken>,
+    hasher: ahash::RandomState,
+    max_entries: usize,
+    ttl: Duration,
+    /// Seconds since EPOCH of the last purge of expired entries
+    last_purge_secs: AtomicU64,
+}
+
+struct CachedToken {
+    /// Full token: a hash collision must never authenticate another token
+    token: Box<str>,
+    ctx: AuthContext,
+    expires_at: Instant,
+}
+
+static EPOCH: Lazy<Instant> = Lazy::new(Instant::now);
+
+impl TokenCache {
+    fn get(&self, token: &str) -> Option<AuthContext> {
+        let hash = self.hasher.hash_one(token);
+        let entry = self.entries.get(&hash)?;
+        if &*entry.token != token {
+            return None;
+        }
+        if Instant::now() >= entry.expires_at {
+            drop(entry);
+            self.entries.remove(&hash);
+            return None;
+        }
+        Some(entry.ctx.clone())
     }
-    if let Some(iss) = issuer {
-        validation.set_issuer(&[iss]);
+
+    fn insert(&self, token: &str, ctx: &AuthContext) {
+        let now = Instant::now();
+        // Never past the token's own expiry
+        let mut ttl = self.ttl;
+        if let Some(exp) = ctx.claims.as_ref().and_then(|c| c.exp) {
+            let now_unix = SystemTime::now()
+                .duration_since(UNIX_EPOCH)
+                .map(|d| d.as_secs() as i64)
+                .unwrap_or(0);
+            ttl = ttl.min(Duration::from_secs((exp - now_unix).max(0) as u64));
+        }
+        if ttl.is_zero() {
+            return;
+        }
+
+        if self.entries.len() >= self.max_entries && !self.purge_expired(now) {
+            // Full of live tokens: verify this one on every request instead
+            return;
+        }
+        self.entries.insert(
+            self.hasher.hash_one(token),
+            CachedToken {
+                token: token.into(),
+                ctx: ctx.clone(),
+                expires_at: now + ttl,
+            },
+        );
     }
 
-    // Decode token with the specified algorithm
-    let key = DecodingKey::from_secret(secret.as_bytes());
-    match decode::<Claims>(token, &key, &validation) {
-        Ok(token_data) => Some(AuthContext::from_jwt_claims(token_data.claims, "jwt")),
-        Err(_) => None,
+    /// Drop expired entries, at most once per second; true when room was made
+    fn purge_expired(&self, now: Instant) -> bool {
+        let secs = now.duration_since(*EPOCH).as_secs() + 1;
+        let last = self.last_purge_secs.load(Ordering::Relaxed);
+        if last >= secs
+            || self
+                .last_purge_secs
+                .compare_exchange(last, secs, Ordering::AcqRel, Ordering::Relaxed)
+                .is_err()
+        {
+            return false;
+        }
+        self.entries.retain(|_, entry| entry.expires_at > now);
+        self.entries.len() < self.max_entries
     }
 }
 
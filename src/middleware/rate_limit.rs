@@ -4,20 +4,26 @@ use dashmap::DashMap;
 use governor::clock::{Clock, DefaultClock};
 use governor::state::{InMemoryState, NotKeyed};
 use governor::{Quota, RateLimiter};
-use once_cell::sync::Lazy;
-use std::sync::atomic::{AtomicUsize, Ordering};
+use once_cell::sync::{Lazy, OnceCell};
+use parking_lot::Mutex;
+use std::num::NonZeroU32;
+use std::sync::atomic::{AtomicU64, AtomicUsize, Ordering};
 use std::sync::Arc;
+use std::time::{Duration, Instant};
 
+use crate::cluster_rate_limit;
 use crate::metadata::RateLimitConfig;
+use crate::metrics;
 use crate::response_builder;
 use crate::responses;
+use crate::shared_rate_limit;
 
 type Limiter = RateLimiter<NotKeyed, InMemoryState, DefaultClock>;
 
-// Store per-key limiters (IP-based)
-static IP_LIMITERS: Lazy<DashMap<(usize, String), Arc<Limiter>>> = Lazy::new(DashMap::new);
+// Store per-key limiters (keyed by handler id, or SCOPED_BUCKET for scoped limits)
+static IP_LIMITERS: Lazy<DashMap<(usize, String), Arc<KeyLimiter>>> = Lazy::new(DashMap::new);
 
-// Track total limiter count for cleanup
+// Track total limiter count (refreshed by the sweeper)
 static LIMITER_COUNT: AtomicUsize = AtomicUsize::new(0);
 
 // SECURITY: Maximum number of rate limiters to prevent memory exhaustion
@@ -26,10 +32,171 @@ const MAX_LIMITERS: usize = 100_000;
 // SECURITY: Maximum key length to prevent memory attacks
 const MAX_KEY_LENGTH: usize = 256;
 
+/// Key shared by all new clients of a route while the limiter table is full
+/// (cannot collide with a real key: header values never contain NUL)
+const OVERFLOW_KEY: &str = "\0overflow";
+
+/// Bucket id of scoped limits (shared by routes, so not a handler id)
+pub(crate) const SCOPED_BUCKET: usize = usize::MAX;
+
+/// How often the sweeper evicts idle limiters
+const SWEEP_INTERVAL: Duration = Duration::from_secs(10);
+
+/// Background thread evicting idle limiters (started with the first limiter)
+static SWEEPER: OnceCell<std::thread::Thread> = OnceCell::new();
+
+static EPOCH: Lazy<Instant> = Lazy::new(Instant::now);
+
+#[inline]
+fn now_ns() -> u64 {
+    EPOCH.elapsed().as_nanos() as u64
+}
+
+/// Rate limit state of one (bucket_id, key) pair in this process
+struct KeyLimiter {
+    bucket: Limiter,
+    window: Option<SlidingWindow>,
+    /// Last request, in nanoseconds since EPOCH
+    last_seen_ns: AtomicU64,
+    /// Idle time after which the state equals a fresh limiter (safe to evict)
+    idle_ns: u64,
+}
+
+impl KeyLimiter {
+    fn new(config: &RateLimitConfig, now: u64) -> Self {
+        let rps = config.rps.max(1);
+        let burst = config.burst.max(1);
+        let quota = Quota::per_second(NonZeroU32::new(rps).unwrap())
+            .allow_burst(NonZeroU32::new(burst).unwrap());
+        let window = (config.window_limit > 0 && config.window_secs > 0).then(|| SlidingWindow {
+            limit: config.window_limit as u64,
+            window_ns: config.window_secs * 1_000_000_000,
+            counts: Mutex::new(WindowCounts::default()),
+        });
+        // Full refill of the bucket, and two windows for the previous count to decay
+        let refill_ns = burst as u64 * 1_000_000_000 / rps as u64;
+        let window_ns = window.as_ref().map(|w| 2 * w.window_ns).unwrap_or(0);
+        KeyLimiter {
+            bucket: RateLimiter::direct(quota),
+            window,
+            last_seen_ns: AtomicU64::new(now),
+            idle_ns: refill_ns.max(window_ns).max(1_000_000_000),
+        }
+    }
+}
+
+/// Sliding-window counter: the previous fixed window counts for the part of it
+/// that still overlaps the sliding window ending now.
+struct SlidingWindow {
+    limit: u64,
+    window_ns: u64,
+    counts: Mutex<WindowCounts>,
+}
+
+#[derive(Default)]
+struct WindowCounts {
+    index: u64,
+    current: u64,
+    previous: u64,
+}
+
+impl WindowCounts {
+    /// Move to the fixed window containing `now`
+    fn roll(&mut self, now: u64, window_ns: u64) {
+        let index = now / window_ns;
+        if index != self.index {
+            self.previous = if index == self.index + 1 {
+                self.current
+            } else {
+                0
+            };
+            self.current = 0;
+            self.index = index;
+        }
+    }
+
+    /// Ok when `cost` more units fit in the window, else the time until they do
+    fn check(&self, now: u64, window_ns: u64, limit: u64, cost: u64) -> Result<(), Duration> {
+        let elapsed = now - self.index * window_ns;
+        let remaining = window_ns - elapsed;
+        let previous = (self.previous as u128 * remaining as u128 / window_ns as u128) as u64;
+        if previous + self.current + cost <= limit {
+            return Ok(());
+        }
+        if self.current + cost > limit {
+            // Not before the next fixed window
+            return Err(Duration::from_nanos(remaining));
+        }
+        // The previous window's share has to shrink to `limit - current - cost`
+        let allowed = limit - self.current - cost;
+        let until = window_ns as u128 * (self.previous - allowed) as u128 / self.previous as u128;
+        Err(Duration::from_nanos(
+            (until as u64).saturating_sub(elapsed).max(1),
+        ))
+    }
+}
+
+/// Wake the sweeper early (the limiter table is full)
+pub(crate) fn wake_sweeper() {
+    if let Some(sweeper) = SWEEPER.get() {
+        sweeper.unpark();
+    }
+}
+
+fn start_sweeper() {
+    SWEEPER.get_or_init(|| {
+        std::thread::Builder::new()
+            .name("bolt-rate-limit-sweeper".into())
+            .spawn(sweep_loop)
+            .expect("failed to start rate limit sweeper")
+            .thread()
+            .clone()
+    });
+}
+
+/// Evict limiters idle long enough to be back to their initial state
+fn sweep_loop() {
+    loop {
+        std::thread::park_timeout(SWEEP_INTERVAL);
+        let now = now_ns();
+        IP_LIMITERS.retain(|_, limiter| {
+            now.saturating_sub(limiter.last_seen_ns.load(Ordering::Relaxed)) < limiter.idle_ns
+        });
+        LIMITER_COUNT.store(IP_LIMITERS.len(), Ordering::Relaxed);
+        cluster_rate_limit::sweep();
+    }
+}
+
+/// Get or create the limiter of (bucket_id, key).
+///
+/// While the table is full, new keys share one overflow limiter per route until the
+/// sweeper makes room, so the request path never pays for cleanup.
+fn key_limiter(bucket_id: usize, key: &str, config: &RateLimitConfig, now: u64) -> Arc<KeyLimiter> {
+    if let Some(limiter) = IP_LIMITERS.get(&(bucket_id, key.to_string())) {
+        return limiter.clone();
+    }
+    // SECURITY: Check if we've exceeded max limiters (prevent memory exhaustion)
+    let key = if LIMITER_COUNT.load(Ordering::Relaxed) >= MAX_LIMITERS {
+        wake_sweeper();
+        OVERFLOW_KEY
+    } else {
+        key
+    };
+    IP_LIMITERS
+        .entry((bucket_id, key.to_string()))
+        .or_insert_with(|| {
+            start_sweeper();
+            LIMITER_COUNT.fetch_add(1, Ordering::Relaxed);
+            Arc::new(KeyLimiter::new(config, now))
+        })
+        .clone()
+}
+
 pub fn check_rate_limit(
     handler_id: usize,
     headers: &AHashMap<String, String>,
     peer_addr: Option<&str>,
+    user_id: Option<&str>,
     config: &RateLimitConfig,
     method: &str,
     path: &str,
@@ -39,22 +206,29 @@ pub fn check_rate_limit(
     let burst = config.burst;
     let key_type = &config.key_type;
 
+    // Try to get client IP from headers (X-Forwarded-For, X-Real-IP, etc.)
+    let client_ip = || {
+        headers
+            .get("x-forwarded-for")
+            .or_else(|| headers.get("x-real-ip"))
+            .or_else(|| headers.get("remote-addr"))
+            .map(|ip| {
+                // Take first IP if comma-separated
+                ip.split(',').next().unwrap_or(ip).trim().to_string()
+            })
+            // Fallback to peer_addr if headers are missing
+            .or_else(|| peer_addr.map(|s| s.to_string()))
+            .unwrap_or_else(|| "unknown".to_string())
+    };
+
     // Determine the rate limit key
     let key = match key_type.as_str() {
-        "ip" => {
-            // Try to get client IP from headers (X-Forwarded-For, X-Real-IP, etc.)
-            headers
-                .get("x-forwarded-for")
-                .or_else(|| headers.get("x-real-ip"))
-                .or_else(|| headers.get("remote-addr"))
-                .map(|ip| {
-                    // Take first IP if comma-separated
-                    ip.split(',').next().unwrap_or(ip).trim().to_string()
-                })
-                // Fallback to peer_addr if headers are missing
-                .or_else(|| peer_addr.map(|s| s.to_string()))
-                .unwrap_or_else(|| "unknown".to_string())
-        }
+        "ip" => client_ip(),
+        // Authenticated user id (checked after auth); anonymous requests are keyed by IP
+        "user" => match user_id {
+            Some(id) => format!("user:{}", id),
+            None => client_ip(),
+        },
         header_name => {
             // Use custom header as key
             headers
@@ -74,64 +248,99 @@ pub fn check_rate_limit(
         );
     }
 
-    // SECURITY: Check if we've exceeded max limiters (prevent memory exhaustion)
-    let current_count = LIMITER_COUNT.load(Ordering::Relaxed);
-    if current_count >= MAX_LIMITERS {
-        // Trigger cleanup of old limiters (simple LRU-style)
-        cleanup_old_limiters();
-    }
+    // Routes with the same scope share buckets (handler_id still labels metrics and logs)
+    let (bucket_id, bucket_key) = match config.scope.as_deref() {
+        Some(scope) => (SCOPED_BUCKET, format!("scope:{}:{}", scope, key)),
+        None => (handler_id, key.clone()),
+    };
+
+    let cost = config.cost.max(1);
+    let now = now_ns();
+    let limiter = key_limiter(bucket_id, &bucket_key, config, now);
+    limiter.last_seen_ns.store(now, Ordering::Relaxed);
 
-    // Get or create rate limiter for this handler + key combination
-    let limiter_key = (handler_id, key.clone());
-    let limiter = IP_LIMITERS.entry(limiter_key.clone()).or_insert_with(|| {
-        // Increment counter
-        LIMITER_COUNT.fetch_add(1, Ordering::Relaxed);
-
-        // Use NonZero constructors properly
-        let rps_nonzero = std::num::NonZeroU32::new(rps.max(1)).unwrap();
-        let burst_nonzero = std::num::NonZeroU32::new(burst.max(1)).unwrap();
-        let quota = Quota::per_second(rps_nonzero).allow_burst(burst_nonzero);
-        Arc::new(RateLimiter::direct(quota))
+    // Sliding window (per process): checked first, but only charged once the
+    // bucket admits the request too
+    let mut window = limiter.window.as_ref().map(|window| {
+        let mut counts = window.counts.lock();
+        counts.roll(now, window.window_ns);
+        (window, counts)
     });
+    if let Some((window, counts)) = window.as_ref() {
+        if let Err(wait_time) = counts.check(now, window.window_ns, window.limit, cost as u64) {
+            return Some(rate_limited(
+                handler_id, method, path, &key, rps, burst, wait_time,
+            ));
+        }
+    }
 
-    // Check rate limit
-    match limiter.check() {
-        Ok(_) => None, // Request allowed
-        Err(not_until) => {
-            // Calculate retry after in seconds
-            let wait_time = not_until.wait_time_from(DefaultClock::default().now());
-            let retry_after = wait_time.as_secs().max(1);
-
-            // Log rate limit exceeded
-            eprintln!(
-                "[django-bolt] Rate limit exceeded: {} {} | key: {} | limit: {} rps (burst: {}) | retry after: {}s",
-                method, path, key, rps, burst, retry_after
-            );
-
-            Some(response_builder::build_rate_limit_response(
-                retry_after,
-                rps,
-                burst,
-                responses::get_rate_limit_body(retry_after),
-            ))
+    let result = check_bucket(bucket_id, &bucket_key, rps, burst, cost, &limiter.bucket);
+    match result {
+        Ok(()) => {
+            if let Some((_, counts)) = window.as_mut() {
+                counts.current += cost as u64;
+            }
+            None // Request allowed
         }
+        Err(wait_time) => Some(rate_limited(
+            handler_id, method, path, &key, rps, burst, wait_time,
+        )),
     }
 }
 
-/// Cleanup old rate limiters when limit is reached
-/// Simple strategy: remove 20% of limiters to make room for new ones
-fn cleanup_old_limiters() {
-    let to_remove = (MAX_LIMITERS as f64 * 0.2) as usize;
-    let mut removed = 0;
-
-    // Remove first N entries (simple cleanup, not LRU)
-    IP_LIMITERS.retain(|_, _| {
-        if removed < to_remove {
-            removed += 1;
-            LIMITER_COUNT.fetch_sub(1, Ordering::Relaxed);
-            false // Remove this entry
-        } else {
-            true // Keep this entry
+/// Take `cost` tokens from the bucket of (bucket_id, key): the cluster store
+/// (BOLT_RATE_LIMIT_STORE), else the shared table (BOLT_SHARED_RATE_LIMIT), else
+/// the per-process limiter. Stores without room for the key fall through.
+fn check_bucket(
+    bucket_id: usize,
+    key: &str,
+    rps: u32,
+    burst: u32,
+    cost: u32,
+    local: &Limiter,
+) -> Result<(), Duration> {
+    if let Some(result) = cluster_rate_limit::check(bucket_id, key, rps, burst, cost) {
+        return result;
+    }
+
+    if let Some(shared) = shared_rate_limit::attached() {
+        if let Some(result) = shared.check(bucket_id, key, rps, burst, cost) {
+            return result;
         }
-    });
+    }
+
+    match local.check_n(NonZeroU32::new(cost).unwrap()) {
+        Ok(Ok(())) => Ok(()),
+        Ok(Err(not_until)) => Err(not_until.wait_time_from(DefaultClock::default().now())),
+        // Costs above burst are rejected when the route is registered
+        Err(_) => Err(Duration::from_secs(1)),
+    }
+}
+
+/// Record and log a rejected request and build its 429 response
+fn rate_limited(
+    handler_id: usize,
+    method: &str,
+    path: &str,
+    key: &str,
+    rps: u32,
+    burst: u32,
+    wait_time: Duration,
+) -> HttpResponse {
+    // Calculate retry after in seconds
+    let retry_after = wait_time.as_secs().max(1);
+    metrics::record_rate_limited(handler_id);
+
+    // Log rate limit exceeded
+    eprintln!(
+        "[django-bolt] Rate limit exceeded: {} {} | key: {} | limit: {} rps (burst: {}) | retry after: {}s",
+        method, path, key, rps, burst, retry_after
+    );
+
+    response_builder::build_rate_limit_response(
+        retry_after,
+        rps,
+        burst,
+        responses::get_rate_limit_body(retry_after),
+    )
 }
@@ -0,0 +1,188 @@
+//! Worker recycling (`runbolt --max-requests` / `--max-rss-mb`).
+//!
+//! When a limit is hit, the server is stopped gracefully: listeners are closed so
+//! SO_REUSEPORT siblings take new connections, in-flight requests are drained, and
+//! `start_server_async` returns so the process exits and the runbolt master
+//! respawns it.
+
+use actix_web::dev::ServerHandle;
+use once_cell::sync::Lazy;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::time::Duration;
+use tokio::sync::Notify;
+
+/// How often RSS is checked against the limit
+const RSS_CHECK_INTERVAL: Duration = Duration::from_secs(1);
+
+/// Requests served by this process (only counted when a max is set)
+static REQUESTS: AtomicU64 = AtomicU64::new(0);
+
+/// Request limit of this process (0 = unlimited)
+static MAX_REQUESTS: AtomicU64 = AtomicU64::new(0);
+
+/// Notified once the request limit is reached
+static REQUEST_LIMIT_REACHED: Lazy<Notify> = Lazy::new(Notify::new);
+
+/// Recycling limits read once at startup
+#[derive(Clone, Copy, Debug, Default)]
+pub struct RecycleConfig {
+    /// Requests before recycling (jitter already applied by runbolt)
+    pub max_requests: u64,
+    /// Resident set size limit in bytes
+    pub max_rss_bytes: u64,
+}
+
+impl RecycleConfig {
+    /// Read DJANGO_BOLT_MAX_REQUESTS / DJANGO_BOLT_MAX_RSS_MB (set by runbolt)
+    pub fn from_env() -> Self {
+        let read = |name: &str| -> u64 {
+            std::env::var(name)
+                .ok()
+                .and_then(|s| s.parse::<u64>().ok())
+                .unwrap_or(0)
+        };
+        RecycleConfig {
+            max_requests: read("DJANGO_BOLT_MAX_REQUESTS"),
+            max_rss_bytes: read("DJANGO_BOLT_MAX_RSS_MB") * 1024 * 1024,
+        }
+    }
+
+    #[inline]
+    pub fn enabled(&self) -> bool {
+        self.max_requests > 0 || self.max_rss_bytes > 0
+    }
+}
+
+/// Count a request towards the request limit (a single relaxed load when disabled)
+#[inline]
+pub fn record_request() {
+    let max = MAX_REQUESTS.load(Ordering::Relaxed);
+    if max == 0 {
+        return;
+    }
+    if REQUESTS.fetch_add(1, Ordering::Relaxed) + 1 == max {
+        REQUEST_LIMIT_REACHED.notify_one();
+    }
+}
+
+/// Current resident set size of this process
+fn current_rss_bytes() -> Option<u64> {
+    #[cfg(target_os = "linux")]
+    {
+        let statm = std::fs::read_to_string("/proc/self/statm").ok()?;
+        let pages: u64 = statm.split_whitespace().nth(1)?.parse().ok()?;
+        // SAFETY: sysconf has no preconditions
+        let page_size = unsafe { libc::sysconf(libc::_SC_PAGESIZE) };
+        Some(pages * page_size.max(0) as u64)
+    }
+    #[cfg(all(unix, not(target_os = "linux")))]
+    {
+        // No cheap current RSS outside Linux: fall back to the peak
+        // SAFETY: rusage is plain data, all-zero is a valid value; getrusage fills it
+        let mut usage: libc::rusage = unsafe { std::mem::zeroed() };
+        if unsafe { libc::getrusage(libc::RUSAGE_SELF, &mut usage) } != 0 {
+            return None;
+        }
+        Some(maxrss_bytes(usage.ru_maxrss.max(0) as u64))
+    }
+    #[cfg(not(unix))]
+    {
+        None
+    }
+}
+
+/// Convert `ru_maxrss` to bytes: macOS/iOS report bytes, Linux and the BSDs kilobytes
+#[cfg_attr(any(target_os = "linux", not(unix)), allow(dead_code))]
+fn maxrss_bytes(maxrss: u64) -> u64 {
+    if cfg!(any(target_os = "macos", target_os = "ios")) {
+        maxrss
+    } else {
+        maxrss * 1024
+    }
+}
+
+/// Return a future that stops `server` gracefully once a limit of `config` is hit.
+/// Call right after `run()` (requests are counted from then on) and spawn the future.
+pub fn watch(server: ServerHandle, config: RecycleConfig) -> impl std::future::Future<Output = ()> {
+    MAX_REQUESTS.store(config.max_requests, Ordering::Relaxed);
+    async move {
+        let mut rss_check = tokio::time::interval(RSS_CHECK_INTERVAL);
+
+        let reason = loop {
+            tokio::select! {
+                _ = REQUEST_LIMIT_REACHED.notified(), if config.max_requests > 0 => {
+                    break format!("served {} requests", config.max_requests);
+                }
+                _ = rss_check.tick(), if config.max_rss_bytes > 0 => {
+                    if let Some(rss) = current_rss_bytes() {
+                        if rss > config.max_rss_bytes {
+                            break format!(
+                                "RSS {} MB above {} MB",
+                                rss / (1024 * 1024),
+                                config.max_rss_bytes / (1024 * 1024)
+                            );
+                        }
+                    }
+                }
+            }
+        };
+
+        eprintln!(
+            "[django-bolt] Process {} recycling ({}): draining in-flight requests",
+            std::process::id(),
+            reason
+        );
+        server.stop(true).await;
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use futures_util::FutureExt;
+
+    #[test]
+    fn test_record_request_notifies_at_limit() {
+        REQUESTS.store(0, Ordering::Relaxed);
+        MAX_REQUESTS.store(3, Ordering::Relaxed);
+
+        record_request();
+        record_request();
+        assert!(REQUEST_LIMIT_REACHED.notified().now_or_never().is_none());
+
+        record_request();
+        assert!(REQUEST_LIMIT_REACHED.notified().now_or_never().is_some());
+
+        // Requests past the limit (while draining) don't notify again
+        record_request();
+        assert!(REQUEST_LIMIT_REACHED.notified().now_or_never().is_none());
+        assert_eq!(REQUESTS.load(Ordering::Relaxed), 4);
+
+        MAX_REQUESTS.store(0, Ordering::Relaxed);
+        record_request();
+        assert_eq!(REQUESTS.load(Ordering::Relaxed), 4);
+    }
+
+    #[test]
+    fn test_config_from_env() {
+        std::env::set_var("DJANGO_BOLT_MAX_REQUESTS", "500");
+        std::env::set_var("DJANGO_BOLT_MAX_RSS_MB", "2");
+        let config = RecycleConfig::from_env();
+        std::env::remove_var("DJANGO_BOLT_MAX_REQUESTS");
+        std::env::remove_var("DJANGO_BOLT_MAX_RSS_MB");
+
+        assert_eq!(config.max_requests, 500);
+        assert_eq!(config.max_rss_bytes, 2 * 1024 * 1024);
+        assert!(config.enabled());
+        assert!(!RecycleConfig::default().enabled());
+    }
+
+    #[test]
+    fn test_maxrss_units() {
+        if cfg!(any(target_os = "macos", target_os = "ios")) {
+            assert_eq!(maxrss_bytes(4096), 4096);
+        } else {
+            assert_eq!(maxrss_bytes(4096), 4096 * 1024);
+        }
+    }
+}
@@ -279,8 +279,9 @@ impl PyRequest {
 
     /// Get the async user loader (Django-style).
     ///
-    /// Returns the async user callable set by Django's AuthenticationMiddleware.
-    /// Use this in async handlers to load the user without blocking:
+    /// Returns the async user callable set for Bolt authentication backends (or by
+    /// Django's AuthenticationMiddleware). Use this in async handlers to load the
+    /// user without blocking:
     ///
     ///     user = await request.auser()
     ///
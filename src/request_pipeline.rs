@@ -3,6 +3,7 @@
 //! This module contains validation and processing logic that is common
 //! between the production handler (handler.rs) and test handler (testing.rs).
 
+use actix_web::http::header::{HeaderMap, ACCEPT, CONTENT_TYPE};
 use actix_web::HttpResponse;
 use ahash::AHashMap;
 use std::collections::HashMap;
@@ -90,3 +91,124 @@ pub fn validate_and_cache_typed_params(
 
     Ok((path_coerced, query_coerced))
 }
+
+/// MessagePack media types accepted for content negotiation.
+const MSGPACK_MEDIA_TYPES: [&str; 2] = ["application/msgpack", "application/x-msgpack"];
+
+#[inline]
+fn is_msgpack_media_type(value: &str) -> bool {
+    let media_type = value.split(';').next().unwrap_or("").trim();
+    MSGPACK_MEDIA_TYPES
+        .iter()
+        .any(|m| media_type.eq_ignore_ascii_case(m))
+}
+
+/// Quality value of one `Accept` entry (`q` parameter, 1 when absent, 0 when invalid)
+#[inline]
+fn accept_quality(entry: &str) -> f32 {
+    entry
+        .split(';')
+        .skip(1)
+        .filter_map(|param| param.split_once('='))
+        .find(|(name, _)| name.trim().eq_ignore_ascii_case("q"))
+        .map(|(_, value)| value.trim().parse::<f32>().unwrap_or(0.0).clamp(0.0, 1.0))
+        .unwrap_or(1.0)
+}
+
+/// True when the preferred `Accept` entry is a MessagePack media type: the one with
+/// the highest q above 0, the first listed among equals.
+#[inline]
+fn accept_prefers_msgpack(accept: &str) -> bool {
+    let mut best_quality = 0.0;
+    let mut msgpack = false;
+    for entry in accept.split(',') {
+        if entry.trim().is_empty() {
+            continue;
+        }
+        let quality = accept_quality(entry);
+        if quality > best_quality {
+            best_quality = quality;
+            msgpack = is_msgpack_media_type(entry);
+        }
+    }
+    msgpack
+}
+
+/// Detect MessagePack content negotiation from raw request headers.
+///
+/// Returns `(msgpack_body, msgpack_response)`:
+/// - `msgpack_body`: `Content-Type` is a MessagePack media type
+/// - `msgpack_response`: `Accept` prefers a MessagePack media type (q-values honored)
+///
+/// Reads the actix `HeaderMap` directly so it works even when header
+/// extraction for Python is skipped by the `needs_headers` optimization.
+#[inline]
+pub fn detect_msgpack(headers: &HeaderMap) -> (bool, bool) {
+    let msgpack_body = headers
+        .get(CONTENT_TYPE)
+        .and_then(|v| v.to_str().ok())
+        .map(is_msgpack_media_type)
+        .unwrap_or(false);
+    let msgpack_response = headers
+        .get(ACCEPT)
+        .and_then(|v| v.to_str().ok())
+        .map(accept_prefers_msgpack)
+        .unwrap_or(false);
+    (msgpack_body, msgpack_response)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use actix_web::http::header::HeaderValue;
+
+    fn headers(pairs: &[(actix_web::http::header::HeaderName, &'static str)]) -> HeaderMap {
+        let mut map = HeaderMap::new();
+        for (name, value) in pairs {
+            map.insert(name.clone(), HeaderValue::from_static(value));
+        }
+        map
+    }
+
+    #[test]
+    fn test_detect_msgpack_none() {
+        assert_eq!(detect_msgpack(&HeaderMap::new()), (false, false));
+        let map = headers(&[(CONTENT_TYPE, "application/json"), (ACCEPT, "*/*")]);
+        assert_eq!(detect_msgpack(&map), (false, false));
+    }
+
+    #[test]
+    fn test_detect_msgpack_content_type() {
+        let map = headers(&[(CONTENT_TYPE, "application/msgpack")]);
+        assert_eq!(detect_msgpack(&map), (true, false));
+        let map = headers(&[(CONTENT_TYPE, "application/x-msgpack; charset=binary")]);
+        assert_eq!(detect_msgpack(&map), (true, false));
+    }
+
+    #[test]
+    fn test_detect_msgpack_accept() {
+        let map = headers(&[(ACCEPT, "application/msgpack")]);
+        assert_eq!(detect_msgpack(&map), (false, true));
+        let map = headers(&[(ACCEPT, "application/json;q=0.5, application/x-msgpack")]);
+        assert_eq!(detect_msgpack(&map), (false, true));
+        let map = headers(&[(ACCEPT, "application/msgpack, */*;q=0.8")]);
+        assert_eq!(detect_msgpack(&map), (false, true));
+        let map = headers(&[(ACCEPT, "application/msgpackx")]);
+        assert_eq!(detect_msgpack(&map), (false, false));
+    }
+
+    #[test]
+    fn test_detect_msgpack_accept_quality() {
+        // JSON preferred
+        let map = headers(&[(ACCEPT, "application/json, application/msgpack;q=0.9")]);
+        assert_eq!(detect_msgpack(&map), (false, false));
+        // Explicitly not acceptable
+        let map = headers(&[(ACCEPT, "application/msgpack;q=0")]);
+        assert_eq!(detect_msgpack(&map), (false, false));
+        // Equal quality: the first listed wins
+        let map = headers(&[(ACCEPT, "application/json, application/msgpack")]);
+        assert_eq!(detect_msgpack(&map), (false, false));
+        let map = headers(&[(ACCEPT, "application/msgpack; q=1.0, application/json")]);
+        assert_eq!(detect_msgpack(&map), (false, true));
+    }
+}
@@ -14,6 +14,7 @@ use pyo3::types::PyTuple;
 #[derive(Debug, Clone, Copy, PartialEq)]
 pub enum ResponseType {
     Json,
+    MsgPack,
     Html,
     PlainText,
     OctetStream,
@@ -28,6 +29,7 @@ impl ResponseType {
     pub fn from_str(s: &str) -> Self {
         match s {
             "json" => Self::Json,
+            "msgpack" => Self::MsgPack,
             "html" => Self::Html,
             "plaintext" => Self::PlainText,
             "redirect" => Self::Redirect,
@@ -42,6 +44,7 @@ impl ResponseType {
     pub const fn content_type(&self) -> &'static str {
         match self {
             Self::Json => "application/json",
+            Self::MsgPack => "application/msgpack",
             Self::Html => "text/html; charset=utf-8",
             Self::PlainText => "text/plain; charset=utf-8",
             Self::OctetStream => "application/octet-stream",
@@ -141,6 +144,7 @@ mod tests {
     #[test]
     fn test_response_type_from_str() {
         assert_eq!(ResponseType::from_str("json"), ResponseType::Json);
+        assert_eq!(ResponseType::from_str("msgpack"), ResponseType::MsgPack);
         assert_eq!(ResponseType::from_str("html"), ResponseType::Html);
         assert_eq!(ResponseType::from_str("plaintext"), ResponseType::PlainText);
         assert_eq!(ResponseType::from_str("redirect"), ResponseType::Redirect);
@@ -152,6 +156,7 @@ mod tests {
     #[test]
     fn test_response_type_content_type() {
         assert_eq!(ResponseType::Json.content_type(), "application/json");
+        assert_eq!(ResponseType::MsgPack.content_type(), "application/msgpack");
         assert_eq!(
             ResponseType::Html.content_type(),
             "text/html; charset=utf-8"
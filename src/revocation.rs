@@ -0,0 +1,283 @@
+//! Revoked JWT IDs held in Rust, so revocation is checked without the GIL.
+//!
+//! Each `RevocationStore` used by a `JWTAuthentication` backend gets one set here,
+//! identified by the store's Python `id()`. The set is filled two ways:
+//!
+//! - incrementally: `store.revoke()` pushes the JTI through `revoke_token` right away
+//!   (visible to this process only);
+//! - periodically: a background thread calls `store.revoked_tokens(cursor)` every
+//!   `revocation_sync` seconds, which is how revocations made by other processes and
+//!   nodes arrive.
+//!
+//! Checks first consult a Bloom filter of lock-free atomic words: most tokens are not
+//! revoked, and for them the filter answers without a lock or string hashing into the
+//! map. Only possible matches look up the map.
+//!
+//! `revoke_all(user)` is a per-user watermark instead: tokens of that user issued
+//! before it are rejected, without listing their JTIs.
+
+use ahash::AHashMap;
+use dashmap::DashMap;
+use once_cell::sync::Lazy;
+use parking_lot::RwLock;
+use pyo3::prelude::*;
+use std::collections::HashMap;
+use std::hash::{BuildHasher, Hash, Hasher};
+use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
+use std::sync::{Arc, Weak};
+use std::time::{Duration, SystemTime, UNIX_EPOCH};
+
+/// Bloom filter size: 2^20 bits (128 KiB), ~1% false positives at 100k revoked tokens
+const BLOOM_WORDS: usize = (1 << 20) / 64;
+const BLOOM_HASHES: u64 = 4;
+
+/// Expiry of tokens revoked without a TTL
+const NEVER: u64 = u64::MAX;
+
+/// Every this many syncs, drop expired entries and rebuild the filter
+const PRUNE_EVERY: u32 = 60;
+
+/// Revocation sets by store id
+static SETS: Lazy<DashMap<usize, Arc<RevocationSet>>> = Lazy::new(DashMap::new);
+
+/// Fixed seeds: the same JTI maps to the same bits for every rebuild
+static BLOOM_HASHER: Lazy<ahash::RandomState> = Lazy::new(|| {
+    ahash::RandomState::with_seeds(0x626f_6c74, 0x7265_766f, 0x6b65_6400, 0x6a74_6900)
+});
+
+fn now_unix() -> u64 {
+    SystemTime::now()
+        .duration_since(UNIX_EPOCH)
+        .map(|d| d.as_secs())
+        .unwrap_or(0)
+}
+
+/// Bit positions of `jti` (double hashing)
+fn bloom_bits(jti: &str) -> impl Iterator<Item = usize> {
+    let mut hasher = BLOOM_HASHER.build_hasher();
+    jti.hash(&mut hasher);
+    let hash = hasher.finish();
+    let (h1, h2) = (hash & 0xffff_ffff, (hash >> 32) | 1);
+    (0..BLOOM_HASHES)
+        .map(move |i| (h1.wrapping_add(i.wrapping_mul(h2)) as usize) % (BLOOM_WORDS * 64))
+}
+
+/// Revoked JTIs of one store
+pub struct RevocationSet {
+    bloom: Box<[AtomicU64]>,
+    /// JTI -> expiry (unix seconds)
+    revoked: RwLock<AHashMap<Box<str>, u64>>,
+    /// User id -> tokens issued before this time (unix seconds) are revoked
+    users: RwLock<AHashMap<Box<str>, f64>>,
+    /// `users` is not empty (skips its lock in the common case)
+    has_users: AtomicBool,
+}
+
+impl RevocationSet {
+    fn new() -> Self {
+        RevocationSet {
+            bloom: (0..BLOOM_WORDS).map(|_| AtomicU64::new(0)).collect(),
+            revoked: RwLock::new(AHashMap::new()),
+            users: RwLock::new(AHashMap::new()),
+            has_users: AtomicBool::new(false),
+        }
+    }
+
+    /// True when all tokens of `user` issued before a watermark are revoked and this
+    /// one (issued at `iat`, unknown tokens included) is one of them
+    pub fn is_user_revoked(&self, user: &str, iat: Option<i64>) -> bool {
+        if !self.has_users.load(Ordering::Acquire) {
+            return false;
+        }
+        match self.users.read().get(user) {
+            Some(&before) => match iat {
+                Some(iat) => (iat as f64) < before,
+                None => true,
+            },
+            None => false,
+        }
+    }
+
+    /// Set user watermarks (`replace` drops the ones missing from `entries`)
+    fn set_users(&self, entries: impl IntoIterator<Item = (String, f64)>, replace: bool) {
+        let mut users = self.users.write();
+        if replace {
+            users.clear();
+        }
+        for (user, before) in entries {
+            let current = users.entry(user.into_boxed_str()).or_insert(before);
+            *current = current.max(before);
+        }
+        self.has_users.store(!users.is_empty(), Ordering::Release);
+    }
+
+    /// True when `jti` is revoked (and the revocation has not expired)
+    pub fn is_revoked(&self, jti: &str) -> bool {
+        let maybe = bloom_bits(jti)
+            .all(|bit| self.bloom[bit / 64].load(Ordering::Acquire) & (1 << (bit % 64)) != 0);
+        if !maybe {
+            return false;
+        }
+        match self.revoked.read().get(jti) {
+            Some(&expires) => expires > now_unix(),
+            None => false,
+        }
+    }
+
+    /// Add revocations (bits are set before the entries become visible)
+    fn add(&self, entries: impl IntoIterator<Item = (String, u64)>) {
+        let mut revoked = self.revoked.write();
+        for (jti, expires) in entries {
+            for bit in bloom_bits(&jti) {
+                self.bloom[bit / 64].fetch_or(1 << (bit % 64), Ordering::AcqRel);
+            }
+            revoked.insert(jti.into_boxed_str(), expires);
+        }
+    }
+
+    /// Replace all revocations with a full snapshot from the store
+    fn replace(&self, entries: impl IntoIterator<Item = (String, u64)>) {
+        let mut revoked = self.revoked.write();
+        *revoked = entries
+            .into_iter()
+            .map(|(jti, expires)| (jti.into_boxed_str(), expires))
+            .collect();
+        self.rebuild(&mut revoked);
+    }
+
+    /// Drop expired revocations (their tokens are expired too)
+    fn prune(&self) {
+        let mut revoked = self.revoked.write();
+        self.rebuild(&mut revoked);
+    }
+
+    fn rebuild(&self, revoked: &mut AHashMap<Box<str>, u64>) {
+        let now = now_unix();
+        revoked.retain(|_, expires| *expires > now);
+
+        // Rebuild the filter word by word: every word keeps the bits of all current
+        // entries, so a revoked token is never missed while it is rewritten
+        let mut words = vec![0u64; BLOOM_WORDS];
+        for jti in revoked.keys() {
+            for bit in bloom_bits(jti) {
+                words[bit / 64] |= 1 << (bit % 64);
+            }
+        }
+        for (word, value) in self.bloom.iter().zip(words) {
+            word.store(value, Ordering::Release);
+        }
+    }
+
+    /// Run one sync with the store; returns the next cursor, or Err to stop syncing
+    fn sync(&self, sync: &Py<PyAny>, cursor: Option<Py<PyAny>>) -> Result<Option<Py<PyAny>>, ()> {
+        Python::attach(|py| {
+            let full = cursor.is_none();
+            let result = match sync.call1(py, (cursor.as_ref().map(|c| c.clone_ref(py)),)) {
+                Ok(result) => result,
+                Err(e) => {
+                    eprintln!("[django-bolt] Warning: Revocation sync failed: {}", e);
+                    // Keep the current set and cursor, try again next time
+                    return Ok(cursor);
+                }
+            };
+            // None: the store cannot list revoked tokens
+            if result.is_none(py) {
+                return Err(());
+            }
+            let parsed = result.extract::<(
+                HashMap<String, Option<f64>>,
+                Py<PyAny>,
+                HashMap<String, f64>,
+            )>(py);
+            let (entries, next, users) = match parsed {
+                Ok(parsed) => parsed,
+                Err(e) => {
+                    eprintln!(
+                        "[django-bolt] Warning: Invalid revocation sync result: {}",
+                        e
+                    );
+                    return Ok(cursor);
+                }
+            };
+            let entries = entries
+                .into_iter()
+                .map(|(jti, expires)| (jti, expires.map(|t| t.max(0.0) as u64).unwrap_or(NEVER)));
+            if full {
+                self.replace(entries);
+            } else {
+                self.add(entries);
+            }
+            // Watermarks are few: always a full snapshot
+            self.set_users(users, true);
+            Ok((!next.is_none(py)).then_some(next))
+        })
+    }
+}
+
+/// Get the revocation set of store `store_id`, creating it on first use.
+///
+/// With `sync` (wrapper of `store.revoked_tokens` and `store.revoked_users`), the set is filled now and refreshed
+/// every `interval` in the background.
+pub fn shared(store_id: usize, sync: Option<Py<PyAny>>, interval: Duration) -> Arc<RevocationSet> {
+    if let Some(set) = SETS.get(&store_id) {
+        return set.clone();
+    }
+    let set = Arc::new(RevocationSet::new());
+    let set = SETS.entry(store_id).or_insert(set).clone();
+    if let Some(sync) = sync {
+        if let Ok(cursor) = set.sync(&sync, None) {
+            if !interval.is_zero() {
+                spawn_sync(Arc::downgrade(&set), sync, cursor, interval);
+            }
+        }
+    }
+    set
+}
+
+fn spawn_sync(
+    set: Weak<RevocationSet>,
+    sync: Py<PyAny>,
+    mut cursor: Option<Py<PyAny>>,
+    interval: Duration,
+) {
+    let spawned = std::thread::Builder::new()
+        .name("bolt-revocation-sync".into())
+        .spawn(move || {
+            for round in 1u32.. {
+                std::thread::sleep(interval);
+                let Some(set) = set.upgrade() else {
+                    break;
+                };
+                match set.sync(&sync, cursor.take()) {
+                    Ok(next) => cursor = next,
+                    Err(()) => break,
+                }
+                if round % PRUNE_EVERY == 0 {
+                    set.prune();
+                }
+            }
+        });
+    if let Err(e) = spawned {
+        eprintln!("[django-bolt] Warning: Revocation sync disabled: {}", e);
+    }
+}
+
+/// Revoke `jti` in this process right away (called by `RevocationStore.revoke`).
+/// No-op until a backend using the store is registered.
+#[pyfunction]
+#[pyo3(signature = (store_id, jti, expires_at=None))]
+pub fn revoke_token(store_id: usize, jti: String, expires_at: Option<f64>) {
+    if let Some(set) = SETS.get(&store_id) {
+        let expires = expires_at.map(|t| t.max(0.0) as u64).unwrap_or(NEVER);
+        set.add([(jti, expires)]);
+    }
+}
+
+/// Revoke the tokens of `user_id` issued before `before` (unix seconds) in this
+/// process right away (called by `RevocationStore.revoke_all`).
+#[pyfunction]
+pub fn revoke_user_tokens(store_id: usize, user_id: String, before: f64) {
+    if let Some(set) = SETS.get(&store_id) {
+        set.set_users([(user_id, before)], false);
+    }
+}
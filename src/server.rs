@@ -14,14 +14,17 @@ use std::sync::Arc;
 
 use crate::handler::handle_request;
 use crate::metadata::{CompressionConfig, CorsConfig, RouteMetadata};
+use crate::metrics::{self, configure_metrics_route, MetricsConfig};
 use crate::middleware::compression::CompressionMiddleware;
 use crate::middleware::cors::CorsMiddleware;
+use crate::recycle::RecycleConfig;
 use crate::router::Router;
 use crate::state::{
     AppState, StaticFilesConfig, GLOBAL_ROUTER, GLOBAL_WEBSOCKET_ROUTER, ROUTE_METADATA,
     ROUTE_METADATA_TEMP, TASK_LOCALS,
 };
 use crate::static_files::handle_static_file;
+use crate::timing::TimingConfig;
 use crate::websocket::{
     handle_websocket_upgrade_with_handler, is_websocket_upgrade, WebSocketRouter,
 };
@@ -33,6 +36,7 @@ pub fn register_routes(
 ) -> PyResult<()> {
     let mut router = Router::new();
     for (method, path, handler_id, handler) in routes {
+        metrics::register_route_label(handler_id, &method, &path);
         router.register(&method, &path, handler_id, handler.into())?;
     }
     GLOBAL_ROUTER
@@ -465,8 +469,20 @@ pub fn start_server_async(
         router: None,         // Production uses GLOBAL_ROUTER
         route_metadata: None, // Production uses ROUTE_METADATA
         static_files_config: static_files_config.clone(),
+        timing: TimingConfig::from_django_settings(py),
+        metrics: MetricsConfig::from_django_settings(py),
     });
 
+    let recycle = RecycleConfig::from_env();
+
+    // Multi-process mode: check rate limits against the buckets created by the runbolt master
+    crate::shared_rate_limit::attach_from_env();
+
+    // Multi-process mode: record metrics into the region created by the runbolt master
+    if app_state.metrics.enabled {
+        crate::shared_metrics::attach_from_env();
+    }
+
     py.detach(|| {
         aw::rt::System::new()
             .block_on(async move {
@@ -524,6 +540,10 @@ pub fn start_server_async(
                                 .to(websocket_not_found_handler),
                         );
 
+                        // Prometheus metrics endpoint (BOLT_METRICS), rendered in Rust without the GIL
+                        let metrics_config = app_state.metrics.clone();
+                        app = app.configure(|cfg| configure_metrics_route(cfg, &metrics_config));
+
                         // Register static files handler (if configured via Django settings)
                         // Uses a custom handler that:
                         // 1. Searches configured directories in order (fast path)
@@ -587,11 +607,17 @@ pub fn start_server_async(
                     listener
                         .set_nonblocking(true)
                         .map_err(|e| std::io::Error::new(std::io::ErrorKind::Other, e))?;
-                    server
+                    let server = server
                         .listen(listener)
                         .map_err(|e| std::io::Error::new(std::io::ErrorKind::Other, e))?
-                        .run()
-                        .await
+                        .run();
+
+                    // Worker recycling (runbolt --max-requests / --max-rss-mb)
+                    if recycle.enabled() {
+                        aw::rt::spawn(crate::recycle::watch(server.handle(), recycle));
+                    }
+
+                    server.await
                 }
             })
             .map_err(|e| std::io::Error::new(std::io::ErrorKind::Other, format!("{:?}", e)))
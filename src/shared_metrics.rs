@@ -0,0 +1,467 @@
+//! Metrics shared across `runbolt --processes N` workers.
+//!
+//! The master process creates a file (in `/dev/shm` when available) laid out as a
+//! header followed by one segment per worker, and passes its path to the workers in
+//! `DJANGO_BOLT_METRICS_SHM`. Each worker maps the file and records its request
+//! counters directly into its own segment (indexed by `DJANGO_BOLT_PROCESS_ID`) with
+//! atomic adds, so any worker can render the merged view by summing all segments.
+//!
+//! Counters are never copied or reset: a restarted worker claims the same segment and
+//! keeps adding to it, so restarts neither lose nor double count requests. Gauges
+//! (in-flight requests, connections, threads) are published by each worker once per
+//! second together with a heartbeat; segments whose heartbeat is stale are left out.
+//!
+//! Layout (all fields are native-endian u64 words):
+//!
+//! ```text
+//! header:   magic, version, slots, route_entries, limit_entries, segment_words, 0, 0
+//! segment:  pid, generation, heartbeat_ms, in_flight, ws_connections, sync_threads,
+//!           executor_pending, executor_running, unmatched, ws_rejected, 0 x 6
+//!           route_entries x [key, count, sum_ns, buckets...]
+//!           limit_entries x [key, count]
+//! ```
+
+use once_cell::sync::OnceCell;
+use pyo3::prelude::*;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::time::{Duration, SystemTime, UNIX_EPOCH};
+
+use crate::timing::{bucket_index, BUCKET_COUNT};
+
+const MAGIC: u64 = u64::from_le_bytes(*b"BOLTMET1");
+const VERSION: u64 = 1;
+
+const HEADER_WORDS: usize = 8;
+const SEGMENT_HEADER_WORDS: usize = 16;
+
+// Segment header fields
+const PID: usize = 0;
+const GENERATION: usize = 1;
+const HEARTBEAT_MS: usize = 2;
+pub const IN_FLIGHT: usize = 3;
+pub const WS_CONNECTIONS: usize = 4;
+pub const SYNC_THREADS: usize = 5;
+pub const EXECUTOR_PENDING: usize = 6;
+pub const EXECUTOR_RUNNING: usize = 7;
+pub const UNMATCHED: usize = 8;
+pub const WS_REJECTED: usize = 9;
+
+/// Gauges published by the worker (zeroed when a segment is claimed)
+pub const GAUGES: [usize; 5] = [
+    IN_FLIGHT,
+    WS_CONNECTIONS,
+    SYNC_THREADS,
+    EXECUTOR_PENDING,
+    EXECUTOR_RUNNING,
+];
+
+/// (handler_id, status) pairs per worker; further pairs fall back to process-local metrics
+const ROUTE_ENTRIES: usize = 1024;
+const ROUTE_ENTRY_WORDS: usize = 3 + BUCKET_COUNT;
+/// Rate-limited handlers per worker
+const LIMIT_ENTRIES: usize = 256;
+const LIMIT_ENTRY_WORDS: usize = 2;
+
+const SEGMENT_WORDS: usize =
+    SEGMENT_HEADER_WORDS + ROUTE_ENTRIES * ROUTE_ENTRY_WORDS + LIMIT_ENTRIES * LIMIT_ENTRY_WORDS;
+
+const MAX_SLOTS: usize = 1024;
+
+/// How often workers publish gauges and heartbeat
+const PUBLISH_INTERVAL: Duration = Duration::from_secs(1);
+/// Segments without a heartbeat for this long are treated as dead (gauges ignored)
+const STALE_AFTER_MS: u64 = 5_000;
+
+fn now_ms() -> u64 {
+    SystemTime::now()
+        .duration_since(UNIX_EPOCH)
+        .map(|d| d.as_millis() as u64)
+        .unwrap_or(0)
+}
+
+#[inline]
+fn route_key(handler_id: usize, status: u16) -> u64 {
+    (((handler_id as u64) << 16) | status as u64) + 1
+}
+
+#[inline]
+fn limit_key(handler_id: usize) -> u64 {
+    handler_id as u64 + 1
+}
+
+/// Find (or claim) the entry of `key` in an open-addressing table; returns its word offset
+fn find_or_insert(
+    table: &[AtomicU64],
+    entries: usize,
+    entry_words: usize,
+    key: u64,
+) -> Option<usize> {
+    let mut index = (key.wrapping_mul(0x9E37_79B9_7F4A_7C15) >> 32) as usize % entries;
+    for _ in 0..entries {
+        let offset = index * entry_words;
+        let slot = &table[offset];
+        match slot.load(Ordering::Acquire) {
+            current if current == key => return Some(offset),
+            0 => match slot.compare_exchange(0, key, Ordering::AcqRel, Ordering::Acquire) {
+                Ok(_) => return Some(offset),
+                Err(existing) if existing == key => return Some(offset),
+                Err(_) => {}
+            },
+            _ => {}
+        }
+        index = (index + 1) % entries;
+    }
+    None
+}
+
+/// A shared memory file mapped into this process (also used by the shared rate limiter)
+pub struct Mapping {
+    ptr: *mut u8,
+    len: usize,
+}
+
+// The mapping is only accessed through atomics
+unsafe impl Send for Mapping {}
+unsafe impl Sync for Mapping {}
+
+impl Mapping {
+    #[cfg(unix)]
+    pub(crate) fn open(path: &str) -> std::io::Result<Self> {
+        use std::os::unix::io::AsRawFd;
+
+        let file = std::fs::OpenOptions::new()
+            .read(true)
+            .write(true)
+            .open(path)?;
+        let len = file.metadata()?.len() as usize;
+        if len < HEADER_WORDS * 8 {
+            return Err(std::io::Error::new(
+                std::io::ErrorKind::InvalidData,
+                "shared memory file is too small",
+            ));
+        }
+        // SAFETY: mapping a regular file we just opened; checked for MAP_FAILED below
+        let ptr = unsafe {
+            libc::mmap(
+                std::ptr::null_mut(),
+                len,
+                libc::PROT_READ | libc::PROT_WRITE,
+                libc::MAP_SHARED,
+                file.as_raw_fd(),
+                0,
+            )
+        };
+        if ptr == libc::MAP_FAILED {
+            return Err(std::io::Error::last_os_error());
+        }
+        Ok(Mapping {
+            ptr: ptr as *mut u8,
+            len,
+        })
+    }
+
+    #[cfg(not(unix))]
+    pub(crate) fn open(_path: &str) -> std::io::Result<Self> {
+        Err(std::io::Error::new(
+            std::io::ErrorKind::Unsupported,
+            "shared memory regions require a Unix platform",
+        ))
+    }
+
+    pub(crate) fn words(&self) -> &[AtomicU64] {
+        // SAFETY: page-aligned mapping of `len` bytes that lives as long as self
+        unsafe { std::slice::from_raw_parts(self.ptr as *const AtomicU64, self.len / 8) }
+    }
+
+    /// Validate the header and return the number of segments
+    fn slots(&self) -> std::io::Result<usize> {
+        let words = self.words();
+        let field = |i: usize| words[i].load(Ordering::Acquire);
+        let slots = field(2) as usize;
+        let valid = field(0) == MAGIC
+            && field(1) == VERSION
+            && field(3) as usize == ROUTE_ENTRIES
+            && field(4) as usize == LIMIT_ENTRIES
+            && field(5) as usize == SEGMENT_WORDS
+            && words.len() >= HEADER_WORDS + slots * SEGMENT_WORDS;
+        if !valid {
+            return Err(std::io::Error::new(
+                std::io::ErrorKind::InvalidData,
+                "shared metrics file has an incompatible layout",
+            ));
+        }
+        Ok(slots)
+    }
+
+    fn segment(&self, slot: usize) -> &[AtomicU64] {
+        let start = HEADER_WORDS + slot * SEGMENT_WORDS;
+        &self.words()[start..start + SEGMENT_WORDS]
+    }
+}
+
+#[cfg(unix)]
+impl Drop for Mapping {
+    fn drop(&mut self) {
+        // SAFETY: unmapping exactly the region returned by mmap
+        unsafe {
+            libc::munmap(self.ptr as *mut libc::c_void, self.len);
+        }
+    }
+}
+
+/// This worker's view of the shared region
+pub struct SharedRegion {
+    mapping: Mapping,
+    slots: usize,
+    slot: usize,
+}
+
+static ATTACHED: OnceCell<SharedRegion> = OnceCell::new();
+
+/// The region this worker records into, if any
+#[inline]
+pub fn attached() -> Option<&'static SharedRegion> {
+    ATTACHED.get()
+}
+
+impl SharedRegion {
+    fn own(&self) -> &[AtomicU64] {
+        self.mapping.segment(self.slot)
+    }
+
+    /// Record a request; false if the route table is full
+    #[inline]
+    pub fn observe_request(&self, handler_id: usize, status: u16, secs: f64) -> bool {
+        let segment = self.own();
+        let table = &segment[SEGMENT_HEADER_WORDS..];
+        let Some(offset) = find_or_insert(
+            table,
+            ROUTE_ENTRIES,
+            ROUTE_ENTRY_WORDS,
+            route_key(handler_id, status),
+        ) else {
+            return false;
+        };
+        let entry = &table[offset..offset + ROUTE_ENTRY_WORDS];
+        entry[3 + bucket_index(secs)].fetch_add(1, Ordering::Relaxed);
+        entry[2].fetch_add((secs * 1_000_000_000.0) as u64, Ordering::Relaxed);
+        entry[1].fetch_add(1, Ordering::Relaxed);
+        true
+    }
+
+    /// Record a rate-limit rejection; false if the table is full
+    pub fn record_rate_limited(&self, handler_id: usize) -> bool {
+        let table = &self.own()[SEGMENT_HEADER_WORDS + ROUTE_ENTRIES * ROUTE_ENTRY_WORDS..];
+        match find_or_insert(
+            table,
+            LIMIT_ENTRIES,
+            LIMIT_ENTRY_WORDS,
+            limit_key(handler_id),
+        ) {
+            Some(offset) => {
+                table[offset + 1].fetch_add(1, Ordering::Relaxed);
+                true
+            }
+            None => false,
+        }
+    }
+
+    pub fn record_unmatched(&self) {
+        self.own()[UNMATCHED].fetch_add(1, Ordering::Relaxed);
+    }
+
+    pub fn record_ws_rejected(&self) {
+        self.own()[WS_REJECTED].fetch_add(1, Ordering::Relaxed);
+    }
+
+    /// Publish this worker's gauges (field index, value) and heartbeat
+    fn publish(&self, gauges: &[(usize, u64)]) {
+        let segment = self.own();
+        for &(field, value) in gauges {
+            segment[field].store(value, Ordering::Relaxed);
+        }
+        segment[HEARTBEAT_MS].store(now_ms(), Ordering::Release);
+    }
+
+    /// Visit the shared segments (this worker's included)
+    pub fn visit(&self, visitor: &mut impl SegmentVisitor) {
+        visit_segments(&self.mapping, self.slots, Some(self.slot), visitor);
+    }
+}
+
+/// Receives the contents of shared segments when rendering the merged view
+pub trait SegmentVisitor {
+    fn request(&mut self, handler_id: usize, status: u16, count: u64, sum_ns: u64, buckets: &[u64]);
+    fn rate_limited(&mut self, handler_id: usize, count: u64);
+    fn counter(&mut self, field: usize, value: u64);
+    /// Gauges of other live workers (the reader's own are read from memory)
+    fn gauge(&mut self, field: usize, value: u64);
+    fn live_worker(&mut self);
+}
+
+fn visit_segments(
+    mapping: &Mapping,
+    slots: usize,
+    own_slot: Option<usize>,
+    visitor: &mut impl SegmentVisitor,
+) {
+    let now = now_ms();
+    for slot in 0..slots {
+        let segment = mapping.segment(slot);
+
+        let heartbeat = segment[HEARTBEAT_MS].load(Ordering::Acquire);
+        let live = heartbeat != 0 && now.saturating_sub(heartbeat) <= STALE_AFTER_MS;
+        if own_slot == Some(slot) || live {
+            visitor.live_worker();
+        }
+        if own_slot != Some(slot) && live {
+            for field in GAUGES {
+                visitor.gauge(field, segment[field].load(Ordering::Relaxed));
+            }
+        }
+        for field in [UNMATCHED, WS_REJECTED] {
+            visitor.counter(field, segment[field].load(Ordering::Relaxed));
+        }
+
+        let routes = &segment[SEGMENT_HEADER_WORDS..];
+        let mut buckets = [0u64; BUCKET_COUNT];
+        for entry in routes[..ROUTE_ENTRIES * ROUTE_ENTRY_WORDS].chunks_exact(ROUTE_ENTRY_WORDS) {
+            let key = entry[0].load(Ordering::Acquire);
+            if key == 0 {
+                continue;
+            }
+            for (bucket, word) in buckets.iter_mut().zip(&entry[3..]) {
+                *bucket = word.load(Ordering::Relaxed);
+            }
+            let key = key - 1;
+            visitor.request(
+                (key >> 16) as usize,
+                (key & 0xFFFF) as u16,
+                entry[1].load(Ordering::Relaxed),
+                entry[2].load(Ordering::Relaxed),
+                &buckets,
+            );
+        }
+
+        let limits = &routes[ROUTE_ENTRIES * ROUTE_ENTRY_WORDS..];
+        for entry in limits.chunks_exact(LIMIT_ENTRY_WORDS) {
+            let key = entry[0].load(Ordering::Acquire);
+            if key != 0 {
+                visitor.rate_limited((key - 1) as usize, entry[1].load(Ordering::Relaxed));
+            }
+        }
+    }
+}
+
+/// Visit every segment of a shared metrics file from any process (e.g. the master)
+pub fn visit_file(path: &str, visitor: &mut impl SegmentVisitor) -> std::io::Result<()> {
+    let mapping = Mapping::open(path)?;
+    let slots = mapping.slots()?;
+    visit_segments(&mapping, slots, None, visitor);
+    Ok(())
+}
+
+/// Create (or truncate) a shared metrics file with one segment per worker
+#[pyfunction]
+pub fn create_shared_metrics(path: &str, slots: usize) -> PyResult<()> {
+    if slots == 0 || slots > MAX_SLOTS {
+        return Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "slots must be between 1 and {}",
+            MAX_SLOTS
+        )));
+    }
+    let file = std::fs::OpenOptions::new()
+        .read(true)
+        .write(true)
+        .create(true)
+        .truncate(true)
+        .open(path)?;
+    // Zero-filled by the OS
+    file.set_len(((HEADER_WORDS + slots * SEGMENT_WORDS) * 8) as u64)?;
+    drop(file);
+
+    let mapping = Mapping::open(path)?;
+    let words = mapping.words();
+    for (i, value) in [
+        VERSION,
+        slots as u64,
+        ROUTE_ENTRIES as u64,
+        LIMIT_ENTRIES as u64,
+        SEGMENT_WORDS as u64,
+    ]
+    .into_iter()
+    .enumerate()
+    {
+        words[i + 1].store(value, Ordering::Relaxed);
+    }
+    // Magic last: readers only trust a fully written header
+    words[0].store(MAGIC, Ordering::Release);
+    Ok(())
+}
+
+/// Attach this process to segment `slot` of a shared metrics file.
+///
+/// Counters already in the segment (from a previous worker in the same slot) are
+/// kept; gauges are reset. Starts the thread publishing gauges and heartbeat.
+pub fn attach(path: &str, slot: usize) -> std::io::Result<()> {
+    if ATTACHED.get().is_some() {
+        return Ok(());
+    }
+    let mapping = Mapping::open(path)?;
+    let slots = mapping.slots()?;
+    if slot >= slots {
+        return Err(std::io::Error::new(
+            std::io::ErrorKind::InvalidInput,
+            format!("process slot {} out of range ({} slots)", slot, slots),
+        ));
+    }
+
+    let region = SharedRegion {
+        mapping,
+        slots,
+        slot,
+    };
+    let segment = region.own();
+    segment[PID].store(std::process::id() as u64, Ordering::Relaxed);
+    segment[GENERATION].fetch_add(1, Ordering::Relaxed);
+    region.publish(&GAUGES.map(|field| (field, 0)));
+
+    if ATTACHED.set(region).is_err() {
+        return Ok(());
+    }
+    std::thread::Builder::new()
+        .name("bolt-metrics-publisher".into())
+        .spawn(|| {
+            let region = ATTACHED.get().expect("attached above");
+            loop {
+                region.publish(&crate::metrics::local_gauges());
+                std::thread::sleep(PUBLISH_INTERVAL);
+            }
+        })?;
+    Ok(())
+}
+
+/// Attach from the environment set by `runbolt --processes N`
+/// (DJANGO_BOLT_METRICS_SHM and DJANGO_BOLT_PROCESS_ID)
+pub fn attach_from_env() {
+    let Ok(path) = std::env::var("DJANGO_BOLT_METRICS_SHM") else {
+        return;
+    };
+    let slot = std::env::var("DJANGO_BOLT_PROCESS_ID")
+        .ok()
+        .and_then(|s| s.parse::<usize>().ok())
+        .unwrap_or(0);
+    if let Err(e) = attach(&path, slot) {
+        eprintln!(
+            "[django-bolt] Warning: Shared metrics disabled ({}): {}",
+            path, e
+        );
+    }
+}
+
+/// Attach this process to segment `slot` of a shared metrics file
+#[pyfunction]
+#[pyo3(name = "attach_shared_metrics")]
+pub fn py_attach_shared_metrics(path: &str, slot: usize) -> PyResult<()> {
+    Ok(attach(path, slot)?)
+}
@@ -0,0 +1,233 @@
+//! Rate limits shared across `runbolt --processes N` workers.
+//!
+//! With per-process limiters, N SO_REUSEPORT workers each allow the full rate, so
+//! `@rate_limit(rps=100)` admits up to N x 100 rps. When `BOLT_SHARED_RATE_LIMIT` is
+//! enabled, the runbolt master creates a file (in `/dev/shm` when available) holding a
+//! fixed-size open-addressing table of buckets and passes its path to the workers in
+//! `DJANGO_BOLT_RATE_LIMIT_SHM`. Every worker maps it and checks the same buckets, so
+//! limits hold for the whole host.
+//!
+//! Each bucket is one word pair `[key, tat]` updated with atomics only (no locks, no
+//! GIL). `tat` is the GCRA "theoretical arrival time" on the system-wide monotonic
+//! clock: a request costing `cost` tokens pushes `tat` `cost` intervals forward
+//! (`interval = 1s / rps`), and is allowed when the new `tat` stays within
+//! `burst x interval` of now. This admits exactly `burst` tokens at once and `rps` per
+//! second afterwards, like the per-process limiter.
+//!
+//! A bucket whose `tat` is in the past is full again and indistinguishable from a new
+//! one, so its slot is reused by the next key that needs one. When no slot is
+//! free within the probe window, the request falls back to the per-process limiter.
+//!
+//! Layout (all fields are native-endian u64 words):
+//!
+//! ```text
+//! header:  magic, version, entries, 0 x 5
+//! entries: entries x [key, tat_ns]
+//! ```
+
+use once_cell::sync::OnceCell;
+use pyo3::prelude::*;
+use std::collections::hash_map::DefaultHasher;
+use std::hash::{Hash, Hasher};
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::time::Duration;
+
+use crate::shared_metrics::Mapping;
+
+const MAGIC: u64 = u64::from_le_bytes(*b"BOLTRLM1");
+const VERSION: u64 = 1;
+
+const HEADER_WORDS: usize = 8;
+const ENTRY_WORDS: usize = 2;
+
+/// Slots inspected per lookup before falling back to the per-process limiter
+const MAX_PROBES: usize = 32;
+
+const MAX_ENTRIES: usize = 1 << 24;
+
+/// Nanoseconds on the system-wide monotonic clock (comparable across processes)
+#[cfg(unix)]
+fn monotonic_ns() -> u64 {
+    let mut ts = libc::timespec {
+        tv_sec: 0,
+        tv_nsec: 0,
+    };
+    // SAFETY: `ts` is a valid timespec; CLOCK_MONOTONIC is always available
+    unsafe {
+        libc::clock_gettime(libc::CLOCK_MONOTONIC, &mut ts);
+    }
+    ts.tv_sec as u64 * 1_000_000_000 + ts.tv_nsec as u64
+}
+
+#[cfg(not(unix))]
+fn monotonic_ns() -> u64 {
+    // Never attached off Unix (Mapping::open fails)
+    0
+}
+
+/// Bucket key: a hash of (handler_id, key) that is identical in every worker.
+/// 0 marks an empty slot.
+fn bucket_key(handler_id: usize, key: &str) -> u64 {
+    // SipHash with fixed keys: stable across the processes of one build
+    let mut hasher = DefaultHasher::new();
+    handler_id.hash(&mut hasher);
+    key.hash(&mut hasher);
+    hasher.finish().max(1)
+}
+
+/// Rate limit buckets mapped into this worker
+pub struct SharedBuckets {
+    mapping: Mapping,
+    entries: usize,
+}
+
+static ATTACHED: OnceCell<SharedBuckets> = OnceCell::new();
+
+/// The shared buckets this worker checks, if any
+#[inline]
+pub fn attached() -> Option<&'static SharedBuckets> {
+    ATTACHED.get()
+}
+
+impl SharedBuckets {
+    fn open(path: &str) -> std::io::Result<Self> {
+        let mapping = Mapping::open(path)?;
+        let words = mapping.words();
+        let entries = words[2].load(Ordering::Acquire) as usize;
+        let valid = words[0].load(Ordering::Acquire) == MAGIC
+            && words[1].load(Ordering::Acquire) == VERSION
+            && entries > 0
+            && words.len() >= HEADER_WORDS + entries * ENTRY_WORDS;
+        if !valid {
+            return Err(std::io::Error::new(
+                std::io::ErrorKind::InvalidData,
+                "shared rate limit file has an incompatible layout",
+            ));
+        }
+        Ok(SharedBuckets { mapping, entries })
+    }
+
+    /// Find or claim the `tat` word of `key`; None when the probe window is full
+    fn bucket(&self, key: u64, now: u64) -> Option<&AtomicU64> {
+        let table = &self.mapping.words()[HEADER_WORDS..];
+        let entry = |index: usize| &table[index * ENTRY_WORDS..(index + 1) * ENTRY_WORDS];
+
+        let mut index = key as usize % self.entries;
+        // First slot with an expired bucket (reused if the key is absent)
+        let mut expired: Option<(usize, u64)> = None;
+        let mut empty: Option<usize> = None;
+        for _ in 0..MAX_PROBES.min(self.entries) {
+            let slot = entry(index);
+            let current = slot[0].load(Ordering::Acquire);
+            if current == key {
+                return Some(&slot[1]);
+            }
+            // Keys are never removed (only replaced), so an empty slot ends the search
+            if current == 0 {
+                empty = Some(index);
+                break;
+            }
+            if expired.is_none() && slot[1].load(Ordering::Relaxed) <= now {
+                expired = Some((index, current));
+            }
+            index = (index + 1) % self.entries;
+        }
+
+        let (index, expected) = expired.or(empty.map(|index| (index, 0)))?;
+        let slot = entry(index);
+        match slot[0].compare_exchange(expected, key, Ordering::AcqRel, Ordering::Acquire) {
+            Ok(_) => Some(&slot[1]),
+            // Another worker claimed the slot for the same key
+            Err(existing) if existing == key => Some(&slot[1]),
+            Err(_) => None,
+        }
+    }
+
+    /// Check a request costing `cost` tokens against the shared bucket of (handler_id, key).
+    ///
+    /// Returns `Some(Ok(()))` when allowed, `Some(Err(wait))` when limited, and None when
+    /// the table has no room for the key (the caller uses the per-process limiter).
+    pub fn check(
+        &self,
+        handler_id: usize,
+        key: &str,
+        rps: u32,
+        burst: u32,
+        cost: u32,
+    ) -> Option<Result<(), Duration>> {
+        let interval = (1_000_000_000 / rps.max(1) as u64).max(1);
+        let capacity = interval * burst.max(1) as u64;
+        let increment = interval * cost.max(1) as u64;
+        let now = monotonic_ns();
+        let tat = self.bucket(bucket_key(handler_id, key), now)?;
+
+        let mut current = tat.load(Ordering::Acquire);
+        loop {
+            let next = current.max(now) + increment;
+            if next - now > capacity {
+                return Some(Err(Duration::from_nanos(next - now - capacity)));
+            }
+            match tat.compare_exchange_weak(current, next, Ordering::AcqRel, Ordering::Acquire) {
+                Ok(_) => return Some(Ok(())),
+                Err(actual) => current = actual,
+            }
+        }
+    }
+}
+
+/// Attach this worker to a shared rate limit file (first call wins)
+pub fn attach(path: &str) -> std::io::Result<()> {
+    if ATTACHED.get().is_some() {
+        return Ok(());
+    }
+    let _ = ATTACHED.set(SharedBuckets::open(path)?);
+    Ok(())
+}
+
+/// Attach from the environment set by `runbolt` (DJANGO_BOLT_RATE_LIMIT_SHM)
+pub fn attach_from_env() {
+    let Ok(path) = std::env::var("DJANGO_BOLT_RATE_LIMIT_SHM") else {
+        return;
+    };
+    if let Err(e) = attach(&path) {
+        eprintln!(
+            "[django-bolt] Warning: Shared rate limits disabled ({}): {}",
+            path, e
+        );
+    }
+}
+
+/// Create (or truncate) a shared rate limit file with `entries` buckets
+#[pyfunction]
+pub fn create_shared_rate_limit(path: &str, entries: usize) -> PyResult<()> {
+    if entries == 0 || entries > MAX_ENTRIES {
+        return Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "entries must be between 1 and {}",
+            MAX_ENTRIES
+        )));
+    }
+    let file = std::fs::OpenOptions::new()
+        .read(true)
+        .write(true)
+        .create(true)
+        .truncate(true)
+        .open(path)?;
+    // Zero-filled by the OS
+    file.set_len(((HEADER_WORDS + entries * ENTRY_WORDS) * 8) as u64)?;
+    drop(file);
+
+    let mapping = Mapping::open(path)?;
+    let words = mapping.words();
+    words[1].store(VERSION, Ordering::Relaxed);
+    words[2].store(entries as u64, Ordering::Relaxed);
+    // Magic last: workers only trust a fully written header
+    words[0].store(MAGIC, Ordering::Release);
+    Ok(())
+}
+
+/// Attach this process to a shared rate limit file
+#[pyfunction]
+#[pyo3(name = "attach_shared_rate_limit")]
+pub fn py_attach_shared_rate_limit(path: &str) -> PyResult<()> {
+    Ok(attach(path)?)
+}
@@ -7,7 +7,9 @@ use std::sync::atomic::AtomicU64;
 use std::sync::Arc;
 
 use crate::metadata::{CompressionConfig, CorsConfig, RouteMetadata};
+use crate::metrics::MetricsConfig;
 use crate::router::Router;
+use crate::timing::TimingConfig;
 use crate::websocket::WebSocketRouter;
 
 /// Configuration for serving static files via Actix
@@ -28,6 +30,8 @@ pub struct AppState {
     pub router: Option<Arc<Router>>, // Router (used by test infrastructure, optional in production)
     pub route_metadata: Option<Arc<AHashMap<usize, RouteMetadata>>>, // Route metadata (used by test infrastructure)
     pub static_files_config: Option<StaticFilesConfig>, // Static files configuration from Django settings
+    pub timing: TimingConfig, // Phase timing / Server-Timing settings (BOLT_PHASE_TIMINGS, BOLT_SERVER_TIMING)
+    pub metrics: MetricsConfig, // Prometheus metrics settings (BOLT_METRICS, BOLT_METRICS_PATH)
 }
 
 pub static GLOBAL_ROUTER: OnceCell<Arc<Router>> = OnceCell::new();
@@ -19,7 +19,7 @@ use dashmap::DashMap;
 use once_cell::sync::OnceCell;
 use parking_lot::RwLock;
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyDict, PyList};
 use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::Arc;
 
@@ -37,9 +37,11 @@ use futures_util::StreamExt;
 use std::collections::HashMap;
 
 use crate::handler::{build_prebound_args_kwargs, coerced_value_to_py, form_result_to_py};
-use crate::request_pipeline::validate_and_cache_typed_params;
+use crate::metrics::{self, configure_metrics_route, MetricsConfig};
+use crate::request_pipeline::{detect_msgpack, validate_and_cache_typed_params};
 use crate::response_meta::ResponseMeta;
 use crate::static_files::handle_static_file;
+use crate::timing::{Phase, PhaseTimer, TimingConfig, TIMINGS_STATE_KEY};
 use crate::type_coercion::{coerce_param, params_to_py_dict, TYPE_STRING};
 
 /// One-time initialization flag for async runtime
@@ -126,6 +128,10 @@ pub struct TestAppState {
     pub trailing_slash: String,
     /// Static files configuration for testing static file serving
     pub static_files_config: Option<StaticFilesConfig>,
+    /// Phase timing / Server-Timing settings (same as production server)
+    pub timing: TimingConfig,
+    /// Prometheus metrics settings (same as production server)
+    pub metrics: MetricsConfig,
 }
 
 /// Registry for test app instances
@@ -373,6 +379,8 @@ pub fn create_test_app(
         max_payload_size,
         trailing_slash: trailing_slash.unwrap_or_else(|| "strip".to_string()),
         static_files_config: static_config,
+        timing: TimingConfig::from_django_settings(py),
+        metrics: MetricsConfig::from_django_settings(py),
     };
 
     let id = TEST_ID_GEN.fetch_add(1, Ordering::Relaxed);
@@ -403,6 +411,7 @@ pub fn register_test_routes(
     // Create a new router with the routes
     let mut router = Router::new();
     for (method, path, handler_id, handler) in routes {
+        metrics::register_route_label(handler_id, &method, &path);
         router.register(&method, &path, handler_id, handler)?;
     }
     app.router = Arc::new(router);
@@ -514,6 +523,8 @@ pub fn test_request(
             max_payload_size,
             _trailing_slash,
             static_files_config,
+            timing,
+            metrics_config,
         ) = {
             let state = app_state.read();
             (
@@ -525,6 +536,8 @@ pub fn test_request(
                 state.max_payload_size,
                 state.trailing_slash.clone(),
                 state.static_files_config.clone(),
+                state.timing,
+                state.metrics.clone(),
             )
         };
 
@@ -540,6 +553,8 @@ pub fn test_request(
             router: Some(router.clone()),
             route_metadata: Some(route_metadata.clone()),
             static_files_config: static_files_config.clone(),
+            timing,
+            metrics: metrics_config.clone(),
         });
 
         // Clone the Arc values for the handler closure
@@ -573,6 +588,7 @@ pub fn test_request(
                     .wrap(NormalizePath::new(TrailingSlash::MergeOnly))
                     .wrap(CorsMiddleware::new())
                     .wrap(CompressionMiddleware::new())
+                    .configure(|cfg| configure_metrics_route(cfg, &metrics_config))
                     .route(&static_route, web::get().to(handle_static_file))
                     .default_service(web::to(handler)),
             )
@@ -586,6 +602,7 @@ pub fn test_request(
                     .wrap(NormalizePath::new(TrailingSlash::MergeOnly))
                     .wrap(CorsMiddleware::new())
                     .wrap(CompressionMiddleware::new())
+                    .configure(|cfg| configure_metrics_route(cfg, &metrics_config))
                     .default_service(web::to(handler)),
             )
             .await
@@ -648,10 +665,39 @@ pub fn test_request(
 /// Internal handler for test requests that uses per-instance state.
 /// This mirrors the production `handle_request` but uses the provided router and metadata.
 async fn handle_test_request_internal(
+    req: HttpRequest,
+    payload: web::Payload,
+    router: Arc<Router>,
+    route_metadata: Arc<AHashMap<usize, RouteMetadata>>,
+) -> HttpResponse {
+    let (timing, metrics_enabled) = match req.app_data::<web::Data<Arc<AppState>>>() {
+        Some(s) => (s.timing, s.metrics.enabled),
+        None => (TimingConfig::default(), false),
+    };
+    if !timing.enabled && !metrics_enabled {
+        return handle_test_request_timed(req, payload, router, route_metadata, None).await;
+    }
+    let _in_flight = metrics_enabled.then(metrics::InFlightGuard::enter);
+    let mut timer = PhaseTimer::start(timing.enabled);
+    let mut response =
+        handle_test_request_timed(req, payload, router, route_metadata, Some(&mut timer)).await;
+    if metrics_enabled {
+        metrics::observe_request(
+            timer.handler_id(),
+            response.status().as_u16(),
+            timer.elapsed(),
+        );
+    }
+    timer.finish(&mut response, timing.header);
+    response
+}
+
+async fn handle_test_request_timed(
     req: HttpRequest,
     mut payload: web::Payload,
     router: Arc<Router>,
     route_metadata: Arc<AHashMap<usize, RouteMetadata>>,
+    mut timer: Option<&mut PhaseTimer>,
 ) -> HttpResponse {
     use crate::handler::{extract_headers, handle_python_error};
     use crate::middleware;
@@ -727,6 +773,11 @@ async fn handle_test_request_internal(
         }
     };
 
+    if let Some(t) = timer.as_mut() {
+        t.mark(Phase::Route);
+        t.set_handler_id(handler_id);
+    }
+
     // Get route metadata
     let route_meta = route_metadata.get(&handler_id).cloned();
 
@@ -770,6 +821,9 @@ async fn handle_test_request_internal(
 
     let peer_addr = req.peer_addr().map(|addr| addr.ip().to_string());
 
+    // MessagePack content negotiation (Content-Type / Accept), checked on raw headers
+    let (msgpack_body, msgpack_response) = detect_msgpack(req.headers());
+
     // Get connection info from Actix - handles proxies, IPv6, etc. correctly
     let conn_info = req.connection_info();
     let conn_host = conn_info.host().to_owned();
@@ -779,18 +833,25 @@ async fn handle_test_request_internal(
         .unwrap_or("127.0.0.1")
         .to_owned();
 
-    // Rate limiting
+    if let Some(t) = timer.as_mut() {
+        t.mark(Phase::Parse);
+    }
+
+    // Rate limiting (limits keyed by user are checked after auth)
     if let Some(ref meta) = route_meta {
         if let Some(ref rate_config) = meta.rate_limit_config {
-            if let Some(response) = middleware::rate_limit::check_rate_limit(
-                handler_id,
-                &headers,
-                peer_addr.as_deref(),
-                rate_config,
-                method,
-                path,
-            ) {
-                return response;
+            if !rate_config.keyed_by_user() {
+                if let Some(response) = middleware::rate_limit::check_rate_limit(
+                    handler_id,
+                    &headers,
+                    peer_addr.as_deref(),
+                    None,
+                    rate_config,
+                    method,
+                    path,
+                ) {
+                    return response;
+                }
             }
         }
     }
@@ -806,6 +867,30 @@ async fn handle_test_request_internal(
         None
     };
 
+    // Rate limits keyed by the authenticated user id
+    if let Some(rate_config) = route_meta
+        .as_ref()
+        .and_then(|m| m.rate_limit_config.as_ref())
+    {
+        if rate_config.keyed_by_user() {
+            if let Some(response) = middleware::rate_limit::check_rate_limit(
+                handler_id,
+                &headers,
+                peer_addr.as_deref(),
+                auth_ctx.as_ref().and_then(|ctx| ctx.user_id.as_deref()),
+                rate_config,
+                method,
+                path,
+            ) {
+                return response;
+            }
+        }
+    }
+
+    if let Some(t) = timer.as_mut() {
+        t.mark(Phase::Auth);
+    }
+
     // Cookies
     let needs_cookies = route_meta.as_ref().map(|m| m.needs_cookies).unwrap_or(true);
     let cookies = if needs_cookies {
@@ -926,9 +1011,17 @@ async fn handle_test_request_internal(
 
     let is_head_request = method == "HEAD";
 
+    let timing_enabled = match timer.as_mut() {
+        Some(t) => {
+            t.mark(Phase::Body);
+            t.phases_enabled()
+        }
+        None => false,
+    };
+
     // Execute handler using run_coroutine_threadsafe to submit to background event loop
     // This reuses the global event loop instead of creating one per request via asyncio.run()
-    let result_obj = match Python::attach(|py| -> PyResult<Py<PyAny>> {
+    let (result_obj, python_timings) = match Python::attach(|py| -> PyResult<_> {
         let dispatch = state.dispatch.clone_ref(py);
         let handler = route_handler.clone_ref(py);
 
@@ -977,6 +1070,21 @@ async fn handle_test_request_internal(
         let cookies_dict = params_to_py_dict(py, &cookies, &param_types)?;
 
         let state_dict = PyDict::new(py);
+        // MessagePack content negotiation flags (read by Python body extractors/serializers)
+        if msgpack_body {
+            state_dict.set_item("_bolt_msgpack_body", true)?;
+        }
+        if msgpack_response {
+            state_dict.set_item("_bolt_msgpack_response", true)?;
+        }
+        // Python's _dispatch appends (phase, seconds) tuples to this list
+        let python_timings = if timing_enabled {
+            let list = PyList::empty(py);
+            state_dict.set_item(TIMINGS_STATE_KEY, &list)?;
+            Some(list.unbind())
+        } else {
+            None
+        };
         if let Some(bindings) = route_meta
             .as_ref()
             .and_then(|m| m.rust_arg_bindings.as_deref())
@@ -1038,7 +1146,7 @@ async fn handle_test_request_internal(
 
         // Wait for the result (releases GIL while waiting)
         let result = future.call_method0("result")?;
-        Ok(result.unbind())
+        Ok((result.unbind(), python_timings))
     }) {
         Ok(r) => r,
         Err(e) => {
@@ -1046,6 +1154,12 @@ async fn handle_test_request_internal(
         }
     };
 
+    // The test path builds the request and waits for dispatch in one GIL scope,
+    // so request build time is reported as part of the queue phase here.
+    if let Some(t) = timer.as_mut() {
+        t.mark_app(python_timings.as_ref());
+    }
+
     // Process the result
     match Ok::<_, PyErr>(result_obj) {
         Ok(result_obj) => {
@@ -1485,6 +1599,7 @@ pub fn handle_test_websocket(
                 handler_id,
                 &header_map,
                 Some("127.0.0.1"),
+                None,
                 rate_config,
                 "GET",
                 &path,
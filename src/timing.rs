@@ -0,0 +1,339 @@
+//! Per-phase request timing.
+//!
+//! When enabled (`BOLT_PHASE_TIMINGS` / `BOLT_SERVER_TIMING`), each request gets a
+//! `PhaseTimer` that splits its latency into phases measured in Rust (route match,
+//! parameter/header parsing, auth, body read, GIL + request build, response build)
+//! and phases reported back by Python's `_dispatch` (parameter binding, handler,
+//! serialization). The time the dispatch coroutine waited for the event loop is
+//! derived as `app - dispatch`.
+//!
+//! Phase durations are aggregated into lock-free per-route histograms and can be
+//! emitted as a `Server-Timing` response header.
+
+use actix_web::http::header::{HeaderName, HeaderValue};
+use actix_web::HttpResponse;
+use dashmap::DashMap;
+use once_cell::sync::Lazy;
+use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyList};
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::Arc;
+use std::time::Instant;
+
+/// Key of the list Python appends `(phase, seconds)` tuples to (in `request.state`)
+pub const TIMINGS_STATE_KEY: &str = "_bolt_timings";
+
+/// Request phases, in request order
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub enum Phase {
+    Route = 0,
+    Parse,
+    Auth,
+    Body,
+    Gil,
+    Queue,
+    Bind,
+    Handler,
+    Serialize,
+    Respond,
+    Total,
+}
+
+pub const PHASE_COUNT: usize = 11;
+
+/// Phase names (Server-Timing metric names and histogram keys)
+pub const PHASE_NAMES: [&str; PHASE_COUNT] = [
+    "route",
+    "parse",
+    "auth",
+    "body",
+    "gil",
+    "queue",
+    "bind",
+    "handler",
+    "serialize",
+    "respond",
+    "total",
+];
+
+/// Histogram bucket upper bounds in milliseconds (plus an implicit +Inf bucket)
+pub const BUCKETS_MS: [f64; 16] = [
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0,
+    10000.0,
+];
+
+pub(crate) const BUCKET_COUNT: usize = BUCKETS_MS.len() + 1;
+
+/// Index of the bucket a duration (in seconds) falls into
+#[inline]
+pub(crate) fn bucket_index(secs: f64) -> usize {
+    let ms = secs * 1000.0;
+    BUCKETS_MS
+        .iter()
+        .position(|&bound| ms <= bound)
+        .unwrap_or(BUCKETS_MS.len())
+}
+
+/// Timing settings read once at startup
+#[derive(Clone, Copy, Debug, Default)]
+pub struct TimingConfig {
+    /// Collect phase timings into per-route histograms
+    pub enabled: bool,
+    /// Also emit a Server-Timing header
+    pub header: bool,
+}
+
+impl TimingConfig {
+    /// Read BOLT_PHASE_TIMINGS / BOLT_SERVER_TIMING from Django settings.
+    /// BOLT_SERVER_TIMING implies phase timing collection.
+    pub fn from_django_settings(py: Python<'_>) -> Self {
+        let read_bool = |name: &str| -> bool {
+            (|| -> PyResult<bool> {
+                let django_conf = py.import("django.conf")?;
+                let settings = django_conf.getattr("settings")?;
+                settings.getattr(name)?.is_truthy()
+            })()
+            .unwrap_or(false)
+        };
+        let header = read_bool("BOLT_SERVER_TIMING");
+        TimingConfig {
+            enabled: header || read_bool("BOLT_PHASE_TIMINGS"),
+            header,
+        }
+    }
+}
+
+/// Lock-free latency histogram over `BUCKETS_MS` (shared with the Prometheus metrics)
+pub(crate) struct Histogram {
+    pub(crate) buckets: [AtomicU64; BUCKET_COUNT],
+    pub(crate) count: AtomicU64,
+    pub(crate) sum_ns: AtomicU64,
+}
+
+impl Histogram {
+    pub(crate) fn new() -> Self {
+        Self {
+            buckets: std::array::from_fn(|_| AtomicU64::new(0)),
+            count: AtomicU64::new(0),
+            sum_ns: AtomicU64::new(0),
+        }
+    }
+
+    #[inline]
+    pub(crate) fn observe(&self, secs: f64) {
+        self.buckets[bucket_index(secs)].fetch_add(1, Ordering::Relaxed);
+        self.count.fetch_add(1, Ordering::Relaxed);
+        self.sum_ns
+            .fetch_add((secs * 1_000_000_000.0) as u64, Ordering::Relaxed);
+    }
+}
+
+/// Phase histograms of one route
+pub struct RouteTimings {
+    phases: [Histogram; PHASE_COUNT],
+}
+
+impl RouteTimings {
+    fn new() -> Self {
+        Self {
+            phases: std::array::from_fn(|_| Histogram::new()),
+        }
+    }
+}
+
+/// handler_id -> phase histograms (recording only touches atomics after first insert)
+static ROUTE_TIMINGS: Lazy<DashMap<usize, Arc<RouteTimings>>> = Lazy::new(DashMap::new);
+
+fn route_timings(handler_id: usize) -> Arc<RouteTimings> {
+    if let Some(timings) = ROUTE_TIMINGS.get(&handler_id) {
+        return timings.clone();
+    }
+    ROUTE_TIMINGS
+        .entry(handler_id)
+        .or_insert_with(|| Arc::new(RouteTimings::new()))
+        .clone()
+}
+
+/// Splits one request's latency into phases.
+///
+/// With `phases` disabled (metrics only) the timer just tracks the matched route and
+/// total latency, and all marks are no-ops.
+pub struct PhaseTimer {
+    start: Instant,
+    last: Instant,
+    phases: bool,
+    durations: [Option<f64>; PHASE_COUNT],
+    handler_id: Option<usize>,
+}
+
+impl PhaseTimer {
+    pub fn start(phases: bool) -> Self {
+        let now = Instant::now();
+        Self {
+            start: now,
+            last: now,
+            phases,
+            durations: [None; PHASE_COUNT],
+            handler_id: None,
+        }
+    }
+
+    /// Whether per-phase durations are collected (and Python should report its phases)
+    #[inline]
+    pub fn phases_enabled(&self) -> bool {
+        self.phases
+    }
+
+    pub fn set_handler_id(&mut self, handler_id: usize) {
+        self.handler_id = Some(handler_id);
+    }
+
+    /// Matched route (None for unmatched requests)
+    #[inline]
+    pub fn handler_id(&self) -> Option<usize> {
+        self.handler_id
+    }
+
+    /// Seconds since the timer started
+    #[inline]
+    pub fn elapsed(&self) -> f64 {
+        self.start.elapsed().as_secs_f64()
+    }
+
+    /// Attribute the time since the previous mark to `phase`
+    #[inline]
+    pub fn mark(&mut self, phase: Phase) {
+        if !self.phases {
+            return;
+        }
+        let now = Instant::now();
+        let elapsed = now.duration_since(self.last).as_secs_f64();
+        self.last = now;
+        let slot = &mut self.durations[phase as usize];
+        *slot = Some(slot.unwrap_or(0.0) + elapsed);
+    }
+
+    /// Attribute the time since the previous mark (awaiting Python dispatch) to the
+    /// phases Python reported in its timings list; the remainder is event loop queueing.
+    pub fn mark_app(&mut self, python_timings: Option<&Py<PyList>>) {
+        if !self.phases {
+            return;
+        }
+        let now = Instant::now();
+        let app = now.duration_since(self.last).as_secs_f64();
+        self.last = now;
+
+        let mut dispatch: Option<f64> = None;
+        if let Some(list) = python_timings {
+            Python::attach(|py| {
+                for item in list.bind(py).iter() {
+                    let Ok((name, secs)) = item.extract::<(String, f64)>() else {
+                        continue;
+                    };
+                    match name.as_str() {
+                        "bind" => self.durations[Phase::Bind as usize] = Some(secs),
+                        "handler" => self.durations[Phase::Handler as usize] = Some(secs),
+                        "serialize" => self.durations[Phase::Serialize as usize] = Some(secs),
+                        "dispatch" => dispatch = Some(secs),
+                        _ => {}
+                    }
+                }
+            });
+        }
+
+        match dispatch {
+            Some(dispatch) => {
+                self.durations[Phase::Queue as usize] = Some((app - dispatch).max(0.0))
+            }
+            // Python did not report (e.g. error before dispatch): attribute everything to the handler
+            None => self.durations[Phase::Handler as usize] = Some(app),
+        }
+    }
+
+    /// Close the request: record the response-build phase and total, update the route
+    /// histograms, and add the Server-Timing header when requested.
+    pub fn finish(mut self, response: &mut HttpResponse, header: bool) {
+        if !self.phases {
+            return;
+        }
+        self.mark(Phase::Respond);
+        self.durations[Phase::Total as usize] = Some(self.start.elapsed().as_secs_f64());
+
+        if let Some(handler_id) = self.handler_id {
+            let timings = route_timings(handler_id);
+            for (histogram, duration) in timings.phases.iter().zip(self.durations.iter()) {
+                if let Some(secs) = duration {
+                    histogram.observe(*secs);
+                }
+            }
+        }
+
+        if header {
+            if let Ok(value) = HeaderValue::from_str(&self.server_timing_value()) {
+                response
+                    .headers_mut()
+                    .append(HeaderName::from_static("server-timing"), value);
+            }
+        }
+    }
+
+    fn server_timing_value(&self) -> String {
+        let mut value = String::with_capacity(160);
+        for (name, duration) in PHASE_NAMES.iter().zip(self.durations.iter()) {
+            if let Some(secs) = duration {
+                if !value.is_empty() {
+                    value.push_str(", ");
+                }
+                value.push_str(name);
+                value.push_str(";dur=");
+                value.push_str(&format!("{:.3}", secs * 1000.0));
+            }
+        }
+        value
+    }
+}
+
+/// Return per-route phase histograms:
+/// {handler_id: {phase: {"count", "sum_ms", "buckets": [(le_ms, cumulative_count), ...]}}}
+#[pyfunction]
+pub fn get_route_timings(py: Python<'_>) -> PyResult<Py<PyDict>> {
+    // Snapshot the Arcs first so no DashMap shard lock is held while building Python objects
+    let routes: Vec<(usize, Arc<RouteTimings>)> = ROUTE_TIMINGS
+        .iter()
+        .map(|entry| (*entry.key(), entry.value().clone()))
+        .collect();
+
+    let result = PyDict::new(py);
+    for (handler_id, timings) in routes {
+        let phases = PyDict::new(py);
+        for (name, histogram) in PHASE_NAMES.iter().zip(timings.phases.iter()) {
+            let count = histogram.count.load(Ordering::Relaxed);
+            if count == 0 {
+                continue;
+            }
+            let buckets = PyList::empty(py);
+            let mut cumulative = 0u64;
+            for (i, bucket) in histogram.buckets.iter().enumerate() {
+                cumulative += bucket.load(Ordering::Relaxed);
+                let bound = BUCKETS_MS.get(i).copied().unwrap_or(f64::INFINITY);
+                buckets.append((bound, cumulative))?;
+            }
+            let phase = PyDict::new(py);
+            phase.set_item("count", count)?;
+            phase.set_item(
+                "sum_ms",
+                histogram.sum_ns.load(Ordering::Relaxed) as f64 / 1_000_000.0,
+            )?;
+            phase.set_item("buckets", buckets)?;
+            phases.set_item(*name, phase)?;
+        }
+        result.set_item(handler_id, phases)?;
+    }
+    Ok(result.unbind())
+}
+
+/// Drop all collected route timings
+#[pyfunction]
+pub fn reset_route_timings() {
+    ROUTE_TIMINGS.clear();
+}
@@ -16,6 +16,7 @@ use std::collections::HashMap;
 
 use crate::handler::coerced_value_to_py;
 use crate::metadata::CorsConfig;
+use crate::metrics;
 use crate::middleware::rate_limit::check_rate_limit;
 use crate::state::{AppState, ROUTE_METADATA, TASK_LOCALS};
 use crate::type_coercion::{coerce_param, TYPE_STRING};
@@ -463,6 +464,7 @@ pub async fn handle_websocket_upgrade_with_handler(
     // Check connection limit FIRST (before any processing)
     let current_connections = ACTIVE_WS_CONNECTIONS.load(Ordering::Relaxed);
     if current_connections >= config.max_connections {
+        metrics::record_ws_rejected();
         eprintln!(
             "[django-bolt] WebSocket: Connection limit reached ({}/{})",
             current_connections, config.max_connections
@@ -492,6 +494,8 @@ pub async fn handle_websocket_upgrade_with_handler(
                     handler_id,
                     &headers,
                     peer_addr.as_deref(),
+                    // Checked before authentication: limits keyed by user fall back to the IP
+                    None,
                     rate_config,
                     req.method().as_str(),
                     req.path(),